@@ -8,37 +8,88 @@ Aplikasi REST API untuk manajemen buku perpustakaan
 from flask import Flask, jsonify
 from flask_cors import CORS
 
-from app.config import Config
+from app.config import get_config
 from app.database import db_connection, db
+from app.observers import activity_logger
+from app.middleware import (
+    init_allocation_profiling, init_compression, init_metrics, init_profiling, init_server_timing
+)
 
 
-def create_app(config_class=Config):
+def create_app(config_class=None):
     """
     Application Factory Pattern
     Membuat dan mengkonfigurasi instance Flask app
     
     Args:
         config_class: Kelas konfigurasi yang akan digunakan
+            (default: dipilih dari env APP_ENV / FLASK_ENV lewat config_by_name)
     
     Returns:
         Flask app instance
     """
     # Inisialisasi Flask
     app = Flask(__name__)
-    app.config.from_object(config_class)
+    app.config.from_object(config_class or get_config())
     
     # Inisialisasi CORS
     CORS(app)
     
+    # File log dibuka saat app dibuat, bukan saat package observers di-import
+    activity_logger.configure(app.config['LOG_FILE'])
+    
     # Inisialisasi database menggunakan Singleton
     db_connection.init_app(app)
     
+    # Buka koneksi pool di awal (DB_POOL_WARMUP)
+    db_connection.warm_up_pool(app, app.config.get('DB_POOL_WARMUP', 0))
+    
+    # Kompresi response; didaftarkan pertama agar after_request-nya berjalan terakhir
+    init_compression(app)
+    
+    # Coalescing panggilan service read-only yang identik (COALESCE_*)
+    from app.services import (
+        circulation_timeseries, overdue_analytics, popularity_tracker, single_flight,
+        snapshot_store
+    )
+    single_flight.init_app(app)
+    
+    # Tarif denda, aging bucket dan cache analitik overdue
+    overdue_analytics.init_app(app)
+    
+    # Cache bucket historis timeseries sirkulasi
+    circulation_timeseries.init_app(app)
+    
+    # Direktori, format dan kompresi snapshot kolumnar
+    snapshot_store.init_app(app)
+    
+    # Window top-N popularitas dan state file gabungan worker
+    popularity_tracker.init_app(app)
+    
+    # Middleware Server-Timing (nonaktif kecuali SERVER_TIMING_ENABLED)
+    init_server_timing(app)
+    
+    # Metrics Prometheus di /metrics
+    with app.app_context():
+        init_metrics(app, db.engine)
+    
+    # Profiling on-demand (nonaktif kecuali PROFILING_ENABLED)
+    init_profiling(app)
+    
+    # Profiling alokasi memori per route (nonaktif kecuali ALLOCATION_PROFILING_ENABLED)
+    init_allocation_profiling(app)
+    
     # Import dan register blueprints (controllers)
-    from app.controllers import book_bp, loan_bp, statistics_bp
+    from app.controllers import book_bp, loan_bp, snapshot_bp, statistics_bp
     
     app.register_blueprint(book_bp)
     app.register_blueprint(loan_bp)
     app.register_blueprint(statistics_bp)
+    app.register_blueprint(snapshot_bp)
+    
+    # Register CLI commands (migrasi index, explain)
+    from app.commands import register_commands
+    register_commands(app)
     
     # Root endpoint
     @app.route('/')
@@ -87,8 +138,5 @@ def create_app(config_class=Config):
             'message': 'Internal server error'
         }), 500
     
-    # Create database tables
-    with app.app_context():
-        db.create_all()
-    
+    # Tabel tidak dibuat saat boot: jalankan `flask init-db` sekali per database
     return app
@@ -0,0 +1,126 @@
+"""
+Mode ASGI - Library Book Management API dengan stack async
+
+Controller async (Quart) -> service async -> repository async
+(AsyncSession, driver async psycopg / aiosqlite). Model, validator,
+factory dan observer sama dengan stack sync; route dan format response
+identik dengan create_app().
+
+Cara menjalankan:
+    hypercorn asgi:app --bind 0.0.0.0:5000
+"""
+
+from quart import Quart, jsonify
+from sqlalchemy.orm import configure_mappers
+
+from app.config import get_config
+from app.database import async_db_connection
+from app.middleware import init_asgi_compression
+from app.observers import activity_logger
+
+
+def create_asgi_app(config_class=None):
+    """
+    Application Factory untuk mode ASGI
+
+    Args:
+        config_class: Kelas konfigurasi (default: dipilih dari APP_ENV / FLASK_ENV)
+
+    Returns:
+        Quart app instance
+    """
+    app = Quart(__name__)
+    app.config.from_object(config_class or get_config())
+
+    activity_logger.configure(app.config['LOG_FILE'])
+
+    # Engine async + session per request
+    async_db_connection.init_app(app)
+
+    # Semua relationship (Loan.book di-eager load repository async) di-resolve
+    # saat boot: kesalahan mapping gagal di sini, bukan di request pertama
+    configure_mappers()
+
+    from app.services import (
+        circulation_timeseries, overdue_analytics, popularity_tracker, single_flight,
+        snapshot_store
+    )
+    single_flight.init_app(app)
+    overdue_analytics.init_app(app)
+    circulation_timeseries.init_app(app)
+    snapshot_store.init_app(app)
+    popularity_tracker.init_app(app)
+
+    # Kompresi response (body non-streaming)
+    init_asgi_compression(app)
+
+    from app.asgi.book_controller import book_bp
+    from app.asgi.loan_controller import loan_bp
+    from app.asgi.statistics_controller import statistics_bp
+    from app.asgi.snapshot_controller import snapshot_bp
+
+    app.register_blueprint(book_bp)
+    app.register_blueprint(loan_bp)
+    app.register_blueprint(statistics_bp)
+    app.register_blueprint(snapshot_bp)
+
+    @app.after_request
+    async def add_cors_headers(response):
+        # Setara Flask-CORS default di stack sync: semua origin diizinkan
+        response.headers.setdefault('Access-Control-Allow-Origin', '*')
+        response.headers.setdefault('Access-Control-Allow-Headers', app.config['CORS_HEADERS'])
+        return response
+
+    @app.after_serving
+    async def close_engine():
+        await async_db_connection.dispose()
+
+    @app.route('/')
+    async def index():
+        """Root endpoint - API info"""
+        return jsonify({
+            'name': 'Library Book Management API',
+            'version': '1.0.0',
+            'description': 'REST API untuk manajemen buku perpustakaan',
+            'mode': 'asgi',
+            'endpoints': {
+                'books': '/api/books',
+                'loans': '/api/loans',
+                'statistics': '/api/statistics'
+            },
+            'documentation': 'Lihat file README.md untuk dokumentasi lengkap'
+        })
+
+    @app.route('/health')
+    async def health_check():
+        """Health check endpoint"""
+        return jsonify({
+            'status': 'healthy',
+            'message': 'API is running'
+        })
+
+    @app.errorhandler(404)
+    async def not_found(error):
+        return jsonify({
+            'success': False,
+            'message': 'Endpoint tidak ditemukan'
+        }), 404
+
+    @app.errorhandler(405)
+    async def method_not_allowed(error):
+        return jsonify({
+            'success': False,
+            'message': 'Method tidak diizinkan'
+        }), 405
+
+    @app.errorhandler(500)
+    async def internal_error(error):
+        return jsonify({
+            'success': False,
+            'message': 'Internal server error'
+        }), 500
+
+    return app
+
+
+__all__ = ['create_asgi_app']
@@ -0,0 +1,216 @@
+"""
+Async Book Controller - REST API endpoints buku untuk mode ASGI
+
+Route, query parameter dan format response sama dengan
+app.controllers.book_controller; hanya service yang dipakai async.
+"""
+
+from quart import Blueprint, request, jsonify
+
+from app.asgi.request_helper import read_json_body
+from app.controllers.book_controller import (
+    parse_book_filters, parse_book_loans_args, parse_book_lookup, parse_include
+)
+from app.services import async_book_service, async_loan_service
+
+
+# Blueprint async untuk book routes
+book_bp = Blueprint('books', __name__, url_prefix='/api/books')
+
+
+@book_bp.route('', methods=['GET'])
+async def get_all_books():
+    """
+    GET /api/books
+    Mendapatkan daftar semua buku
+    """
+    filters = parse_book_filters(request.args)
+    result = await async_book_service.get_all_books(filters if filters else None)
+    
+    status_code = 200 if result['success'] else 500
+    return jsonify(result), status_code
+
+
+@book_bp.route('/isbn/<isbn>', methods=['GET'])
+async def get_book_by_isbn(isbn):
+    """
+    GET /api/books/isbn/:isbn
+    Mendapatkan detail buku berdasarkan ISBN
+    """
+    book = await async_book_service.get_book_by_isbn(isbn)
+    
+    if book:
+        return jsonify({
+            'success': True,
+            'message': 'Buku ditemukan',
+            'data': {
+                'id': book.id,
+                'title': book.title,
+                'author': book.author,
+                'isbn': book.isbn,
+                'year': book.year,
+                'category': book.category,
+                'stock': book.stock,
+                'available': book.available,
+                'created_at': book.created_at.isoformat() if book.created_at else None,
+                'updated_at': book.updated_at.isoformat() if book.updated_at else None
+            }
+        }), 200
+    else:
+        return jsonify({
+            'success': False,
+            'message': f'Buku dengan ISBN {isbn} tidak ditemukan'
+        }), 404
+
+
+@book_bp.route('/lookup', methods=['POST'])
+async def lookup_books():
+    """
+    POST /api/books/lookup
+    Mengambil banyak buku sekaligus berdasarkan ID dan/atau ISBN
+    """
+    data, error_response = await read_json_body()
+    if error_response:
+        return error_response
+    
+    ids, isbns, error = parse_book_lookup(data)
+    if error:
+        return jsonify({
+            'success': False,
+            'message': error
+        }), 400
+    
+    result = await async_book_service.lookup_books(ids, isbns)
+    
+    status_code = 200 if result['success'] else 500
+    return jsonify(result), status_code
+
+
+@book_bp.route('/search', methods=['GET'])
+async def search_books():
+    """
+    GET /api/books/search?q=keyword
+    Mencari buku berdasarkan keyword
+    """
+    keyword = request.args.get('q', '')
+    result = await async_book_service.search_books(keyword)
+    
+    status_code = 200 if result['success'] else 400
+    return jsonify(result), status_code
+
+
+@book_bp.route('/categories', methods=['GET'])
+async def get_categories():
+    """
+    GET /api/books/categories
+    Mendapatkan daftar kategori buku
+    """
+    result = await async_book_service.get_categories()
+    
+    status_code = 200 if result['success'] else 500
+    return jsonify(result), status_code
+
+
+@book_bp.route('/category/<category>', methods=['GET'])
+async def get_books_by_category(category):
+    """
+    GET /api/books/category/:category
+    Mendapatkan buku berdasarkan kategori
+    """
+    result = await async_book_service.get_all_books({'category': category})
+    
+    status_code = 200 if result['success'] else 500
+    return jsonify(result), status_code
+
+
+@book_bp.route('/<int:book_id>', methods=['GET'])
+async def get_book(book_id):
+    """
+    GET /api/books/:id
+    Mendapatkan detail buku berdasarkan ID
+    """
+    include = parse_include(request.args)
+    result = await async_book_service.get_book_by_id(
+        book_id, include_active_loans='active_loans' in include)
+    
+    return jsonify(result), 200 if result['success'] else 404
+
+
+@book_bp.route('/<int:book_id>/loans', methods=['GET'])
+async def get_book_loans(book_id):
+    """
+    GET /api/books/:id/loans
+    Mendapatkan riwayat peminjaman sebuah buku, terbaru dulu
+    """
+    params, error = parse_book_loans_args(request.args)
+    if error:
+        return jsonify({
+            'success': False,
+            'message': error
+        }), 400
+    
+    result = await async_loan_service.get_book_loans(book_id, **params)
+    
+    if result['success']:
+        return jsonify(result), 200
+    elif 'tidak ditemukan' in result.get('message', ''):
+        return jsonify(result), 404
+    else:
+        return jsonify(result), 500
+
+
+@book_bp.route('/<int:book_id>/availability', methods=['GET'])
+async def check_availability(book_id):
+    """
+    GET /api/books/:id/availability
+    Mengecek ketersediaan buku
+    """
+    result = await async_book_service.check_availability(book_id)
+    
+    return jsonify(result), 200 if result['success'] else 404
+
+
+@book_bp.route('', methods=['POST'])
+async def create_book():
+    """
+    POST /api/books
+    Menambahkan buku baru
+    """
+    data, error_response = await read_json_body()
+    if error_response:
+        return error_response
+    
+    result = await async_book_service.create_book(data)
+    
+    return jsonify(result), 201 if result['success'] else 400
+
+
+@book_bp.route('/<int:book_id>', methods=['PUT'])
+async def update_book(book_id):
+    """
+    PUT /api/books/:id
+    Update data buku
+    """
+    data, error_response = await read_json_body()
+    if error_response:
+        return error_response
+    
+    result = await async_book_service.update_book(book_id, data)
+    
+    if result['success']:
+        return jsonify(result), 200
+    elif 'tidak ditemukan' in result.get('message', ''):
+        return jsonify(result), 404
+    else:
+        return jsonify(result), 400
+
+
+@book_bp.route('/<int:book_id>', methods=['DELETE'])
+async def delete_book(book_id):
+    """
+    DELETE /api/books/:id
+    Menghapus buku (soft delete)
+    """
+    result = await async_book_service.delete_book(book_id)
+    
+    return jsonify(result), 200 if result['success'] else 404
@@ -0,0 +1,163 @@
+"""
+Async Loan Controller - REST API endpoints peminjaman untuk mode ASGI
+
+Route, query parameter dan format response sama dengan
+app.controllers.loan_controller; hanya service yang dipakai async.
+"""
+
+from quart import Blueprint, request, jsonify
+
+from app.asgi.request_helper import read_json_body
+from app.controllers.loan_controller import parse_include_archived, parse_loan_filters
+from app.services import async_loan_service
+
+
+# Blueprint async untuk loan routes
+loan_bp = Blueprint('loans', __name__, url_prefix='/api/loans')
+
+
+@loan_bp.route('', methods=['GET'])
+async def get_all_loans():
+    """
+    GET /api/loans
+    Mendapatkan daftar semua peminjaman
+    """
+    filters = parse_loan_filters(request.args)
+    result = await async_loan_service.get_all_loans(filters if filters else None)
+    
+    status_code = 200 if result['success'] else 500
+    return jsonify(result), status_code
+
+
+@loan_bp.route('/<int:loan_id>', methods=['GET'])
+async def get_loan(loan_id):
+    """
+    GET /api/loans/:id
+    Mendapatkan detail peminjaman berdasarkan ID
+    """
+    result = await async_loan_service.get_loan_by_id(loan_id)
+    
+    return jsonify(result), 200 if result['success'] else 404
+
+
+@loan_bp.route('', methods=['POST'])
+async def create_loan():
+    """
+    POST /api/loans
+    Membuat peminjaman baru
+    """
+    data, error_response = await read_json_body()
+    if error_response:
+        return error_response
+    
+    result = await async_loan_service.create_loan(data)
+    
+    return jsonify(result), 201 if result['success'] else 400
+
+
+@loan_bp.route('/<int:loan_id>', methods=['PUT'])
+async def update_loan(loan_id):
+    """
+    PUT /api/loans/:id
+    Update data peminjaman (perpanjang, dll)
+    """
+    data, error_response = await read_json_body()
+    if error_response:
+        return error_response
+    
+    result = await async_loan_service.update_loan(loan_id, data)
+    
+    if result is None:
+        return jsonify({
+            'success': False,
+            'message': f'Peminjaman dengan ID {loan_id} tidak ditemukan',
+            'data': None
+        }), 404
+    
+    return jsonify(result), 200 if result['success'] else 400
+
+
+@loan_bp.route('/<int:loan_id>/return', methods=['PUT'])
+async def return_book(loan_id):
+    """
+    PUT /api/loans/:id/return
+    Proses pengembalian buku
+    """
+    return_date = None
+    
+    if request.is_json:
+        data = await request.get_json()
+        if data and 'return_date' in data:
+            return_date = data['return_date']
+    
+    result = await async_loan_service.return_book(loan_id, return_date)
+    
+    if result['success']:
+        return jsonify(result), 200
+    elif 'tidak ditemukan' in result.get('message', ''):
+        return jsonify(result), 404
+    else:
+        return jsonify(result), 400
+
+
+@loan_bp.route('/<int:loan_id>', methods=['DELETE'])
+async def delete_loan(loan_id):
+    """
+    DELETE /api/loans/:id
+    Menghapus data peminjaman
+    """
+    success = await async_loan_service.delete_loan(loan_id)
+    
+    if success is None:
+        return jsonify({
+            'success': False,
+            'message': f'Peminjaman dengan ID {loan_id} tidak ditemukan'
+        }), 404
+    
+    if success:
+        return jsonify({
+            'success': True,
+            'message': 'Peminjaman berhasil dihapus'
+        }), 200
+    else:
+        return jsonify({
+            'success': False,
+            'message': 'Gagal menghapus peminjaman'
+        }), 500
+
+
+@loan_bp.route('/overdue', methods=['GET'])
+async def get_overdue_loans():
+    """
+    GET /api/loans/overdue
+    Mendapatkan daftar peminjaman yang terlambat
+    """
+    result = await async_loan_service.get_overdue_loans()
+    
+    status_code = 200 if result['success'] else 500
+    return jsonify(result), status_code
+
+
+@loan_bp.route('/borrower/<borrower_name>', methods=['GET'])
+async def get_loans_by_borrower(borrower_name):
+    """
+    GET /api/loans/borrower/:borrower_name
+    Mendapatkan peminjaman berdasarkan nama peminjam
+    """
+    result = await async_loan_service.get_loans_by_borrower(
+        borrower_name, parse_include_archived(request.args))
+    
+    status_code = 200 if result['success'] else 500
+    return jsonify(result), status_code
+
+
+@loan_bp.route('/borrowed', methods=['GET'])
+async def get_borrowed_loans():
+    """
+    GET /api/loans/borrowed
+    Mendapatkan semua peminjaman yang sedang berjalan
+    """
+    result = await async_loan_service.get_all_loans({'status': 'borrowed'})
+    
+    status_code = 200 if result['success'] else 500
+    return jsonify(result), status_code
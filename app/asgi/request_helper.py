@@ -0,0 +1,29 @@
+"""
+Helper request untuk controller async (Quart)
+"""
+
+from quart import request, jsonify
+
+
+async def read_json_body():
+    """
+    Membaca body JSON request
+    
+    Returns:
+        tuple: (data, error_response) - salah satunya None
+    """
+    if not request.is_json:
+        return None, (jsonify({
+            'success': False,
+            'message': 'Content-Type harus application/json'
+        }), 400)
+    
+    data = await request.get_json()
+    
+    if not data:
+        return None, (jsonify({
+            'success': False,
+            'message': 'Request body tidak boleh kosong'
+        }), 400)
+    
+    return data, None
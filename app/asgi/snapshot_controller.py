@@ -0,0 +1,73 @@
+"""
+Async Snapshot Controller - REST API endpoints snapshot kolumnar untuk mode ASGI
+"""
+
+from quart import Blueprint, jsonify, request, send_file
+
+from app.controllers.snapshot_controller import parse_snapshot_mode, snapshot_file
+from app.services import async_snapshot_service
+
+
+# Blueprint async untuk snapshot routes
+snapshot_bp = Blueprint('snapshots', __name__, url_prefix='/api/snapshots')
+
+
+@snapshot_bp.route('', methods=['POST'])
+async def create_snapshot():
+    """
+    POST /api/snapshots
+    Membuat snapshot books dan loans (lihat controller sync)
+    """
+    mode, error = parse_snapshot_mode(await request.get_json(silent=True))
+    if error:
+        return jsonify({'success': False, 'message': error, 'data': None}), 400
+
+    result = await async_snapshot_service.export_snapshot(mode)
+
+    if result['success']:
+        return jsonify(result), 201
+    elif 'sedang berjalan' in result.get('message', ''):
+        return jsonify(result), 409
+    else:
+        return jsonify(result), 500
+
+
+@snapshot_bp.route('', methods=['GET'])
+async def get_snapshot_manifest():
+    """
+    GET /api/snapshots
+    Manifest snapshot terakhir
+    """
+    result = await async_snapshot_service.get_manifest()
+
+    status_code = 200 if result['success'] else 404
+    return jsonify(result), status_code
+
+
+@snapshot_bp.route('/verify', methods=['GET'])
+async def verify_snapshot():
+    """
+    GET /api/snapshots/verify
+    Mencocokkan ukuran dan sha256 setiap file dengan manifest
+    """
+    result = await async_snapshot_service.verify_snapshot()
+
+    status_code = 200 if result['success'] else 404
+    return jsonify(result), status_code
+
+
+@snapshot_bp.route('/files/<name>', methods=['GET'])
+async def download_snapshot_file(name):
+    """
+    GET /api/snapshots/files/<name>
+    Download file snapshot (hanya file yang tercatat di manifest)
+    """
+    path, mimetype = snapshot_file(name)
+    if path is None:
+        return jsonify({
+            'success': False,
+            'message': f'File snapshot {name} tidak ditemukan'
+        }), 404
+
+    return await send_file(path, mimetype=mimetype, as_attachment=True,
+                           attachment_filename=name)
@@ -0,0 +1,86 @@
+"""
+Async Statistics Controller - REST API endpoints statistik untuk mode ASGI
+"""
+
+from quart import Blueprint, jsonify, request
+
+from app.controllers.statistics_controller import (
+    parse_overdue_limit, parse_popular_args, parse_timeseries_args
+)
+from app.services import async_statistics_service
+
+
+# Blueprint async untuk statistics routes
+statistics_bp = Blueprint('statistics', __name__, url_prefix='/api/statistics')
+
+
+@statistics_bp.route('', methods=['GET'])
+async def get_statistics():
+    """
+    GET /api/statistics
+    Mendapatkan statistik lengkap perpustakaan
+    """
+    result = await async_statistics_service.get_library_statistics()
+    
+    status_code = 200 if result['success'] else 500
+    return jsonify(result), status_code
+
+
+@statistics_bp.route('/categories', methods=['GET'])
+async def get_category_statistics():
+    """
+    GET /api/statistics/categories
+    Mendapatkan statistik per kategori
+    """
+    result = await async_statistics_service.get_category_statistics()
+    
+    status_code = 200 if result['success'] else 500
+    return jsonify(result), status_code
+
+
+@statistics_bp.route('/overdue', methods=['GET'])
+async def get_overdue_statistics():
+    """
+    GET /api/statistics/overdue
+    Analitik keterlambatan (lihat controller sync)
+    """
+    limit, error = parse_overdue_limit(request.args)
+    if error:
+        return jsonify({'success': False, 'message': error, 'data': None}), 400
+
+    result = await async_statistics_service.get_overdue_statistics(limit)
+
+    status_code = 200 if result['success'] else 500
+    return jsonify(result), status_code
+
+
+@statistics_bp.route('/timeseries', methods=['GET'])
+async def get_circulation_timeseries():
+    """
+    GET /api/statistics/timeseries
+    Timeseries sirkulasi (lihat controller sync)
+    """
+    params, error = parse_timeseries_args(request.args)
+    if error:
+        return jsonify({'success': False, 'message': error, 'data': None}), 400
+
+    result = await async_statistics_service.get_circulation_timeseries(*params)
+
+    status_code = 200 if result['success'] else 500
+    return jsonify(result), status_code
+
+
+@statistics_bp.route('/popular', methods=['GET'])
+async def get_popular_statistics():
+    """
+    GET /api/statistics/popular
+    Top-N buku dan peminjam per window (lihat controller sync)
+    """
+    params, error = parse_popular_args(request.args)
+    if error:
+        return jsonify({'success': False, 'message': error, 'data': None}), 400
+
+    result = await async_statistics_service.get_popular(*params)
+
+    status_code = 200 if result['success'] else 500
+    return jsonify(result), status_code
@@ -0,0 +1,17 @@
+"""
+Package commands - Flask CLI commands
+"""
+from .database_commands import register_database_commands
+
+
+def register_commands(app):
+    """
+    Mendaftarkan semua CLI command ke Flask app
+
+    Args:
+        app: Flask application instance
+    """
+    register_database_commands(app)
+
+
+__all__ = ['register_commands']
@@ -0,0 +1,266 @@
+"""
+Database Commands - CLI untuk migrasi index dan verifikasi query plan
+
+Cara pakai:
+    flask init-db                   # Membuat tabel yang belum ada
+    flask init-db --drop            # Drop lalu buat ulang semua tabel
+    flask replica-status            # Lag dan status routing read replica
+    flask create-indexes            # CREATE INDEX CONCURRENTLY (PostgreSQL)
+    flask create-indexes --blocking # CREATE INDEX biasa
+    flask explain-queries           # EXPLAIN query panas repository
+    flask archive-loans             # Pindahkan peminjaman lama ke loans_archive
+    flask partition-loans --convert # Ubah loans menjadi partitioned table (PostgreSQL)
+    flask partition-loans           # Buat partisi ke depan, buang partisi kadaluarsa
+    flask purge-deleted-books       # Pindahkan buku soft delete ke books_tombstone
+    flask export-snapshot           # Snapshot kolumnar books/loans (Arrow IPC/Parquet)
+    flask export-snapshot --incremental  # Hanya row yang berubah sejak snapshot terakhir
+    flask verify-snapshot           # Cocokkan checksum file snapshot dengan manifest
+    flask rebuild-popularity        # Isi ulang hitungan top-N popularitas dari loans
+"""
+
+from datetime import datetime, timedelta
+
+import click
+from flask import current_app
+
+from app.database import db, db_connection, replica_router
+from app.database.indexes import create_indexes, explain_hot_queries
+from app.database.partitioning import (
+    convert_to_partitioned, is_partitioned, is_supported, maintain_partitions
+)
+from app.repositories import loan_repository
+from app.services import book_service, snapshot_service, statistics_service
+
+
+@click.command('init-db')
+@click.option('--drop', is_flag=True,
+              help='Drop semua tabel sebelum dibuat ulang (data hilang)')
+def init_db_command(drop):
+    """Membuat tabel database (tidak lagi dijalankan otomatis saat boot)"""
+    app = current_app._get_current_object()
+
+    if drop:
+        click.confirm('Semua tabel dan data akan dihapus. Lanjutkan?', abort=True)
+        db_connection.drop_tables(app)
+        click.echo('Semua tabel dihapus')
+
+    db_connection.create_tables(app)
+    click.echo('Tabel database siap: ' + ', '.join(sorted(db.metadata.tables)))
+
+    if app.config.get('LOANS_PARTITIONED') and is_supported(db.engine):
+        result = convert_to_partitioned(
+            db.engine, app.config.get('LOAN_PARTITION_MONTHS_AHEAD', 3))
+        click.echo(f'Tabel loans dipartisi per bulan ({result["partitions"]} partisi)')
+
+
+@click.command('replica-status')
+def replica_status_command():
+    """Menampilkan lag read replica dan tujuan query read-only"""
+    if not replica_router.enabled:
+        click.echo('Read replica tidak dikonfigurasi (REPLICA_DATABASE_URI kosong)')
+        return
+
+    try:
+        lag = replica_router.measure_lag(db.engines['replica'])
+    except Exception as e:
+        raise click.ClickException(f'Replica tidak bisa dihubungi: {e}')
+
+    target = 'replica' if lag <= replica_router.max_lag else 'primary (fallback)'
+    click.echo(f'Lag replica: {lag:.2f} detik (batas {replica_router.max_lag})')
+    click.echo(f'Query read-only dibaca dari: {target}')
+
+
+@click.command('create-indexes')
+@click.option('--blocking', is_flag=True,
+              help='Jangan gunakan CREATE INDEX CONCURRENTLY')
+def create_indexes_command(blocking):
+    """Membuat index yang didefinisikan di model"""
+    created = create_indexes(db.engine, concurrently=not blocking)
+
+    if created:
+        for name in created:
+            click.echo(f'Index dibuat: {name}')
+    else:
+        click.echo('Semua index sudah ada')
+
+
+@click.command('explain-queries')
+@click.option('--no-analyze', is_flag=True,
+              help='Lewati ANALYZE sebelum EXPLAIN')
+def explain_queries_command(no_analyze):
+    """Menampilkan query plan untuk query panas repository"""
+    results = explain_hot_queries(db.engine, analyze_tables=not no_analyze)
+
+    seq_scans = []
+    for name, result in results.items():
+        marker = 'SEQ SCAN' if result['seq_scan'] else 'OK'
+        click.echo(f'[{marker}] {name}')
+        for line in result['plan']:
+            click.echo(f'    {line}')
+        if result['seq_scan']:
+            seq_scans.append(name)
+
+    if seq_scans:
+        raise click.ClickException(
+            f'{len(seq_scans)} query masih sequential scan: {", ".join(seq_scans)}'
+        )
+
+
+@click.command('archive-loans')
+@click.option('--retention-days', type=int, default=None,
+              help='Arsipkan peminjaman yang dikembalikan lebih dari n hari lalu '
+                   '(default LOAN_ARCHIVE_RETENTION_DAYS)')
+@click.option('--batch-size', type=int, default=None,
+              help='Jumlah row per transaksi (default LOAN_ARCHIVE_BATCH_SIZE)')
+def archive_loans_command(retention_days, batch_size):
+    """Memindahkan peminjaman lama yang sudah dikembalikan ke loans_archive"""
+    config = current_app.config
+    if retention_days is None:
+        retention_days = config.get('LOAN_ARCHIVE_RETENTION_DAYS', 365)
+    if batch_size is None:
+        batch_size = config.get('LOAN_ARCHIVE_BATCH_SIZE', 1000)
+    if retention_days < 0 or batch_size < 1:
+        raise click.BadParameter('retention-days >= 0 dan batch-size >= 1')
+
+    cutoff = datetime.utcnow().date() - timedelta(days=retention_days)
+    click.echo(f'Mengarsipkan peminjaman returned dengan return_date < {cutoff.isoformat()}')
+
+    def on_batch(moved, total):
+        click.echo(f'  batch {moved} row, total {total}')
+
+    total = loan_repository.archive_returned(cutoff, batch_size, on_batch)
+    click.echo(f'{total} peminjaman dipindahkan ke loans_archive')
+
+
+@click.command('partition-loans')
+@click.option('--convert', is_flag=True,
+              help='Ubah tabel loans biasa menjadi partitioned table (tabel terkunci selama proses)')
+@click.option('--months-ahead', type=int, default=None,
+              help='Jumlah partisi bulan ke depan (default LOAN_PARTITION_MONTHS_AHEAD)')
+@click.option('--retention-months', type=int, default=None,
+              help='Buang partisi kosong yang lebih tua dari n bulan '
+                   '(default LOAN_PARTITION_RETENTION_MONTHS, 0 = tidak pernah)')
+@click.option('--detach-only', is_flag=True,
+              help='Partisi kadaluarsa hanya di-detach, tidak di-drop')
+def partition_loans_command(convert, months_ahead, retention_months, detach_only):
+    """Memelihara partisi bulanan tabel loans (PostgreSQL)"""
+    config = current_app.config
+    if months_ahead is None:
+        months_ahead = config.get('LOAN_PARTITION_MONTHS_AHEAD', 3)
+    if retention_months is None:
+        retention_months = config.get('LOAN_PARTITION_RETENTION_MONTHS', 0)
+
+    engine = db.engine
+    if not is_supported(engine):
+        raise click.ClickException('Partisi tabel loans hanya didukung di PostgreSQL')
+
+    with engine.connect() as conn:
+        partitioned = is_partitioned(conn)
+
+    if convert and not partitioned:
+        click.confirm('Tabel loans akan dikunci selama data disalin ke partisi. Lanjutkan?',
+                      abort=True)
+        result = convert_to_partitioned(engine, months_ahead)
+        click.echo(f'{result["rows"]} peminjaman disalin ke {result["partitions"]} partisi bulanan')
+    elif not partitioned:
+        raise click.ClickException(
+            'Tabel loans belum dipartisi: jalankan flask partition-loans --convert')
+
+    result = maintain_partitions(engine, months_ahead, retention_months, detach_only)
+    for name in result['created']:
+        click.echo(f'Partisi dibuat: {name}')
+    if result['moved_from_default']:
+        click.echo(f'{result["moved_from_default"]} row dipindahkan dari partisi default')
+    for name in result['dropped']:
+        click.echo(f'Partisi dibuang: {name}')
+    for name in result['detached']:
+        click.echo(f'Partisi di-detach: {name}')
+    for name, rows in result['kept'].items():
+        click.echo(f'Partisi kadaluarsa dipertahankan: {name} masih berisi {rows} row '
+                   f'(peminjaman aktif atau belum diarsipkan archive-loans)')
+
+
+@click.command('purge-deleted-books')
+@click.option('--batch-size', type=int, default=None,
+              help='Jumlah buku per transaksi (default BOOK_PURGE_BATCH_SIZE)')
+@click.option('--pause', type=float, default=None,
+              help='Jeda detik antar batch (default BOOK_PURGE_PAUSE_SECONDS)')
+def purge_deleted_books_command(batch_size, pause):
+    """Memindahkan buku soft delete tanpa riwayat di loans ke books_tombstone"""
+    config = current_app.config
+    if batch_size is None:
+        batch_size = config.get('BOOK_PURGE_BATCH_SIZE', 500)
+    if pause is None:
+        pause = config.get('BOOK_PURGE_PAUSE_SECONDS', 0.1)
+    if batch_size < 1 or pause < 0:
+        raise click.BadParameter('batch-size >= 1 dan pause >= 0')
+
+    def on_batch(ids, total):
+        click.echo(f'  batch {len(ids)} buku, total {total}')
+
+    result = book_service.purge_deleted_books(batch_size, pause, on_batch)
+    if not result['success']:
+        raise click.ClickException(result['message'])
+    click.echo(result['message'])
+
+
+@click.command('export-snapshot')
+@click.option('--incremental', is_flag=True,
+              help='Hanya row yang berubah sejak snapshot terakhir (part tambahan)')
+def export_snapshot_command(incremental):
+    """Menulis snapshot kolumnar books dan loans ke SNAPSHOT_DIR"""
+    result = snapshot_service.export_snapshot('incremental' if incremental else 'full')
+    if not result['success']:
+        raise click.ClickException(result['message'])
+
+    manifest = result['data']
+    click.echo(f"{result['message']} (sequence {manifest['sequence']}, "
+               f"as_of {manifest['as_of']})")
+    deleted = manifest['history'][-1].get('deleted', {})
+    for table, entry in manifest['tables'].items():
+        parts = [part for part in entry['parts'] if part['sequence'] == manifest['sequence']]
+        written = parts[0]['rows'] if parts else 0
+        click.echo(f'  {table:<6} +{written} row, -{deleted.get(table, 0)} dihapus, '
+                   f'total {entry["rows"]} row di {len(entry["parts"])} file')
+
+
+@click.command('verify-snapshot')
+def verify_snapshot_command():
+    """Mencocokkan ukuran dan sha256 file snapshot dengan manifest"""
+    result = snapshot_service.verify_snapshot()
+    if not result['success']:
+        raise click.ClickException(result['message'])
+
+    for problem in result['data']['problems']:
+        click.echo(f"  {problem['file']}: {problem['error']}")
+    if not result['data']['valid']:
+        raise click.ClickException(result['message'])
+    click.echo(result['message'])
+
+
+@click.command('rebuild-popularity')
+def rebuild_popularity_command():
+    """Mengisi ulang hitungan popularitas (window terbesar) dari loans dan arsip"""
+    result = statistics_service.rebuild_popularity()
+    if not result['success']:
+        raise click.ClickException(result['message'])
+    click.echo(result['message'])
+
+
+def register_database_commands(app):
+    """
+    Mendaftarkan command database ke Flask app
+
+    Args:
+        app: Flask application instance
+    """
+    app.cli.add_command(init_db_command)
+    app.cli.add_command(replica_status_command)
+    app.cli.add_command(create_indexes_command)
+    app.cli.add_command(explain_queries_command)
+    app.cli.add_command(archive_loans_command)
+    app.cli.add_command(partition_loans_command)
+    app.cli.add_command(purge_deleted_books_command)
+    app.cli.add_command(export_snapshot_command)
+    app.cli.add_command(verify_snapshot_command)
+    app.cli.add_command(rebuild_popularity_command)
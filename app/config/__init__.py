@@ -1,6 +1,18 @@
 """
 Package config
 """
-from .config import Config, config_by_name
+from .config import (
+    Config,
+    build_engine_options,
+    config_by_name,
+    default_worker_count,
+    get_config
+)
 
-__all__ = ['Config', 'config_by_name']
+__all__ = [
+    'Config',
+    'build_engine_options',
+    'config_by_name',
+    'default_worker_count',
+    'get_config'
+]
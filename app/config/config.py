@@ -10,6 +10,52 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+def default_worker_count():
+    """
+    Jumlah worker process default: (2 x CPU) + 1
+
+    Returns:
+        int: Jumlah worker
+    """
+    return (os.cpu_count() or 1) * 2 + 1
+
+
+def build_engine_options(workers, threads, max_connections, reserved_connections=10,
+                         pool_recycle=3600):
+    """
+    Menurunkan setting connection pool dari jumlah worker dan thread
+
+    Setiap worker process memiliki pool sendiri dan setiap thread memakai
+    paling banyak satu koneksi untuk request, sehingga pool_size = threads.
+    Overflow memberi ruang untuk koneksi tambahan sesaat (mis. EXPLAIN slow
+    query). Total koneksi semua worker dibatasi agar tidak melebihi
+    max_connections database dikurangi koneksi cadangan (admin, migrasi).
+
+    Env DB_POOL_SIZE / DB_MAX_OVERFLOW / DB_POOL_TIMEOUT menimpa hasil turunan.
+
+    Args:
+        workers: Jumlah worker process
+        threads: Jumlah thread per worker
+        max_connections: max_connections server database
+        reserved_connections: Koneksi yang tidak dipakai aplikasi
+        pool_recycle: Recycle koneksi setelah n detik
+
+    Returns:
+        dict: SQLALCHEMY_ENGINE_OPTIONS
+    """
+    budget = max(1, (max_connections - reserved_connections) // max(1, workers))
+    pool_size = min(max(1, threads), budget)
+    max_overflow = min(max(1, threads // 2), budget - pool_size)
+
+    return {
+        'pool_size': int(os.getenv('DB_POOL_SIZE', pool_size)),
+        'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', max_overflow)),
+        'pool_timeout': float(os.getenv('DB_POOL_TIMEOUT', '10')),  # Gagal cepat saat pool habis
+        'pool_recycle': pool_recycle,
+        'pool_pre_ping': True,     # Cek koneksi sebelum digunakan
+    }
+
+
 class Config:
     """
     Kelas konfigurasi utama aplikasi
@@ -27,12 +73,28 @@ class Config:
     )
     SQLALCHEMY_TRACK_MODIFICATIONS = False  # Disable modification tracking untuk performa
     
-    # PostgreSQL specific settings
-    SQLALCHEMY_ENGINE_OPTIONS = {
-        'pool_size': 10,           # Jumlah koneksi dalam pool
-        'pool_recycle': 3600,      # Recycle koneksi setiap 1 jam
-        'pool_pre_ping': True,     # Cek koneksi sebelum digunakan
-    }
+    # Read replica (opsional): method repository read-only dibaca dari bind 'replica'
+    REPLICA_DATABASE_URI = os.getenv('REPLICA_DATABASE_URI')
+    SQLALCHEMY_BINDS = {'replica': REPLICA_DATABASE_URI} if REPLICA_DATABASE_URI else {}
+    REPLICA_MAX_LAG_SECONDS = float(os.getenv('REPLICA_MAX_LAG_SECONDS', '5'))  # Lebih dari ini: baca dari primary
+    REPLICA_LAG_CHECK_INTERVAL = float(os.getenv('REPLICA_LAG_CHECK_INTERVAL', '5'))
+    
+    # Connection pool - diturunkan dari jumlah worker process dan thread per worker
+    WEB_CONCURRENCY = int(os.getenv('WEB_CONCURRENCY', '1'))
+    WEB_THREADS = int(os.getenv('WEB_THREADS', '10'))
+    DB_MAX_CONNECTIONS = int(os.getenv('DB_MAX_CONNECTIONS', '100'))  # max_connections PostgreSQL
+    SQLALCHEMY_ENGINE_OPTIONS = build_engine_options(
+        WEB_CONCURRENCY, WEB_THREADS, DB_MAX_CONNECTIONS,
+        pool_recycle=3600          # Recycle koneksi setiap 1 jam
+    )
+    # Jumlah koneksi yang dibuka saat startup (0 = nonaktif)
+    DB_POOL_WARMUP = int(os.getenv('DB_POOL_WARMUP', '0'))
+    # psycopg: prepared statement server-side setelah n eksekusi query yang sama per koneksi
+    # ('none' menonaktifkan, mis. di belakang PgBouncer mode transaction)
+    DB_PREPARE_THRESHOLD = (
+        None if os.getenv('DB_PREPARE_THRESHOLD', '1').lower() == 'none'
+        else int(os.getenv('DB_PREPARE_THRESHOLD', '1'))
+    )
     
     # CORS configuration
     CORS_HEADERS = 'Content-Type'
@@ -50,11 +112,111 @@ class Config:
     
     # Logging
     LOG_FILE = 'logs/app.log'
+    
+    # Kompresi response sesuai Accept-Encoding (zstd/br jika dependency terpasang, gzip)
+    COMPRESSION_ENABLED = os.getenv('COMPRESSION_ENABLED', 'true').lower() == 'true'
+    COMPRESSION_ALGORITHMS = os.getenv('COMPRESSION_ALGORITHMS', 'zstd,br,gzip')  # urutan preferensi
+    COMPRESSION_MIN_SIZE = int(os.getenv('COMPRESSION_MIN_SIZE', '1024'))  # byte
+    # Level: lihat benchmarks/compression_benchmark.py (CPU vs ukuran)
+    COMPRESSION_GZIP_LEVEL = int(os.getenv('COMPRESSION_GZIP_LEVEL', '6'))
+    COMPRESSION_BROTLI_QUALITY = int(os.getenv('COMPRESSION_BROTLI_QUALITY', '4'))
+    COMPRESSION_ZSTD_LEVEL = int(os.getenv('COMPRESSION_ZSTD_LEVEL', '3'))
+    COMPRESSION_STREAM_FLUSH_BYTES = int(os.getenv('COMPRESSION_STREAM_FLUSH_BYTES', str(64 * 1024)))
+    
+    # Server-Timing breakdown per fase (sql, orm, serialize, json, ...)
+    SERVER_TIMING_ENABLED = os.getenv('SERVER_TIMING_ENABLED', 'false').lower() == 'true'
+    SERVER_TIMING_ACCESS_LOG = os.getenv('SERVER_TIMING_ACCESS_LOG', 'false').lower() == 'true'
+    
+    # Profiling per request on-demand (header X-Profile atau sampling)
+    PROFILING_ENABLED = os.getenv('PROFILING_ENABLED', 'false').lower() == 'true'
+    PROFILING_MODE = os.getenv('PROFILING_MODE', 'cprofile')  # 'cprofile' atau 'sample'
+    PROFILING_SAMPLE_RATE = float(os.getenv('PROFILING_SAMPLE_RATE', '0.0'))
+    PROFILING_SAMPLE_INTERVAL_MS = int(os.getenv('PROFILING_SAMPLE_INTERVAL_MS', '5'))
+    PROFILING_TOKEN = os.getenv('PROFILING_TOKEN')
+    PROFILING_DIR = os.getenv('PROFILING_DIR', 'logs/profiles')
+    PROFILING_MAX_FILES = int(os.getenv('PROFILING_MAX_FILES', '50'))
+    
+    # Profiling alokasi memori (tracemalloc) per route, hasil di /debug/allocations
+    ALLOCATION_PROFILING_ENABLED = os.getenv('ALLOCATION_PROFILING_ENABLED', 'false').lower() == 'true'
+    ALLOCATION_PROFILING_ROUTES = os.getenv('ALLOCATION_PROFILING_ROUTES', '')  # mis. '/api/books,/api/loans'
+    ALLOCATION_PROFILING_TOP_SITES = int(os.getenv('ALLOCATION_PROFILING_TOP_SITES', '10'))
+    ALLOCATION_PROFILING_FRAMES = int(os.getenv('ALLOCATION_PROFILING_FRAMES', '30'))
+    ALLOCATION_PROFILING_REPORT = os.getenv('ALLOCATION_PROFILING_REPORT', 'logs/allocations.json')
+    
+    # Prometheus metrics di /metrics
+    # Multi-process: set env PROMETHEUS_MULTIPROC_DIR ke direktori kosong yang sama
+    # untuk semua worker sebelum aplikasi dijalankan
+    METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'true').lower() == 'true'
+    
+    # Request coalescing (single-flight) untuk statistik, kategori dan search:
+    # panggilan identik yang bersamaan dieksekusi sekali. Window > 0: hasil juga
+    # dipakai ulang selama n detik setelah selesai (data bisa tertinggal n detik)
+    COALESCE_ENABLED = os.getenv('COALESCE_ENABLED', 'true').lower() == 'true'
+    COALESCE_WINDOW_SECONDS = float(os.getenv('COALESCE_WINDOW_SECONDS', '0'))
+    
+    # Archival (flask archive-loans): peminjaman 'returned' yang dikembalikan
+    # lebih dari n hari lalu dipindahkan ke loans_archive per batch
+    LOAN_ARCHIVE_RETENTION_DAYS = int(os.getenv('LOAN_ARCHIVE_RETENTION_DAYS', '365'))
+    LOAN_ARCHIVE_BATCH_SIZE = int(os.getenv('LOAN_ARCHIVE_BATCH_SIZE', '1000'))
+    
+    # Purge buku soft delete (flask purge-deleted-books): buku tanpa row di
+    # loans dipindahkan ke books_tombstone per batch, dengan jeda antar batch
+    BOOK_PURGE_BATCH_SIZE = int(os.getenv('BOOK_PURGE_BATCH_SIZE', '500'))
+    BOOK_PURGE_PAUSE_SECONDS = float(os.getenv('BOOK_PURGE_PAUSE_SECONDS', '0.1'))
+    
+    # Analitik overdue (GET /api/statistics/overdue): denda per hari terlambat,
+    # batas denda per peminjaman (0 = tanpa batas), batas aging bucket (hari)
+    # dan lama laporan di-cache per tanggal (dibuang juga saat buku dikembalikan)
+    LATE_FEE_PER_DAY = int(os.getenv('LATE_FEE_PER_DAY', '1000'))
+    LATE_FEE_MAX_PER_LOAN = int(os.getenv('LATE_FEE_MAX_PER_LOAN', '0'))
+    OVERDUE_AGING_BUCKETS = os.getenv('OVERDUE_AGING_BUCKETS', '7,30,90')
+    OVERDUE_ANALYTICS_CACHE_SECONDS = float(os.getenv('OVERDUE_ANALYTICS_CACHE_SECONDS', '300'))
+    
+    # Timeseries sirkulasi (GET /api/statistics/timeseries): jumlah maksimum
+    # bucket historis (hari/minggu/bulan yang sudah lewat) di cache, 0 = tanpa
+    # cache, dan umur bucket di cache (perubahan dari worker lain)
+    TIMESERIES_CACHE_BUCKETS = int(os.getenv('TIMESERIES_CACHE_BUCKETS', '5000'))
+    TIMESERIES_CACHE_SECONDS = float(os.getenv('TIMESERIES_CACHE_SECONDS', '300'))
+    
+    # Top-N popularitas (GET /api/statistics/popular): window hari yang
+    # tersedia, file state gabungan semua worker ('' = hanya di memori) dan
+    # interval penggabungan hitungan worker ke file tersebut
+    POPULARITY_WINDOWS = os.getenv('POPULARITY_WINDOWS', '7,30')
+    POPULARITY_STATE_FILE = os.getenv('POPULARITY_STATE_FILE', 'instance/popularity.json')
+    POPULARITY_PERSIST_SECONDS = float(os.getenv('POPULARITY_PERSIST_SECONDS', '60'))
+    
+    # Snapshot kolumnar books/loans (flask export-snapshot, POST /api/snapshots):
+    # format 'arrow' (Arrow IPC, bisa di-memory-map) atau 'parquet', kompresi
+    # 'zstd'/'lz4'/'none', row per fetch server-side cursor, dan mundur
+    # watermark mode incremental (transaksi yang commit terlambat, lag replica)
+    SNAPSHOT_DIR = os.getenv('SNAPSHOT_DIR', 'snapshots')
+    SNAPSHOT_FORMAT = os.getenv('SNAPSHOT_FORMAT', 'arrow')
+    SNAPSHOT_COMPRESSION = os.getenv('SNAPSHOT_COMPRESSION', 'zstd')
+    SNAPSHOT_CHUNK_SIZE = int(os.getenv('SNAPSHOT_CHUNK_SIZE', '10000'))
+    SNAPSHOT_OVERLAP_SECONDS = float(os.getenv('SNAPSHOT_OVERLAP_SECONDS', '300'))
+    
+    # Partisi bulanan tabel loans berdasarkan loan_date (PostgreSQL saja,
+    # flask partition-loans). LOANS_PARTITIONED: init-db langsung membuat
+    # loans sebagai partitioned table. Retensi 0 = partisi lama tidak dibuang
+    LOANS_PARTITIONED = os.getenv('LOANS_PARTITIONED', 'false').lower() == 'true'
+    LOAN_PARTITION_MONTHS_AHEAD = int(os.getenv('LOAN_PARTITION_MONTHS_AHEAD', '3'))
+    LOAN_PARTITION_RETENTION_MONTHS = int(os.getenv('LOAN_PARTITION_RETENTION_MONTHS', '0'))
+    
+    # SQL instrumentation: jumlah query, N+1 detection, slow query log
+    SQL_INSTRUMENTATION_ENABLED = os.getenv('SQL_INSTRUMENTATION_ENABLED', 'true').lower() == 'true'
+    SQL_INSTRUMENTATION_SAMPLE_RATE = float(os.getenv('SQL_INSTRUMENTATION_SAMPLE_RATE', '1.0'))
+    SQL_SLOW_QUERY_MS = int(os.getenv('SQL_SLOW_QUERY_MS', '100'))
+    SQL_EXPLAIN_SLOW_QUERIES = True
+    SQL_N_PLUS_ONE_THRESHOLD = int(os.getenv('SQL_N_PLUS_ONE_THRESHOLD', '5'))
+    SQL_N_PLUS_ONE_RAISE = os.getenv('SQL_N_PLUS_ONE_RAISE', 'false').lower() == 'true'
 
 
 class DevelopmentConfig(Config):
     """Konfigurasi untuk development"""
     DEBUG = True
+    
+    # N+1 langsung gagal agar terlihat saat development
+    SQL_N_PLUS_ONE_RAISE = True
 
 
 class ProductionConfig(Config):
@@ -62,17 +224,27 @@ class ProductionConfig(Config):
     DEBUG = False
     TESTING = False
     
-    # Production - lebih banyak pool connections
-    SQLALCHEMY_ENGINE_OPTIONS = {
-        'pool_size': 20,
-        'pool_recycle': 1800,
-        'pool_pre_ping': True,
-    }
+    # Production - worker sesuai jumlah CPU, pool dibagi rata ke semua worker
+    WEB_CONCURRENCY = int(os.getenv('WEB_CONCURRENCY', default_worker_count()))
+    SQLALCHEMY_ENGINE_OPTIONS = build_engine_options(
+        WEB_CONCURRENCY, Config.WEB_THREADS, Config.DB_MAX_CONNECTIONS,
+        pool_recycle=1800
+    )
+    # Production - seluruh pool dibuka saat startup
+    DB_POOL_WARMUP = int(os.getenv('DB_POOL_WARMUP', SQLALCHEMY_ENGINE_OPTIONS['pool_size']))
+    
+    # Production - hanya sampling, N+1 di-log tanpa menggagalkan request
+    SQL_INSTRUMENTATION_SAMPLE_RATE = float(os.getenv('SQL_INSTRUMENTATION_SAMPLE_RATE', '0.05'))
+    SQL_SLOW_QUERY_MS = int(os.getenv('SQL_SLOW_QUERY_MS', '250'))
+    SQL_N_PLUS_ONE_RAISE = False
 
 
 class TestingConfig(Config):
     """Konfigurasi untuk testing"""
     TESTING = True
+    SQL_N_PLUS_ONE_RAISE = True
+    # Hitungan popularitas tidak dibawa antar test run
+    POPULARITY_STATE_FILE = os.getenv('TEST_POPULARITY_STATE_FILE', '')
     # Bisa pakai SQLite untuk testing
     SQLALCHEMY_DATABASE_URI = os.getenv(
         'TEST_DATABASE_URI', 
@@ -87,3 +259,27 @@ config_by_name = {
     'testing': TestingConfig,
     'default': DevelopmentConfig
 }
+
+
+def get_config(name=None, default='default'):
+    """
+    Memilih kelas konfigurasi berdasarkan nama environment
+
+    Args:
+        name: Nama environment (default: env APP_ENV, lalu FLASK_ENV, lalu default)
+        default: Environment jika APP_ENV dan FLASK_ENV tidak di-set
+            (entry point server production memakai 'production')
+
+    Returns:
+        type: Kelas konfigurasi
+
+    Raises:
+        ValueError: Jika nama environment tidak dikenal
+    """
+    name = name or os.getenv('APP_ENV') or os.getenv('FLASK_ENV') or default
+    try:
+        return config_by_name[name.lower()]
+    except KeyError:
+        raise ValueError(
+            f"Environment '{name}' tidak dikenal, pilih salah satu: {', '.join(config_by_name)}"
+        )
@@ -5,59 +5,178 @@ Menghandle HTTP request/response untuk operasi Book
 """
 
 from flask import Blueprint, request, jsonify
-from app.services import book_service
+from app.services import book_service, loan_service
 from app.repositories import book_repository
 
 
 # Buat Blueprint untuk book routes
 book_bp = Blueprint('books', __name__, url_prefix='/api/books')
 
+# Batas jumlah ID + ISBN per request POST /api/books/lookup
+MAX_LOOKUP_ITEMS = 100
 
-@book_bp.route('', methods=['GET'])
-def get_all_books():
+# Ukuran halaman GET /api/books/:id/loans
+BOOK_LOANS_DEFAULT_LIMIT = 10
+BOOK_LOANS_MAX_LIMIT = 100
+
+
+def parse_book_filters(args):
     """
-    GET /api/books
-    Mendapatkan daftar semua buku
+    Parse query parameters list buku menjadi filters repository
+    Dipakai bersama oleh controller sync dan async
     
-    Query Parameters:
-        - category: Filter berdasarkan kategori
-        - available_only: (true/false) Hanya buku yang tersedia
-        - limit: Batasi jumlah hasil
-        - offset: Skip sejumlah record
-        - order_by: (title/year/created_at) Urutan sorting
+    Args:
+        args: Query parameters (MultiDict)
     
     Returns:
-        JSON: List buku dengan pagination info
+        dict: Filters
     """
-    # Parse query parameters
     filters = {}
     
-    category = request.args.get('category')
+    category = args.get('category')
     if category:
         filters['category'] = category
     
-    available_only = request.args.get('available_only', '').lower() == 'true'
+    available_only = args.get('available_only', '').lower() == 'true'
     if available_only:
         filters['available_only'] = True
     
-    limit = request.args.get('limit')
+    limit = args.get('limit')
     if limit:
         try:
             filters['limit'] = int(limit)
         except ValueError:
             pass
     
-    offset = request.args.get('offset')
+    offset = args.get('offset')
     if offset:
         try:
             filters['offset'] = int(offset)
         except ValueError:
             pass
     
-    order_by = request.args.get('order_by')
+    order_by = args.get('order_by')
     if order_by in ['title', 'year', 'created_at']:
         filters['order_by'] = order_by
     
+    return filters
+
+
+def parse_book_lookup(data):
+    """
+    Parse body POST /api/books/lookup
+    Dipakai bersama oleh controller sync dan async
+    
+    Args:
+        data (dict): Body JSON dengan key 'ids' dan/atau 'isbns'
+    
+    Returns:
+        tuple: (ids, isbns, error) - error berisi pesan jika body tidak valid;
+            duplikat dibuang dengan urutan input dipertahankan
+    """
+    ids = data.get('ids') or []
+    isbns = data.get('isbns') or []
+    
+    if not isinstance(ids, list) or not isinstance(isbns, list):
+        return None, None, 'ids dan isbns harus berupa list'
+    
+    if not ids and not isbns:
+        return None, None, 'Minimal satu id atau isbn harus diisi'
+    
+    parsed_ids = []
+    for value in ids:
+        if isinstance(value, bool):
+            return None, None, f'ID buku tidak valid: {value}'
+        try:
+            parsed_ids.append(int(value))
+        except (TypeError, ValueError):
+            return None, None, f'ID buku tidak valid: {value}'
+    
+    parsed_isbns = []
+    for value in isbns:
+        if not isinstance(value, (str, int)) or isinstance(value, bool) or not str(value).strip():
+            return None, None, f'ISBN tidak valid: {value}'
+        parsed_isbns.append(str(value).strip())
+    
+    parsed_ids = list(dict.fromkeys(parsed_ids))
+    parsed_isbns = list(dict.fromkeys(parsed_isbns))
+    
+    if len(parsed_ids) + len(parsed_isbns) > MAX_LOOKUP_ITEMS:
+        return None, None, f'Maksimal {MAX_LOOKUP_ITEMS} id dan isbn per request'
+    
+    return parsed_ids, parsed_isbns, None
+
+
+def parse_book_loans_args(args):
+    """
+    Parse query parameters GET /api/books/:id/loans
+    Dipakai bersama oleh controller sync dan async
+    
+    Args:
+        args: Query parameters (MultiDict)
+    
+    Returns:
+        tuple: (params, error) - params berisi status, limit, cursor dan
+            include_archived untuk LoanService.get_book_loans
+    """
+    status = args.get('status')
+    if status and status not in ['borrowed', 'returned', 'overdue']:
+        return None, f'Status tidak valid: {status}'
+    
+    try:
+        limit = int(args.get('limit', BOOK_LOANS_DEFAULT_LIMIT))
+    except ValueError:
+        return None, 'limit harus berupa angka'
+    if not 1 <= limit <= BOOK_LOANS_MAX_LIMIT:
+        return None, f'limit harus antara 1 dan {BOOK_LOANS_MAX_LIMIT}'
+    
+    cursor = args.get('cursor')
+    if cursor:
+        try:
+            cursor = int(cursor)
+        except ValueError:
+            return None, 'cursor tidak valid'
+    
+    return {
+        'status': status or None,
+        'limit': limit,
+        'cursor': cursor or None,
+        'include_archived': args.get('include_archived', '').lower() == 'true'
+    }, None
+
+
+def parse_include(args):
+    """
+    Parse parameter ?include=a,b menjadi set
+    
+    Args:
+        args: Query parameters (MultiDict)
+    
+    Returns:
+        set: Nama ekspansi yang diminta
+    """
+    return {value.strip() for value in args.get('include', '').split(',') if value.strip()}
+
+
+@book_bp.route('', methods=['GET'])
+def get_all_books():
+    """
+    GET /api/books
+    Mendapatkan daftar semua buku
+    
+    Query Parameters:
+        - category: Filter berdasarkan kategori
+        - available_only: (true/false) Hanya buku yang tersedia
+        - limit: Batasi jumlah hasil
+        - offset: Skip sejumlah record
+        - order_by: (title/year/created_at) Urutan sorting
+    
+    Returns:
+        JSON: List buku dengan pagination info
+    """
+    # Parse query parameters
+    filters = parse_book_filters(request.args)
+    
     # Panggil service
     result = book_service.get_all_books(filters if filters else None)
     
@@ -103,6 +222,46 @@ def get_book_by_isbn(isbn):
         }), 404
 
 
+@book_bp.route('/lookup', methods=['POST'])
+def lookup_books():
+    """
+    POST /api/books/lookup
+    Mengambil banyak buku sekaligus berdasarkan ID dan/atau ISBN
+    
+    Request Body (JSON):
+        - ids: List ID buku (optional)
+        - isbns: List ISBN (optional)
+    
+    Returns:
+        JSON: Hasil per input (null jika tidak ditemukan) dan daftar yang tidak ditemukan
+    """
+    if not request.is_json:
+        return jsonify({
+            'success': False,
+            'message': 'Content-Type harus application/json'
+        }), 400
+    
+    data = request.get_json()
+    
+    if not data:
+        return jsonify({
+            'success': False,
+            'message': 'Request body tidak boleh kosong'
+        }), 400
+    
+    ids, isbns, error = parse_book_lookup(data)
+    if error:
+        return jsonify({
+            'success': False,
+            'message': error
+        }), 400
+    
+    result = book_service.lookup_books(ids, isbns)
+    
+    status_code = 200 if result['success'] else 500
+    return jsonify(result), status_code
+
+
 @book_bp.route('/search', methods=['GET'])
 def search_books():
     """
@@ -165,10 +324,14 @@ def get_book(book_id):
     Path Parameters:
         - book_id: ID buku
     
+    Query Parameters:
+        - include: 'active_loans' untuk menyertakan peminjaman aktif
+    
     Returns:
         JSON: Detail buku
     """
-    result = book_service.get_book_by_id(book_id)
+    include = parse_include(request.args)
+    result = book_service.get_book_by_id(book_id, include_active_loans='active_loans' in include)
     
     if result['success']:
         return jsonify(result), 200
@@ -176,6 +339,41 @@ def get_book(book_id):
         return jsonify(result), 404
 
 
+@book_bp.route('/<int:book_id>/loans', methods=['GET'])
+def get_book_loans(book_id):
+    """
+    GET /api/books/:id/loans
+    Mendapatkan riwayat peminjaman sebuah buku, terbaru dulu
+    
+    Path Parameters:
+        - book_id: ID buku
+    
+    Query Parameters:
+        - status: Filter status (borrowed, returned, overdue)
+        - limit: Ukuran halaman (default 10, maks 100)
+        - cursor: pagination.next_cursor dari halaman sebelumnya
+        - include_archived: 'true' untuk ikut menampilkan peminjaman yang sudah diarsipkan
+    
+    Returns:
+        JSON: List peminjaman dan cursor halaman berikutnya
+    """
+    params, error = parse_book_loans_args(request.args)
+    if error:
+        return jsonify({
+            'success': False,
+            'message': error
+        }), 400
+    
+    result = loan_service.get_book_loans(book_id, **params)
+    
+    if result['success']:
+        return jsonify(result), 200
+    elif 'tidak ditemukan' in result.get('message', ''):
+        return jsonify(result), 404
+    else:
+        return jsonify(result), 500
+
+
 @book_bp.route('/<int:book_id>/availability', methods=['GET'])
 def check_availability(book_id):
     """
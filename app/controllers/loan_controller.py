@@ -4,7 +4,10 @@ Loan Controller - REST API endpoints untuk manajemen peminjaman
 Menghandle HTTP request/response untuk operasi Loan
 """
 
+from datetime import datetime
+
 from flask import Blueprint, request, jsonify
+from app.observers import EventType, event_subject
 from app.services import loan_service
 
 
@@ -12,53 +15,96 @@ from app.services import loan_service
 loan_bp = Blueprint('loans', __name__, url_prefix='/api/loans')
 
 
-@loan_bp.route('', methods=['GET'])
-def get_all_loans():
+def parse_loan_filters(args):
     """
-    GET /api/loans
-    Mendapatkan daftar semua peminjaman
+    Parse query parameters list peminjaman menjadi filters repository
+    Dipakai bersama oleh controller sync dan async
     
-    Query Parameters:
-        - status: Filter by status ('borrowed', 'returned', 'overdue')
-        - book_id: Filter by book ID
-        - borrower_name: Filter by borrower name
-        - limit: Batasi jumlah hasil
-        - offset: Skip sejumlah record
+    Args:
+        args: Query parameters (MultiDict)
     
     Returns:
-        JSON: List peminjaman
+        dict: Filters
     """
     filters = {}
     
-    status = request.args.get('status')
+    status = args.get('status')
     if status in ['borrowed', 'returned', 'overdue']:
         filters['status'] = status
     
-    book_id = request.args.get('book_id')
+    book_id = args.get('book_id')
     if book_id:
         try:
             filters['book_id'] = int(book_id)
         except ValueError:
             pass
     
-    borrower_name = request.args.get('borrower_name')
+    borrower_name = args.get('borrower_name')
     if borrower_name:
         filters['borrower_name'] = borrower_name
     
-    limit = request.args.get('limit')
+    limit = args.get('limit')
     if limit:
         try:
             filters['limit'] = int(limit)
         except ValueError:
             pass
     
-    offset = request.args.get('offset')
+    offset = args.get('offset')
     if offset:
         try:
             filters['offset'] = int(offset)
         except ValueError:
             pass
     
+    # Rentang tanggal pinjam (YYYY-MM-DD, inklusif)
+    for key in ('loan_date_from', 'loan_date_to'):
+        value = args.get(key)
+        if value:
+            try:
+                filters[key] = datetime.strptime(value, '%Y-%m-%d').date()
+            except ValueError:
+                pass
+    
+    if parse_include_archived(args):
+        filters['include_archived'] = True
+    
+    return filters
+
+
+def parse_include_archived(args):
+    """
+    Parse ?include_archived=true (riwayat lengkap termasuk loans_archive)
+    
+    Args:
+        args: Query parameters (MultiDict)
+    
+    Returns:
+        bool
+    """
+    return args.get('include_archived', '').lower() == 'true'
+
+
+@loan_bp.route('', methods=['GET'])
+def get_all_loans():
+    """
+    GET /api/loans
+    Mendapatkan daftar semua peminjaman
+    
+    Query Parameters:
+        - status: Filter by status ('borrowed', 'returned', 'overdue')
+        - book_id: Filter by book ID
+        - borrower_name: Filter by borrower name
+        - limit: Batasi jumlah hasil
+        - offset: Skip sejumlah record
+        - loan_date_from / loan_date_to: Rentang tanggal pinjam YYYY-MM-DD (inklusif)
+        - include_archived: 'true' untuk ikut menampilkan peminjaman yang sudah diarsipkan
+    
+    Returns:
+        JSON: List peminjaman
+    """
+    filters = parse_loan_filters(request.args)
+    
     result = loan_service.get_all_loans(filters if filters else None)
     
     status_code = 200 if result['success'] else 500
@@ -162,19 +208,28 @@ def update_loan(loan_id):
     loan = loan_repository.find_by_id(loan_id)
     
     if 'due_date' in data:
-        from datetime import datetime
         try:
-            loan.due_date = datetime.strptime(data['due_date'], '%Y-%m-%d').date()
+            due_date = datetime.strptime(data['due_date'], '%Y-%m-%d').date()
         except ValueError:
             return jsonify({
                 'success': False,
                 'message': 'Format due_date tidak valid. Gunakan YYYY-MM-DD'
             }), 400
+        
+        # Sama dengan validasi saat create; query overdue mengandalkan
+        # loan_date <= due_date untuk partition pruning
+        if due_date < loan.loan_date:
+            return jsonify({
+                'success': False,
+                'message': 'due_date tidak boleh sebelum loan_date'
+            }), 400
+        loan.due_date = due_date
     
     if 'notes' in data:
         loan.notes = data['notes']
     
     loan_repository.update(loan)
+    event_subject.notify(EventType.LOAN_UPDATED, {'loan': loan.to_dict()})
     
     return jsonify({
         'success': True,
@@ -245,9 +300,12 @@ def delete_loan(loan_id):
             'message': f'Peminjaman dengan ID {loan_id} tidak ditemukan'
         }), 404
     
+    # Diambil sebelum dihapus: observer membaca tanggal peminjaman
+    loan_data = loan.to_dict()
     success = loan_repository.delete(loan_id)
     
     if success:
+        event_subject.notify(EventType.LOAN_DELETED, {'loan': loan_data})
         return jsonify({
             'success': True,
             'message': 'Peminjaman berhasil dihapus'
@@ -283,10 +341,14 @@ def get_loans_by_borrower(borrower_name):
     Path Parameters:
         - borrower_name: Nama peminjam
     
+    Query Parameters:
+        - include_archived: 'true' untuk ikut menampilkan peminjaman yang sudah diarsipkan
+    
     Returns:
         JSON: List peminjaman
     """
-    result = loan_service.get_loans_by_borrower(borrower_name)
+    result = loan_service.get_loans_by_borrower(
+        borrower_name, parse_include_archived(request.args))
     
     status_code = 200 if result['success'] else 500
     return jsonify(result), status_code
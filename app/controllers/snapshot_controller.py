@@ -0,0 +1,135 @@
+"""
+Snapshot Controller - REST API endpoints untuk snapshot kolumnar (analitik offline)
+"""
+
+from flask import Blueprint, jsonify, request, send_file
+from app.services import snapshot_service, snapshot_store
+from app.services.snapshot_export import MANIFEST_NAME
+
+
+# Buat Blueprint untuk snapshot routes
+snapshot_bp = Blueprint('snapshots', __name__, url_prefix='/api/snapshots')
+
+SNAPSHOT_MODES = ('full', 'incremental')
+
+# Content-Type file snapshot berdasarkan ekstensi
+SNAPSHOT_MIMETYPES = {
+    '.arrow': 'application/vnd.apache.arrow.file',
+    '.parquet': 'application/vnd.apache.parquet',
+    '.json': 'application/json',
+}
+
+
+def parse_snapshot_mode(data):
+    """
+    Parse mode snapshot dari body POST /api/snapshots
+    Dipakai bersama oleh controller sync dan async
+    
+    Args:
+        data: JSON body (dict atau None)
+    
+    Returns:
+        tuple: (mode, error)
+    """
+    mode = (data or {}).get('mode', 'full')
+    if mode not in SNAPSHOT_MODES:
+        return None, f"mode harus salah satu dari: {', '.join(SNAPSHOT_MODES)}"
+    return mode, None
+
+
+def snapshot_file(name):
+    """
+    Path dan Content-Type file snapshot yang tercatat di manifest
+    Dipakai bersama oleh controller sync dan async
+    
+    Args:
+        name: Nama file
+    
+    Returns:
+        tuple: (path, mimetype) atau (None, None)
+    """
+    path = snapshot_store.file_path(name)
+    if path is None:
+        return None, None
+    extension = '.json' if name == MANIFEST_NAME else name[name.rfind('.'):]
+    return path, SNAPSHOT_MIMETYPES.get(extension, 'application/octet-stream')
+
+
+@snapshot_bp.route('', methods=['POST'])
+def create_snapshot():
+    """
+    POST /api/snapshots
+    Membuat snapshot books dan loans (Arrow IPC/Parquet)
+    
+    Request Body (opsional):
+        {
+            "mode": "full" | "incremental"
+        }
+    
+    Returns:
+        JSON: Manifest snapshot
+    """
+    mode, error = parse_snapshot_mode(request.get_json(silent=True))
+    if error:
+        return jsonify({'success': False, 'message': error, 'data': None}), 400
+    
+    result = snapshot_service.export_snapshot(mode)
+    
+    if result['success']:
+        return jsonify(result), 201
+    elif 'sedang berjalan' in result.get('message', ''):
+        return jsonify(result), 409
+    else:
+        return jsonify(result), 500
+
+
+@snapshot_bp.route('', methods=['GET'])
+def get_snapshot_manifest():
+    """
+    GET /api/snapshots
+    Manifest snapshot terakhir: file per tabel, jumlah row dan checksum
+    
+    Returns:
+        JSON: Manifest snapshot
+    """
+    result = snapshot_service.get_manifest()
+    
+    status_code = 200 if result['success'] else 404
+    return jsonify(result), status_code
+
+
+@snapshot_bp.route('/verify', methods=['GET'])
+def verify_snapshot():
+    """
+    GET /api/snapshots/verify
+    Mencocokkan ukuran dan sha256 setiap file dengan manifest
+    
+    Returns:
+        JSON: Status validasi dan file yang tidak cocok
+    """
+    result = snapshot_service.verify_snapshot()
+    
+    status_code = 200 if result['success'] else 404
+    return jsonify(result), status_code
+
+
+@snapshot_bp.route('/files/<name>', methods=['GET'])
+def download_snapshot_file(name):
+    """
+    GET /api/snapshots/files/<name>
+    Download file snapshot (hanya file yang tercatat di manifest)
+    
+    Args:
+        name: Nama file, mis. books-00000.arrow atau manifest.json
+    
+    Returns:
+        File snapshot
+    """
+    path, mimetype = snapshot_file(name)
+    if path is None:
+        return jsonify({
+            'success': False,
+            'message': f'File snapshot {name} tidak ditemukan'
+        }), 404
+    
+    return send_file(path, mimetype=mimetype, as_attachment=True, download_name=name)
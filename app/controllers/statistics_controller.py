@@ -2,13 +2,109 @@
 Statistics Controller - REST API endpoints untuk statistik perpustakaan
 """
 
-from flask import Blueprint, jsonify
-from app.services import statistics_service
+from datetime import datetime, timedelta
+
+from flask import Blueprint, jsonify, request
+from app.database.date_functions import INTERVALS
+from app.services import popularity_tracker, statistics_service
+from app.services.circulation_timeseries import bucket_starts
 
 
 # Buat Blueprint untuk statistics routes
 statistics_bp = Blueprint('statistics', __name__, url_prefix='/api/statistics')
 
+# Jumlah peminjam/peminjaman teratas di GET /api/statistics/overdue
+OVERDUE_DEFAULT_LIMIT = 10
+OVERDUE_MAX_LIMIT = 100
+
+# Rentang default GET /api/statistics/timeseries (hari ke belakang dari ?to=)
+# dan jumlah bucket maksimum per request
+TIMESERIES_DEFAULT_DAYS = {'day': 29, 'week': 7 * 11, 'month': 365}
+TIMESERIES_MAX_BUCKETS = 1000
+
+# Jumlah buku/peminjam teratas di GET /api/statistics/popular
+POPULAR_DEFAULT_LIMIT = 10
+POPULAR_MAX_LIMIT = 100
+
+
+def parse_overdue_limit(args):
+    """
+    Parse ?limit= GET /api/statistics/overdue
+    Dipakai bersama oleh controller sync dan async
+    
+    Args:
+        args: Query parameters (MultiDict)
+    
+    Returns:
+        tuple: (limit, error)
+    """
+    try:
+        limit = int(args.get('limit', OVERDUE_DEFAULT_LIMIT))
+    except ValueError:
+        return None, 'limit harus berupa angka'
+    if not 1 <= limit <= OVERDUE_MAX_LIMIT:
+        return None, f'limit harus antara 1 dan {OVERDUE_MAX_LIMIT}'
+    return limit, None
+
+
+def parse_timeseries_args(args):
+    """
+    Parse ?interval=, ?from= dan ?to= GET /api/statistics/timeseries
+    Dipakai bersama oleh controller sync dan async
+    
+    Args:
+        args: Query parameters (MultiDict)
+    
+    Returns:
+        tuple: ((start, end, interval), error)
+    """
+    interval = args.get('interval', 'day')
+    if interval not in INTERVALS:
+        return None, f"interval harus salah satu dari: {', '.join(INTERVALS)}"
+    
+    dates = {}
+    for key in ('from', 'to'):
+        value = args.get(key)
+        if value:
+            try:
+                dates[key] = datetime.strptime(value, '%Y-%m-%d').date()
+            except ValueError:
+                return None, f'{key} harus berformat YYYY-MM-DD'
+    
+    end = dates.get('to') or datetime.utcnow().date()
+    start = dates.get('from') or end - timedelta(days=TIMESERIES_DEFAULT_DAYS[interval])
+    if start > end:
+        return None, 'from tidak boleh setelah to'
+    if len(bucket_starts(start, end, interval)) > TIMESERIES_MAX_BUCKETS:
+        return None, f'Rentang maksimal {TIMESERIES_MAX_BUCKETS} bucket {interval}'
+    return (start, end, interval), None
+
+
+def parse_popular_args(args):
+    """
+    Parse ?window= dan ?limit= GET /api/statistics/popular
+    Dipakai bersama oleh controller sync dan async
+    
+    Args:
+        args: Query parameters (MultiDict)
+    
+    Returns:
+        tuple: ((window, limit), error)
+    """
+    windows = popularity_tracker.windows
+    window = args.get('window', f'{windows[0]}d')
+    choices = {f'{days}d': days for days in windows}
+    if window not in choices:
+        return None, f"window harus salah satu dari: {', '.join(choices)}"
+    
+    try:
+        limit = int(args.get('limit', POPULAR_DEFAULT_LIMIT))
+    except ValueError:
+        return None, 'limit harus berupa angka'
+    if not 1 <= limit <= POPULAR_MAX_LIMIT:
+        return None, f'limit harus antara 1 dan {POPULAR_MAX_LIMIT}'
+    return (choices[window], limit), None
+
 
 @statistics_bp.route('', methods=['GET'])
 def get_statistics():
@@ -38,3 +134,76 @@ def get_category_statistics():
     
     status_code = 200 if result['success'] else 500
     return jsonify(result), status_code
+
+
+@statistics_bp.route('/overdue', methods=['GET'])
+def get_overdue_statistics():
+    """
+    GET /api/statistics/overdue
+    Analitik keterlambatan: hari terlambat, denda per peminjam dan
+    kategori, aging bucket
+    
+    Query Parameters:
+        - limit: Jumlah peminjam dan peminjaman teratas (default 10, maks 100)
+    
+    Returns:
+        JSON: Analitik overdue
+    """
+    limit, error = parse_overdue_limit(request.args)
+    if error:
+        return jsonify({'success': False, 'message': error, 'data': None}), 400
+    
+    result = statistics_service.get_overdue_statistics(limit)
+    
+    status_code = 200 if result['success'] else 500
+    return jsonify(result), status_code
+
+
+@statistics_bp.route('/timeseries', methods=['GET'])
+def get_circulation_timeseries():
+    """
+    GET /api/statistics/timeseries
+    Timeseries sirkulasi: peminjaman, pengembalian, rata-rata durasi pinjam
+    dan rasio pengembalian tepat waktu per bucket
+    
+    Query Parameters:
+        - interval: day, week (mulai Senin) atau month (default day)
+        - from: Tanggal awal YYYY-MM-DD (diperluas ke awal bucket)
+        - to: Tanggal akhir YYYY-MM-DD, inklusif (default hari ini, diperluas
+          ke akhir bucket)
+    
+    Returns:
+        JSON: Timeseries sirkulasi
+    """
+    params, error = parse_timeseries_args(request.args)
+    if error:
+        return jsonify({'success': False, 'message': error, 'data': None}), 400
+    
+    result = statistics_service.get_circulation_timeseries(*params)
+    
+    status_code = 200 if result['success'] else 500
+    return jsonify(result), status_code
+
+
+@statistics_bp.route('/popular', methods=['GET'])
+def get_popular_statistics():
+    """
+    GET /api/statistics/popular
+    Buku dan peminjam dengan peminjaman terbanyak dalam window hari
+    (hari ini termasuk), dilayani dari hitungan di memori
+    
+    Query Parameters:
+        - window: 7d atau 30d (POPULARITY_WINDOWS, default window terkecil)
+        - limit: Jumlah buku dan peminjam teratas (default 10, maks 100)
+    
+    Returns:
+        JSON: Top-N buku dan peminjam
+    """
+    params, error = parse_popular_args(request.args)
+    if error:
+        return jsonify({'success': False, 'message': error, 'data': None}), 400
+    
+    result = statistics_service.get_popular(*params)
+    
+    status_code = 200 if result['success'] else 500
+    return jsonify(result), status_code
@@ -1,6 +1,34 @@
 """
 Package database
 """
+from app.utils.lazy_exports import lazy_exports
+
 from .connection import DatabaseConnection, db_connection, db, get_db_instance
+from .pool import TimedQueuePool, add_pool_wait_listener
+from .replica import (
+    ReplicaRouter, RoutingSession, add_replica_lag_listener, add_replica_route_listener,
+    read_replica, replica_reads, replica_router
+)
+from .query_instrumentation import (
+    NPlusOneQueryError, QueryInstrumentation, query_instrumentation
+)
+
+# Stack async (mode ASGI) di-import saat pertama diakses agar mode WSGI
+# tidak ikut memuat quart dan driver async saat startup
+_LAZY_EXPORTS = {
+    'AsyncDatabaseConnection': '.async_connection',
+    'async_db_connection': '.async_connection',
+    'to_async_uri': '.async_connection',
+}
+
+__getattr__ = lazy_exports(__name__, _LAZY_EXPORTS)
+
 
-__all__ = ['DatabaseConnection', 'db_connection', 'db', 'get_db_instance']
+__all__ = [
+    'DatabaseConnection', 'db_connection', 'db', 'get_db_instance',
+    'AsyncDatabaseConnection', 'async_db_connection', 'to_async_uri',
+    'TimedQueuePool', 'add_pool_wait_listener',
+    'ReplicaRouter', 'RoutingSession', 'add_replica_lag_listener', 'add_replica_route_listener',
+    'read_replica', 'replica_reads', 'replica_router',
+    'NPlusOneQueryError', 'QueryInstrumentation', 'query_instrumentation'
+]
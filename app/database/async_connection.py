@@ -0,0 +1,134 @@
+"""
+DESIGN PATTERN: SINGLETON
+Async Database Connection - Engine SQLAlchemy async untuk mode ASGI
+
+Tujuan:
+- Satu AsyncEngine per process (driver async psycopg untuk PostgreSQL,
+  aiosqlite untuk SQLite)
+- Satu AsyncSession per request, disimpan di `g` Quart dan ditutup saat
+  app context selesai
+- Memakai model yang sama dengan stack sync (metadata db.Model)
+
+Dependency opsional: quart dan sqlalchemy[asyncio] (greenlet). Tanpa
+dependency tersebut modul tetap bisa di-import, tetapi mode ASGI tidak
+bisa dijalankan.
+"""
+
+from threading import Lock
+
+from sqlalchemy.engine import make_url
+
+try:
+    from quart import g
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+except ImportError:  # pragma: no cover - dependency opsional
+    g = None
+
+
+# Driver async untuk setiap backend database
+ASYNC_DRIVERS = {
+    'postgresql': 'psycopg',
+    'sqlite': 'aiosqlite',
+}
+
+
+def to_async_uri(database_uri):
+    """
+    Mengubah database URI sync menjadi URI dengan driver async
+
+    psycopg 3 menyediakan driver sync dan async dalam satu package, sehingga
+    URI postgresql+psycopg dipakai apa adanya oleh create_async_engine.
+
+    Args:
+        database_uri: SQLAlchemy database URI (sync)
+
+    Returns:
+        str: Database URI dengan driver async
+
+    Raises:
+        ValueError: Jika backend tidak memiliki driver async yang didukung
+    """
+    url = make_url(database_uri)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"Database '{backend}' tidak didukung di mode async")
+    return url.set(drivername=f'{backend}+{ASYNC_DRIVERS[backend]}').render_as_string(
+        hide_password=False
+    )
+
+
+class AsyncDatabaseConnection:
+    """
+    Singleton class untuk mengelola AsyncEngine dan session per request
+
+    Pattern: Singleton
+    """
+
+    _instance = None
+    _lock = Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super(AsyncDatabaseConnection, cls).__new__(cls)
+                    cls._instance.engine = None
+                    cls._instance.session_factory = None
+        return cls._instance
+
+    def init_app(self, app):
+        """
+        Membuat AsyncEngine dan mendaftarkan penutupan session per request
+
+        Pool memakai setting yang sama dengan stack sync
+        (SQLALCHEMY_ENGINE_OPTIONS), tanpa poolclass sync.
+
+        Args:
+            app: Quart application instance
+        """
+        if self.engine is None:
+            options = dict(app.config.get('SQLALCHEMY_ENGINE_OPTIONS', {}))
+            options.pop('poolclass', None)
+            self.engine = create_async_engine(
+                to_async_uri(app.config['SQLALCHEMY_DATABASE_URI']), **options
+            )
+            # expire_on_commit=False: atribut tetap bisa dibaca setelah commit
+            # tanpa lazy load (lazy load tidak didukung di AsyncSession)
+            self.session_factory = async_sessionmaker(self.engine, expire_on_commit=False)
+
+        @app.teardown_appcontext
+        async def close_session(exception=None):
+            session = g.pop('async_db_session', None)
+            if session is not None:
+                await session.close()
+
+    @property
+    def session(self):
+        """
+        AsyncSession untuk request aktif (dibuat saat pertama dipakai)
+
+        Returns:
+            AsyncSession
+        """
+        if 'async_db_session' not in g:
+            g.async_db_session = self.session_factory()
+        return g.async_db_session
+
+    async def create_tables(self, metadata):
+        """
+        Membuat semua tabel (setara db.create_all di stack sync)
+
+        Args:
+            metadata: MetaData model (db.metadata)
+        """
+        async with self.engine.begin() as conn:
+            await conn.run_sync(metadata.create_all)
+
+    async def dispose(self):
+        """Menutup semua koneksi pool"""
+        if self.engine is not None:
+            await self.engine.dispose()
+
+
+# Singleton instance
+async_db_connection = AsyncDatabaseConnection()
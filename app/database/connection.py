@@ -8,9 +8,19 @@ Tujuan:
 - Thread-safe implementation
 """
 
+import logging
+
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.engine import make_url
 from threading import Lock
 
+from app.database.pool import TimedQueuePool
+from app.database.query_instrumentation import query_instrumentation
+from app.database.replica import RoutingSession, replica_router
+
+
+logger = logging.getLogger('LibraryAPI')
+
 
 class DatabaseConnection:
     """
@@ -34,7 +44,8 @@ class DatabaseConnection:
                 if cls._instance is None:
                     cls._instance = super(DatabaseConnection, cls).__new__(cls)
                     # Inisialisasi SQLAlchemy hanya sekali
-                    cls._instance.db = SQLAlchemy()
+                    # RoutingSession: query read-only repository bisa ke replica
+                    cls._instance.db = SQLAlchemy(session_options={'class_': RoutingSession})
                     cls._instance._initialized = False
         return cls._instance
     
@@ -46,9 +57,122 @@ class DatabaseConnection:
             app: Flask application instance
         """
         if not self._initialized:
+            self._configure_pool(app)
+            self._configure_driver(app)
             self.db.init_app(app)
+            replica_router.init_app(app)
+            query_instrumentation.init_app(app, self.db)
             self._initialized = True
     
+    def _configure_pool(self, app):
+        """
+        Memakai TimedQueuePool (waktu tunggu checkout terukur) untuk pool
+        berukuran tetap, dan memperingatkan jika pool lebih kecil dari
+        jumlah thread per worker
+        
+        Args:
+            app: Flask application instance
+        """
+        options = dict(app.config.get('SQLALCHEMY_ENGINE_OPTIONS', {}))
+        if 'pool_size' not in options:
+            return
+        
+        options.setdefault('poolclass', TimedQueuePool)
+        app.config['SQLALCHEMY_ENGINE_OPTIONS'] = options
+        
+        capacity = options['pool_size'] + options.get('max_overflow', 10)
+        threads = app.config.get('WEB_THREADS', 1)
+        if capacity < threads:
+            logger.warning(
+                f'Pool database ({capacity} koneksi) lebih kecil dari WEB_THREADS ({threads}): '
+                f'request akan menunggu koneksi hingga pool_timeout'
+            )
+    
+    def _configure_driver(self, app):
+        """
+        psycopg: query yang sama dieksekusi sebagai server-side prepared
+        statement setelah DB_PREPARE_THRESHOLD kali per koneksi (parse dan
+        planning dilewati). Statement repository yang dibangun sekali (bound parameter)
+        menghasilkan SQL identik di setiap panggilan sehingga bisa di-prepare.
+        
+        Args:
+            app: Flask application instance
+        """
+        url = make_url(app.config['SQLALCHEMY_DATABASE_URI'])
+        if url.get_driver_name() != 'psycopg':
+            return
+        
+        options = dict(app.config.get('SQLALCHEMY_ENGINE_OPTIONS', {}))
+        connect_args = dict(options.get('connect_args', {}))
+        connect_args.setdefault('prepare_threshold', app.config.get('DB_PREPARE_THRESHOLD', 1))
+        options['connect_args'] = connect_args
+        app.config['SQLALCHEMY_ENGINE_OPTIONS'] = options
+    
+    def warm_up_pool(self, app, count):
+        """
+        Membuka koneksi pool di awal agar request pertama tidak membayar
+        biaya koneksi baru (TCP, TLS, autentikasi)
+        
+        Dipanggil per process: setelah fork, koneksi milik parent tidak
+        boleh dipakai ulang.
+        
+        Args:
+            app: Flask application instance
+            count: Jumlah koneksi yang dibuka (dibatasi pool_size)
+        
+        Returns:
+            int: Jumlah koneksi yang berhasil dibuka
+        """
+        if count <= 0:
+            return 0
+        
+        with app.app_context():
+            engine = self.db.engine
+        
+        size = getattr(engine.pool, 'size', None)
+        if size is not None:
+            count = min(count, size())
+        
+        connections = []
+        try:
+            # Dibuka bersamaan agar pool benar-benar berisi count koneksi
+            for _ in range(count):
+                connections.append(engine.connect())
+        except Exception as e:
+            logger.warning(f'Warm-up pool database gagal setelah {len(connections)} koneksi: {e}')
+        finally:
+            for connection in connections:
+                connection.close()
+        
+        return len(connections)
+
+    def dispose_engines(self, app, close=True):
+        """
+        Membuang semua koneksi pool (semua bind)
+
+        Args:
+            app: Flask application instance
+            close: False untuk proses hasil fork: koneksi warisan parent
+                dilepas tanpa ditutup agar socket milik parent tidak rusak
+        """
+        with app.app_context():
+            for engine in self.db.engines.values():
+                engine.dispose(close=close)
+
+    def reset_after_fork(self, app):
+        """
+        Dipanggil di worker setelah fork (mis. hook post_fork gunicorn):
+        pool baru untuk worker ini lalu warm-up sesuai DB_POOL_WARMUP
+
+        Args:
+            app: Flask application instance
+
+        Returns:
+            int: Jumlah koneksi yang dibuka saat warm-up
+        """
+        self.dispose_engines(app, close=False)
+        return self.warm_up_pool(app, app.config.get('DB_POOL_WARMUP', 0))
+
     def get_db(self):
         """
         Mendapatkan instance SQLAlchemy
@@ -0,0 +1,106 @@
+"""
+Date Functions - Ekspresi tanggal SQL yang dikompilasi per dialect
+
+- date_bucket(column, interval): awal bucket hari/minggu (Senin)/bulan dari
+  sebuah kolom DATE, setara date_trunc di PostgreSQL
+- days_between(end, start): selisih hari dua kolom DATE
+
+Ekspresi dibangun sekali (statement prebuilt repository) dan dikompilasi
+sesuai dialect engine yang mengeksekusi: PostgreSQL memakai date_trunc dan
+pengurangan date, SQLite memakai date() dengan modifier dan julianday().
+"""
+
+from sqlalchemy import Date, Float
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+
+
+INTERVALS = ('day', 'week', 'month')
+
+
+class _DateBucket(FunctionElement):
+    type = Date()
+    inherit_cache = True
+    interval = None
+
+
+class _DayBucket(_DateBucket):
+    name = 'day_bucket'
+    inherit_cache = True
+    interval = 'day'
+
+
+class _WeekBucket(_DateBucket):
+    name = 'week_bucket'
+    inherit_cache = True
+    interval = 'week'
+
+
+class _MonthBucket(_DateBucket):
+    name = 'month_bucket'
+    inherit_cache = True
+    interval = 'month'
+
+
+# Satu class per interval agar interval ikut menentukan cache key statement
+_BUCKETS = {bucket.interval: bucket for bucket in (_DayBucket, _WeekBucket, _MonthBucket)}
+
+# Modifier date() SQLite: minggu dimulai Senin seperti date_trunc('week')
+_SQLITE_MODIFIERS = {
+    'day': '',
+    'week': ", 'weekday 0', '-6 days'",
+    'month': ", 'start of month'",
+}
+
+
+def date_bucket(column, interval):
+    """
+    Awal bucket interval dari kolom DATE
+
+    Args:
+        column: Kolom/ekspresi DATE
+        interval: 'day', 'week' atau 'month'
+
+    Returns:
+        Ekspresi SQL bertipe Date
+    """
+    return _BUCKETS[interval](column)
+
+
+class days_between(FunctionElement):
+    """
+    Selisih hari end - start (dua kolom DATE)
+    """
+
+    type = Float()
+    name = 'days_between'
+    inherit_cache = True
+
+
+def _compile_bucket_default(element, compiler, **kw):
+    column = compiler.process(element.clauses, **kw)
+    if element.interval == 'day':
+        return column
+    return f"CAST(date_trunc('{element.interval}', {column}) AS DATE)"
+
+
+def _compile_bucket_sqlite(element, compiler, **kw):
+    column = compiler.process(element.clauses, **kw)
+    return f'date({column}{_SQLITE_MODIFIERS[element.interval]})'
+
+
+for _bucket in _BUCKETS.values():
+    compiles(_bucket)(_compile_bucket_default)
+    compiles(_bucket, 'sqlite')(_compile_bucket_sqlite)
+
+
+@compiles(days_between)
+def _compile_days_between_default(element, compiler, **kw):
+    end, start = (compiler.process(clause, **kw) for clause in element.clauses)
+    return f'({end} - {start})'
+
+
+@compiles(days_between, 'sqlite')
+def _compile_days_between_sqlite(element, compiler, **kw):
+    end, start = (compiler.process(clause, **kw) for clause in element.clauses)
+    return f'(julianday({end}) - julianday({start}))'
@@ -0,0 +1,254 @@
+"""
+Index Manager - Migrasi index dan verifikasi query plan
+
+Tujuan:
+- Index didefinisikan di model (__table_args__), modul ini yang mengelola
+  pembuatannya di database yang sudah berjalan
+- Di PostgreSQL index dibuat dengan CREATE INDEX CONCURRENTLY agar tabel
+  tidak terkunci untuk write selama proses build
+- Menyediakan bukti EXPLAIN bahwa query panas repository tidak lagi
+  melakukan sequential scan
+"""
+
+import re
+from datetime import datetime, timedelta
+
+from sqlalchemy import inspect, text
+from sqlalchemy.schema import CreateIndex
+
+from app.database.partitioning import PARENT_TABLE, child_tables, is_partitioned
+
+
+def get_managed_indexes():
+    """
+    Mendapatkan semua index yang dikelola (didefinisikan di model)
+
+    Returns:
+        List[Index]: Daftar index tabel books, loans dan loans_archive
+    """
+    from app.models import Book, Loan, LoanArchive
+
+    indexes = []
+    for table in (Book.__table__, Loan.__table__, LoanArchive.__table__):
+        indexes.extend(sorted(table.indexes, key=lambda index: index.name))
+    return indexes
+
+
+def create_indexes(engine, concurrently=True):
+    """
+    Membuat index yang belum ada di database (idempotent)
+
+    Di PostgreSQL dengan concurrently=True, setiap index dibuat di luar
+    transaksi (AUTOCOMMIT) karena CREATE INDEX CONCURRENTLY tidak boleh
+    berjalan di dalam blok transaksi. Index INVALID sisa build concurrent
+    yang gagal akan di-drop lalu dibuat ulang. Untuk loans yang sudah
+    dipartisi, index dibuat per partisi (lihat _create_partitioned_index).
+
+    Args:
+        engine: SQLAlchemy engine
+        concurrently: Gunakan CREATE INDEX CONCURRENTLY (PostgreSQL saja)
+
+    Returns:
+        List[str]: Nama index yang dibuat
+    """
+    is_postgres = engine.dialect.name == 'postgresql'
+    use_concurrently = concurrently and is_postgres
+
+    created = []
+    connection_options = {'isolation_level': 'AUTOCOMMIT'} if use_concurrently else {}
+
+    with engine.connect().execution_options(**connection_options) as conn:
+        partitioned = set()
+        if is_postgres:
+            _drop_invalid_indexes(conn, concurrently=use_concurrently)
+            if is_partitioned(conn):
+                partitioned.add(PARENT_TABLE)
+
+        inspector = inspect(conn)
+        existing = {}
+        for table_name in ('books', 'loans', 'loans_archive'):
+            # Tabel yang belum ada dibuat beserta index-nya oleh init-db
+            if inspector.has_table(table_name):
+                existing[table_name] = {
+                    index['name'] for index in inspector.get_indexes(table_name)
+                }
+
+        for index in get_managed_indexes():
+            if index.table.name not in existing or index.name in existing[index.table.name]:
+                continue
+
+            ddl = str(CreateIndex(index, if_not_exists=True).compile(dialect=engine.dialect))
+            if use_concurrently and index.table.name in partitioned:
+                _create_partitioned_index(conn, index, ddl.strip())
+                created.append(index.name)
+                continue
+            if use_concurrently:
+                ddl = re.sub(r'^CREATE (UNIQUE )?INDEX', r'CREATE \1INDEX CONCURRENTLY', ddl.strip())
+
+            conn.exec_driver_sql(ddl)
+            if not use_concurrently:
+                conn.commit()
+            created.append(index.name)
+
+    return created
+
+
+def _create_partitioned_index(conn, index, ddl):
+    """
+    CREATE INDEX CONCURRENTLY tidak bisa dijalankan di partitioned table:
+    index dibuat ON ONLY parent (INVALID, tanpa membaca data), lalu dibuat
+    CONCURRENTLY di setiap partisi dan di-attach ke parent. Parent menjadi
+    valid setelah semua partisi ter-attach.
+
+    Args:
+        conn: Connection PostgreSQL (AUTOCOMMIT)
+        index: Index model
+        ddl: CREATE INDEX IF NOT EXISTS <index> ON <table> (...)
+    """
+    table = index.table.name
+    target = f'INDEX IF NOT EXISTS {index.name} ON {table} '
+    conn.exec_driver_sql(ddl.replace(target, f'INDEX IF NOT EXISTS {index.name} ON ONLY {table} ', 1))
+
+    for partition in child_tables(conn):
+        child = f'{index.name}_{partition[len(table) + 1:]}'
+        conn.exec_driver_sql(ddl.replace(
+            target, f'INDEX CONCURRENTLY IF NOT EXISTS {child} ON {partition} ', 1))
+        conn.exec_driver_sql(f'ALTER INDEX {index.name} ATTACH PARTITION {child}')
+
+
+def _drop_invalid_indexes(conn, concurrently=True):
+    """
+    Menghapus index INVALID (hasil CREATE INDEX CONCURRENTLY yang gagal)
+
+    Index milik partitioned table tidak bisa di-drop CONCURRENTLY dan
+    di-drop biasa (ikut menghapus index partisinya).
+
+    Args:
+        conn: Connection PostgreSQL
+        concurrently: Gunakan DROP INDEX CONCURRENTLY
+    """
+    managed_names = [index.name for index in get_managed_indexes()]
+    result = conn.execute(text(
+        "SELECT c.relname, c.relkind = 'I' FROM pg_index i "
+        "JOIN pg_class c ON c.oid = i.indexrelid "
+        "WHERE NOT i.indisvalid AND c.relname = ANY(:names)"
+    ), {'names': managed_names})
+
+    for name, partitioned in result.fetchall():
+        keyword = 'DROP INDEX CONCURRENTLY' if concurrently and not partitioned else 'DROP INDEX'
+        conn.execute(text(f'{keyword} IF EXISTS "{name}"'))
+        if not concurrently:
+            conn.commit()
+
+
+def get_hot_queries():
+    """
+    Query panas dari BookRepository dan LoanRepository
+    Filter dan ordering harus sama dengan yang dipakai repository
+
+    Returns:
+        dict: Nama query -> SQLAlchemy Select statement
+    """
+    from app.database import db
+    from app.models import Book, Loan
+    from app.repositories.book_repository import SNAPSHOT_CHANGED_QUERY as BOOKS_CHANGED
+    from app.repositories.loan_repository import (
+        CIRCULATION_QUERIES, POPULARITY_QUERY, SNAPSHOT_CHANGED_QUERY as LOANS_CHANGED
+    )
+
+    today = datetime.utcnow().date()
+    circulation_loans, circulation_returns = (
+        statement.params(start=today - timedelta(days=30), end=today)
+        for statement in CIRCULATION_QUERIES['day']
+    )
+
+    return {
+        'books.find_all': Book.query.filter_by(is_deleted=False)
+            .order_by(Book.created_at.desc()).limit(10).statement,
+        'books.count_available': db.select(db.func.count(Book.id))
+            .where(Book.is_deleted == False, Book.available > 0),
+        'books.get_categories': db.select(Book.category)
+            .where(Book.is_deleted == False).distinct(),
+        'books.find_by_isbn': Book.query.filter_by(isbn='0000000000', is_deleted=False)
+            .limit(1).statement,
+        'books.purge_deleted': db.select(Book.id).where(
+            Book.is_deleted == True,
+            ~db.exists().where(Loan.book_id == Book.id)
+        ).order_by(Book.id).limit(500),
+        'loans.find_all': Loan.query.order_by(Loan.created_at.desc()).limit(10).statement,
+        'loans.count_by_status': db.select(db.func.count(Loan.id))
+            .where(Loan.status == 'borrowed'),
+        'loans.find_active_by_book': Loan.query.filter_by(book_id=1, status='borrowed').statement,
+        'loans.find_by_book': db.select(Loan).where(Loan.book_id == 1, Loan.id < 1000)
+            .order_by(Loan.id.desc()).limit(11),
+        'loans.find_overdue_loans': Loan.query.filter(
+            Loan.status == 'borrowed',
+            Loan.due_date < today,
+            Loan.loan_date < today
+        ).statement,
+        'loans.archive_returned': db.select(Loan.id).where(
+            Loan.status == 'returned',
+            Loan.return_date < today
+        ).order_by(Loan.id).limit(1000),
+        'loans.circulation_loans': circulation_loans,
+        'loans.circulation_returns': circulation_returns,
+        'books.snapshot_changed': BOOKS_CHANGED.params(since=datetime.utcnow() - timedelta(days=1)),
+        'loans.snapshot_changed': LOANS_CHANGED.params(since=datetime.utcnow() - timedelta(days=1)),
+        'loans.popularity_rebuild': POPULARITY_QUERY.params(since=today - timedelta(days=30)),
+    }
+
+
+def explain_query(conn, statement):
+    """
+    Menjalankan EXPLAIN untuk satu statement
+
+    Args:
+        conn: SQLAlchemy connection
+        statement: Select statement
+
+    Returns:
+        dict: {'plan': List[str], 'seq_scan': bool}
+    """
+    dialect = conn.dialect
+    sql = str(statement.compile(dialect=dialect, compile_kwargs={'literal_binds': True}))
+
+    if dialect.name == 'postgresql':
+        plan = [row[0] for row in conn.exec_driver_sql(f'EXPLAIN {sql}')]
+        seq_scan = any('Seq Scan' in line for line in plan)
+    else:
+        # SQLite: kolom terakhir EXPLAIN QUERY PLAN berisi detail langkah
+        plan = [row[-1] for row in conn.exec_driver_sql(f'EXPLAIN QUERY PLAN {sql}')]
+        # SCAN atas subquery (CO-ROUTINE/MATERIALIZE) bukan scan tabel
+        subqueries = {
+            line.split()[1] for line in plan
+            if line.startswith(('CO-ROUTINE', 'MATERIALIZE'))
+        }
+        seq_scan = any(
+            line.startswith('SCAN') and 'USING' not in line
+            and line.split()[1] not in subqueries
+            for line in plan
+        )
+
+    return {'plan': plan, 'seq_scan': seq_scan}
+
+
+def explain_hot_queries(engine, analyze_tables=True):
+    """
+    Menjalankan EXPLAIN untuk semua query panas
+
+    Args:
+        engine: SQLAlchemy engine
+        analyze_tables: Jalankan ANALYZE dulu agar statistik planner terbaru
+
+    Returns:
+        dict: Nama query -> hasil explain_query
+    """
+    with engine.connect() as conn:
+        if analyze_tables:
+            conn.execute(text('ANALYZE'))
+            conn.commit()
+
+        return {
+            name: explain_query(conn, statement)
+            for name, statement in get_hot_queries().items()
+        }
@@ -0,0 +1,313 @@
+"""
+Partition Manager - Tabel loans range-partitioned per bulan (PostgreSQL)
+
+Tujuan:
+- loans dipartisi berdasarkan loan_date (satu partisi per bulan) agar query
+  dengan filter loan_date (riwayat terbaru, overdue) hanya membaca partisi
+  yang relevan (partition pruning) dan data lama bisa dibuang per partisi
+  tanpa DELETE besar
+- Model tetap memetakan loans dengan primary key id; di database primary
+  key menjadi (id, loan_date) karena PostgreSQL mewajibkan kolom partisi
+  ada di setiap unique constraint. ID tetap unik karena berasal dari satu
+  sequence
+- Partisi DEFAULT menampung loan_date di luar rentang partisi bulanan;
+  maintain_partitions memindahkan row tersebut ke partisi bulanan
+
+Hanya PostgreSQL. Di database lain tabel loans tetap tabel biasa.
+"""
+
+import re
+from datetime import date
+
+from sqlalchemy import text
+from sqlalchemy.schema import CreateIndex
+
+
+PARENT_TABLE = 'loans'
+DEFAULT_PARTITION = 'loans_default'
+
+_BOUND_PATTERN = re.compile(r"FROM \('([0-9-]+)'\) TO \('([0-9-]+)'\)")
+
+
+def month_start(day):
+    """
+    Tanggal pertama bulan dari day
+
+    Args:
+        day: date
+
+    Returns:
+        date
+    """
+    return day.replace(day=1)
+
+
+def add_months(month, count):
+    """
+    Menggeser tanggal awal bulan sebanyak count bulan (boleh negatif)
+
+    Args:
+        month: date (tanggal 1)
+        count: Jumlah bulan
+
+    Returns:
+        date
+    """
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month):
+    """
+    Nama partisi untuk bulan tertentu, mis. loans_p2026_01
+
+    Args:
+        month: date (tanggal 1)
+
+    Returns:
+        str
+    """
+    return f'{PARENT_TABLE}_p{month:%Y_%m}'
+
+
+def is_supported(engine):
+    """
+    Partisi hanya didukung di PostgreSQL
+
+    Args:
+        engine: SQLAlchemy engine atau connection
+
+    Returns:
+        bool
+    """
+    return engine.dialect.name == 'postgresql'
+
+
+def is_partitioned(conn):
+    """
+    Cek apakah tabel loans sudah berupa partitioned table
+
+    Args:
+        conn: Connection PostgreSQL
+
+    Returns:
+        bool
+    """
+    return conn.execute(text(
+        "SELECT c.relkind = 'p' FROM pg_class c "
+        "WHERE c.oid = to_regclass(:table)"
+    ), {'table': PARENT_TABLE}).scalar() or False
+
+
+def list_partitions(conn):
+    """
+    Daftar partisi bulanan tabel loans
+
+    Args:
+        conn: Connection PostgreSQL
+
+    Returns:
+        List[tuple]: (nama, start, end) urut berdasarkan start; partisi
+            DEFAULT tidak termasuk
+    """
+    rows = conn.execute(text(
+        "SELECT c.relname, pg_get_expr(c.relpartbound, c.oid) "
+        "FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+        "WHERE i.inhparent = to_regclass(:table)"
+    ), {'table': PARENT_TABLE}).all()
+
+    partitions = []
+    for name, bound in rows:
+        match = _BOUND_PATTERN.search(bound or '')
+        if match:
+            start, end = (date.fromisoformat(value) for value in match.groups())
+            partitions.append((name, start, end))
+    return sorted(partitions, key=lambda partition: partition[1])
+
+
+def child_tables(conn):
+    """
+    Nama semua partisi tabel loans, termasuk DEFAULT
+
+    Args:
+        conn: Connection PostgreSQL
+
+    Returns:
+        List[str]
+    """
+    return list(conn.execute(text(
+        "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+        "WHERE i.inhparent = to_regclass(:table) ORDER BY c.relname"
+    ), {'table': PARENT_TABLE}).scalars())
+
+
+def _create_month_partition(conn, month, move_default=True):
+    """
+    Membuat partisi satu bulan; row bulan tersebut yang sudah terlanjur
+    masuk partisi DEFAULT dipindahkan ke partisi baru (PostgreSQL menolak
+    membuat partisi jika DEFAULT berisi row yang masuk rentangnya)
+
+    Args:
+        conn: Connection PostgreSQL (di dalam transaksi)
+        month: date (tanggal 1)
+        move_default: False jika DEFAULT pasti kosong (konversi awal)
+
+    Returns:
+        int: Jumlah row yang dipindahkan dari DEFAULT
+    """
+    bounds = {'start': month, 'end': add_months(month, 1)}
+
+    moved = 0
+    if move_default:
+        conn.execute(text(f'CREATE TEMPORARY TABLE loans_moving (LIKE {PARENT_TABLE})'))
+        moved = conn.execute(text(
+            f'WITH moved AS (DELETE FROM {DEFAULT_PARTITION} '
+            f'WHERE loan_date >= :start AND loan_date < :end RETURNING *) '
+            f'INSERT INTO loans_moving SELECT * FROM moved'
+        ), bounds).rowcount
+
+    conn.execute(text(
+        f'CREATE TABLE {partition_name(month)} PARTITION OF {PARENT_TABLE} '
+        f"FOR VALUES FROM ('{bounds['start'].isoformat()}') TO ('{bounds['end'].isoformat()}')"
+    ))
+
+    if move_default:
+        conn.execute(text(f'INSERT INTO {PARENT_TABLE} SELECT * FROM loans_moving'))
+        conn.execute(text('DROP TABLE loans_moving'))
+    return moved
+
+
+def convert_to_partitioned(engine, months_ahead=3, today=None):
+    """
+    Mengubah tabel loans biasa menjadi partitioned table (RANGE loan_date)
+
+    Dijalankan dalam satu transaksi: loans di-rename, tabel partitioned
+    dibuat dengan kolom, default dan constraint yang sama, partisi dibuat
+    dari bulan loan_date tertua sampai months_ahead bulan ke depan, data
+    disalin, index model dibuat ulang, lalu tabel lama di-drop. Tabel loans
+    terkunci (ACCESS EXCLUSIVE) selama proses, jadi jalankan di maintenance
+    window untuk tabel besar.
+
+    Args:
+        engine: SQLAlchemy engine PostgreSQL
+        months_ahead: Jumlah partisi bulan ke depan yang dibuat
+        today: Override tanggal hari ini (testing)
+
+    Returns:
+        dict: {'rows': jumlah row disalin, 'partitions': jumlah partisi}
+    """
+    from app.models import Loan
+
+    today = today or date.today()
+
+    with engine.begin() as conn:
+        if is_partitioned(conn):
+            return {'rows': 0, 'partitions': len(list_partitions(conn))}
+
+        conn.execute(text(f'LOCK TABLE {PARENT_TABLE} IN ACCESS EXCLUSIVE MODE'))
+        oldest = conn.execute(text(f'SELECT min(loan_date) FROM {PARENT_TABLE}')).scalar()
+
+        # Nama constraint dan index tabel lama dibebaskan untuk tabel baru
+        conn.execute(text(f'ALTER TABLE {PARENT_TABLE} RENAME TO loans_unpartitioned'))
+        conn.execute(text('ALTER TABLE loans_unpartitioned '
+                          'RENAME CONSTRAINT loans_pkey TO loans_unpartitioned_pkey'))
+        for index in Loan.__table__.indexes:
+            conn.execute(text(f'DROP INDEX IF EXISTS {index.name}'))
+
+        # LIKE menyalin kolom, NOT NULL dan DEFAULT nextval(loans_id_seq)
+        conn.execute(text(
+            f'CREATE TABLE {PARENT_TABLE} (LIKE loans_unpartitioned '
+            f'INCLUDING DEFAULTS INCLUDING CONSTRAINTS) PARTITION BY RANGE (loan_date)'
+        ))
+        conn.execute(text(f'ALTER TABLE {PARENT_TABLE} '
+                          f'ADD CONSTRAINT loans_pkey PRIMARY KEY (id, loan_date)'))
+        conn.execute(text(f'ALTER TABLE {PARENT_TABLE} ADD CONSTRAINT loans_book_id_fkey '
+                          f'FOREIGN KEY (book_id) REFERENCES books (id)'))
+        conn.execute(text(f'CREATE TABLE {DEFAULT_PARTITION} PARTITION OF {PARENT_TABLE} DEFAULT'))
+
+        month = month_start(oldest or today)
+        last = add_months(month_start(today), months_ahead)
+        partitions = 0
+        while month <= last:
+            _create_month_partition(conn, month, move_default=False)
+            month = add_months(month, 1)
+            partitions += 1
+
+        rows = conn.execute(text(
+            f'INSERT INTO {PARENT_TABLE} SELECT * FROM loans_unpartitioned'
+        )).rowcount
+
+        # Index dibuat setelah data dimuat (lebih cepat dari update index per row)
+        for index in Loan.__table__.indexes:
+            conn.execute(CreateIndex(index))
+
+        conn.execute(text(f'ALTER SEQUENCE loans_id_seq OWNED BY {PARENT_TABLE}.id'))
+        conn.execute(text('DROP TABLE loans_unpartitioned'))
+
+    with engine.connect().execution_options(isolation_level='AUTOCOMMIT') as conn:
+        conn.execute(text(f'ANALYZE {PARENT_TABLE}'))
+
+    return {'rows': rows, 'partitions': partitions}
+
+
+def maintain_partitions(engine, months_ahead=3, retention_months=0,
+                        detach_only=False, today=None):
+    """
+    Pemeliharaan berkala partisi loans
+
+    1. Membuat partisi bulan berjalan sampai months_ahead bulan ke depan
+    2. Membuat partisi untuk bulan yang row-nya ada di partisi DEFAULT
+       (loan_date di luar rentang partisi yang ada)
+    3. Partisi yang seluruh rentangnya lebih tua dari retention_months
+       bulan di-detach lalu di-drop. Hanya partisi kosong yang dibuang:
+       peminjaman returned lama dipindahkan dulu oleh archive-loans,
+       peminjaman yang masih aktif tidak pernah dibuang
+
+    Setiap partisi diproses dalam transaksi pendek sendiri.
+
+    Args:
+        engine: SQLAlchemy engine PostgreSQL
+        months_ahead: Jumlah partisi bulan ke depan
+        retention_months: Umur partisi (bulan) sebelum dibuang; 0 = tidak pernah
+        detach_only: Partisi kadaluarsa hanya di-detach (tabel tetap ada)
+        today: Override tanggal hari ini (testing)
+
+    Returns:
+        dict: {'created': [...], 'moved_from_default': int,
+               'dropped': [...], 'detached': [...], 'kept': {nama: jumlah row}}
+    """
+    today = today or date.today()
+    result = {'created': [], 'moved_from_default': 0, 'dropped': [], 'detached': [], 'kept': {}}
+
+    with engine.connect() as conn:
+        existing = {start for _, start, _ in list_partitions(conn)}
+        default_months = set(conn.execute(text(
+            f"SELECT DISTINCT date_trunc('month', loan_date)::date FROM {DEFAULT_PARTITION}"
+        )).scalars())
+
+    current = month_start(today)
+    wanted = {add_months(current, offset) for offset in range(months_ahead + 1)}
+    for month in sorted((wanted | default_months) - existing):
+        with engine.begin() as conn:
+            result['moved_from_default'] += _create_month_partition(conn, month)
+        result['created'].append(partition_name(month))
+
+    if retention_months > 0:
+        expire_before = add_months(current, -retention_months)
+        with engine.connect() as conn:
+            expired = [(name, end) for name, _, end in list_partitions(conn) if end <= expire_before]
+
+        for name, _ in expired:
+            with engine.begin() as conn:
+                rows = conn.execute(text(f'SELECT count(*) FROM {name}')).scalar()
+                if rows:
+                    result['kept'][name] = rows
+                    continue
+                conn.execute(text(f'ALTER TABLE {PARENT_TABLE} DETACH PARTITION {name}'))
+                if detach_only:
+                    result['detached'].append(name)
+                else:
+                    conn.execute(text(f'DROP TABLE {name}'))
+                    result['dropped'].append(name)
+
+    return result
@@ -0,0 +1,51 @@
+"""
+Connection Pool - QueuePool dengan pengukuran waktu tunggu checkout
+
+Tanpa pengukuran, pool yang habis hanya terlihat sebagai latency
+tambahan: request menunggu hingga pool_timeout sebelum mendapat koneksi.
+TimedQueuePool mengukur waktu yang dibutuhkan untuk mendapatkan koneksi
+(menunggu koneksi kosong, membuat koneksi baru dan pre-ping) dan
+meneruskannya ke listener yang terdaftar (mis. metrik Prometheus).
+"""
+
+from time import perf_counter
+
+from sqlalchemy import exc
+from sqlalchemy.pool import QueuePool
+
+
+# Listener: callable(duration_seconds, timed_out)
+_wait_listeners = []
+
+
+def add_pool_wait_listener(listener):
+    """
+    Mendaftarkan listener waktu tunggu checkout
+
+    Args:
+        listener: Callable (duration, timed_out)
+    """
+    if listener not in _wait_listeners:
+        _wait_listeners.append(listener)
+
+
+class TimedQueuePool(QueuePool):
+    """
+    QueuePool yang melaporkan waktu tunggu setiap checkout
+
+    recreate() (dipakai engine.dispose()) membuat instance dari class
+    yang sama, sehingga pengukuran tetap aktif setelah dispose.
+    """
+
+    def connect(self):
+        started = perf_counter()
+        timed_out = False
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            timed_out = True
+            raise
+        finally:
+            duration = perf_counter() - started
+            for listener in _wait_listeners:
+                listener(duration, timed_out)
@@ -0,0 +1,293 @@
+"""
+Query Instrumentation - Monitoring SQL per request
+
+Tujuan:
+- Menghitung jumlah statement dan total waktu database per request
+- Fingerprint SQL (literal & parameter dinormalisasi) untuk mengelompokkan
+  statement yang sama
+- Mendeteksi N+1: fingerprint yang sama dieksekusi berulang kali dalam
+  satu request (mis. lazy load Loan.book di Loan.to_dict)
+- Slow query log beserta EXPLAIN (dijalankan setelah response selesai
+  dikirim, saat koneksi session request sudah dikembalikan ke pool)
+
+Development: N+1 menghasilkan NPlusOneQueryError (fail loudly)
+Production: hanya sebagian request yang di-sampling dan hanya di-log
+"""
+
+import hashlib
+import logging
+import random
+import re
+from collections import Counter
+from time import perf_counter
+
+from flask import g, has_request_context, request
+from sqlalchemy import event
+
+
+logger = logging.getLogger('LibraryAPI.sql')
+
+
+class NPlusOneQueryError(RuntimeError):
+    """
+    Dilempar di development ketika satu request mengeksekusi statement
+    yang sama melebihi SQL_N_PLUS_ONE_THRESHOLD
+    """
+    pass
+
+
+# Pola normalisasi SQL untuk fingerprint
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r'\b\d+(?:\.\d+)?\b')
+_PLACEHOLDER = re.compile(r'%\(\w+\)s|%s|\$\d+|:\w+|\?')
+_IN_LIST = re.compile(r'\bin\s*\(\s*\?(?:\s*,\s*\?)*\s*\)')
+_WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_sql(statement):
+    """
+    Normalisasi SQL: literal dan placeholder menjadi '?', whitespace dirapikan
+
+    Args:
+        statement: SQL string
+
+    Returns:
+        str: SQL ternormalisasi
+    """
+    sql = _STRING_LITERAL.sub('?', statement)
+    sql = _PLACEHOLDER.sub('?', sql)
+    sql = _NUMBER_LITERAL.sub('?', sql)
+    sql = _WHITESPACE.sub(' ', sql).strip().lower()
+    return _IN_LIST.sub('in (?+)', sql)
+
+
+def fingerprint_sql(statement):
+    """
+    Fingerprint pendek untuk SQL ternormalisasi
+
+    Args:
+        statement: SQL string
+
+    Returns:
+        str: 12 karakter hex
+    """
+    return hashlib.sha1(normalize_sql(statement).encode('utf-8')).hexdigest()[:12]
+
+
+class RequestQueryStats:
+    """
+    Statistik query untuk satu request
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.total_time = 0.0
+        self.fingerprints = Counter()
+        self.samples = {}
+        self.slow_queries = []
+
+    def record(self, statement, parameters, duration, slow_threshold, engine=None):
+        """
+        Mencatat satu statement
+
+        Args:
+            statement: SQL yang dieksekusi
+            parameters: Parameter statement
+            duration: Durasi (detik)
+            slow_threshold: Batas slow query (detik)
+            engine: Engine yang mengeksekusi statement (primary atau replica),
+                dipakai untuk EXPLAIN slow query
+        """
+        fingerprint = fingerprint_sql(statement)
+        self.count += 1
+        self.total_time += duration
+        self.fingerprints[fingerprint] += 1
+        self.samples.setdefault(fingerprint, statement)
+
+        if duration >= slow_threshold:
+            self.slow_queries.append((statement, parameters, duration, engine))
+
+    def repeated(self, threshold):
+        """
+        Fingerprint yang dieksekusi minimal threshold kali
+
+        Returns:
+            List[tuple]: (fingerprint, jumlah, contoh SQL)
+        """
+        return [
+            (fingerprint, count, self.samples[fingerprint])
+            for fingerprint, count in self.fingerprints.most_common()
+            if count >= threshold
+        ]
+
+
+def explain_statement(engine, statement, parameters):
+    """
+    Menjalankan EXPLAIN untuk statement mentah (dengan parameter driver)
+
+    Args:
+        engine: SQLAlchemy engine
+        statement: SQL dari cursor
+        parameters: Parameter statement
+
+    Returns:
+        List[str]: Baris query plan (kosong jika gagal / bukan SELECT)
+    """
+    if not statement.lstrip().lower().startswith('select'):
+        return []
+
+    prefix = 'EXPLAIN ' if engine.dialect.name == 'postgresql' else 'EXPLAIN QUERY PLAN '
+    try:
+        with engine.connect() as conn:
+            conn = conn.execution_options(skip_query_instrumentation=True)
+            rows = conn.exec_driver_sql(prefix + statement, parameters or ())
+            return [str(row[-1]) for row in rows]
+    except Exception as e:
+        return [f'EXPLAIN gagal: {e}']
+
+
+class QueryInstrumentation:
+    """
+    Instrumentasi SQLAlchemy engine untuk monitoring query per request
+
+    Config:
+        SQL_INSTRUMENTATION_ENABLED: Aktifkan instrumentasi
+        SQL_INSTRUMENTATION_SAMPLE_RATE: Fraksi request yang diukur (0.0 - 1.0)
+        SQL_SLOW_QUERY_MS: Batas slow query (ms)
+        SQL_EXPLAIN_SLOW_QUERIES: Jalankan EXPLAIN untuk slow query
+        SQL_N_PLUS_ONE_THRESHOLD: Jumlah eksekusi fingerprint sama yang dianggap N+1
+        SQL_N_PLUS_ONE_RAISE: Lempar NPlusOneQueryError (development)
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.sample_rate = 1.0
+        self.slow_threshold = 0.1
+        self.explain_slow = True
+        self.n_plus_one_threshold = 5
+        self.raise_on_n_plus_one = False
+
+    def init_app(self, app, db):
+        """
+        Memasang instrumentasi ke engine dan request lifecycle
+
+        Args:
+            app: Flask application instance
+            db: SQLAlchemy instance (Flask-SQLAlchemy)
+        """
+        self.enabled = app.config.get('SQL_INSTRUMENTATION_ENABLED', False)
+        if not self.enabled:
+            return
+
+        self.sample_rate = app.config.get('SQL_INSTRUMENTATION_SAMPLE_RATE', 1.0)
+        self.slow_threshold = app.config.get('SQL_SLOW_QUERY_MS', 100) / 1000.0
+        self.explain_slow = app.config.get('SQL_EXPLAIN_SLOW_QUERIES', True)
+        self.n_plus_one_threshold = app.config.get('SQL_N_PLUS_ONE_THRESHOLD', 5)
+        self.raise_on_n_plus_one = app.config.get('SQL_N_PLUS_ONE_RAISE', False)
+
+        with app.app_context():
+            # Semua bind (termasuk read replica) dihitung dalam statistik request
+            engines = list(db.engines.values())
+
+        for bind_engine in engines:
+            event.listen(bind_engine, 'before_cursor_execute', self._before_cursor_execute)
+            event.listen(bind_engine, 'after_cursor_execute', self._after_cursor_execute)
+            event.listen(bind_engine, 'handle_error', self._handle_error)
+
+        @app.before_request
+        def start_query_stats():
+            if self.sample_rate >= 1.0 or random.random() < self.sample_rate:
+                g.sql_stats = RequestQueryStats()
+
+        @app.after_request
+        def check_query_stats(response):
+            stats = g.pop('sql_stats', None)
+            if stats is not None:
+                route = f'{request.method} {request.path}'
+                # Log dan EXPLAIN tidak menahan response; hanya N+1 yang
+                # harus menggagalkan request
+                response.call_on_close(lambda: self._report(stats, route))
+                self._check_n_plus_one(stats, route)
+            return response
+
+    def current_stats(self):
+        """
+        Statistik query request aktif
+
+        Returns:
+            RequestQueryStats atau None jika request tidak di-sampling
+        """
+        if not has_request_context():
+            return None
+        return g.get('sql_stats')
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('query_start_time', []).append(perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        started = conn.info['query_start_time'].pop()
+        if conn.get_execution_options().get('skip_query_instrumentation'):
+            return
+
+        duration = perf_counter() - started
+        stats = self.current_stats()
+
+        if stats is not None:
+            stats.record(statement, parameters, duration, self.slow_threshold, conn.engine)
+        elif duration >= self.slow_threshold:
+            # Di luar request (CLI, job): log tanpa EXPLAIN
+            logger.warning(
+                f'[SLOW QUERY] {duration * 1000:.1f}ms {normalize_sql(statement)}'
+            )
+
+    def _handle_error(self, exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get('query_start_time'):
+            conn.info['query_start_time'].pop()
+
+    def _report(self, stats, route):
+        """
+        Log ringkasan request, slow query (beserta EXPLAIN) dan N+1 suspect
+
+        Args:
+            stats: RequestQueryStats
+            route: 'METHOD /path' request
+        """
+        logger.debug(
+            f'[SQL] {route}: {stats.count} statements, {stats.total_time * 1000:.1f}ms'
+        )
+
+        for statement, parameters, duration, engine in stats.slow_queries:
+            # EXPLAIN di bind yang mengeksekusi statement (primary atau replica)
+            plan = explain_statement(engine, statement, parameters) if self.explain_slow else []
+            plan_text = ''.join(f'\n    {line}' for line in plan)
+            logger.warning(
+                f'[SLOW QUERY] {route} {duration * 1000:.1f}ms '
+                f'{normalize_sql(statement)}{plan_text}'
+            )
+
+        for fingerprint, count, statement in stats.repeated(self.n_plus_one_threshold):
+            logger.warning(
+                f'[N+1 SUSPECT] {route}: {count}x [{fingerprint}] {normalize_sql(statement)}'
+            )
+
+    def _check_n_plus_one(self, stats, route):
+        """
+        Menggagalkan request yang terdeteksi N+1 (development)
+
+        Raises:
+            NPlusOneQueryError: Jika SQL_N_PLUS_ONE_RAISE aktif dan ada N+1
+        """
+        if not self.raise_on_n_plus_one:
+            return
+        suspects = stats.repeated(self.n_plus_one_threshold)
+        if suspects:
+            fingerprint, count, statement = suspects[0]
+            raise NPlusOneQueryError(
+                f'{route} mengeksekusi statement yang sama {count}x '
+                f'(threshold {self.n_plus_one_threshold}): {normalize_sql(statement)}'
+            )
+
+
+# Singleton instance
+query_instrumentation = QueryInstrumentation()
@@ -0,0 +1,249 @@
+"""
+Read Replica - Routing query read-only ke database replica
+
+Method repository read-only yang ditandai @replica_reads dieksekusi di
+bind 'replica' (SQLALCHEMY_BINDS['replica'], dari REPLICA_DATABASE_URI).
+Query lain tetap ke primary:
+- flush/commit (semua write)
+- read-after-write: begitu session melakukan flush dalam request ini,
+  semua query berikutnya di request yang sama dibaca dari primary
+- replica tertinggal lebih dari REPLICA_MAX_LAG_SECONDS atau tidak bisa
+  dihubungi: fallback ke primary sampai pengecekan lag berikutnya
+
+Lag dicek paling sering sekali per REPLICA_LAG_CHECK_INTERVAL detik per
+proses. Di PostgreSQL lag dihitung dari waktu replay WAL terakhir
+(0 jika replica sudah menerapkan semua WAL yang diterima); database lain
+hanya dicek konektivitasnya.
+"""
+
+import logging
+from contextlib import contextmanager
+from functools import wraps
+from threading import Lock
+from time import monotonic
+
+from flask import has_app_context
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event, text
+
+
+logger = logging.getLogger('LibraryAPI')
+
+REPLICA_BIND = 'replica'
+
+_POSTGRES_LAG_SQL = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+""")
+
+# Listener: callable(target, reason) dengan target 'replica' atau 'primary'
+_route_listeners = []
+# Listener: callable(lag_seconds) setiap pengecekan lag (None jika gagal)
+_lag_listeners = []
+
+
+def add_replica_route_listener(listener):
+    """
+    Mendaftarkan listener keputusan routing query read-only
+
+    Args:
+        listener: Callable (target, reason)
+    """
+    if listener not in _route_listeners:
+        _route_listeners.append(listener)
+
+
+def add_replica_lag_listener(listener):
+    """
+    Mendaftarkan listener hasil pengecekan lag replica
+
+    Args:
+        listener: Callable (lag_seconds atau None)
+    """
+    if listener not in _lag_listeners:
+        _lag_listeners.append(listener)
+
+
+class ReplicaRouter:
+    """
+    Menentukan apakah query read-only boleh dibaca dari replica
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.max_lag = 5.0
+        self.check_interval = 5.0
+        self._lock = Lock()
+        self._checked_at = None
+        self._healthy = False
+        self.last_lag = None
+
+    def init_app(self, app):
+        """
+        Membaca konfigurasi replica
+
+        Config:
+            SQLALCHEMY_BINDS['replica']: URI replica (aktif jika ada)
+            REPLICA_MAX_LAG_SECONDS: Lag maksimum sebelum fallback ke primary
+            REPLICA_LAG_CHECK_INTERVAL: Interval pengecekan lag (detik)
+
+        Args:
+            app: Flask application instance
+        """
+        self.enabled = REPLICA_BIND in (app.config.get('SQLALCHEMY_BINDS') or {})
+        self.max_lag = app.config.get('REPLICA_MAX_LAG_SECONDS', 5.0)
+        self.check_interval = app.config.get('REPLICA_LAG_CHECK_INTERVAL', 5.0)
+        self._checked_at = None
+
+    def measure_lag(self, engine):
+        """
+        Mengukur lag replica
+
+        Args:
+            engine: Engine replica
+
+        Returns:
+            float: Lag dalam detik (0 untuk database non-PostgreSQL)
+        """
+        with engine.connect() as connection:
+            # Query pengecekan tidak dihitung di statistik SQL request
+            connection = connection.execution_options(skip_query_instrumentation=True)
+            if engine.dialect.name == 'postgresql':
+                return float(connection.execute(_POSTGRES_LAG_SQL).scalar() or 0)
+            connection.execute(text('SELECT 1'))
+            return 0.0
+
+    def is_healthy(self, engine):
+        """
+        Status replica (cache per check_interval; hanya satu thread yang
+        mengecek, thread lain memakai status terakhir)
+
+        Args:
+            engine: Engine replica
+
+        Returns:
+            bool: True jika lag di bawah max_lag
+        """
+        now = monotonic()
+        if self._checked_at is not None and now - self._checked_at < self.check_interval:
+            return self._healthy
+        if not self._lock.acquire(blocking=False):
+            return self._healthy
+
+        try:
+            error = None
+            try:
+                lag = self.measure_lag(engine)
+            except Exception as e:
+                lag, error = None, e
+
+            healthy = lag is not None and lag <= self.max_lag
+            # Hanya perubahan status yang di-log
+            if not healthy and (self._healthy or self._checked_at is None):
+                if error is not None:
+                    logger.warning(f'Replica tidak bisa dihubungi, baca dari primary: {error}')
+                else:
+                    logger.warning(
+                        f'Replica tertinggal {lag:.1f} detik (batas {self.max_lag}), baca dari primary'
+                    )
+            elif healthy and not self._healthy and self._checked_at is not None:
+                logger.info(f'Replica kembali dipakai (lag {lag:.1f} detik)')
+
+            self.last_lag = lag
+            self._healthy = healthy
+            self._checked_at = monotonic()
+            for listener in _lag_listeners:
+                listener(lag)
+            return healthy
+        finally:
+            self._lock.release()
+
+    def read_engine(self, session):
+        """
+        Engine untuk query read-only di session ini
+
+        Args:
+            session: RoutingSession
+
+        Returns:
+            Engine replica, atau None jika harus ke primary
+        """
+        if session.info.get('wrote'):
+            reason, engine = 'read_after_write', None
+        else:
+            engine = session._db.engines.get(REPLICA_BIND)
+            if engine is None:
+                reason = 'not_configured'
+            elif self.is_healthy(engine):
+                reason = 'replica'
+            else:
+                reason, engine = 'unhealthy', None
+
+        for listener in _route_listeners:
+            listener('replica' if engine is not None else 'primary', reason)
+        return engine
+
+
+# Singleton instance
+replica_router = ReplicaRouter()
+
+
+class RoutingSession(Session):
+    """
+    Session Flask-SQLAlchemy yang mengarahkan query di dalam
+    read_replica() ke replica; flush dan query lain tetap ke primary
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if (bind is None and self.info.get('replica_depth')
+                and not self._flushing and replica_router.enabled):
+            engine = replica_router.read_engine(self)
+            if engine is not None:
+                return engine
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+@event.listens_for(RoutingSession, 'after_flush')
+def _mark_wrote(session, flush_context):
+    # Read-after-write: sisa request membaca dari primary
+    session.info['wrote'] = True
+
+
+@contextmanager
+def read_replica(session):
+    """
+    Context manager: query read-only di dalam blok boleh dibaca dari replica
+
+    Args:
+        session: RoutingSession (mis. db.session())
+    """
+    session.info['replica_depth'] = session.info.get('replica_depth', 0) + 1
+    try:
+        yield session
+    finally:
+        session.info['replica_depth'] -= 1
+
+
+def replica_reads(method):
+    """
+    Decorator method repository read-only: dieksekusi di replica jika
+    replica aktif dan sehat
+
+    Args:
+        method: Method repository
+
+    Returns:
+        Method yang dibungkus
+    """
+    @wraps(method)
+    def wrapper(*args, **kwargs):
+        if not replica_router.enabled or not has_app_context():
+            return method(*args, **kwargs)
+
+        from app.database.connection import db
+        with read_replica(db.session()):
+            return method(*args, **kwargs)
+    return wrapper
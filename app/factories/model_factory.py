@@ -10,7 +10,7 @@ Tujuan:
 """
 
 from app.models import Book, Loan
-from datetime import datetime
+from datetime import date, datetime, timedelta
 
 
 class ModelFactory:
@@ -38,6 +38,35 @@ class ModelFactory:
         Returns:
             Book: Instance Book object yang sudah tervalidasi
         
+        Raises:
+            ValueError: Jika data tidak valid
+        """
+        row = ModelFactory.create_book_row(data)
+        
+        # Create Book instance
+        book = Book(
+            title=row['title'],
+            author=row['author'],
+            isbn=row['isbn'],
+            year=row['year'],
+            category=row['category'],
+            stock=row['stock']
+        )
+        
+        return book
+    
+    @staticmethod
+    def create_book_row(data):
+        """
+        Factory method untuk membuat row buku (dict) tanpa ORM object
+        Dipakai untuk bulk insert, dengan validasi yang sama seperti create_book
+        
+        Args:
+            data (dict): Dictionary berisi data buku (lihat create_book)
+        
+        Returns:
+            dict: Kolom-kolom tabel books yang siap di-insert
+        
         Raises:
             ValueError: Jika data tidak valid
         """
@@ -60,17 +89,16 @@ class ModelFactory:
             if stock < 0:
                 raise ValueError("Stock tidak boleh negatif")
             
-            # Create Book instance
-            book = Book(
-                title=title,
-                author=author,
-                isbn=isbn,
-                year=year,
-                category=category,
-                stock=stock
-            )
-            
-            return book
+            return {
+                'title': title,
+                'author': author,
+                'isbn': isbn,
+                'year': year,
+                'category': category,
+                'stock': stock,
+                'available': stock,  # Initially, semua stock tersedia
+                'is_deleted': False
+            }
             
         except (TypeError, ValueError) as e:
             raise ValueError(f"Error creating Book: {str(e)}")
@@ -90,6 +118,34 @@ class ModelFactory:
         Returns:
             Loan: Instance Loan object yang sudah tervalidasi
         
+        Raises:
+            ValueError: Jika data tidak valid
+        """
+        row = ModelFactory.create_loan_row(data)
+        
+        # Create Loan instance
+        loan = Loan(
+            book_id=row['book_id'],
+            borrower_name=row['borrower_name'],
+            loan_date=row['loan_date'],
+            due_date=row['due_date']
+        )
+        
+        return loan
+    
+    @staticmethod
+    def create_loan_row(data):
+        """
+        Factory method untuk membuat row peminjaman (dict) tanpa ORM object
+        Dipakai untuk bulk insert, dengan validasi yang sama seperti create_loan
+        
+        Args:
+            data (dict): Dictionary berisi data peminjaman (lihat create_loan)
+                loan_date/due_date boleh berupa string YYYY-MM-DD atau date
+        
+        Returns:
+            dict: Kolom-kolom tabel loans yang siap di-insert
+        
         Raises:
             ValueError: Jika data tidak valid
         """
@@ -97,39 +153,54 @@ class ModelFactory:
             # Extract data
             book_id = int(data.get('book_id', 0))
             borrower_name = data.get('borrower_name', '').strip()
-            loan_date_str = data.get('loan_date', '')
-            due_date_str = data.get('due_date', None)
+            loan_date_value = data.get('loan_date', '')
+            due_date_value = data.get('due_date', None)
             
             # Basic validation
-            if not book_id or not borrower_name or not loan_date_str:
+            if not book_id or not borrower_name or not loan_date_value:
                 raise ValueError("book_id, borrower_name, dan loan_date wajib diisi")
             
             # Parse dates
-            try:
-                loan_date = datetime.strptime(loan_date_str, '%Y-%m-%d').date()
-            except ValueError:
-                raise ValueError("Format loan_date tidak valid. Gunakan: YYYY-MM-DD")
-            
-            due_date = None
-            if due_date_str:
-                try:
-                    due_date = datetime.strptime(due_date_str, '%Y-%m-%d').date()
-                except ValueError:
-                    raise ValueError("Format due_date tidak valid. Gunakan: YYYY-MM-DD")
+            loan_date = ModelFactory._parse_date(loan_date_value, 'loan_date')
             
-            # Create Loan instance
-            loan = Loan(
-                book_id=book_id,
-                borrower_name=borrower_name,
-                loan_date=loan_date,
-                due_date=due_date
-            )
+            if due_date_value:
+                due_date = ModelFactory._parse_date(due_date_value, 'due_date')
+            else:
+                due_date = loan_date + timedelta(days=Loan.DEFAULT_LOAN_DAYS)
             
-            return loan
+            return {
+                'book_id': book_id,
+                'borrower_name': borrower_name,
+                'loan_date': loan_date,
+                'due_date': due_date,
+                'status': 'borrowed',
+                'notes': data.get('notes')
+            }
             
         except (TypeError, ValueError) as e:
             raise ValueError(f"Error creating Loan: {str(e)}")
     
+    @staticmethod
+    def _parse_date(value, field_name):
+        """
+        Parse tanggal dari string YYYY-MM-DD atau date object
+        
+        Args:
+            value: String atau date
+            field_name: Nama field untuk error message
+        
+        Returns:
+            date: Tanggal hasil parsing
+        """
+        if isinstance(value, datetime):
+            return value.date()
+        if isinstance(value, date):
+            return value
+        try:
+            return datetime.strptime(value, '%Y-%m-%d').date()
+        except ValueError:
+            raise ValueError(f"Format {field_name} tidak valid. Gunakan: YYYY-MM-DD")
+    
     @staticmethod
     def update_book(book, data):
         """
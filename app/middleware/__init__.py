@@ -0,0 +1,37 @@
+"""
+Package middleware
+"""
+from .allocation_profiling import allocation_profiler, init_allocation_profiling
+from .compression import add_compression_listener, init_asgi_compression, init_compression
+from .metrics import (
+    init_metrics,
+    mark_worker_dead,
+    record_cache_lookup,
+    record_observer_dispatch
+)
+from .profiling import init_profiling
+from .server_timing import (
+    RequestTimer,
+    init_server_timing,
+    instrument_methods,
+    timed,
+    timing_phase
+)
+
+__all__ = [
+    'allocation_profiler',
+    'init_allocation_profiling',
+    'add_compression_listener',
+    'init_compression',
+    'init_asgi_compression',
+    'init_metrics',
+    'init_profiling',
+    'mark_worker_dead',
+    'record_cache_lookup',
+    'record_observer_dispatch',
+    'RequestTimer',
+    'init_server_timing',
+    'instrument_methods',
+    'timed',
+    'timing_phase'
+]
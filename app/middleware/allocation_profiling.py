@@ -0,0 +1,277 @@
+"""
+Allocation Profiling Middleware - Profiling alokasi memori per route
+
+Endpoint list membangun beberapa salinan penuh hasil query: objek ORM,
+list dict dari to_dict() di dalam result service, lalu string JSON dari
+jsonify. Mode ini memakai tracemalloc untuk mencatat per route:
+- peak: puncak memori yang dialokasikan selama request
+- net: memori yang masih hidup saat response selesai dibangun
+  (objek ORM di session + body response)
+- top allocation sites (file:baris) dari request dengan peak tertinggi
+
+Hasil diagregasi di memori dan dapat dilihat di GET /debug/allocations
+serta ditulis ke file report JSON (ALLOCATION_PROFILING_REPORT).
+
+tracemalloc bersifat global per proses, sehingga hanya satu request yang
+diukur pada satu waktu; request lain yang berjalan bersamaan dilewati.
+"""
+
+import json
+import os
+import threading
+import tracemalloc
+
+from flask import g, jsonify, request
+
+
+# tracemalloc global per proses: satu request diukur pada satu waktu
+_tracing_lock = threading.Lock()
+
+
+class RouteAllocationStats:
+    """
+    Agregat alokasi untuk satu route
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.peak_total = 0
+        self.peak_max = 0
+        self.net_total = 0
+        self.net_max = 0
+        self.worst = None
+
+    def record(self, peak, net, sample):
+        """
+        Mencatat hasil satu request
+
+        Args:
+            peak: Puncak alokasi (bytes)
+            net: Alokasi yang masih hidup di akhir request (bytes)
+            sample: Detail request (args, status, top sites)
+        """
+        self.requests += 1
+        self.peak_total += peak
+        self.net_total += net
+        self.net_max = max(self.net_max, net)
+        if peak >= self.peak_max:
+            self.peak_max = peak
+            self.worst = sample
+
+    def to_dict(self):
+        return {
+            'requests': self.requests,
+            'peak_avg_kb': round(self.peak_total / self.requests / 1024, 1),
+            'peak_max_kb': round(self.peak_max / 1024, 1),
+            'net_avg_kb': round(self.net_total / self.requests / 1024, 1),
+            'net_max_kb': round(self.net_max / 1024, 1),
+            'worst_request': self.worst
+        }
+
+
+class AllocationProfiler:
+    """
+    Mengumpulkan statistik alokasi per route
+
+    Config:
+        ALLOCATION_PROFILING_ENABLED: Aktifkan mode profiling alokasi
+        ALLOCATION_PROFILING_ROUTES: Daftar URL rule dipisah koma (kosong = semua)
+        ALLOCATION_PROFILING_TOP_SITES: Jumlah allocation site yang disimpan
+        ALLOCATION_PROFILING_FRAMES: Kedalaman traceback tracemalloc
+        ALLOCATION_PROFILING_REPORT: Path file report JSON (kosong = tanpa file)
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.routes = set()
+        self.top_sites = 10
+        self.frames = 30
+        self.report_path = None
+        self.root_path = None
+        self.app_path = None
+        self.stats = {}
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        """
+        Mendaftarkan hook request dan endpoint /debug/allocations
+
+        Args:
+            app: Flask application instance
+        """
+        self.enabled = app.config.get('ALLOCATION_PROFILING_ENABLED', False)
+        if not self.enabled:
+            return
+
+        routes = app.config.get('ALLOCATION_PROFILING_ROUTES') or ''
+        self.routes = {route.strip() for route in routes.split(',') if route.strip()}
+        self.top_sites = app.config.get('ALLOCATION_PROFILING_TOP_SITES', 10)
+        self.frames = app.config.get('ALLOCATION_PROFILING_FRAMES', 30)
+        self.report_path = app.config.get('ALLOCATION_PROFILING_REPORT') or None
+        self.root_path = os.path.dirname(app.root_path)
+        # Frame middleware sendiri tidak dianggap allocation site aplikasi
+        self.app_path = app.root_path + os.sep
+
+        app.before_request(self._start)
+        app.after_request(self._finish)
+        app.teardown_request(self._abort)
+        app.add_url_rule(
+            '/debug/allocations', 'debug_allocations', self._view, methods=['GET', 'DELETE']
+        )
+
+    def report(self):
+        """
+        Statistik alokasi semua route, diurutkan dari peak tertinggi
+
+        Returns:
+            List[dict]: Statistik per route ('METHOD rule')
+        """
+        with self._lock:
+            items = sorted(self.stats.items(), key=lambda item: item[1].peak_max, reverse=True)
+            return [dict(route=route, **stats.to_dict()) for route, stats in items]
+
+    def reset(self):
+        """Hapus semua statistik"""
+        with self._lock:
+            self.stats.clear()
+
+    def _selected(self):
+        rule = request.url_rule.rule if request.url_rule else None
+        if rule is None or rule == '/debug/allocations':
+            return False
+        return not self.routes or rule in self.routes
+
+    def _start(self):
+        if not self._selected():
+            return
+        # Lewati jika request lain sedang diukur atau tracemalloc dipakai pihak lain
+        if not _tracing_lock.acquire(blocking=False):
+            return
+        if tracemalloc.is_tracing():
+            _tracing_lock.release()
+            return
+        g.allocation_tracing = True
+        tracemalloc.start(self.frames)
+
+    def _finish(self, response):
+        if not g.pop('allocation_tracing', False):
+            return response
+
+        try:
+            net, peak = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+            _tracing_lock.release()
+
+        route = f'{request.method} {request.url_rule.rule}'
+        sample = {
+            'path': request.path,
+            'args': request.args.to_dict(flat=False),
+            'status': response.status_code,
+            'response_kb': round(response.calculate_content_length() / 1024, 1)
+            if not response.is_streamed else None,
+            'peak_kb': round(peak / 1024, 1),
+            'net_kb': round(net / 1024, 1),
+            'top_sites': self._top_sites(snapshot)
+        }
+
+        with self._lock:
+            self.stats.setdefault(route, RouteAllocationStats()).record(peak, net, sample)
+
+        if self.report_path:
+            self._write_report()
+        return response
+
+    def _abort(self, exception=None):
+        # Request gagal sebelum after_request: pastikan tracing berhenti
+        if g.pop('allocation_tracing', False):
+            tracemalloc.stop()
+            _tracing_lock.release()
+
+    def _top_sites(self, snapshot):
+        """
+        Allocation site terbesar yang masih hidup di akhir request
+
+        Setiap alokasi diatribusikan ke frame terdalam di dalam kode
+        aplikasi (mis. baris to_dict() atau jsonify di controller), bukan
+        ke baris internal SQLAlchemy/Werkzeug. Frame terdalam aslinya
+        disertakan sebagai 'origin'.
+
+        Args:
+            snapshot: tracemalloc.Snapshot
+
+        Returns:
+            List[dict]: site, origin, size_kb, count
+        """
+        snapshot = snapshot.filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap*>'),
+            tracemalloc.Filter(False, '<unknown>')
+        ))
+
+        sites = {}
+        for stat in snapshot.statistics('traceback'):
+            # Traceback berurutan dari frame terluar ke terdalam
+            frames = list(reversed(stat.traceback))
+            origin = frames[0]
+            site = next((f for f in frames if f.filename.startswith(self.app_path)), origin)
+            key = (self._format_frame(site), self._format_frame(origin))
+            entry = sites.setdefault(key, [0, 0])
+            entry[0] += stat.size
+            entry[1] += stat.count
+
+        top = sorted(sites.items(), key=lambda item: item[1][0], reverse=True)
+        return [
+            {
+                'site': site,
+                'origin': origin,
+                'size_kb': round(size / 1024, 1),
+                'count': count
+            }
+            for (site, origin), (size, count) in top[:self.top_sites]
+        ]
+
+    def _format_frame(self, frame):
+        filename = frame.filename
+        if filename.startswith(self.root_path):
+            filename = os.path.relpath(filename, self.root_path)
+        return f'{filename}:{frame.lineno}'
+
+    def _write_report(self):
+        directory = os.path.dirname(self.report_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f'{self.report_path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, indent=2)
+        os.replace(tmp_path, self.report_path)
+
+    def _view(self):
+        """
+        GET /debug/allocations - Statistik alokasi per route
+        DELETE /debug/allocations - Reset statistik
+        """
+        if request.method == 'DELETE':
+            self.reset()
+            return jsonify({'success': True, 'message': 'Statistik alokasi direset'}), 200
+
+        return jsonify({
+            'success': True,
+            'message': 'Statistik alokasi per route',
+            'data': self.report()
+        }), 200
+
+
+# Singleton instance
+allocation_profiler = AllocationProfiler()
+
+
+def init_allocation_profiling(app):
+    """
+    Mendaftarkan mode profiling alokasi (no-op jika nonaktif)
+
+    Args:
+        app: Flask application instance
+    """
+    allocation_profiler.init_app(app)
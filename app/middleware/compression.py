@@ -0,0 +1,372 @@
+"""
+Compression Middleware - Kompresi response sesuai Accept-Encoding
+
+Encoding yang didukung (urutan preferensi server, COMPRESSION_ALGORITHMS):
+- zstd: dependency opsional zstandard
+- br: dependency opsional brotli
+- gzip: selalu tersedia (zlib)
+Encoding yang dependency-nya tidak terpasang dilewati.
+
+Response biasa dikompresi sekali jika body >= COMPRESSION_MIN_SIZE byte.
+Response streaming (generator) dikompresi per chunk tanpa menunggu body
+lengkap; output di-flush setiap COMPRESSION_STREAM_FLUSH_BYTES byte input
+agar client menerima data secara bertahap.
+
+Level default dipilih dari benchmarks/compression_benchmark.py: untuk
+payload JSON API, level lebih tinggi hanya memperkecil ukuran beberapa
+persen dengan biaya CPU berlipat.
+"""
+
+import zlib
+from threading import local
+from time import perf_counter
+
+from flask import request
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - dependency opsional
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - dependency opsional
+    zstandard = None
+
+
+DEFAULT_MIMETYPES = (
+    'application/json', 'application/x-ndjson', 'text/csv', 'text/plain', 'text/html'
+)
+
+# Listener: callable(encoding, original_bytes, compressed_bytes, duration)
+_listeners = []
+
+
+def add_compression_listener(listener):
+    """
+    Mendaftarkan listener hasil kompresi response
+
+    Args:
+        listener: Callable (encoding, original_bytes, compressed_bytes, duration)
+    """
+    if listener not in _listeners:
+        _listeners.append(listener)
+
+
+class GzipCodec:
+    """gzip (zlib, wbits=31)"""
+
+    name = 'gzip'
+
+    def __init__(self, level):
+        self.level = level
+
+    def compress(self, data):
+        compressor = self.compressobj()
+        return compressor.compress(data) + compressor.finish()
+
+    def compressobj(self):
+        return _ZlibStream(zlib.compressobj(self.level, zlib.DEFLATED, 31))
+
+
+class BrotliCodec:
+    """Brotli (dependency opsional brotli)"""
+
+    name = 'br'
+
+    def __init__(self, quality):
+        self.quality = quality
+
+    def compress(self, data):
+        return brotli.compress(data, mode=brotli.MODE_TEXT, quality=self.quality)
+
+    def compressobj(self):
+        return _BrotliStream(brotli.Compressor(mode=brotli.MODE_TEXT, quality=self.quality))
+
+
+class ZstdCodec:
+    """Zstandard (dependency opsional zstandard)"""
+
+    name = 'zstd'
+
+    def __init__(self, level):
+        self.level = level
+        # ZstdCompressor hanya boleh dipakai satu operasi pada satu waktu:
+        # satu instance per thread (gunicorn gthread)
+        self._local = local()
+
+    def compress(self, data):
+        compressor = getattr(self._local, 'compressor', None)
+        if compressor is None:
+            compressor = self._local.compressor = zstandard.ZstdCompressor(level=self.level)
+        return compressor.compress(data)
+
+    def compressobj(self):
+        return _ZstdStream(zstandard.ZstdCompressor(level=self.level).compressobj())
+
+
+class _ZlibStream:
+    def __init__(self, compressor):
+        self._compressor = compressor
+
+    def compress(self, data):
+        return self._compressor.compress(data)
+
+    def flush(self):
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self):
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class _BrotliStream:
+    def __init__(self, compressor):
+        self._compressor = compressor
+
+    def compress(self, data):
+        return self._compressor.process(data)
+
+    def flush(self):
+        return self._compressor.flush()
+
+    def finish(self):
+        return self._compressor.finish()
+
+
+class _ZstdStream:
+    def __init__(self, compressor):
+        self._compressor = compressor
+
+    def compress(self, data):
+        return self._compressor.compress(data)
+
+    def flush(self):
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self):
+        return self._compressor.flush()
+
+
+def build_codecs(config):
+    """
+    Membuat codec yang tersedia sesuai urutan COMPRESSION_ALGORITHMS
+
+    Args:
+        config: Mapping konfigurasi aplikasi
+
+    Returns:
+        dict: nama encoding -> codec (urutan = preferensi server)
+    """
+    factories = {
+        'zstd': lambda: ZstdCodec(config.get('COMPRESSION_ZSTD_LEVEL', 3)) if zstandard else None,
+        'br': lambda: BrotliCodec(config.get('COMPRESSION_BROTLI_QUALITY', 4)) if brotli else None,
+        'gzip': lambda: GzipCodec(config.get('COMPRESSION_GZIP_LEVEL', 6)),
+    }
+
+    codecs = {}
+    for name in config.get('COMPRESSION_ALGORITHMS', 'zstd,br,gzip').split(','):
+        name = name.strip()
+        codec = factories[name]() if name in factories else None
+        if codec is not None:
+            codecs[name] = codec
+    return codecs
+
+
+def choose_encoding(accept_encodings, codecs):
+    """
+    Memilih encoding dari header Accept-Encoding
+
+    Encoding dengan q tertinggi dipilih; jika q sama, urutan preferensi
+    server (urutan codecs) yang menentukan.
+
+    Args:
+        accept_encodings: werkzeug Accept (request.accept_encodings)
+        codecs: Hasil build_codecs
+
+    Returns:
+        Nama encoding, atau None jika tidak ada yang cocok
+    """
+    best, best_quality = None, 0
+    for name in codecs:
+        quality = accept_encodings.quality(name)
+        if quality > best_quality:
+            best, best_quality = name, quality
+    return best
+
+
+def _compress_stream(chunks, codec, flush_bytes, on_done):
+    """
+    Generator: mengompresi chunk body streaming secara bertahap
+
+    on_done(original, compressed, duration) dipanggil saat stream selesai;
+    duration hanya menghitung waktu kompresi, bukan waktu menunggu chunk.
+    """
+    stream = codec.compressobj()
+    original = compressed = pending = 0
+    duration = 0.0
+    try:
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                chunk = chunk.encode('utf-8')
+            original += len(chunk)
+            pending += len(chunk)
+
+            started = perf_counter()
+            output = stream.compress(chunk)
+            if pending >= flush_bytes:
+                output += stream.flush()
+                pending = 0
+            duration += perf_counter() - started
+            if output:
+                compressed += len(output)
+                yield output
+
+        started = perf_counter()
+        output = stream.finish()
+        duration += perf_counter() - started
+        compressed += len(output)
+        yield output
+    finally:
+        close = getattr(chunks, 'close', None)
+        if close is not None:
+            close()
+        on_done(original, compressed, duration)
+
+
+def _vary_accept_encoding(headers):
+    vary = headers.get('Vary')
+    if not vary:
+        headers['Vary'] = 'Accept-Encoding'
+    elif 'accept-encoding' not in vary.lower():
+        headers['Vary'] = f'{vary}, Accept-Encoding'
+
+
+def _compressible(response, mimetypes):
+    return (
+        response.status_code >= 200
+        and response.status_code not in (204, 206, 304)
+        and 'Content-Encoding' not in response.headers
+        and response.mimetype in mimetypes
+    )
+
+
+def _notify(encoding, original, compressed, duration):
+    for listener in _listeners:
+        listener(encoding, original, compressed, duration)
+
+
+def _compress_body(response, codec, data):
+    started = perf_counter()
+    compressed = codec.compress(data)
+    _notify(codec.name, len(data), len(compressed), perf_counter() - started)
+
+    response.set_data(compressed)
+    response.headers['Content-Encoding'] = codec.name
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+
+
+class _Settings:
+    """
+    Konfigurasi kompresi yang dibaca sekali saat init
+    """
+
+    def __init__(self, config):
+        self.codecs = build_codecs(config)
+        self.min_size = config.get('COMPRESSION_MIN_SIZE', 1024)
+        self.mimetypes = frozenset(config.get('COMPRESSION_MIMETYPES', DEFAULT_MIMETYPES))
+        self.flush_bytes = config.get('COMPRESSION_STREAM_FLUSH_BYTES', 64 * 1024)
+
+    def select_codec(self, method, response, accept_encodings):
+        """
+        Codec untuk response ini, atau None jika tidak dikompresi
+        (menambahkan Vary: Accept-Encoding untuk response yang bisa dikompresi)
+        """
+        if method == 'HEAD' or not _compressible(response, self.mimetypes):
+            return None
+
+        _vary_accept_encoding(response.headers)
+        encoding = choose_encoding(accept_encodings, self.codecs)
+        return self.codecs[encoding] if encoding else None
+
+
+def init_compression(app):
+    """
+    Mendaftarkan kompresi response ke Flask app
+
+    Didaftarkan sebelum middleware lain agar after_request-nya berjalan
+    paling akhir (setelah semua header dan body final).
+
+    Config:
+        COMPRESSION_ENABLED: Aktifkan kompresi
+        COMPRESSION_ALGORITHMS: Urutan preferensi encoding (mis. 'zstd,br,gzip')
+        COMPRESSION_MIN_SIZE: Body lebih kecil dari ini (byte) tidak dikompresi
+        COMPRESSION_GZIP_LEVEL / COMPRESSION_BROTLI_QUALITY / COMPRESSION_ZSTD_LEVEL:
+            Level kompresi (CPU vs bandwidth)
+        COMPRESSION_MIMETYPES: Mimetype yang dikompresi
+        COMPRESSION_STREAM_FLUSH_BYTES: Interval flush response streaming
+
+    Args:
+        app: Flask application instance
+    """
+    if not app.config.get('COMPRESSION_ENABLED', True):
+        return
+
+    settings = _Settings(app.config)
+
+    @app.after_request
+    def compress_response(response):
+        if response.direct_passthrough:
+            return response
+        codec = settings.select_codec(request.method, response, request.accept_encodings)
+        if codec is None:
+            return response
+
+        if response.is_streamed:
+            def on_done(original, compressed, duration):
+                _notify(codec.name, original, compressed, duration)
+
+            response.response = _compress_stream(
+                response.response, codec, settings.flush_bytes, on_done)
+            response.headers.pop('Content-Length', None)
+            response.headers['Content-Encoding'] = codec.name
+            return response
+
+        data = response.get_data()
+        if len(data) >= settings.min_size:
+            _compress_body(response, codec, data)
+        return response
+
+
+def init_asgi_compression(app):
+    """
+    Padanan init_compression untuk app Quart (mode ASGI)
+
+    Hanya body non-streaming yang dikompresi; response streaming Quart
+    dikirim apa adanya.
+
+    Args:
+        app: Quart application instance
+    """
+    if not app.config.get('COMPRESSION_ENABLED', True):
+        return
+
+    from quart import request as async_request
+    from quart.wrappers.response import DataBody
+
+    settings = _Settings(app.config)
+
+    @app.after_request
+    async def compress_response(response):
+        if not isinstance(response.response, DataBody):
+            return response
+        codec = settings.select_codec(
+            async_request.method, response, async_request.accept_encodings)
+        if codec is None:
+            return response
+
+        data = await response.get_data()
+        if len(data) >= settings.min_size:
+            _compress_body(response, codec, data)
+        return response
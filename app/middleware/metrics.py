@@ -0,0 +1,299 @@
+"""
+Metrics Middleware - Endpoint /metrics format Prometheus
+
+Metrik yang dikumpulkan:
+- http_request_duration_seconds: Histogram latency per route
+- http_requests_total: Counter request per route dan status code
+- db_pool_checkouts_total, db_pool_checked_out, db_pool_overflow, db_pool_size:
+  Pemakaian pool
+- db_pool_wait_seconds, db_pool_timeouts_total: Waktu tunggu checkout dan
+  checkout yang gagal karena pool habis
+- db_pool_pre_ping_failures_total: Koneksi mati yang terdeteksi pre-ping
+- db_replica_reads_total, db_replica_lag_seconds: Routing query read-only
+  (replica/primary beserta alasannya) dan lag replica terakhir
+- service_coalesced_calls_total: Panggilan service per hasil coalescing
+  (executed / shared_inflight / shared_window)
+- http_response_bytes_total, http_compression_seconds: Ukuran body sebelum dan
+  sesudah kompresi per encoding (rasio dihitung di Prometheus) dan waktu CPU kompresi
+- cache_requests_total: Hit/miss per cache (hit ratio dihitung di Prometheus):
+  overdue_analytics (laporan), circulation_timeseries (per bucket historis),
+  single_flight (hasil window COALESCE_WINDOW_SECONDS)
+- observer_dispatch_seconds: Waktu dispatch event per observer
+
+Multi-process: jika env PROMETHEUS_MULTIPROC_DIR di-set (sebelum aplikasi
+di-import), setiap worker menulis metrik ke file mmap di direktori tersebut
+dan /metrics mengagregasi semua file, sehingga hasilnya sama apapun worker
+yang melayani scrape.
+
+Dependency opsional: prometheus-client. Jika tidak terpasang, /metrics
+tidak didaftarkan dan semua hook menjadi no-op.
+"""
+
+import logging
+import os
+from time import perf_counter
+
+from flask import Response, g, request
+
+try:
+    import prometheus_client
+    from prometheus_client import (
+        CONTENT_TYPE_LATEST, CollectorRegistry, Counter, Gauge, Histogram,
+        generate_latest, multiprocess
+    )
+except ImportError:  # pragma: no cover - dependency opsional
+    prometheus_client = None
+
+
+logger = logging.getLogger('LibraryAPI')
+
+# Diaktifkan oleh init_metrics
+_enabled = False
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+if prometheus_client is not None:
+    REQUEST_LATENCY = Histogram(
+        'http_request_duration_seconds',
+        'Latency request HTTP per route',
+        ['method', 'route'],
+        buckets=LATENCY_BUCKETS
+    )
+    REQUEST_COUNT = Counter(
+        'http_requests_total',
+        'Jumlah request HTTP per route dan status',
+        ['method', 'route', 'status']
+    )
+    POOL_CHECKOUTS = Counter(
+        'db_pool_checkouts_total',
+        'Jumlah checkout koneksi dari pool'
+    )
+    POOL_CHECKED_OUT = Gauge(
+        'db_pool_checked_out',
+        'Koneksi yang sedang dipakai',
+        multiprocess_mode='livesum'
+    )
+    POOL_OVERFLOW = Gauge(
+        'db_pool_overflow',
+        'Koneksi overflow di atas pool_size',
+        multiprocess_mode='livesum'
+    )
+    POOL_SIZE = Gauge(
+        'db_pool_size',
+        'Ukuran pool (pool_size) yang dikonfigurasi',
+        multiprocess_mode='livesum'
+    )
+    POOL_WAIT = Histogram(
+        'db_pool_wait_seconds',
+        'Waktu menunggu koneksi dari pool',
+        buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+    )
+    POOL_TIMEOUTS = Counter(
+        'db_pool_timeouts_total',
+        'Checkout yang gagal karena pool habis (pool_timeout)'
+    )
+    POOL_PRE_PING_FAILURES = Counter(
+        'db_pool_pre_ping_failures_total',
+        'Koneksi mati yang terdeteksi oleh pre-ping'
+    )
+    REPLICA_READS = Counter(
+        'db_replica_reads_total',
+        'Query read-only per tujuan (replica/primary) dan alasan',
+        ['target', 'reason']
+    )
+    REPLICA_LAG = Gauge(
+        'db_replica_lag_seconds',
+        'Lag replica pada pengecekan terakhir (-1 jika tidak bisa dihubungi)',
+        multiprocess_mode='max'
+    )
+    SERVICE_COALESCED = Counter(
+        'service_coalesced_calls_total',
+        'Panggilan service read-only per hasil coalescing',
+        ['call', 'result']
+    )
+    RESPONSE_BYTES = Counter(
+        'http_response_bytes_total',
+        'Ukuran body response terkompresi, sebelum (original) dan sesudah (compressed)',
+        ['encoding', 'stage']
+    )
+    COMPRESSION_TIME = Histogram(
+        'http_compression_seconds',
+        'Waktu kompresi body response',
+        ['encoding'],
+        buckets=(0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1)
+    )
+    CACHE_REQUESTS = Counter(
+        'cache_requests_total',
+        'Lookup cache per hasil (hit/miss)',
+        ['cache', 'result']
+    )
+    OBSERVER_DISPATCH = Histogram(
+        'observer_dispatch_seconds',
+        'Waktu dispatch event ke observer',
+        ['event', 'observer'],
+        buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5)
+    )
+
+
+def is_multiprocess():
+    """
+    Cek apakah mode multi-process aktif
+
+    Returns:
+        bool: True jika PROMETHEUS_MULTIPROC_DIR di-set
+    """
+    return bool(os.getenv('PROMETHEUS_MULTIPROC_DIR') or os.getenv('prometheus_multiproc_dir'))
+
+
+def record_cache_lookup(cache_name, hit, count=1):
+    """
+    Mencatat lookup cache
+
+    Args:
+        cache_name: Nama cache
+        hit: True jika hit
+        count: Jumlah lookup dengan hasil yang sama
+    """
+    if _enabled and count:
+        CACHE_REQUESTS.labels(cache_name, 'hit' if hit else 'miss').inc(count)
+
+
+def record_observer_dispatch(event_name, observer_name, duration):
+    """
+    Mencatat waktu dispatch event ke satu observer
+
+    Args:
+        event_name: Nama event
+        observer_name: Nama class observer
+        duration: Durasi (detik)
+    """
+    if _enabled:
+        OBSERVER_DISPATCH.labels(event_name, observer_name).observe(duration)
+
+
+def mark_worker_dead(pid):
+    """
+    Membersihkan file metrik gauge 'live' milik worker yang sudah berhenti
+    Dipanggil oleh process manager (mis. hook child_exit gunicorn)
+
+    Args:
+        pid: PID worker
+    """
+    if prometheus_client is not None and is_multiprocess():
+        multiprocess.mark_process_dead(pid)
+
+
+def metrics_view():
+    """
+    GET /metrics
+    Metrik aplikasi dalam format Prometheus text
+    """
+    if is_multiprocess():
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = prometheus_client.REGISTRY
+
+    return Response(generate_latest(registry), mimetype=CONTENT_TYPE_LATEST)
+
+
+def init_metrics(app, engine):
+    """
+    Mendaftarkan endpoint /metrics dan hook metrik
+
+    Config:
+        METRICS_ENABLED: Aktifkan metrik dan endpoint /metrics
+
+    Args:
+        app: Flask application instance
+        engine: SQLAlchemy engine untuk metrik pool
+    """
+    global _enabled
+
+    if not app.config.get('METRICS_ENABLED'):
+        return
+
+    if prometheus_client is None:
+        logger.warning('METRICS_ENABLED aktif tetapi prometheus-client tidak terpasang')
+        return
+
+    _enabled = True
+
+    from sqlalchemy import event, exc
+    
+    from app.database import (
+        add_pool_wait_listener, add_replica_lag_listener, add_replica_route_listener
+    )
+    from app.middleware.compression import add_compression_listener
+    from app.services.single_flight import add_coalesce_listener, single_flight
+
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        POOL_CHECKOUTS.inc()
+        POOL_CHECKED_OUT.inc()
+        # engine.pool dibaca ulang karena dispose() membuat pool baru
+        overflow = getattr(engine.pool, 'overflow', None)
+        if overflow is not None:
+            POOL_OVERFLOW.set(max(0, overflow()))
+
+    def on_checkin(dbapi_connection, connection_record):
+        POOL_CHECKED_OUT.dec()
+
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        # Pre-ping yang gagal meng-invalidate koneksi dengan DisconnectionError
+        if isinstance(exception, exc.DisconnectionError):
+            POOL_PRE_PING_FAILURES.inc()
+
+    def on_pool_wait(duration, timed_out):
+        POOL_WAIT.observe(duration)
+        if timed_out:
+            POOL_TIMEOUTS.inc()
+
+    def on_replica_route(target, reason):
+        REPLICA_READS.labels(target, reason).inc()
+
+    def on_replica_lag(lag):
+        REPLICA_LAG.set(-1 if lag is None else lag)
+
+    def on_coalesce(name, result):
+        SERVICE_COALESCED.labels(name, result).inc()
+        # Window hasil single-flight berfungsi sebagai cache singkat
+        if result == 'shared_window':
+            CACHE_REQUESTS.labels('single_flight', 'hit').inc()
+        elif result == 'executed' and single_flight.window > 0:
+            CACHE_REQUESTS.labels('single_flight', 'miss').inc()
+
+    def on_compress(encoding, original, compressed, duration):
+        RESPONSE_BYTES.labels(encoding, 'original').inc(original)
+        RESPONSE_BYTES.labels(encoding, 'compressed').inc(compressed)
+        COMPRESSION_TIME.labels(encoding).observe(duration)
+
+    event.listen(engine, 'checkout', on_checkout)
+    event.listen(engine, 'checkin', on_checkin)
+    event.listen(engine, 'invalidate', on_invalidate)
+    add_pool_wait_listener(on_pool_wait)
+    add_replica_route_listener(on_replica_route)
+    add_replica_lag_listener(on_replica_lag)
+    add_coalesce_listener(on_coalesce)
+    add_compression_listener(on_compress)
+
+    size = getattr(engine.pool, 'size', None)
+    if size is not None:
+        POOL_SIZE.set(size())
+
+    @app.before_request
+    def start_request_metrics():
+        g.metrics_started = perf_counter()
+
+    @app.after_request
+    def record_request_metrics(response):
+        started = g.pop('metrics_started', None)
+        if started is None:
+            return response
+
+        route = request.url_rule.rule if request.url_rule else 'unmatched'
+        REQUEST_LATENCY.labels(request.method, route).observe(perf_counter() - started)
+        REQUEST_COUNT.labels(request.method, route, str(response.status_code)).inc()
+        return response
+
+    app.add_url_rule('/metrics', 'metrics', metrics_view, methods=['GET'])
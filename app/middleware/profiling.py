@@ -0,0 +1,248 @@
+"""
+Profiling Middleware - Profiling per request secara on-demand
+
+Request diprofile jika PROFILING_ENABLED aktif dan salah satu terpenuhi:
+- Request membawa header X-Profile (harus sama dengan PROFILING_TOKEN
+  jika token dikonfigurasi)
+- Request terpilih oleh sampling PROFILING_SAMPLE_RATE
+
+Mode profiler:
+- cprofile: deterministik, ditulis sebagai file pstats (.prof)
+- sample: statistik (sampling stack thread request), ditulis sebagai
+  collapsed stacks (.folded) yang siap untuk flamegraph.pl / speedscope
+
+Setiap profile disertai file metadata .json (route, args, durasi).
+Direktori profile berupa ring: hanya PROFILING_MAX_FILES profile terbaru
+yang disimpan.
+"""
+
+import cProfile
+import json
+import os
+import random
+import re
+import sys
+import threading
+from collections import Counter
+from datetime import datetime
+from time import perf_counter
+
+from flask import g, request
+
+
+PROFILE_HEADER = 'X-Profile'
+
+# cProfile tidak bisa aktif di beberapa thread sekaligus secara aman
+_cprofile_lock = threading.Lock()
+
+
+class StackSampler(threading.Thread):
+    """
+    Sampling profiler untuk satu thread
+
+    Mengambil stack thread target setiap interval dan menghitung
+    collapsed stack (frame terluar ke terdalam dipisah ';').
+    """
+
+    def __init__(self, thread_id, interval=0.005):
+        super().__init__(daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            names = []
+            while frame is not None:
+                code = frame.f_code
+                names.append(f'{os.path.basename(code.co_filename)}:{code.co_name}')
+                frame = frame.f_back
+            self.stacks[';'.join(reversed(names))] += 1
+
+    def stop(self):
+        """Hentikan sampling dan tunggu thread selesai"""
+        self._stop_event.set()
+        self.join()
+
+    def collapsed(self):
+        """
+        Format collapsed stacks
+
+        Returns:
+            str: Satu baris per stack: 'frame;frame;frame count'
+        """
+        return ''.join(f'{stack} {count}\n' for stack, count in self.stacks.most_common())
+
+
+class RequestProfiler:
+    """
+    Mengelola satu sesi profiling untuk satu request
+    """
+
+    def __init__(self, mode, sample_interval):
+        self.mode = mode
+        self.started = perf_counter()
+        self._profile = None
+        self._sampler = None
+        self._sample_interval = sample_interval
+
+    def start(self):
+        """
+        Mulai profiling
+
+        Returns:
+            bool: False jika profiler tidak bisa dimulai (cProfile sedang dipakai)
+        """
+        if self.mode == 'sample':
+            self._sampler = StackSampler(threading.get_ident(), self._sample_interval)
+            self._sampler.start()
+            return True
+
+        if not _cprofile_lock.acquire(blocking=False):
+            return False
+        self._profile = cProfile.Profile()
+        self._profile.enable()
+        return True
+
+    def stop(self):
+        """
+        Hentikan profiling
+
+        Returns:
+            float: Durasi request (ms)
+        """
+        if self._sampler is not None:
+            self._sampler.stop()
+        if self._profile is not None:
+            self._profile.disable()
+            _cprofile_lock.release()
+        return (perf_counter() - self.started) * 1000
+
+    def write(self, path_without_ext):
+        """
+        Tulis hasil profile ke disk
+
+        Args:
+            path_without_ext: Path file tanpa ekstensi
+
+        Returns:
+            str: Path file profile
+        """
+        if self._sampler is not None:
+            path = path_without_ext + '.folded'
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(self._sampler.collapsed())
+        else:
+            path = path_without_ext + '.prof'
+            self._profile.dump_stats(path)
+        return path
+
+
+def _trim_ring(directory, max_files):
+    """
+    Hapus profile terlama sehingga tersisa max_files profile
+
+    Args:
+        directory: Direktori profile
+        max_files: Jumlah profile maksimal
+    """
+    metadata_files = sorted(
+        name for name in os.listdir(directory) if name.endswith('.json')
+    )
+    for name in metadata_files[:-max_files] if max_files > 0 else metadata_files:
+        base = os.path.join(directory, name[:-len('.json')])
+        for ext in ('.json', '.prof', '.folded'):
+            try:
+                os.remove(base + ext)
+            except FileNotFoundError:
+                pass
+
+
+def _should_profile(config):
+    header_value = request.headers.get(PROFILE_HEADER)
+    if header_value:
+        token = config.get('PROFILING_TOKEN')
+        return not token or header_value == token
+
+    sample_rate = config.get('PROFILING_SAMPLE_RATE', 0.0)
+    return sample_rate > 0 and random.random() < sample_rate
+
+
+def init_profiling(app):
+    """
+    Mendaftarkan hook profiling per request
+
+    Config:
+        PROFILING_ENABLED: Aktifkan profiling on-demand
+        PROFILING_MODE: 'cprofile' atau 'sample'
+        PROFILING_SAMPLE_RATE: Fraksi request yang diprofile tanpa header
+        PROFILING_SAMPLE_INTERVAL_MS: Interval sampling mode 'sample'
+        PROFILING_TOKEN: Nilai header X-Profile yang diterima (opsional)
+        PROFILING_DIR: Direktori output
+        PROFILING_MAX_FILES: Ukuran ring (jumlah profile)
+
+    Args:
+        app: Flask application instance
+    """
+    if not app.config.get('PROFILING_ENABLED'):
+        return
+
+    config = app.config
+    directory = config.get('PROFILING_DIR', 'logs/profiles')
+    max_files = config.get('PROFILING_MAX_FILES', 50)
+    mode = config.get('PROFILING_MODE', 'cprofile')
+    sample_interval = config.get('PROFILING_SAMPLE_INTERVAL_MS', 5) / 1000.0
+    ring_lock = threading.Lock()
+
+    @app.before_request
+    def start_profiling():
+        if not _should_profile(config):
+            return
+        profiler = RequestProfiler(mode, sample_interval)
+        if profiler.start():
+            g.request_profiler = profiler
+
+    @app.after_request
+    def finish_profiling(response):
+        profiler = g.pop('request_profiler', None)
+        if profiler is None:
+            return response
+
+        duration_ms = profiler.stop()
+        route = request.url_rule.rule if request.url_rule else request.path
+        slug = re.sub(r'[^A-Za-z0-9]+', '_', route).strip('_') or 'root'
+        stamp = datetime.utcnow().strftime('%Y%m%dT%H%M%S%f')
+        profile_id = f'{stamp}_{request.method}_{slug}_{int(duration_ms)}ms'
+
+        with ring_lock:
+            os.makedirs(directory, exist_ok=True)
+            base = os.path.join(directory, profile_id)
+            profile_path = profiler.write(base)
+            with open(base + '.json', 'w', encoding='utf-8') as f:
+                json.dump({
+                    'id': profile_id,
+                    'mode': mode,
+                    'method': request.method,
+                    'route': route,
+                    'path': request.path,
+                    'args': request.args.to_dict(flat=False),
+                    'view_args': request.view_args,
+                    'status': response.status_code,
+                    'duration_ms': round(duration_ms, 3),
+                    'profile': os.path.basename(profile_path)
+                }, f, indent=2)
+            _trim_ring(directory, max_files)
+
+        response.headers['X-Profile-Id'] = profile_id
+        return response
+
+    @app.teardown_request
+    def abort_profiling(exception=None):
+        # Request gagal sebelum after_request: pastikan profiler berhenti
+        profiler = g.pop('request_profiler', None)
+        if profiler is not None:
+            profiler.stop()
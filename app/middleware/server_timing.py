@@ -0,0 +1,246 @@
+"""
+Server-Timing Middleware - Breakdown waktu per fase untuk setiap request
+
+Fase yang diukur (waktu eksklusif, fase bersarang tidak dihitung ganda):
+- sql: eksekusi statement di database (event SQLAlchemy engine)
+- orm: repository di luar SQL (membangun query, hydration object)
+- validation: validator (Strategy)
+- serialize: to_dict() model
+- observers: EventSubject.notify
+- json: serialisasi response oleh JSON provider
+- service: logic service di luar fase lain
+- other: sisa waktu request (routing, controller, middleware)
+
+Hook dipasang lewat decorator timed/instrument_methods. Saat fitur ini
+nonaktif, decorator hanya mengecek satu flag lalu memanggil fungsi asli.
+"""
+
+import json
+import logging
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter
+
+from flask import g, has_request_context, request
+from flask.json.provider import DefaultJSONProvider
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+# Di-set oleh init_server_timing, dibaca oleh semua hook
+_enabled = False
+
+PHASE_ORDER = ['sql', 'orm', 'validation', 'serialize', 'observers', 'json', 'service']
+
+access_logger = logging.getLogger('LibraryAPI.access')
+
+
+class RequestTimer:
+    """
+    Akumulator waktu per fase untuk satu request
+
+    Menggunakan stack agar waktu fase bersarang (mis. lazy load SQL di dalam
+    to_dict) dikurangkan dari fase induknya.
+    """
+
+    def __init__(self):
+        self.started = perf_counter()
+        self.phases = {}
+        self._stack = []
+
+    def push(self, name):
+        """Mulai fase baru"""
+        self._stack.append([name, perf_counter(), 0.0])
+
+    def pop(self):
+        """Akhiri fase teratas dan akumulasikan waktu eksklusifnya"""
+        if not self._stack:
+            return
+        name, started, child_time = self._stack.pop()
+        elapsed = perf_counter() - started
+        self.phases[name] = self.phases.get(name, 0.0) + elapsed - child_time
+        if self._stack:
+            self._stack[-1][2] += elapsed
+
+    def durations_ms(self):
+        """
+        Durasi semua fase dalam milidetik, termasuk 'other' dan 'total'
+
+        Returns:
+            dict: Nama fase -> durasi (ms)
+        """
+        total = perf_counter() - self.started
+        durations = {}
+        for name in PHASE_ORDER + sorted(set(self.phases) - set(PHASE_ORDER)):
+            if name in self.phases:
+                durations[name] = round(self.phases[name] * 1000, 3)
+        durations['other'] = round(max(0.0, total - sum(self.phases.values())) * 1000, 3)
+        durations['total'] = round(total * 1000, 3)
+        return durations
+
+    def header_value(self, durations=None):
+        """
+        Format header Server-Timing
+
+        Args:
+            durations: Optional hasil durations_ms() yang sudah dihitung
+
+        Returns:
+            str: Contoh 'sql;dur=1.2, orm;dur=0.4, total;dur=3.1'
+        """
+        durations = durations or self.durations_ms()
+        return ', '.join(f'{name};dur={duration}' for name, duration in durations.items())
+
+
+def current_timer():
+    """
+    Mendapatkan RequestTimer untuk request aktif
+
+    Returns:
+        RequestTimer atau None jika nonaktif / di luar request
+    """
+    if not _enabled or not has_request_context():
+        return None
+    return g.get('server_timing')
+
+
+@contextmanager
+def timing_phase(name):
+    """
+    Context manager untuk mengukur satu fase
+
+    Args:
+        name: Nama fase
+    """
+    timer = current_timer()
+    if timer is None:
+        yield
+        return
+    timer.push(name)
+    try:
+        yield
+    finally:
+        timer.pop()
+
+
+def timed(name):
+    """
+    Decorator untuk mengukur fungsi sebagai fase tertentu
+
+    Args:
+        name: Nama fase
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            timer = current_timer()
+            if timer is None:
+                return func(*args, **kwargs)
+            timer.push(name)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                timer.pop()
+        return wrapper
+    return decorator
+
+
+def instrument_methods(name):
+    """
+    Class decorator: mengukur semua public method class sebagai satu fase
+
+    Args:
+        name: Nama fase
+    """
+    def decorator(cls):
+        for attr, value in list(vars(cls).items()):
+            if not attr.startswith('_') and callable(value):
+                setattr(cls, attr, timed(name)(value))
+        return cls
+    return decorator
+
+
+class TimedJSONProvider(DefaultJSONProvider):
+    """
+    JSON provider yang mengukur waktu serialisasi response (fase 'json')
+    """
+
+    def dumps(self, obj, **kwargs):
+        with timing_phase('json'):
+            return super().dumps(obj, **kwargs)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    timer = current_timer()
+    if timer is not None:
+        timer.push('sql')
+        conn.info['server_timing_pushed'] = True
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if conn.info.pop('server_timing_pushed', False):
+        timer = current_timer()
+        if timer is not None:
+            timer.pop()
+
+
+def _handle_error(exception_context):
+    conn = exception_context.connection
+    if conn is not None and conn.info.pop('server_timing_pushed', False):
+        timer = current_timer()
+        if timer is not None:
+            timer.pop()
+
+
+def init_server_timing(app):
+    """
+    Mendaftarkan middleware Server-Timing ke Flask app
+
+    Config:
+        SERVER_TIMING_ENABLED: Aktifkan pengukuran dan header Server-Timing
+        SERVER_TIMING_ACCESS_LOG: Tulis breakdown ke access log (JSON)
+
+    Args:
+        app: Flask application instance
+    """
+    global _enabled
+
+    # Flag proses mengikuti app terakhir yang di-init: app yang dibuat kemudian
+    # dengan SERVER_TIMING_ENABLED=False tidak ikut mengukur setiap request
+    _enabled = bool(app.config.get('SERVER_TIMING_ENABLED'))
+    if not _enabled:
+        return
+
+    access_log = app.config.get('SERVER_TIMING_ACCESS_LOG', False)
+
+    app.json = TimedJSONProvider(app)
+
+    if not event.contains(Engine, 'before_cursor_execute', _before_cursor_execute):
+        event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+        event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+        event.listen(Engine, 'handle_error', _handle_error)
+
+    @app.before_request
+    def start_server_timing():
+        g.server_timing = RequestTimer()
+
+    @app.after_request
+    def add_server_timing_header(response):
+        timer = g.pop('server_timing', None)
+        if timer is None:
+            return response
+
+        durations = timer.durations_ms()
+        response.headers['Server-Timing'] = timer.header_value(durations)
+
+        if access_log:
+            access_logger.info(json.dumps({
+                'method': request.method,
+                'path': request.path,
+                'endpoint': request.endpoint,
+                'status': response.status_code,
+                'timing_ms': durations
+            }))
+        return response
@@ -2,6 +2,8 @@
 Package models
 """
 from .book import Book
+from .book_tombstone import BookTombstone
 from .loan import Loan
+from .loan_archive import LoanArchive
 
-__all__ = ['Book', 'Loan']
+__all__ = ['Book', 'BookTombstone', 'Loan', 'LoanArchive']
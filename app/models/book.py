@@ -6,6 +6,7 @@ Model ini merepresentasikan entity Buku dalam sistem perpustakaan
 
 from datetime import datetime
 from app.database import db
+from app.middleware import timed
 
 
 class Book(db.Model):
@@ -48,7 +49,39 @@ class Book(db.Model):
     is_deleted = db.Column(db.Boolean, default=False)
     
     # Relationship dengan Loan
-    loans = db.relationship('Loan', backref='book', lazy=True)
+    loans = db.relationship('Loan', back_populates='book', lazy=True)
+    
+    # Index sesuai pola akses BookRepository.
+    # Semua query baca memfilter is_deleted = false, sehingga index dibuat
+    # partial agar buku yang sudah dihapus tidak ikut memperbesar index.
+    __table_args__ = (
+        # find_all / count: ORDER BY created_at DESC (id sebagai tie-breaker)
+        db.Index(
+            'ix_books_live_created_at_id', 'created_at', 'id',
+            postgresql_where=(is_deleted == False),
+            sqlite_where=(is_deleted == False)
+        ),
+        # get_categories (DISTINCT category) dan statistik per kategori
+        db.Index(
+            'ix_books_live_category', 'category',
+            postgresql_where=(is_deleted == False),
+            sqlite_where=(is_deleted == False)
+        ),
+        # count({'available_only': True})
+        db.Index(
+            'ix_books_live_available', 'available',
+            postgresql_where=(is_deleted == False),
+            sqlite_where=(is_deleted == False)
+        ),
+        # purge_deleted: kandidat buku yang sudah dihapus (kecil, terus di-purge)
+        db.Index(
+            'ix_books_deleted_id', 'id',
+            postgresql_where=(is_deleted == True),
+            sqlite_where=(is_deleted == True)
+        ),
+        # Snapshot incremental: updated_at >= watermark (termasuk buku terhapus)
+        db.Index('ix_books_updated_at', 'updated_at'),
+    )
     
     def __init__(self, title, author, isbn, year, category, stock):
         """
@@ -70,6 +103,7 @@ class Book(db.Model):
         self.stock = stock
         self.available = stock  # Initially, semua stock tersedia
     
+    @timed('serialize')
     def to_dict(self):
         """
         Konversi object Book ke dictionary untuk JSON response
@@ -0,0 +1,70 @@
+"""
+Model BookTombstone - Representasi tabel books_tombstone di database
+
+Buku yang sudah di-soft delete dan tidak lagi direferensikan tabel loans
+dipindahkan dari books ke tabel ini (lihat BookRepository.purge_deleted)
+agar tabel books, index-nya dan unique constraint isbn hanya berisi katalog
+yang masih hidup. ID buku dipertahankan sehingga riwayat di loans_archive
+tetap bisa menampilkan judul buku.
+"""
+
+from datetime import datetime
+from app.database import db
+from app.middleware import timed
+
+
+class BookTombstone(db.Model):
+    """
+    Model untuk tabel books_tombstone
+
+    Attributes:
+        Sama dengan Book (tanpa is_deleted), ditambah:
+        purged_at: Waktu record dipindahkan dari books
+    """
+
+    __tablename__ = 'books_tombstone'
+
+    # Primary Key (ID asli dari tabel books, bukan autoincrement)
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+
+    # Book Information (isbn tidak unique: ISBN boleh dipakai buku baru)
+    title = db.Column(db.String(200), nullable=False)
+    author = db.Column(db.String(100), nullable=False)
+    isbn = db.Column(db.String(20), nullable=False)
+    year = db.Column(db.Integer, nullable=False)
+    category = db.Column(db.String(50), nullable=False)
+    stock = db.Column(db.Integer, nullable=False)
+    available = db.Column(db.Integer, nullable=False)
+
+    # Metadata
+    created_at = db.Column(db.DateTime)
+    updated_at = db.Column(db.DateTime)
+    purged_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    @timed('serialize')
+    def to_dict(self):
+        """
+        Konversi ke dictionary dengan format yang sama dengan Book.to_dict,
+        ditambah purged_at
+
+        Returns:
+            Dictionary representasi BookTombstone
+        """
+        return {
+            'id': self.id,
+            'title': self.title,
+            'author': self.author,
+            'isbn': self.isbn,
+            'year': self.year,
+            'category': self.category,
+            'stock': self.stock,
+            'available': self.available,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
+            'is_deleted': True,
+            'purged_at': self.purged_at.isoformat() if self.purged_at else None
+        }
+
+    def __repr__(self):
+        """String representation untuk debugging"""
+        return f'<BookTombstone {self.id}: {self.title} by {self.author}>'
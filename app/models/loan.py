@@ -6,6 +6,7 @@ Model ini merepresentasikan peminjaman buku
 
 from datetime import datetime, timedelta
 from app.database import db
+from app.middleware import timed
 
 
 class Loan(db.Model):
@@ -22,10 +23,14 @@ class Loan(db.Model):
         status: Status peminjaman ('borrowed', 'returned', 'overdue')
         notes: Catatan tambahan terkait peminjaman/perpanjangan
         created_at: Waktu pembuatan record
+        updated_at: Waktu update terakhir (watermark snapshot incremental)
     """
     
     __tablename__ = 'loans'
     
+    # Durasi pinjam default jika due_date tidak diisi
+    DEFAULT_LOAN_DAYS = 14
+    
     # Primary Key
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     
@@ -42,6 +47,30 @@ class Loan(db.Model):
     
     # Metadata
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    # Relationship dengan Book; dideklarasikan di sini (bukan backref) agar
+    # Loan.book sudah ada saat statement repository dibangun
+    book = db.relationship('Book', back_populates='loans')
+    
+    # Index sesuai pola akses LoanRepository
+    __table_args__ = (
+        # find_overdue_loans / statistik: status = 'borrowed' AND due_date < today
+        db.Index('ix_loans_status_due_date', 'status', 'due_date'),
+        # find_active_by_book / filter book_id (+ status) di find_all
+        db.Index('ix_loans_book_id_status', 'book_id', 'status'),
+        # Urutan default find_all / find_by_borrower: ORDER BY created_at DESC
+        db.Index('ix_loans_created_at_id', 'created_at', 'id'),
+        # find_by_book: book_id = ? AND id < cursor ORDER BY id DESC (keyset)
+        db.Index('ix_loans_book_id_id', 'book_id', 'id'),
+        # archive_returned: status = 'returned' AND return_date < cutoff
+        # (juga statistik timeseries pengembalian per return_date)
+        db.Index('ix_loans_status_return_date', 'status', 'return_date'),
+        # Statistik timeseries: loan_date dalam rentang
+        db.Index('ix_loans_loan_date', 'loan_date'),
+        # Snapshot incremental: updated_at >= watermark
+        db.Index('ix_loans_updated_at', 'updated_at'),
+    )
     
     def __init__(self, book_id, borrower_name, loan_date, due_date=None, notes=None):
         """
@@ -69,7 +98,7 @@ class Loan(db.Model):
             else:
                 self.due_date = due_date
         else:
-            self.due_date = self.loan_date + timedelta(days=14)
+            self.due_date = self.loan_date + timedelta(days=self.DEFAULT_LOAN_DAYS)
         
         self.status = 'borrowed'
         self.notes = notes
@@ -102,6 +131,7 @@ class Loan(db.Model):
             return False
         return datetime.utcnow().date() > self.due_date
     
+    @timed('serialize')
     def to_dict(self):
         """
         Konversi object Loan ke dictionary untuk JSON response
@@ -0,0 +1,114 @@
+"""
+Model LoanArchive - Representasi tabel loans_archive di database
+
+Peminjaman yang sudah dikembalikan dan melewati masa retensi dipindahkan
+dari tabel loans ke tabel ini (lihat LoanRepository.archive_returned) agar
+tabel loans tetap kecil. ID peminjaman dipertahankan sehingga ID unik di
+kedua tabel.
+"""
+
+from datetime import datetime
+from app.database import db
+from app.middleware import timed
+
+
+class LoanArchive(db.Model):
+    """
+    Model untuk tabel loans_archive
+
+    Attributes:
+        Sama dengan Loan, ditambah:
+        archived_at: Waktu record dipindahkan ke arsip
+    """
+
+    __tablename__ = 'loans_archive'
+
+    # Primary Key (ID asli dari tabel loans, bukan autoincrement)
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+
+    # Tanpa foreign key: buku yang sudah di-purge pindah ke books_tombstone
+    # sementara riwayat peminjamannya tetap di arsip
+    book_id = db.Column(db.Integer, nullable=False)
+
+    # Loan Information
+    borrower_name = db.Column(db.String(100), nullable=False)
+    loan_date = db.Column(db.Date, nullable=False)
+    due_date = db.Column(db.Date, nullable=False)
+    return_date = db.Column(db.Date, nullable=True)
+    status = db.Column(db.String(20), nullable=False)
+    notes = db.Column(db.Text, nullable=True)
+
+    # Metadata
+    created_at = db.Column(db.DateTime)
+    updated_at = db.Column(db.DateTime)
+    archived_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    book = db.relationship(
+        'Book', primaryjoin='foreign(LoanArchive.book_id) == Book.id', viewonly=True
+    )
+    # Judul buku yang sudah di-purge; selalu di-join agar to_dict tidak N+1
+    purged_book = db.relationship(
+        'BookTombstone', primaryjoin='foreign(LoanArchive.book_id) == BookTombstone.id',
+        viewonly=True, lazy='joined'
+    )
+
+    # Index untuk query riwayat lengkap (include_archived)
+    __table_args__ = (
+        # find_all: ORDER BY created_at DESC
+        db.Index('ix_loans_archive_created_at_id', 'created_at', 'id'),
+        # find_by_book: book_id = ? AND id < cursor ORDER BY id DESC
+        db.Index('ix_loans_archive_book_id_id', 'book_id', 'id'),
+        # Statistik timeseries: loan_date / return_date dalam rentang
+        db.Index('ix_loans_archive_loan_date', 'loan_date'),
+        db.Index('ix_loans_archive_return_date', 'return_date'),
+        # Snapshot incremental: updated_at >= watermark
+        db.Index('ix_loans_archive_updated_at', 'updated_at'),
+    )
+
+    @property
+    def book_title(self):
+        """
+        Judul buku dari books, atau dari books_tombstone jika sudah di-purge
+
+        Returns:
+            str atau None
+        """
+        book = self.book or self.purged_book
+        return book.title if book else None
+
+    def is_overdue(self):
+        """
+        Peminjaman di arsip selalu sudah dikembalikan
+
+        Returns:
+            Boolean: False
+        """
+        return False
+
+    @timed('serialize')
+    def to_dict(self):
+        """
+        Konversi ke dictionary dengan format yang sama dengan Loan.to_dict,
+        ditambah archived_at
+
+        Returns:
+            Dictionary representasi LoanArchive
+        """
+        return {
+            'id': self.id,
+            'book_id': self.book_id,
+            'book_title': self.book_title,
+            'borrower_name': self.borrower_name,
+            'loan_date': self.loan_date.isoformat() if self.loan_date else None,
+            'due_date': self.due_date.isoformat() if self.due_date else None,
+            'return_date': self.return_date.isoformat() if self.return_date else None,
+            'status': self.status,
+            'is_overdue': False,
+            'notes': self.notes,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'archived_at': self.archived_at.isoformat() if self.archived_at else None
+        }
+
+    def __repr__(self):
+        """String representation untuk debugging"""
+        return f'<LoanArchive {self.id}: Book {self.book_id} by {self.borrower_name}>'
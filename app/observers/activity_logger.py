@@ -22,27 +22,51 @@ class ActivityLogger(EventObserver):
         """
         Inisialisasi logger
         
+        Handler belum dibuat di sini: direktori log dan file handler baru
+        dibuka oleh configure() (dipanggil create_app) atau saat log pertama,
+        sehingga import package observers tidak menyentuh filesystem.
+        
         Args:
-            log_file: Path ke file log
+            log_file: Path default ke file log
         """
         self.log_file = log_file
-        self._setup_logger()
+        self._logger = None
+    
+    @property
+    def logger(self):
+        """
+        Logger 'LibraryAPI', dikonfigurasi saat pertama dipakai
+        
+        Returns:
+            logging.Logger
+        """
+        if self._logger is None:
+            self.configure()
+        return self._logger
     
-    def _setup_logger(self):
+    def configure(self, log_file=None):
         """
-        Setup konfigurasi logging
+        Setup konfigurasi logging (hanya sekali per proses)
+        
+        Args:
+            log_file: Path ke file log (default: log_file dari constructor)
         """
+        if self._logger is not None:
+            return
+        if log_file:
+            self.log_file = log_file
+        
         # Buat direktori logs jika belum ada
         log_dir = os.path.dirname(self.log_file)
         if log_dir and not os.path.exists(log_dir):
             os.makedirs(log_dir)
         
         # Konfigurasi logger
-        self.logger = logging.getLogger('LibraryAPI')
-        self.logger.setLevel(logging.INFO)
+        logger = logging.getLogger('LibraryAPI')
+        logger.setLevel(logging.INFO)
         
         # Hindari duplicate handlers
-        if not self.logger.handlers:
+        if not logger.handlers:
             # File handler
             file_handler = logging.FileHandler(self.log_file, encoding='utf-8')
             file_handler.setLevel(logging.INFO)
@@ -59,8 +83,10 @@ class ActivityLogger(EventObserver):
             file_handler.setFormatter(formatter)
             console_handler.setFormatter(formatter)
             
-            self.logger.addHandler(file_handler)
-            self.logger.addHandler(console_handler)
+            logger.addHandler(file_handler)
+            logger.addHandler(console_handler)
+        
+        self._logger = logger
     
     def get_subscribed_events(self):
         """
@@ -115,6 +141,10 @@ class ActivityLogger(EventObserver):
         elif event_type == EventType.BOOK_DELETED:
             return f"[BOOK_DELETED] Buku dihapus (ID: {data.get('book_id', 'N/A')})"
         
+        elif event_type == EventType.BOOK_PURGED:
+            book_ids = data.get('book_ids', [])
+            return f"[BOOK_PURGED] {len(book_ids)} buku dipindahkan ke books_tombstone (ID: {', '.join(map(str, book_ids[:10]))}{', ...' if len(book_ids) > 10 else ''})"
+        
         elif event_type == EventType.LOAN_CREATED:
             loan_info = data.get('loan', {})
             return f"[LOAN_CREATED] Peminjaman baru: Buku '{loan_info.get('book_title', 'N/A')}' oleh {loan_info.get('borrower_name', 'N/A')}"
@@ -123,6 +153,14 @@ class ActivityLogger(EventObserver):
             loan_info = data.get('loan', {})
             return f"[LOAN_RETURNED] Buku dikembalikan: '{loan_info.get('book_title', 'N/A')}' oleh {loan_info.get('borrower_name', 'N/A')}"
         
+        elif event_type == EventType.LOAN_UPDATED:
+            loan_info = data.get('loan', {})
+            return f"[LOAN_UPDATED] Peminjaman diupdate (ID: {loan_info.get('id', 'N/A')}, due_date: {loan_info.get('due_date', 'N/A')})"
+        
+        elif event_type == EventType.LOAN_DELETED:
+            loan_info = data.get('loan', {})
+            return f"[LOAN_DELETED] Peminjaman dihapus (ID: {loan_info.get('id', 'N/A')})"
+        
         elif event_type == EventType.SYSTEM_ERROR:
             return f"[ERROR] {data.get('message', 'Unknown error')}"
         
@@ -12,6 +12,10 @@ Tujuan:
 from abc import ABC, abstractmethod
 from enum import Enum
 
+from time import perf_counter
+
+from app.middleware import record_observer_dispatch, timed
+
 
 class EventType(Enum):
     """
@@ -21,10 +25,13 @@ class EventType(Enum):
     BOOK_CREATED = "book_created"
     BOOK_UPDATED = "book_updated"
     BOOK_DELETED = "book_deleted"
+    BOOK_PURGED = "book_purged"
     
     # Loan events
     LOAN_CREATED = "loan_created"
     LOAN_RETURNED = "loan_returned"
+    LOAN_UPDATED = "loan_updated"
+    LOAN_DELETED = "loan_deleted"
     
     # System events
     SYSTEM_ERROR = "system_error"
@@ -100,6 +107,7 @@ class EventSubject:
                 if observer in self._observers[event_type]:
                     self._observers[event_type].remove(observer)
     
+    @timed('observers')
     def notify(self, event_type, data=None):
         """
         Memberitahu semua observer yang terdaftar untuk event tertentu
@@ -110,11 +118,17 @@ class EventSubject:
         """
         if event_type in self._observers:
             for observer in self._observers[event_type]:
+                started = perf_counter()
                 try:
                     observer.update(event_type, data or {})
                 except Exception as e:
                     # Log error tapi jangan stop notifikasi ke observer lain
                     print(f"Error notifying observer: {e}")
+                record_observer_dispatch(
+                    event_type.value,
+                    type(observer).__name__,
+                    perf_counter() - started
+                )
     
     def get_observer_count(self, event_type=None):
         """
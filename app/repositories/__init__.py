@@ -1,12 +1,27 @@
 """
 Package repositories
 """
-from .base_repository import BaseRepository
+from app.utils.lazy_exports import lazy_exports
+
+from .base_repository import AsyncBaseRepository, BaseRepository
 from .book_repository import BookRepository, book_repository
 from .loan_repository import LoanRepository, loan_repository
 
+# Repository async di-import saat pertama diakses (lihat app.database)
+_LAZY_EXPORTS = {
+    'AsyncBookRepository': '.async_book_repository',
+    'async_book_repository': '.async_book_repository',
+    'AsyncLoanRepository': '.async_loan_repository',
+    'async_loan_repository': '.async_loan_repository',
+}
+
+__getattr__ = lazy_exports(__name__, _LAZY_EXPORTS)
+
+
 __all__ = [
-    'BaseRepository',
+    'BaseRepository', 'AsyncBaseRepository',
     'BookRepository', 'book_repository',
-    'LoanRepository', 'loan_repository'
+    'LoanRepository', 'loan_repository',
+    'AsyncBookRepository', 'async_book_repository',
+    'AsyncLoanRepository', 'async_loan_repository'
 ]
@@ -0,0 +1,260 @@
+"""
+Async Book Repository - Implementasi Adapter async untuk akses data Book
+
+Padanan BookRepository untuk mode ASGI: query yang sama ditulis sebagai
+statement select() dan dieksekusi di AsyncSession request aktif.
+"""
+
+from sqlalchemy import case, func, or_, select
+from sqlalchemy.orm import selectinload
+
+from app.repositories.base_repository import AsyncBaseRepository
+from app.models import Book, Loan
+from app.database.async_connection import async_db_connection
+from app.repositories.book_repository import (
+    SNAPSHOT_CHANGED_QUERY, SNAPSHOT_IDS_QUERY, SNAPSHOT_QUERY
+)
+
+
+class AsyncBookRepository(AsyncBaseRepository):
+    """
+    Repository async untuk operasi database tabel books
+
+    Pattern: Adapter
+    """
+
+    @property
+    def session(self):
+        return async_db_connection.session
+
+    def _apply_filters(self, stmt, filters):
+        """
+        Menerapkan filter category / available_only (sama dengan BookRepository)
+        """
+        if filters:
+            if 'category' in filters and filters['category']:
+                stmt = stmt.where(Book.category.ilike(f"%{filters['category']}%"))
+            if filters.get('available_only'):
+                stmt = stmt.where(Book.available > 0)
+        return stmt
+
+    async def find_all(self, filters=None):
+        """
+        Mendapatkan semua buku yang tidak dihapus
+
+        Args:
+            filters (dict): Optional filters (lihat BookRepository.find_all)
+
+        Returns:
+            List[Book]: Daftar buku
+        """
+        stmt = self._apply_filters(select(Book).where(Book.is_deleted == False), filters)
+
+        order_field = filters.get('order_by') if filters else None
+        if order_field == 'title':
+            stmt = stmt.order_by(Book.title)
+        elif order_field == 'year':
+            stmt = stmt.order_by(Book.year.desc())
+        else:
+            stmt = stmt.order_by(Book.created_at.desc())
+
+        if filters:
+            if 'limit' in filters:
+                stmt = stmt.limit(filters['limit'])
+            if 'offset' in filters:
+                stmt = stmt.offset(filters['offset'])
+
+        result = await self.session.scalars(stmt)
+        return result.all()
+
+    async def find_by_id(self, id):
+        """
+        Mendapatkan buku berdasarkan ID
+
+        Returns:
+            Book object atau None
+        """
+        return await self.session.scalar(
+            select(Book).where(Book.id == id, Book.is_deleted == False)
+        )
+
+    async def find_by_isbn(self, isbn):
+        """
+        Mendapatkan buku berdasarkan ISBN
+
+        Returns:
+            Book object atau None
+        """
+        return await self.session.scalar(
+            select(Book).where(Book.isbn == isbn, Book.is_deleted == False)
+        )
+
+    async def find_by_id_with_active_loans(self, id):
+        """
+        Mendapatkan buku beserta peminjaman aktifnya (lihat
+        BookRepository.find_by_id_with_active_loans)
+
+        Returns:
+            Book object atau None
+        """
+        return await self.session.scalar(
+            select(Book)
+            .options(selectinload(Book.loans.and_(Loan.status == 'borrowed')))
+            .where(Book.id == id, Book.is_deleted == False)
+            .execution_options(populate_existing=True)
+        )
+
+    async def find_many_by_ids(self, ids):
+        """
+        Mendapatkan banyak buku sekaligus berdasarkan ID (satu query IN)
+
+        Returns:
+            List[Book]: Buku yang ditemukan (urutan tidak dijamin)
+        """
+        if not ids:
+            return []
+        result = await self.session.scalars(
+            select(Book).where(Book.id.in_(ids), Book.is_deleted == False)
+        )
+        return result.all()
+
+    async def find_many_by_isbns(self, isbns):
+        """
+        Mendapatkan banyak buku sekaligus berdasarkan ISBN (satu query IN)
+
+        Returns:
+            List[Book]: Buku yang ditemukan (urutan tidak dijamin)
+        """
+        if not isbns:
+            return []
+        result = await self.session.scalars(
+            select(Book).where(Book.isbn.in_(isbns), Book.is_deleted == False)
+        )
+        return result.all()
+
+    async def save(self, book):
+        """
+        Menyimpan buku baru ke database
+
+        Returns:
+            Saved Book object dengan ID
+        """
+        self.session.add(book)
+        await self.session.commit()
+        return book
+
+    async def update(self, book):
+        """
+        Update buku yang sudah ada
+
+        Returns:
+            Updated Book object
+        """
+        await self.session.commit()
+        return book
+
+    async def delete(self, id):
+        """
+        Soft delete buku
+
+        Returns:
+            Boolean: True jika berhasil
+        """
+        book = await self.find_by_id(id)
+        if book:
+            book.is_deleted = True
+            await self.session.commit()
+            return True
+        return False
+
+    async def count(self, filters=None):
+        """
+        Menghitung jumlah buku
+
+        Returns:
+            Integer: jumlah buku
+        """
+        stmt = self._apply_filters(
+            select(func.count(Book.id)).where(Book.is_deleted == False), filters
+        )
+        return await self.session.scalar(stmt)
+
+    async def search(self, keyword):
+        """
+        Mencari buku berdasarkan keyword
+
+        Returns:
+            List[Book]: Daftar buku yang cocok
+        """
+        if not keyword:
+            return []
+
+        search_term = f"%{keyword}%"
+        result = await self.session.scalars(
+            select(Book).where(
+                Book.is_deleted == False,
+                or_(
+                    Book.title.ilike(search_term),
+                    Book.author.ilike(search_term),
+                    Book.isbn.ilike(search_term),
+                    Book.category.ilike(search_term)
+                )
+            ).order_by(Book.title)
+        )
+        return result.all()
+
+    async def get_categories(self):
+        """
+        Mendapatkan daftar semua kategori unik
+
+        Returns:
+            List[str]: Daftar kategori
+        """
+        result = await self.session.scalars(
+            select(Book.category).where(Book.is_deleted == False).distinct()
+        )
+        return result.all()
+
+    async def count_by_category(self):
+        """
+        Menghitung jumlah buku dan buku tersedia per kategori (satu GROUP BY)
+
+        Returns:
+            List[tuple]: (category, total, available) urut berdasarkan kategori
+        """
+        available_count = func.sum(case((Book.available > 0, 1), else_=0))
+        result = await self.session.execute(
+            select(Book.category, func.count(Book.id), available_count)
+            .where(Book.is_deleted == False)
+            .group_by(Book.category)
+            .order_by(Book.category)
+        )
+        return [(category, total, int(available or 0)) for category, total, available in result]
+
+    async def stream_snapshot(self, since=None, chunk_size=10000):
+        """
+        Semua buku (termasuk yang di-soft delete) untuk snapshot kolumnar
+        (server-side cursor)
+
+        Returns:
+            AsyncResult: Dibaca per chunk dengan result.partitions()
+        """
+        options = {'yield_per': chunk_size}
+        if since is None:
+            return await self.session.stream(SNAPSHOT_QUERY, execution_options=options)
+        return await self.session.stream(SNAPSHOT_CHANGED_QUERY, {'since': since},
+                                         execution_options=options)
+
+    async def stream_snapshot_ids(self, chunk_size=10000):
+        """
+        Semua id buku untuk deteksi buku yang di-purge (server-side cursor)
+
+        Returns:
+            AsyncResult: Dibaca per chunk dengan result.partitions()
+        """
+        return await self.session.stream(SNAPSHOT_IDS_QUERY,
+                                         execution_options={'yield_per': chunk_size})
+
+
+# Singleton instance
+async_book_repository = AsyncBookRepository()
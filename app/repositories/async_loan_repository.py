@@ -0,0 +1,282 @@
+"""
+Async Loan Repository - Implementasi Adapter async untuk akses data Loan
+
+Padanan LoanRepository untuk mode ASGI. Loan.book selalu di-eager load
+karena Loan.to_dict membaca book.title dan lazy load tidak didukung di
+AsyncSession.
+
+Riwayat lengkap (include_archived) digabung dengan helper yang sama dengan
+LoanRepository.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import joinedload, selectinload
+
+from app.repositories.base_repository import AsyncBaseRepository
+from app.models import Loan, LoanArchive
+from app.database.async_connection import async_db_connection
+from app.repositories.loan_repository import (
+    CIRCULATION_QUERIES, OVERDUE_COLUMNS_QUERY, SNAPSHOT_CHANGED_QUERY, SNAPSHOT_IDS_QUERY,
+    SNAPSHOT_QUERY, apply_loan_filters, created_at_key, id_key, merge_history, to_columns
+)
+
+
+class AsyncLoanRepository(AsyncBaseRepository):
+    """
+    Repository async untuk operasi database tabel loans
+
+    Pattern: Adapter
+    """
+
+    @property
+    def session(self):
+        return async_db_connection.session
+
+    async def find_all(self, filters=None):
+        """
+        Mendapatkan semua peminjaman
+
+        Args:
+            filters (dict): Optional filters (lihat LoanRepository.find_all)
+
+        Returns:
+            List[Loan]: Daftar peminjaman (LoanArchive untuk row arsip)
+        """
+        filters = filters or {}
+        limit = filters.get('limit')
+        offset = filters.get('offset', 0)
+
+        stmt = apply_loan_filters(select(Loan).options(joinedload(Loan.book)), Loan, filters)
+        stmt = stmt.order_by(Loan.created_at.desc())
+
+        if not filters.get('include_archived'):
+            if limit is not None:
+                stmt = stmt.limit(limit)
+            if offset:
+                stmt = stmt.offset(offset)
+            result = await self.session.scalars(stmt)
+            return result.all()
+
+        archive_stmt = apply_loan_filters(
+            select(LoanArchive).options(joinedload(LoanArchive.book)), LoanArchive, filters
+        ).order_by(LoanArchive.created_at.desc())
+        if limit is not None:
+            stmt = stmt.limit(offset + limit)
+            archive_stmt = archive_stmt.limit(offset + limit)
+
+        loans = (await self.session.scalars(stmt)).all()
+        archived = (await self.session.scalars(archive_stmt)).all()
+        return merge_history(loans, archived, created_at_key, offset, limit)
+
+    async def find_by_id(self, id):
+        """
+        Mendapatkan peminjaman berdasarkan ID
+
+        Returns:
+            Loan object atau None
+        """
+        return await self.session.get(Loan, id, options=[joinedload(Loan.book)])
+
+    async def find_by_book(self, book_id, status=None, limit=10, before_id=None,
+                           include_archived=False):
+        """
+        Mendapatkan satu halaman peminjaman sebuah buku (keyset pagination)
+
+        Args:
+            book_id, status, limit, before_id, include_archived:
+                Lihat LoanRepository.find_by_book
+
+        Returns:
+            List[Loan]: Daftar peminjaman (LoanArchive untuk row arsip)
+        """
+        loans = await self._find_book_page(Loan, book_id, status, limit, before_id)
+        if not include_archived:
+            return loans
+
+        archived = await self._find_book_page(LoanArchive, book_id, status, limit, before_id)
+        return merge_history(loans, archived, id_key, limit=limit)
+
+    async def _find_book_page(self, model, book_id, status, limit, before_id):
+        stmt = select(model).options(selectinload(model.book)).where(model.book_id == book_id)
+
+        if status:
+            stmt = stmt.where(model.status == status)
+        if before_id is not None:
+            stmt = stmt.where(model.id < before_id)
+
+        result = await self.session.scalars(stmt.order_by(model.id.desc()).limit(limit))
+        return result.all()
+
+    async def save(self, loan):
+        """
+        Menyimpan peminjaman baru ke database
+
+        Returns:
+            Saved Loan object dengan ID
+        """
+        self.session.add(loan)
+        await self.session.commit()
+        return loan
+
+    async def update(self, loan):
+        """
+        Update peminjaman yang sudah ada
+
+        Returns:
+            Updated Loan object
+        """
+        await self.session.commit()
+        return loan
+
+    async def delete(self, id):
+        """
+        Hapus peminjaman (hard delete)
+
+        Returns:
+            Boolean: True jika berhasil
+        """
+        loan = await self.find_by_id(id)
+        if loan:
+            await self.session.delete(loan)
+            await self.session.commit()
+            return True
+        return False
+
+    async def count(self, filters=None):
+        """
+        Menghitung jumlah peminjaman
+
+        Returns:
+            Integer: jumlah peminjaman
+        """
+        total = await self.session.scalar(self._count_stmt(Loan, filters))
+        if filters and filters.get('include_archived'):
+            total += await self.session.scalar(self._count_stmt(LoanArchive, filters))
+        return total
+
+    @staticmethod
+    def _count_stmt(model, filters):
+        stmt = select(func.count(model.id))
+
+        if filters:
+            if 'status' in filters and filters['status']:
+                stmt = stmt.where(model.status == filters['status'])
+            if 'book_id' in filters and filters['book_id']:
+                stmt = stmt.where(model.book_id == filters['book_id'])
+            if filters.get('loan_date_from'):
+                stmt = stmt.where(model.loan_date >= filters['loan_date_from'])
+            if filters.get('loan_date_to'):
+                stmt = stmt.where(model.loan_date <= filters['loan_date_to'])
+
+        return stmt
+
+    async def find_overdue_loans(self):
+        """
+        Mendapatkan semua peminjaman yang terlambat
+
+        Returns:
+            List[Loan]: Daftar peminjaman terlambat
+        """
+        today = datetime.utcnow().date()
+        result = await self.session.scalars(
+            select(Loan).options(joinedload(Loan.book)).where(
+                Loan.status == 'borrowed',
+                Loan.due_date < today,
+                # Implisit dari due_date < today; untuk partition pruning
+                Loan.loan_date < today
+            )
+        )
+        return result.all()
+
+    async def get_circulation(self, interval, start, end):
+        """
+        Peminjaman dan pengembalian per bucket interval (termasuk arsip)
+
+        Returns:
+            tuple: (List[(bucket, loans)], List[(bucket, returns, total_loan_days, on_time)])
+        """
+        loans, returns = CIRCULATION_QUERIES[interval]
+        params = {'start': start, 'end': end}
+        loan_rows = (await self.session.execute(loans, params)).all()
+        return_rows = (await self.session.execute(returns, params)).all()
+        return loan_rows, return_rows
+
+    async def stream_snapshot(self, since=None, chunk_size=10000):
+        """
+        Semua peminjaman (termasuk arsip) untuk snapshot kolumnar (server-side cursor)
+
+        Returns:
+            AsyncResult: Dibaca per chunk dengan result.partitions()
+        """
+        options = {'yield_per': chunk_size}
+        if since is None:
+            return await self.session.stream(SNAPSHOT_QUERY, execution_options=options)
+        return await self.session.stream(SNAPSHOT_CHANGED_QUERY, {'since': since},
+                                         execution_options=options)
+
+    async def stream_snapshot_ids(self, chunk_size=10000):
+        """
+        Semua id peminjaman (termasuk arsip) untuk deteksi peminjaman yang
+        dihapus (server-side cursor)
+
+        Returns:
+            AsyncResult: Dibaca per chunk dengan result.partitions()
+        """
+        return await self.session.stream(SNAPSHOT_IDS_QUERY,
+                                         execution_options={'yield_per': chunk_size})
+
+    async def fetch_overdue_columns(self, today):
+        """
+        Mengambil kolom peminjaman terlambat dalam satu query (analitik overdue)
+
+        Returns:
+            dict: Nama kolom -> tuple nilai
+        """
+        result = await self.session.execute(OVERDUE_COLUMNS_QUERY, {'today': today})
+        return to_columns(result.all())
+
+    async def find_by_borrower(self, borrower_name, include_archived=False):
+        """
+        Mendapatkan semua peminjaman dari seorang peminjam
+
+        Returns:
+            List[Loan]: Daftar peminjaman (LoanArchive untuk row arsip)
+        """
+        return await self.find_all({'borrower_name': borrower_name,
+                                    'include_archived': include_archived})
+
+    async def get_loan_statistics(self):
+        """
+        Mendapatkan statistik peminjaman
+
+        Returns:
+            Dict: Statistik peminjaman
+        """
+        today = datetime.utcnow().date()
+        total = await self.session.scalar(select(func.count(Loan.id)))
+        borrowed = await self.session.scalar(
+            select(func.count(Loan.id)).where(Loan.status == 'borrowed')
+        )
+        returned = await self.session.scalar(
+            select(func.count(Loan.id)).where(Loan.status == 'returned')
+        )
+        overdue = await self.session.scalar(
+            select(func.count(Loan.id)).where(
+                Loan.status == 'borrowed', Loan.due_date < today, Loan.loan_date < today
+            )
+        )
+        archived = await self.session.scalar(select(func.count(LoanArchive.id)))
+
+        return {
+            'total_loans': total + archived,
+            'borrowed_loans': borrowed,
+            'returned_loans': returned + archived,
+            'overdue_loans': overdue,
+            'archived_loans': archived
+        }
+
+
+# Singleton instance
+async_loan_repository = AsyncLoanRepository()
@@ -99,3 +99,43 @@ class BaseRepository(ABC):
             Integer: jumlah records
         """
         pass
+
+
+class AsyncBaseRepository(ABC):
+    """
+    Abstract Base Class untuk Repository async (mode ASGI)
+    
+    Pattern: Adapter
+    Interface yang sama dengan BaseRepository, tetapi setiap operasi
+    adalah coroutine yang dijalankan di AsyncSession
+    """
+    
+    @abstractmethod
+    async def find_all(self, filters=None):
+        """Mendapatkan semua records"""
+        pass
+    
+    @abstractmethod
+    async def find_by_id(self, id):
+        """Mendapatkan record berdasarkan ID"""
+        pass
+    
+    @abstractmethod
+    async def save(self, entity):
+        """Menyimpan entity baru ke database"""
+        pass
+    
+    @abstractmethod
+    async def update(self, entity):
+        """Update entity yang sudah ada"""
+        pass
+    
+    @abstractmethod
+    async def delete(self, id):
+        """Hapus entity"""
+        pass
+    
+    @abstractmethod
+    async def count(self, filters=None):
+        """Menghitung jumlah records"""
+        pass
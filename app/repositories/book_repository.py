@@ -2,13 +2,80 @@
 Book Repository - Implementasi Adapter untuk akses data Book
 
 Mengimplementasikan BaseRepository interface untuk operasi database Book
+Method read-only bertanda @replica_reads dibaca dari read replica jika
+dikonfigurasi (lihat app.database.replica)
+
+Buku yang di-soft delete dan tidak lagi direferensikan tabel loans
+dipindahkan ke books_tombstone oleh purge_deleted.
 """
 
+import time
+from datetime import datetime
+
+from sqlalchemy import DateTime, bindparam, delete, exists, func, insert, literal, select
+from sqlalchemy.orm import selectinload
+
 from app.repositories.base_repository import BaseRepository
-from app.models import Book
-from app.database import db
+from app.models import Book, BookTombstone, Loan
+from app.database import db, replica_reads
+from app.middleware import instrument_methods
+
+
+# Kolom yang disalin apa adanya dari books ke books_tombstone
+TOMBSTONE_COLUMNS = (
+    'id', 'title', 'author', 'isbn', 'year', 'category',
+    'stock', 'available', 'created_at', 'updated_at'
+)
+
+
+# Statement hot path dibangun sekali saat import: cache key dan hasil
+# compile SQLAlchemy dipakai ulang, nilai filter dikirim sebagai bound parameter
+_FIND_BY_ID = select(Book).where(Book.id == bindparam('id'), Book.is_deleted == False).limit(1)
+_FIND_BY_ISBN = select(Book).where(Book.isbn == bindparam('isbn'), Book.is_deleted == False).limit(1)
+_FIND_MANY_BY_IDS = select(Book).where(
+    Book.id.in_(bindparam('ids', expanding=True)), Book.is_deleted == False
+)
+_FIND_MANY_BY_ISBNS = select(Book).where(
+    Book.isbn.in_(bindparam('isbns', expanding=True)), Book.is_deleted == False
+)
+
+
+def _build_count(category, available_only):
+    stmt = select(func.count(Book.id)).where(Book.is_deleted == False)
+    if category:
+        stmt = stmt.where(Book.category.ilike(bindparam('category')))
+    if available_only:
+        stmt = stmt.where(Book.available > 0)
+    return stmt
+
 
+# (filter category, filter available_only) -> statement COUNT
+_COUNT = {
+    (category, available_only): _build_count(category, available_only)
+    for category in (False, True) for available_only in (False, True)
+}
 
+# Snapshot kolumnar (snapshot_export): semua buku termasuk yang di-soft delete
+SNAPSHOT_COLUMNS = (
+    'id', 'title', 'author', 'isbn', 'year', 'category',
+    'stock', 'available', 'is_deleted', 'created_at', 'updated_at'
+)
+SNAPSHOT_QUERY = select(*(getattr(Book, column) for column in SNAPSHOT_COLUMNS))
+SNAPSHOT_CHANGED_QUERY = SNAPSHOT_QUERY.where(Book.updated_at >= bindparam('since'))
+# Snapshot incremental: id yang masih ada, untuk mendeteksi buku yang di-purge
+SNAPSHOT_IDS_QUERY = select(Book.id)
+
+# Batch purge_deleted: buku soft delete yang tidak direferensikan loans
+# (peminjaman aktif tidak pernah di-purge; riwayat returned harus sudah
+# dipindahkan archive-loans). FOR UPDATE SKIP LOCKED (PostgreSQL) juga
+# memblokir INSERT loans baru ke buku tersebut selama batch berjalan
+_PURGEABLE_IDS = select(Book.id).where(
+    Book.is_deleted == True,
+    ~exists().where(Loan.book_id == Book.id)
+).order_by(Book.id).limit(bindparam('batch_size')).with_for_update(skip_locked=True)
+
+
+@instrument_methods('orm')
 class BookRepository(BaseRepository):
     """
     Repository untuk operasi database tabel books
@@ -17,6 +84,7 @@ class BookRepository(BaseRepository):
     Mengadaptasi operasi database SQLAlchemy ke interface standar
     """
     
+    @replica_reads
     def find_all(self, filters=None):
         """
         Mendapatkan semua buku yang tidak dihapus
@@ -74,7 +142,7 @@ class BookRepository(BaseRepository):
         Returns:
             Book object atau None
         """
-        return Book.query.filter_by(id=id, is_deleted=False).first()
+        return db.session.scalars(_FIND_BY_ID, {'id': id}).first()
     
     def find_by_isbn(self, isbn):
         """
@@ -86,7 +154,60 @@ class BookRepository(BaseRepository):
         Returns:
             Book object atau None
         """
-        return Book.query.filter_by(isbn=isbn, is_deleted=False).first()
+        return db.session.scalars(_FIND_BY_ISBN, {'isbn': isbn}).first()
+    
+    def find_by_id_with_active_loans(self, id):
+        """
+        Mendapatkan buku beserta peminjaman aktifnya (status 'borrowed')
+        
+        Book.loans di-select-in load dengan kriteria status, sehingga untuk
+        object ini Book.loans hanya berisi peminjaman aktif. Total dua query
+        berapa pun jumlah peminjaman.
+        
+        Args:
+            id: Book ID
+        
+        Returns:
+            Book object atau None
+        """
+        stmt = (
+            select(Book)
+            .options(selectinload(Book.loans.and_(Loan.status == 'borrowed')))
+            .where(Book.id == id, Book.is_deleted == False)
+            # Muat ulang koleksi meskipun buku sudah ada di session
+            .execution_options(populate_existing=True)
+        )
+        return db.session.scalars(stmt).first()
+    
+    def find_many_by_ids(self, ids):
+        """
+        Mendapatkan banyak buku sekaligus berdasarkan ID (satu query IN).
+        Dibaca dari primary: lookup melaporkan stok available terkini
+        
+        Args:
+            ids: List ID buku
+        
+        Returns:
+            List[Book]: Buku yang ditemukan (urutan tidak dijamin)
+        """
+        if not ids:
+            return []
+        return db.session.scalars(_FIND_MANY_BY_IDS, {'ids': list(ids)}).all()
+    
+    def find_many_by_isbns(self, isbns):
+        """
+        Mendapatkan banyak buku sekaligus berdasarkan ISBN (satu query IN).
+        Dibaca dari primary: lookup melaporkan stok available terkini
+        
+        Args:
+            isbns: List ISBN buku
+        
+        Returns:
+            List[Book]: Buku yang ditemukan (urutan tidak dijamin)
+        """
+        if not isbns:
+            return []
+        return db.session.scalars(_FIND_MANY_BY_ISBNS, {'isbns': list(isbns)}).all()
     
     def save(self, book):
         """
@@ -150,6 +271,7 @@ class BookRepository(BaseRepository):
             return True
         return False
     
+    @replica_reads
     def count(self, filters=None):
         """
         Menghitung jumlah buku
@@ -160,16 +282,15 @@ class BookRepository(BaseRepository):
         Returns:
             Integer: jumlah buku
         """
-        query = Book.query.filter_by(is_deleted=False)
-        
-        if filters:
-            if 'category' in filters and filters['category']:
-                query = query.filter(Book.category.ilike(f"%{filters['category']}%"))
-            if filters.get('available_only'):
-                query = query.filter(Book.available > 0)
+        filters = filters or {}
+        params = {}
+        if filters.get('category'):
+            params['category'] = f"%{filters['category']}%"
         
-        return query.count()
+        stmt = _COUNT[('category' in params, bool(filters.get('available_only')))]
+        return db.session.scalar(stmt, params)
     
+    @replica_reads
     def search(self, keyword):
         """
         Mencari buku berdasarkan keyword
@@ -194,6 +315,7 @@ class BookRepository(BaseRepository):
             )
         ).order_by(Book.title).all()
     
+    @replica_reads
     def get_categories(self):
         """
         Mendapatkan daftar semua kategori unik
@@ -206,6 +328,27 @@ class BookRepository(BaseRepository):
         ).distinct().all()
         return [r[0] for r in result]
     
+    @replica_reads
+    def count_by_category(self):
+        """
+        Menghitung jumlah buku dan buku tersedia per kategori
+        dalam satu query GROUP BY
+        
+        Returns:
+            List[tuple]: (category, total, available) urut berdasarkan kategori
+        """
+        available_count = db.func.sum(
+            db.case((Book.available > 0, 1), else_=0)
+        )
+        result = db.session.query(
+            Book.category,
+            db.func.count(Book.id),
+            available_count
+        ).filter(
+            Book.is_deleted == False
+        ).group_by(Book.category).order_by(Book.category).all()
+        return [(category, total, int(available or 0)) for category, total, available in result]
+    
     def update_availability(self, book_id, delta):
         """
         Update ketersediaan buku
@@ -225,6 +368,88 @@ class BookRepository(BaseRepository):
                 db.session.commit()
                 return True
         return False
+    
+    @replica_reads
+    def stream_snapshot(self, since=None, chunk_size=10000):
+        """
+        Semua buku (termasuk yang di-soft delete) untuk snapshot kolumnar,
+        dibaca dengan server-side cursor
+        
+        Args:
+            since: Hanya buku dengan updated_at >= since (None = semua)
+            chunk_size: Jumlah row per fetch
+        
+        Returns:
+            Result: Dibaca per chunk dengan result.partitions()
+        """
+        options = {'yield_per': chunk_size}
+        if since is None:
+            return db.session.execute(SNAPSHOT_QUERY, execution_options=options)
+        return db.session.execute(SNAPSHOT_CHANGED_QUERY, {'since': since},
+                                  execution_options=options)
+    
+    @replica_reads
+    def stream_snapshot_ids(self, chunk_size=10000):
+        """
+        Semua id buku (termasuk yang di-soft delete), untuk mendeteksi buku
+        yang sudah di-purge sejak snapshot sebelumnya
+        
+        Args:
+            chunk_size: Jumlah row per fetch
+        
+        Returns:
+            Result: Dibaca per chunk dengan result.partitions()
+        """
+        return db.session.execute(SNAPSHOT_IDS_QUERY, execution_options={'yield_per': chunk_size})
+    
+    def purge_deleted(self, batch_size=500, pause=0.0, on_batch=None):
+        """
+        Memindahkan buku yang sudah di-soft delete dari books ke
+        books_tombstone
+        
+        Hanya buku tanpa row di tabel loans yang dipindahkan: buku dengan
+        peminjaman aktif tetap di books, dan buku dengan riwayat returned
+        baru di-purge setelah riwayatnya diarsipkan (archive_returned).
+        Setiap batch adalah satu transaksi pendek (INSERT ... SELECT ke
+        tombstone lalu DELETE dari books); pause memberi jeda antar batch
+        agar job tidak memonopoli I/O database.
+        
+        Args:
+            batch_size: Jumlah buku per transaksi
+            pause: Jeda (detik) antar batch
+            on_batch: Optional callable (ids, total_purged) setiap batch selesai
+        
+        Returns:
+            int: Jumlah buku yang dipindahkan
+        """
+        total = 0
+        while True:
+            try:
+                ids = db.session.scalars(_PURGEABLE_IDS, {'batch_size': batch_size}).all()
+                if not ids:
+                    db.session.rollback()
+                    break
+                
+                source = select(
+                    *(getattr(Book, column) for column in TOMBSTONE_COLUMNS),
+                    literal(datetime.utcnow(), DateTime)
+                ).where(Book.id.in_(ids))
+                db.session.execute(
+                    insert(BookTombstone).from_select([*TOMBSTONE_COLUMNS, 'purged_at'], source))
+                db.session.execute(delete(Book).where(Book.id.in_(ids)),
+                                   execution_options={'synchronize_session': False})
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+                raise
+            
+            total += len(ids)
+            if on_batch is not None:
+                on_batch(ids, total)
+            if pause > 0:
+                time.sleep(pause)
+        
+        return total
 
 
 # Singleton instance
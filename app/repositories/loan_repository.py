@@ -2,14 +2,251 @@
 Loan Repository - Implementasi Adapter untuk akses data Loan
 
 Mengimplementasikan BaseRepository interface untuk operasi database Loan
+Method read-only bertanda @replica_reads dibaca dari read replica jika
+dikonfigurasi (lihat app.database.replica)
+
+Query default hanya membaca tabel loans. Peminjaman lama yang sudah
+dipindahkan ke loans_archive (archive_returned) ikut dibaca jika pemanggil
+meminta riwayat lengkap (include_archived).
 """
 
+from heapq import merge
+from itertools import islice, product
+
+from sqlalchemy import (
+    Boolean, DateTime, bindparam, case, delete, func, insert, literal, select, union_all
+)
+from sqlalchemy.orm import joinedload, selectinload
+
 from app.repositories.base_repository import BaseRepository
-from app.models import Loan
-from app.database import db
+from app.models import Book, Loan, LoanArchive
+from app.database import db, replica_reads
+from app.database.date_functions import INTERVALS, date_bucket, days_between
+from app.middleware import instrument_methods
 from datetime import datetime
 
 
+# Kolom yang disalin apa adanya dari loans ke loans_archive
+ARCHIVE_COLUMNS = (
+    'id', 'book_id', 'borrower_name', 'loan_date', 'due_date',
+    'return_date', 'status', 'notes', 'created_at', 'updated_at'
+)
+
+
+def apply_loan_filters(stmt, model, filters):
+    """
+    Menerapkan filter status, book_id, borrower_name dan rentang loan_date
+    find_all ke statement Loan atau LoanArchive. Dipakai bersama oleh
+    repository sync dan async
+    
+    Args:
+        stmt: Select statement
+        model: Loan atau LoanArchive
+        filters: Optional filters (lihat LoanRepository.find_all)
+    
+    Returns:
+        Select statement
+    """
+    if filters:
+        if filters.get('status'):
+            stmt = stmt.where(model.status == filters['status'])
+        if filters.get('book_id'):
+            stmt = stmt.where(model.book_id == filters['book_id'])
+        if filters.get('borrower_name'):
+            stmt = stmt.where(model.borrower_name.ilike(f"%{filters['borrower_name']}%"))
+        # Filter loan_date: di PostgreSQL yang dipartisi hanya partisi bulan
+        # dalam rentang yang dibaca (partition pruning)
+        if filters.get('loan_date_from'):
+            stmt = stmt.where(model.loan_date >= filters['loan_date_from'])
+        if filters.get('loan_date_to'):
+            stmt = stmt.where(model.loan_date <= filters['loan_date_to'])
+    return stmt
+
+
+# Key urutan merge_history: find_all/find_by_borrower (created_at DESC) dan
+# find_by_book (id DESC)
+def created_at_key(loan):
+    return loan.created_at or datetime.min
+
+
+def id_key(loan):
+    return loan.id
+
+
+def merge_history(hot, archived, key, offset=0, limit=None):
+    """
+    Menggabungkan hasil tabel loans dan loans_archive yang masing-masing
+    sudah urut menurun berdasarkan key, lalu menerapkan offset/limit
+    
+    Args:
+        hot: List Loan
+        archived: List LoanArchive
+        key: Fungsi key urutan (created_at_key atau id_key)
+        offset: Skip sejumlah record hasil gabungan
+        limit: Jumlah maksimal hasil (None = semua)
+    
+    Returns:
+        list: Loan dan LoanArchive, urut menurun
+    """
+    stop = offset + limit if limit is not None else None
+    return list(islice(merge(hot, archived, key=key, reverse=True), offset, stop))
+
+
+# Statement hot path dibangun sekali saat import: cache key dan hasil
+# compile SQLAlchemy dipakai ulang, nilai filter dikirim sebagai bound parameter
+_COUNT_ALL = select(func.count(Loan.id))
+_COUNT_BORROWED = _COUNT_ALL.where(Loan.status == 'borrowed')
+_COUNT_RETURNED = _COUNT_ALL.where(Loan.status == 'returned')
+# loan_date <= due_date selalu berlaku, jadi loan_date < today tidak mengubah
+# hasil tetapi membuat partisi bulan berjalan dan ke depan dilewati (pruning)
+_COUNT_OVERDUE = _COUNT_BORROWED.where(
+    Loan.due_date < bindparam('today'),
+    Loan.loan_date < bindparam('today')
+)
+_COUNT_ARCHIVED = select(func.count(LoanArchive.id))
+
+
+# Filter count yang dikirim sebagai bound parameter
+_COUNT_FILTERS = ('status', 'book_id', 'loan_date_from', 'loan_date_to')
+
+
+def _build_count(model, status, book_id, loan_date_from, loan_date_to):
+    stmt = select(func.count(model.id))
+    if status:
+        stmt = stmt.where(model.status == bindparam('status'))
+    if book_id:
+        stmt = stmt.where(model.book_id == bindparam('book_id'))
+    if loan_date_from:
+        stmt = stmt.where(model.loan_date >= bindparam('loan_date_from'))
+    if loan_date_to:
+        stmt = stmt.where(model.loan_date <= bindparam('loan_date_to'))
+    return stmt
+
+
+# (model, filter yang dipakai...) -> statement COUNT
+_COUNT = {
+    (model, *used): _build_count(model, *used)
+    for model in (Loan, LoanArchive)
+    for used in product((False, True), repeat=len(_COUNT_FILTERS))
+}
+
+# Analitik overdue (fetch_overdue_columns): hanya kolom yang dibutuhkan,
+# tanpa membuat object ORM per row
+OVERDUE_COLUMNS = ('loan_id', 'book_id', 'borrower_name', 'category', 'due_date')
+OVERDUE_COLUMNS_QUERY = select(
+    Loan.id, Loan.book_id, Loan.borrower_name, Book.category, Loan.due_date
+).join(Book, Book.id == Loan.book_id).where(
+    Loan.status == 'borrowed',
+    Loan.due_date < bindparam('today'),
+    Loan.loan_date < bindparam('today')
+)
+
+
+def to_columns(rows):
+    """
+    Mengubah row hasil OVERDUE_COLUMNS_QUERY menjadi kolom
+
+    Args:
+        rows: List row (tuple)
+
+    Returns:
+        dict: Nama kolom (OVERDUE_COLUMNS) -> tuple nilai
+    """
+    columns = tuple(zip(*rows)) or ((),) * len(OVERDUE_COLUMNS)
+    return dict(zip(OVERDUE_COLUMNS, columns))
+
+
+def _build_circulation(interval):
+    """
+    Statement timeseries sirkulasi untuk satu interval; loans dan
+    loans_archive digabung (UNION ALL) agar bucket lama tidak berubah saat
+    peminjaman diarsipkan
+
+    Returns:
+        tuple: (peminjaman per bucket loan_date,
+                pengembalian per bucket return_date: jumlah, total hari, tepat waktu)
+    """
+    started = union_all(*(
+        select(model.loan_date.label('day')).where(
+            model.loan_date >= bindparam('start'), model.loan_date < bindparam('end'))
+        for model in (Loan, LoanArchive)
+    )).subquery()
+    bucket = date_bucket(started.c.day, interval)
+    loans = select(bucket.label('bucket'), func.count()).group_by(bucket)
+
+    returned = union_all(*(
+        select(model.return_date.label('day'), model.loan_date, model.due_date).where(
+            model.status == 'returned',
+            model.return_date >= bindparam('start'), model.return_date < bindparam('end'))
+        for model in (Loan, LoanArchive)
+    )).subquery()
+    bucket = date_bucket(returned.c.day, interval)
+    returns = select(
+        bucket.label('bucket'),
+        func.count(),
+        func.sum(days_between(returned.c.day, returned.c.loan_date)),
+        func.sum(case((returned.c.day <= returned.c.due_date, 1), else_=0))
+    ).group_by(bucket)
+    return loans, returns
+
+
+# interval -> (statement peminjaman, statement pengembalian)
+CIRCULATION_QUERIES = {interval: _build_circulation(interval) for interval in INTERVALS}
+
+def _build_snapshot(changed):
+    """
+    Statement snapshot kolumnar: loans UNION ALL loans_archive, kolom
+    archived menandai row arsip
+    
+    Args:
+        changed: Hanya row dengan updated_at >= :since
+    """
+    branches = []
+    for model, archived in ((Loan, False), (LoanArchive, True)):
+        stmt = select(
+            *(getattr(model, column) for column in ARCHIVE_COLUMNS),
+            literal(archived, Boolean).label('archived')
+        )
+        if changed:
+            stmt = stmt.where(model.updated_at >= bindparam('since'))
+        branches.append(stmt)
+    return union_all(*branches)
+
+
+SNAPSHOT_QUERY = _build_snapshot(changed=False)
+SNAPSHOT_CHANGED_QUERY = _build_snapshot(changed=True)
+# Snapshot incremental: id yang masih ada (loans + arsip), untuk mendeteksi
+# peminjaman yang dihapus
+SNAPSHOT_IDS_QUERY = union_all(select(Loan.id), select(LoanArchive.id))
+
+# Rebuild popularity tracker: peminjaman per (hari, buku, peminjam) sejak
+# :since, termasuk arsip; judul dari books (NULL jika buku sudah di-purge)
+_started = union_all(*(
+    select(model.loan_date, model.book_id, model.borrower_name).where(
+        model.loan_date >= bindparam('since'))
+    for model in (Loan, LoanArchive)
+)).subquery()
+POPULARITY_QUERY = select(
+    _started.c.loan_date, _started.c.book_id, Book.title,
+    _started.c.borrower_name, func.count()
+).outerjoin(Book, Book.id == _started.c.book_id).group_by(
+    _started.c.loan_date, _started.c.book_id, Book.title, _started.c.borrower_name)
+
+# Batch archive_returned: FOR UPDATE SKIP LOCKED (PostgreSQL) agar row yang
+# sedang diubah request lain dilewati dan diambil di run berikutnya
+_ARCHIVABLE_IDS = select(Loan.id).where(
+    Loan.status == 'returned',
+    Loan.return_date < bindparam('cutoff')
+).order_by(Loan.id).limit(bindparam('batch_size')).with_for_update(skip_locked=True)
+
+# find_active_by_book: peminjaman aktif satu buku, buku di-eager load
+_FIND_ACTIVE_BY_BOOK = select(Loan).options(joinedload(Loan.book)).where(
+    Loan.book_id == bindparam('book_id'),
+    Loan.status == 'borrowed'
+)
+
+
+@instrument_methods('orm')
 class LoanRepository(BaseRepository):
     """
     Repository untuk operasi database tabel loans
@@ -18,6 +255,7 @@ class LoanRepository(BaseRepository):
     Mengadaptasi operasi database SQLAlchemy ke interface standar
     """
     
+    @replica_reads
     def find_all(self, filters=None):
         """
         Mendapatkan semua peminjaman
@@ -29,34 +267,42 @@ class LoanRepository(BaseRepository):
                 - borrower_name: Filter by borrower
                 - limit: Batasi jumlah hasil
                 - offset: Skip sejumlah record
+                - include_archived: Ikut membaca loans_archive (riwayat lengkap)
         
         Returns:
-            List[Loan]: Daftar peminjaman
+            List[Loan]: Daftar peminjaman (LoanArchive untuk row arsip)
         """
-        query = Loan.query
+        return self._find(filters)
+    
+    def _find(self, filters):
+        filters = filters or {}
+        limit = filters.get('limit')
+        offset = filters.get('offset', 0)
         
-        if filters:
-            # Filter berdasarkan status
-            if 'status' in filters and filters['status']:
-                query = query.filter(Loan.status == filters['status'])
-            
-            # Filter berdasarkan book_id
-            if 'book_id' in filters and filters['book_id']:
-                query = query.filter(Loan.book_id == filters['book_id'])
-            
-            # Filter berdasarkan borrower
-            if 'borrower_name' in filters and filters['borrower_name']:
-                query = query.filter(
-                    Loan.borrower_name.ilike(f"%{filters['borrower_name']}%")
-                )
-            
-            # Pagination
-            if 'limit' in filters:
-                query = query.limit(filters['limit'])
-            if 'offset' in filters:
-                query = query.offset(filters['offset'])
+        # Eager load book: to_dict membaca book.title untuk setiap row
+        stmt = apply_loan_filters(select(Loan).options(joinedload(Loan.book)), Loan, filters)
+        # Ordering harus diterapkan sebelum limit/offset
+        stmt = stmt.order_by(Loan.created_at.desc())
         
-        return query.order_by(Loan.created_at.desc()).all()
+        if not filters.get('include_archived'):
+            if limit is not None:
+                stmt = stmt.limit(limit)
+            if offset:
+                stmt = stmt.offset(offset)
+            return db.session.scalars(stmt).all()
+        
+        # Riwayat lengkap: offset + limit teratas dari setiap tabel cukup
+        # untuk menyusun halaman gabungan
+        archive_stmt = apply_loan_filters(
+            select(LoanArchive).options(joinedload(LoanArchive.book)), LoanArchive, filters
+        ).order_by(LoanArchive.created_at.desc())
+        if limit is not None:
+            stmt = stmt.limit(offset + limit)
+            archive_stmt = archive_stmt.limit(offset + limit)
+        
+        return merge_history(db.session.scalars(stmt).all(),
+                             db.session.scalars(archive_stmt).all(),
+                             created_at_key, offset, limit)
     
     def find_by_id(self, id):
         """
@@ -114,25 +360,68 @@ class LoanRepository(BaseRepository):
             return True
         return False
     
+    @replica_reads
     def count(self, filters=None):
         """
         Menghitung jumlah peminjaman
         
         Args:
-            filters: Optional filters
+            filters: Optional filters (status, book_id, loan_date_from,
+                loan_date_to, include_archived)
         
         Returns:
             Integer: jumlah peminjaman
         """
-        query = Loan.query
+        params = {key: value for key, value in (filters or {}).items()
+                  if key in _COUNT_FILTERS and value}
         
-        if filters:
-            if 'status' in filters and filters['status']:
-                query = query.filter(Loan.status == filters['status'])
-            if 'book_id' in filters and filters['book_id']:
-                query = query.filter(Loan.book_id == filters['book_id'])
+        key = tuple(name in params for name in _COUNT_FILTERS)
+        total = db.session.scalar(_COUNT[(Loan, *key)], params)
+        if filters and filters.get('include_archived'):
+            total += db.session.scalar(_COUNT[(LoanArchive, *key)], params)
+        return total
+    
+    @replica_reads
+    def find_by_book(self, book_id, status=None, limit=10, before_id=None,
+                     include_archived=False):
+        """
+        Mendapatkan satu halaman peminjaman sebuah buku (keyset pagination)
+        
+        Urut dari yang terbaru (id DESC); halaman berikutnya diambil dengan
+        before_id = id terakhir halaman sebelumnya, sehingga biaya query
+        tidak bertambah seiring halaman seperti OFFSET.
+        
+        Args:
+            book_id: ID buku
+            status: Optional filter status
+            limit: Jumlah maksimal hasil
+            before_id: Hanya peminjaman dengan id < before_id
+            include_archived: Ikut membaca loans_archive (ID unik di kedua tabel)
+        
+        Returns:
+            List[Loan]: Daftar peminjaman (LoanArchive untuk row arsip)
+        """
+        loans = db.session.scalars(
+            self._book_page_stmt(Loan, book_id, status, limit, before_id)).all()
+        if not include_archived:
+            return loans
         
-        return query.count()
+        archived = db.session.scalars(
+            self._book_page_stmt(LoanArchive, book_id, status, limit, before_id)).all()
+        return merge_history(loans, archived, id_key, limit=limit)
+    
+    @staticmethod
+    def _book_page_stmt(model, book_id, status, limit, before_id):
+        # selectinload: to_dict membaca book.title; satu query tambahan
+        # berapa pun jumlah row
+        stmt = select(model).options(selectinload(model.book)).where(model.book_id == book_id)
+        
+        if status:
+            stmt = stmt.where(model.status == status)
+        if before_id is not None:
+            stmt = stmt.where(model.id < before_id)
+        
+        return stmt.order_by(model.id.desc()).limit(limit)
     
     def find_active_by_book(self, book_id):
         """
@@ -144,11 +433,9 @@ class LoanRepository(BaseRepository):
         Returns:
             List[Loan]: Daftar peminjaman aktif
         """
-        return Loan.query.filter_by(
-            book_id=book_id,
-            status='borrowed'
-        ).all()
+        return db.session.scalars(_FIND_ACTIVE_BY_BOOK, {'book_id': book_id}).all()
     
+    @replica_reads
     def find_overdue_loans(self):
         """
         Mendapatkan semua peminjaman yang terlambat
@@ -157,48 +444,182 @@ class LoanRepository(BaseRepository):
             List[Loan]: Daftar peminjaman terlambat
         """
         today = datetime.utcnow().date()
-        return Loan.query.filter(
+        return Loan.query.options(db.joinedload(Loan.book)).filter(
             Loan.status == 'borrowed',
-            Loan.due_date < today
+            Loan.due_date < today,
+            # Implisit dari due_date < today; untuk partition pruning
+            Loan.loan_date < today
         ).all()
     
-    def find_by_borrower(self, borrower_name):
+    @replica_reads
+    def get_circulation(self, interval, start, end):
+        """
+        Peminjaman dan pengembalian per bucket interval (termasuk arsip),
+        satu query GROUP BY per metrik
+        
+        Args:
+            interval: 'day', 'week' atau 'month'
+            start: date awal (inklusif, awal bucket)
+            end: date akhir (eksklusif, awal bucket berikutnya)
+        
+        Returns:
+            tuple: (List[(bucket, loans)],
+                    List[(bucket, returns, total_loan_days, on_time)])
+        """
+        loans, returns = CIRCULATION_QUERIES[interval]
+        params = {'start': start, 'end': end}
+        return (
+            db.session.execute(loans, params).all(),
+            db.session.execute(returns, params).all()
+        )
+    
+    @replica_reads
+    def get_popularity_counts(self, since):
+        """
+        Jumlah peminjaman per hari, buku dan peminjam sejak tanggal since
+        (termasuk arsip), untuk mengisi ulang popularity tracker
+        
+        Args:
+            since: date awal (inklusif)
+        
+        Returns:
+            List[(loan_date, book_id, title, borrower_name, loans)]
+        """
+        return db.session.execute(POPULARITY_QUERY, {'since': since}).all()
+    
+    @replica_reads
+    def stream_snapshot(self, since=None, chunk_size=10000):
+        """
+        Semua peminjaman (termasuk arsip) untuk snapshot kolumnar, dibaca
+        dengan server-side cursor
+        
+        Args:
+            since: Hanya row dengan updated_at >= since (None = semua)
+            chunk_size: Jumlah row per fetch
+        
+        Returns:
+            Result: Dibaca per chunk dengan result.partitions()
+        """
+        options = {'yield_per': chunk_size}
+        if since is None:
+            return db.session.execute(SNAPSHOT_QUERY, execution_options=options)
+        return db.session.execute(SNAPSHOT_CHANGED_QUERY, {'since': since},
+                                  execution_options=options)
+    
+    @replica_reads
+    def stream_snapshot_ids(self, chunk_size=10000):
+        """
+        Semua id peminjaman (termasuk arsip), untuk mendeteksi peminjaman
+        yang dihapus sejak snapshot sebelumnya
+        
+        Args:
+            chunk_size: Jumlah row per fetch
+        
+        Returns:
+            Result: Dibaca per chunk dengan result.partitions()
+        """
+        return db.session.execute(SNAPSHOT_IDS_QUERY, execution_options={'yield_per': chunk_size})
+    
+    @replica_reads
+    def fetch_overdue_columns(self, today):
+        """
+        Mengambil kolom peminjaman terlambat dalam satu query (untuk
+        analitik overdue), tanpa object Loan
+        
+        Args:
+            today: date acuan keterlambatan
+        
+        Returns:
+            dict: Nama kolom (OVERDUE_COLUMNS) -> tuple nilai
+        """
+        return to_columns(db.session.execute(OVERDUE_COLUMNS_QUERY, {'today': today}).all())
+    
+    def find_by_borrower(self, borrower_name, include_archived=False):
         """
         Mendapatkan semua peminjaman dari seorang peminjam
         
         Args:
             borrower_name: Nama peminjam
+            include_archived: Ikut membaca loans_archive (riwayat lengkap)
         
         Returns:
-            List[Loan]: Daftar peminjaman
+            List[Loan]: Daftar peminjaman (LoanArchive untuk row arsip)
         """
-        return Loan.query.filter(
-            Loan.borrower_name.ilike(f"%{borrower_name}%")
-        ).order_by(Loan.created_at.desc()).all()
+        return self._find({'borrower_name': borrower_name,
+                           'include_archived': include_archived})
     
+    @replica_reads
     def get_loan_statistics(self):
         """
         Mendapatkan statistik peminjaman
         
+        Peminjaman yang sudah diarsipkan tetap dihitung di total_loans dan
+        returned_loans agar angka statistik tidak turun setelah archival
+        
         Returns:
             Dict: Statistik peminjaman
         """
-        total = Loan.query.count()
-        borrowed = Loan.query.filter_by(status='borrowed').count()
-        returned = Loan.query.filter_by(status='returned').count()
+        total = db.session.scalar(_COUNT_ALL)
+        borrowed = db.session.scalar(_COUNT_BORROWED)
+        returned = db.session.scalar(_COUNT_RETURNED)
+        archived = db.session.scalar(_COUNT_ARCHIVED)
         
         today = datetime.utcnow().date()
-        overdue = Loan.query.filter(
-            Loan.status == 'borrowed',
-            Loan.due_date < today
-        ).count()
+        overdue = db.session.scalar(_COUNT_OVERDUE, {'today': today})
         
         return {
-            'total_loans': total,
+            'total_loans': total + archived,
             'borrowed_loans': borrowed,
-            'returned_loans': returned,
-            'overdue_loans': overdue
+            'returned_loans': returned + archived,
+            'overdue_loans': overdue,
+            'archived_loans': archived
         }
+    
+    def archive_returned(self, cutoff, batch_size=1000, on_batch=None):
+        """
+        Memindahkan peminjaman 'returned' dengan return_date < cutoff dari
+        loans ke loans_archive
+        
+        Setiap batch (paling banyak batch_size row) adalah satu transaksi
+        pendek: INSERT ... SELECT ke arsip lalu DELETE dari loans, sehingga
+        lock dan ukuran WAL per transaksi tetap kecil dan proses yang
+        terhenti bisa dilanjutkan kapan saja.
+        
+        Args:
+            cutoff: date; peminjaman dengan return_date < cutoff diarsipkan
+            batch_size: Jumlah row per transaksi
+            on_batch: Optional callable (moved, total_moved) setiap batch selesai
+        
+        Returns:
+            int: Jumlah peminjaman yang dipindahkan
+        """
+        total = 0
+        while True:
+            try:
+                ids = db.session.scalars(
+                    _ARCHIVABLE_IDS, {'cutoff': cutoff, 'batch_size': batch_size}).all()
+                if not ids:
+                    db.session.rollback()
+                    break
+                
+                source = select(
+                    *(getattr(Loan, column) for column in ARCHIVE_COLUMNS),
+                    literal(datetime.utcnow(), DateTime)
+                ).where(Loan.id.in_(ids))
+                db.session.execute(
+                    insert(LoanArchive).from_select([*ARCHIVE_COLUMNS, 'archived_at'], source))
+                db.session.execute(delete(Loan).where(Loan.id.in_(ids)),
+                                   execution_options={'synchronize_session': False})
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+                raise
+            
+            total += len(ids)
+            if on_batch is not None:
+                on_batch(len(ids), total)
+        
+        return total
 
 
 # Singleton instance
@@ -1,12 +1,45 @@
 """
 Package services
 """
+from app.utils.lazy_exports import lazy_exports
+
+from .single_flight import SingleFlight, add_coalesce_listener, coalesced, single_flight
+from .overdue_analytics import OverdueAnalytics, OverdueReport, overdue_analytics
+from .circulation_timeseries import CirculationTimeseries, circulation_timeseries
+from .popularity_tracker import PopularityTracker, popularity_tracker
 from .book_service import BookService, book_service
 from .loan_service import LoanService, loan_service
 from .statistics_service import StatisticsService, statistics_service
+from .snapshot_export import SnapshotBusyError, SnapshotStore, snapshot_store
+from .snapshot_service import SnapshotService, snapshot_service
+
+# Service async di-import saat pertama diakses (lihat app.database)
+_LAZY_EXPORTS = {
+    'AsyncBookService': '.async_book_service',
+    'async_book_service': '.async_book_service',
+    'AsyncLoanService': '.async_loan_service',
+    'async_loan_service': '.async_loan_service',
+    'AsyncStatisticsService': '.async_statistics_service',
+    'async_statistics_service': '.async_statistics_service',
+    'AsyncSnapshotService': '.async_snapshot_service',
+    'async_snapshot_service': '.async_snapshot_service',
+}
+
+__getattr__ = lazy_exports(__name__, _LAZY_EXPORTS)
+
 
 __all__ = [
+    'SingleFlight', 'single_flight', 'coalesced', 'add_coalesce_listener',
+    'OverdueAnalytics', 'OverdueReport', 'overdue_analytics',
+    'CirculationTimeseries', 'circulation_timeseries',
+    'PopularityTracker', 'popularity_tracker',
     'BookService', 'book_service',
     'LoanService', 'loan_service',
-    'StatisticsService', 'statistics_service'
+    'StatisticsService', 'statistics_service',
+    'SnapshotBusyError', 'SnapshotStore', 'snapshot_store',
+    'SnapshotService', 'snapshot_service',
+    'AsyncBookService', 'async_book_service',
+    'AsyncLoanService', 'async_loan_service',
+    'AsyncStatisticsService', 'async_statistics_service',
+    'AsyncSnapshotService', 'async_snapshot_service'
 ]
@@ -0,0 +1,379 @@
+"""
+DESIGN PATTERN: FACADE
+Async Book Service - Padanan BookService untuk mode ASGI
+
+Memakai validator, factory dan observer yang sama dengan BookService;
+hanya akses database yang berbeda (AsyncBookRepository). Pengecekan
+validator yang membutuhkan database (duplikasi ISBN) dilakukan di sini
+lewat repository async, lalu diputuskan oleh validator yang sama.
+"""
+
+from app.repositories import async_book_repository
+from app.factories import model_factory
+from app.validators import book_validator
+from app.observers import event_subject, EventType
+from app.services.book_service import build_lookup_response, serialize_active_loans
+from app.services.single_flight import coalesced
+
+
+class AsyncBookService:
+    """
+    Facade async untuk operasi Book
+
+    Pattern: Facade
+    """
+
+    def __init__(self):
+        """
+        Inisialisasi service dengan dependencies
+        """
+        self.repository = async_book_repository
+        self.factory = model_factory
+        self.validator = book_validator
+        self.event_subject = event_subject
+
+    async def _validate(self, data, is_update=False):
+        """
+        Validasi format (validator bersama) + cek duplikasi ISBN async
+
+        Returns:
+            tuple: (is_valid: bool, errors: dict)
+        """
+        is_valid, errors = self.validator.validate_fields(data, is_update)
+
+        if 'isbn' in data and data['isbn'] and 'isbn' not in errors:
+            existing_book = await self.repository.find_by_isbn(str(data['isbn']).strip())
+            isbn_error = self.validator.check_isbn_conflict(existing_book, data.get('id'))
+            if isbn_error:
+                errors['isbn'] = isbn_error
+
+        return len(errors) == 0, errors
+
+    async def get_all_books(self, filters=None):
+        """
+        Mendapatkan semua buku
+
+        Returns:
+            dict: Response dengan list buku
+        """
+        try:
+            books = await self.repository.find_all(filters)
+            total = await self.repository.count(filters)
+
+            return {
+                'success': True,
+                'data': [book.to_dict() for book in books],
+                'total': total,
+                'message': 'Data buku berhasil diambil'
+            }
+        except Exception as e:
+            self.event_subject.notify(EventType.SYSTEM_ERROR, {'message': str(e)})
+            return {
+                'success': False,
+                'message': f'Gagal mengambil data buku: {str(e)}',
+                'data': []
+            }
+
+    async def get_book_by_id(self, book_id, include_active_loans=False):
+        """
+        Mendapatkan detail buku berdasarkan ID
+
+        Returns:
+            dict: Response dengan detail buku
+        """
+        try:
+            if include_active_loans:
+                book = await self.repository.find_by_id_with_active_loans(book_id)
+            else:
+                book = await self.repository.find_by_id(book_id)
+
+            if not book:
+                return {
+                    'success': False,
+                    'message': f'Buku dengan ID {book_id} tidak ditemukan',
+                    'data': None
+                }
+
+            data = book.to_dict()
+            if include_active_loans:
+                data['active_loans'] = serialize_active_loans(book)
+
+            return {
+                'success': True,
+                'data': data,
+                'message': 'Detail buku berhasil diambil'
+            }
+        except Exception as e:
+            self.event_subject.notify(EventType.SYSTEM_ERROR, {'message': str(e)})
+            return {
+                'success': False,
+                'message': f'Gagal mengambil detail buku: {str(e)}',
+                'data': None
+            }
+
+    async def get_book_by_isbn(self, isbn):
+        """
+        Mendapatkan buku berdasarkan ISBN
+
+        Returns:
+            Book object atau None
+        """
+        return await self.repository.find_by_isbn(isbn)
+
+    async def create_book(self, data):
+        """
+        Membuat buku baru (validasi, factory, simpan, notify)
+
+        Returns:
+            dict: Response dengan hasil operasi
+        """
+        try:
+            is_valid, errors = await self._validate(data)
+            if not is_valid:
+                return {
+                    'success': False,
+                    'message': 'Validasi gagal',
+                    'errors': errors
+                }
+
+            book = self.factory.create_book(data)
+            saved_book = await self.repository.save(book)
+
+            self.event_subject.notify(
+                EventType.BOOK_CREATED,
+                {'book': saved_book.to_dict()}
+            )
+
+            return {
+                'success': True,
+                'data': saved_book.to_dict(),
+                'message': 'Buku berhasil ditambahkan'
+            }
+
+        except ValueError as e:
+            return {
+                'success': False,
+                'message': str(e),
+                'errors': {}
+            }
+        except Exception as e:
+            self.event_subject.notify(EventType.SYSTEM_ERROR, {'message': str(e)})
+            return {
+                'success': False,
+                'message': f'Gagal menambahkan buku: {str(e)}',
+                'errors': {}
+            }
+
+    async def update_book(self, book_id, data):
+        """
+        Update buku yang sudah ada
+
+        Returns:
+            dict: Response dengan hasil operasi
+        """
+        try:
+            book = await self.repository.find_by_id(book_id)
+            if not book:
+                return {
+                    'success': False,
+                    'message': f'Buku dengan ID {book_id} tidak ditemukan',
+                    'data': None
+                }
+
+            data['id'] = book_id
+
+            is_valid, errors = await self._validate(data, is_update=True)
+            if not is_valid:
+                return {
+                    'success': False,
+                    'message': 'Validasi gagal',
+                    'errors': errors
+                }
+
+            updated_book = self.factory.update_book(book, data)
+            await self.repository.update(updated_book)
+
+            self.event_subject.notify(
+                EventType.BOOK_UPDATED,
+                {'book': updated_book.to_dict()}
+            )
+
+            return {
+                'success': True,
+                'data': updated_book.to_dict(),
+                'message': 'Buku berhasil diupdate'
+            }
+
+        except ValueError as e:
+            return {
+                'success': False,
+                'message': str(e),
+                'errors': {}
+            }
+        except Exception as e:
+            self.event_subject.notify(EventType.SYSTEM_ERROR, {'message': str(e)})
+            return {
+                'success': False,
+                'message': f'Gagal mengupdate buku: {str(e)}',
+                'errors': {}
+            }
+
+    async def delete_book(self, book_id):
+        """
+        Hapus buku (soft delete)
+
+        Returns:
+            dict: Response dengan hasil operasi
+        """
+        try:
+            book = await self.repository.find_by_id(book_id)
+            if not book:
+                return {
+                    'success': False,
+                    'message': f'Buku dengan ID {book_id} tidak ditemukan'
+                }
+
+            if await self.repository.delete(book_id):
+                self.event_subject.notify(
+                    EventType.BOOK_DELETED,
+                    {'book_id': book_id, 'book_title': book.title}
+                )
+
+                return {
+                    'success': True,
+                    'message': f'Buku "{book.title}" berhasil dihapus'
+                }
+            else:
+                return {
+                    'success': False,
+                    'message': 'Gagal menghapus buku'
+                }
+
+        except Exception as e:
+            self.event_subject.notify(EventType.SYSTEM_ERROR, {'message': str(e)})
+            return {
+                'success': False,
+                'message': f'Gagal menghapus buku: {str(e)}'
+            }
+
+    @coalesced('books.search')
+    async def search_books(self, keyword):
+        """
+        Mencari buku berdasarkan keyword
+
+        Returns:
+            dict: Response dengan hasil pencarian
+        """
+        try:
+            if not keyword or len(keyword.strip()) < 2:
+                return {
+                    'success': False,
+                    'message': 'Kata kunci pencarian minimal 2 karakter',
+                    'data': []
+                }
+
+            books = await self.repository.search(keyword.strip())
+
+            return {
+                'success': True,
+                'data': [book.to_dict() for book in books],
+                'total': len(books),
+                'keyword': keyword,
+                'message': f'Ditemukan {len(books)} buku'
+            }
+
+        except Exception as e:
+            self.event_subject.notify(EventType.SYSTEM_ERROR, {'message': str(e)})
+            return {
+                'success': False,
+                'message': f'Gagal mencari buku: {str(e)}',
+                'data': []
+            }
+
+    @coalesced('books.categories')
+    async def get_categories(self):
+        """
+        Mendapatkan daftar kategori buku
+
+        Returns:
+            dict: Response dengan daftar kategori
+        """
+        try:
+            categories = await self.repository.get_categories()
+
+            return {
+                'success': True,
+                'data': categories,
+                'total': len(categories),
+                'message': 'Daftar kategori berhasil diambil'
+            }
+
+        except Exception as e:
+            return {
+                'success': False,
+                'message': f'Gagal mengambil kategori: {str(e)}',
+                'data': []
+            }
+
+    async def lookup_books(self, ids, isbns):
+        """
+        Batch lookup buku berdasarkan ID dan/atau ISBN
+
+        Returns:
+            dict: Response dengan hasil per input (None jika tidak ditemukan)
+        """
+        try:
+            books_by_id = {book.id: book for book in await self.repository.find_many_by_ids(ids)}
+            books_by_isbn = {
+                book.isbn: book for book in await self.repository.find_many_by_isbns(isbns)
+            }
+            return build_lookup_response(ids, isbns, books_by_id, books_by_isbn)
+
+        except Exception as e:
+            self.event_subject.notify(EventType.SYSTEM_ERROR, {'message': str(e)})
+            return {
+                'success': False,
+                'message': f'Gagal mengambil data buku: {str(e)}',
+                'data': None
+            }
+
+    async def check_availability(self, book_id):
+        """
+        Cek ketersediaan buku
+
+        Returns:
+            dict: Response dengan status ketersediaan
+        """
+        try:
+            book = await self.repository.find_by_id(book_id)
+
+            if not book:
+                return {
+                    'success': False,
+                    'message': f'Buku dengan ID {book_id} tidak ditemukan',
+                    'data': None
+                }
+
+            return {
+                'success': True,
+                'data': {
+                    'book_id': book.id,
+                    'title': book.title,
+                    'total_stock': book.stock,
+                    'available': book.available,
+                    'borrowed': book.stock - book.available,
+                    'is_available': book.available > 0
+                },
+                'message': 'Status ketersediaan berhasil diambil'
+            }
+
+        except Exception as e:
+            return {
+                'success': False,
+                'message': f'Gagal mengecek ketersediaan: {str(e)}',
+                'data': None
+            }
+
+
+# Singleton instance
+async_book_service = AsyncBookService()
@@ -0,0 +1,340 @@
+"""
+DESIGN PATTERN: FACADE
+Async Loan Service - Padanan LoanService untuk mode ASGI
+
+Memakai validator, factory dan observer yang sama dengan LoanService;
+lookup database untuk validasi (buku tersedia, loan bisa dikembalikan)
+dilakukan lewat repository async lalu diputuskan oleh validator yang sama.
+"""
+
+from datetime import datetime
+
+from app.repositories import async_book_repository, async_loan_repository
+from app.factories import model_factory
+from app.validators import loan_validator
+from app.observers import event_subject, EventType
+from app.services.loan_service import build_book_loans_response
+
+
+class AsyncLoanService:
+    """
+    Facade async untuk operasi Loan (Peminjaman)
+
+    Pattern: Facade
+    """
+
+    def __init__(self):
+        """
+        Inisialisasi service dengan dependencies
+        """
+        self.loan_repository = async_loan_repository
+        self.book_repository = async_book_repository
+        self.factory = model_factory
+        self.validator = loan_validator
+        self.event_subject = event_subject
+
+    async def get_all_loans(self, filters=None):
+        """
+        Mendapatkan semua peminjaman
+
+        Returns:
+            dict: Response dengan list peminjaman
+        """
+        try:
+            loans = await self.loan_repository.find_all(filters)
+            total = await self.loan_repository.count(filters)
+
+            return {
+                'success': True,
+                'data': [loan.to_dict() for loan in loans],
+                'total': total,
+                'message': 'Data peminjaman berhasil diambil'
+            }
+        except Exception as e:
+            self.event_subject.notify(EventType.SYSTEM_ERROR, {'message': str(e)})
+            return {
+                'success': False,
+                'message': f'Gagal mengambil data peminjaman: {str(e)}',
+                'data': []
+            }
+
+    async def get_loan_by_id(self, loan_id):
+        """
+        Mendapatkan detail peminjaman berdasarkan ID
+
+        Returns:
+            dict: Response dengan detail peminjaman
+        """
+        try:
+            loan = await self.loan_repository.find_by_id(loan_id)
+
+            if not loan:
+                return {
+                    'success': False,
+                    'message': f'Peminjaman dengan ID {loan_id} tidak ditemukan',
+                    'data': None
+                }
+
+            return {
+                'success': True,
+                'data': loan.to_dict(),
+                'message': 'Detail peminjaman berhasil diambil'
+            }
+        except Exception as e:
+            self.event_subject.notify(EventType.SYSTEM_ERROR, {'message': str(e)})
+            return {
+                'success': False,
+                'message': f'Gagal mengambil detail peminjaman: {str(e)}',
+                'data': None
+            }
+
+    async def create_loan(self, data):
+        """
+        Membuat peminjaman baru
+
+        Returns:
+            dict: Response dengan hasil operasi
+        """
+        try:
+            # Validasi format (validator bersama)
+            is_valid, errors = self.validator.validate_fields(data)
+
+            # Cek buku ada dan tersedia
+            book = None
+            if 'book_id' not in errors:
+                book = await self.book_repository.find_by_id(int(data['book_id']))
+                book_error = self.validator.check_book_available(book)
+                if book_error:
+                    errors['book_id'] = book_error
+
+            if errors:
+                return {
+                    'success': False,
+                    'message': 'Validasi gagal',
+                    'errors': errors
+                }
+
+            loan = self.factory.create_loan(data)
+            # Relasi di-set langsung: Loan.to_dict membaca book.title
+            loan.book = book
+            book.available -= 1
+
+            # Buku dan peminjaman disimpan dalam satu commit
+            saved_loan = await self.loan_repository.save(loan)
+
+            self.event_subject.notify(
+                EventType.LOAN_CREATED,
+                {'loan': saved_loan.to_dict()}
+            )
+
+            return {
+                'success': True,
+                'data': saved_loan.to_dict(),
+                'message': 'Peminjaman berhasil dibuat'
+            }
+
+        except ValueError as e:
+            return {
+                'success': False,
+                'message': str(e),
+                'errors': {}
+            }
+        except Exception as e:
+            self.event_subject.notify(EventType.SYSTEM_ERROR, {'message': str(e)})
+            return {
+                'success': False,
+                'message': f'Gagal membuat peminjaman: {str(e)}',
+                'errors': {}
+            }
+
+    async def update_loan(self, loan_id, data):
+        """
+        Update peminjaman (perpanjangan due_date / catatan)
+
+        Returns:
+            dict: Response dengan hasil operasi (None jika loan tidak ditemukan)
+        """
+        loan = await self.loan_repository.find_by_id(loan_id)
+        if not loan:
+            return None
+
+        if 'due_date' in data:
+            try:
+                due_date = datetime.strptime(data['due_date'], '%Y-%m-%d').date()
+            except ValueError:
+                return {
+                    'success': False,
+                    'message': 'Format due_date tidak valid. Gunakan YYYY-MM-DD'
+                }
+            if due_date < loan.loan_date:
+                return {
+                    'success': False,
+                    'message': 'due_date tidak boleh sebelum loan_date'
+                }
+            loan.due_date = due_date
+
+        if 'notes' in data:
+            loan.notes = data['notes']
+
+        await self.loan_repository.update(loan)
+        self.event_subject.notify(EventType.LOAN_UPDATED, {'loan': loan.to_dict()})
+
+        return {
+            'success': True,
+            'message': 'Peminjaman berhasil diupdate',
+            'data': {
+                'id': loan.id,
+                'book_id': loan.book_id,
+                'borrower_name': loan.borrower_name,
+                'loan_date': loan.loan_date.isoformat() if loan.loan_date else None,
+                'due_date': loan.due_date.isoformat() if loan.due_date else None,
+                'return_date': loan.return_date.isoformat() if loan.return_date else None,
+                'status': loan.status,
+                'notes': loan.notes
+            }
+        }
+
+    async def delete_loan(self, loan_id):
+        """
+        Hapus data peminjaman
+
+        Returns:
+            bool atau None: None jika loan tidak ditemukan
+        """
+        loan = await self.loan_repository.find_by_id(loan_id)
+        if not loan:
+            return None
+        # Diambil sebelum dihapus: observer membaca tanggal peminjaman
+        loan_data = loan.to_dict()
+        success = await self.loan_repository.delete(loan_id)
+        if success:
+            self.event_subject.notify(EventType.LOAN_DELETED, {'loan': loan_data})
+        return success
+
+    async def return_book(self, loan_id, return_date=None):
+        """
+        Proses pengembalian buku
+
+        Returns:
+            dict: Response dengan hasil operasi
+        """
+        try:
+            loan = await self.loan_repository.find_by_id(loan_id)
+
+            is_valid, errors = self.validator.check_returnable(loan)
+            if not is_valid:
+                return {
+                    'success': False,
+                    'message': 'Validasi gagal',
+                    'errors': errors
+                }
+
+            loan.mark_as_returned(return_date)
+
+            # loan.book sudah di-eager load oleh find_by_id
+            book = loan.book
+            if book and not book.is_deleted:
+                book.available = min(book.stock, book.available + 1)
+
+            await self.loan_repository.update(loan)
+
+            self.event_subject.notify(
+                EventType.LOAN_RETURNED,
+                {'loan': loan.to_dict()}
+            )
+
+            return {
+                'success': True,
+                'data': loan.to_dict(),
+                'message': 'Buku berhasil dikembalikan'
+            }
+
+        except Exception as e:
+            self.event_subject.notify(EventType.SYSTEM_ERROR, {'message': str(e)})
+            return {
+                'success': False,
+                'message': f'Gagal mengembalikan buku: {str(e)}',
+                'errors': {}
+            }
+
+    async def get_book_loans(self, book_id, status=None, limit=10, cursor=None,
+                             include_archived=False):
+        """
+        Mendapatkan peminjaman sebuah buku per halaman (keyset pagination)
+
+        Returns:
+            dict: Response dengan peminjaman dan pagination.next_cursor
+        """
+        try:
+            book = await self.book_repository.find_by_id(book_id)
+
+            if not book:
+                return {
+                    'success': False,
+                    'message': f'Buku dengan ID {book_id} tidak ditemukan',
+                    'data': []
+                }
+
+            loans = await self.loan_repository.find_by_book(
+                book_id, status, limit + 1, cursor, include_archived)
+            return build_book_loans_response(book, loans, limit)
+
+        except Exception as e:
+            self.event_subject.notify(EventType.SYSTEM_ERROR, {'message': str(e)})
+            return {
+                'success': False,
+                'message': f'Gagal mengambil data peminjaman: {str(e)}',
+                'data': []
+            }
+
+    async def get_overdue_loans(self):
+        """
+        Mendapatkan daftar peminjaman yang terlambat
+
+        Returns:
+            dict: Response dengan daftar peminjaman terlambat
+        """
+        try:
+            loans = await self.loan_repository.find_overdue_loans()
+
+            return {
+                'success': True,
+                'data': [loan.to_dict() for loan in loans],
+                'total': len(loans),
+                'message': f'Ditemukan {len(loans)} peminjaman terlambat'
+            }
+
+        except Exception as e:
+            return {
+                'success': False,
+                'message': f'Gagal mengambil data: {str(e)}',
+                'data': []
+            }
+
+    async def get_loans_by_borrower(self, borrower_name, include_archived=False):
+        """
+        Mendapatkan peminjaman berdasarkan nama peminjam
+
+        Returns:
+            dict: Response dengan daftar peminjaman
+        """
+        try:
+            loans = await self.loan_repository.find_by_borrower(borrower_name, include_archived)
+
+            return {
+                'success': True,
+                'data': [loan.to_dict() for loan in loans],
+                'total': len(loans),
+                'message': f'Ditemukan {len(loans)} peminjaman'
+            }
+
+        except Exception as e:
+            return {
+                'success': False,
+                'message': f'Gagal mengambil data: {str(e)}',
+                'data': []
+            }
+
+
+# Singleton instance
+async_loan_service = AsyncLoanService()
@@ -0,0 +1,115 @@
+"""
+Async Snapshot Service - Padanan SnapshotService untuk mode ASGI
+"""
+
+from app.repositories import async_book_repository, async_loan_repository
+from app.repositories.book_repository import SNAPSHOT_QUERY as BOOK_SNAPSHOT_QUERY
+from app.repositories.loan_repository import SNAPSHOT_QUERY as LOAN_SNAPSHOT_QUERY
+from app.services.snapshot_export import SnapshotBusyError, snapshot_store
+
+
+class AsyncSnapshotService:
+    """
+    Service async untuk snapshot kolumnar (direktori dan manifest yang sama
+    dengan mode sync)
+    """
+
+    def __init__(self):
+        """
+        Inisialisasi service
+        """
+        self.book_repository = async_book_repository
+        self.loan_repository = async_loan_repository
+        self.store = snapshot_store
+
+    async def export_snapshot(self, mode='full'):
+        """
+        Menulis snapshot books dan loans
+
+        Args:
+            mode: 'full' atau 'incremental'
+
+        Returns:
+            dict: Response dengan manifest snapshot
+        """
+        sources = (
+            ('books', self.book_repository, BOOK_SNAPSHOT_QUERY),
+            ('loans', self.loan_repository, LOAN_SNAPSHOT_QUERY),
+        )
+        try:
+            with self.store.begin(mode) as run:
+                for table, repository, query in sources:
+                    if run.mode == 'incremental':
+                        ids = await repository.stream_snapshot_ids(self.store.chunk_size)
+                        run.record_deletes(table, [rows async for rows in ids.partitions()])
+                    writer = run.open(table, query.selected_columns)
+                    result = await repository.stream_snapshot(run.since, self.store.chunk_size)
+                    async for rows in result.partitions():
+                        writer.write(rows)
+                    run.close(table)
+
+            return {
+                'success': True,
+                'data': run.manifest,
+                'message': f'Snapshot {run.mode} berhasil dibuat'
+            }
+
+        except SnapshotBusyError as e:
+            return {
+                'success': False,
+                'message': str(e),
+                'data': None
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'message': f'Gagal membuat snapshot: {str(e)}',
+                'data': None
+            }
+
+    async def get_manifest(self):
+        """
+        Mendapatkan manifest snapshot terakhir
+
+        Returns:
+            dict: Response dengan manifest
+        """
+        manifest = self.store.load_manifest()
+        if manifest is None:
+            return {
+                'success': False,
+                'message': 'Snapshot tidak ditemukan',
+                'data': None
+            }
+
+        return {
+            'success': True,
+            'data': manifest,
+            'message': 'Manifest snapshot berhasil diambil'
+        }
+
+    async def verify_snapshot(self):
+        """
+        Mencocokkan ukuran dan checksum setiap file snapshot dengan manifest
+
+        Returns:
+            dict: Response dengan daftar file yang tidak cocok
+        """
+        manifest = self.store.load_manifest()
+        if manifest is None:
+            return {
+                'success': False,
+                'message': 'Snapshot tidak ditemukan',
+                'data': None
+            }
+
+        problems = self.store.verify(manifest)
+        return {
+            'success': True,
+            'data': {'valid': not problems, 'sequence': manifest['sequence'], 'problems': problems},
+            'message': 'Snapshot valid' if not problems else 'Snapshot tidak valid'
+        }
+
+
+# Singleton instance
+async_snapshot_service = AsyncSnapshotService()
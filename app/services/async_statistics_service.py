@@ -0,0 +1,195 @@
+"""
+Async Statistics Service - Padanan StatisticsService untuk mode ASGI
+"""
+
+from datetime import datetime, timedelta
+
+from app.repositories import async_book_repository, async_loan_repository
+from app.services.circulation_timeseries import bucket_starts, circulation_timeseries, next_bucket
+from app.services.overdue_analytics import overdue_analytics
+from app.services.popularity_tracker import popularity_tracker
+from app.services.single_flight import coalesced
+
+
+class AsyncStatisticsService:
+    """
+    Service async untuk menghasilkan statistik perpustakaan
+    """
+
+    def __init__(self):
+        """
+        Inisialisasi service
+        """
+        self.book_repository = async_book_repository
+        self.loan_repository = async_loan_repository
+
+    @coalesced('statistics.library')
+    async def get_library_statistics(self):
+        """
+        Mendapatkan statistik lengkap perpustakaan
+
+        Returns:
+            dict: Response dengan statistik
+        """
+        try:
+            total_books = await self.book_repository.count()
+            available_books = await self.book_repository.count({'available_only': True})
+            categories = await self.book_repository.get_categories()
+
+            loan_stats = await self.loan_repository.get_loan_statistics()
+
+            return {
+                'success': True,
+                'data': {
+                    'books': {
+                        'total': total_books,
+                        'available': available_books,
+                        'borrowed': total_books - available_books,
+                        'categories_count': len(categories),
+                        'categories': categories
+                    },
+                    'loans': loan_stats
+                },
+                'message': 'Statistik berhasil diambil'
+            }
+
+        except Exception as e:
+            return {
+                'success': False,
+                'message': f'Gagal mengambil statistik: {str(e)}',
+                'data': None
+            }
+
+    @coalesced('statistics.categories')
+    async def get_category_statistics(self):
+        """
+        Mendapatkan statistik per kategori
+
+        Returns:
+            dict: Response dengan statistik kategori
+        """
+        try:
+            category_stats = []
+            for category, total, available in await self.book_repository.count_by_category():
+                category_stats.append({
+                    'category': category,
+                    'total_books': total,
+                    'available': available,
+                    'borrowed': total - available
+                })
+
+            return {
+                'success': True,
+                'data': category_stats,
+                'message': 'Statistik kategori berhasil diambil'
+            }
+
+        except Exception as e:
+            return {
+                'success': False,
+                'message': f'Gagal mengambil statistik: {str(e)}',
+                'data': []
+            }
+
+    @coalesced('statistics.overdue')
+    async def get_overdue_statistics(self, limit=10):
+        """
+        Mendapatkan analitik keterlambatan (cache yang sama dengan mode sync)
+
+        Args:
+            limit: Jumlah peminjam dan peminjaman teratas
+
+        Returns:
+            dict: Response dengan analitik overdue
+        """
+        try:
+            today = datetime.utcnow().date()
+            report = overdue_analytics.cached(today)
+            if report is None:
+                generation = overdue_analytics.generation
+                report = overdue_analytics.build(
+                    await self.loan_repository.fetch_overdue_columns(today), today, generation)
+
+            return {
+                'success': True,
+                'data': report.to_dict(limit),
+                'message': 'Statistik keterlambatan berhasil diambil'
+            }
+
+        except Exception as e:
+            return {
+                'success': False,
+                'message': f'Gagal mengambil statistik: {str(e)}',
+                'data': None
+            }
+
+    @coalesced('statistics.timeseries')
+    async def get_circulation_timeseries(self, start, end, interval='day'):
+        """
+        Mendapatkan timeseries sirkulasi (cache yang sama dengan mode sync)
+
+        Hanya bucket yang belum di-cache dan bucket berjalan yang di-query
+        (lihat circulation_timeseries)
+
+        Args:
+            start: date awal rentang (diperluas ke awal bucket)
+            end: date akhir rentang (inklusif, diperluas ke akhir bucket)
+            interval: 'day', 'week' atau 'month'
+
+        Returns:
+            dict: Response dengan timeseries sirkulasi
+        """
+        try:
+            today = datetime.utcnow().date()
+            plan = circulation_timeseries.plan(interval, bucket_starts(start, end, interval), today)
+            loan_rows, return_rows = (), ()
+            if plan.span:
+                loan_rows, return_rows = await self.loan_repository.get_circulation(
+                    interval, *plan.span)
+            series = circulation_timeseries.assemble(plan, loan_rows, return_rows)
+            last_day = next_bucket(plan.starts[-1], interval) - timedelta(days=1)
+
+            return {
+                'success': True,
+                'data': {
+                    'interval': interval,
+                    'from': plan.starts[0].isoformat(),
+                    'to': last_day.isoformat(),
+                    **series
+                },
+                'message': 'Timeseries sirkulasi berhasil diambil'
+            }
+
+        except Exception as e:
+            return {
+                'success': False,
+                'message': f'Gagal mengambil statistik: {str(e)}',
+                'data': None
+            }
+
+
+    async def get_popular(self, window, limit=10):
+        """
+        Mendapatkan buku dan peminjam terpopuler dalam window hari (hitungan
+        di memori yang sama dengan mode sync, tanpa query database)
+
+        Returns:
+            dict: Response dengan top-N buku dan peminjam
+        """
+        try:
+            return {
+                'success': True,
+                'data': popularity_tracker.top(window, limit),
+                'message': 'Statistik popularitas berhasil diambil'
+            }
+
+        except Exception as e:
+            return {
+                'success': False,
+                'message': f'Gagal mengambil statistik: {str(e)}',
+                'data': None
+            }
+
+
+# Singleton instance
+async_statistics_service = AsyncStatisticsService()
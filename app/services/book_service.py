@@ -13,8 +13,64 @@ from app.repositories import book_repository
 from app.factories import model_factory
 from app.validators import book_validator
 from app.observers import event_subject, EventType
+from app.middleware import instrument_methods
+from app.services.single_flight import coalesced
 
 
+def serialize_active_loans(book):
+    """
+    Serialisasi Book.loans hasil find_by_id_with_active_loans, terbaru dulu
+    
+    Args:
+        book: Book dengan koleksi loans berisi peminjaman aktif
+    
+    Returns:
+        List[dict]: Peminjaman aktif
+    """
+    return [loan.to_dict() for loan in sorted(book.loans, key=lambda loan: loan.id, reverse=True)]
+
+
+def build_lookup_response(ids, isbns, books_by_id, books_by_isbn):
+    """
+    Menyusun response batch lookup: hasil per input, None untuk yang tidak
+    ditemukan. Dipakai bersama oleh service sync dan async.
+    
+    Args:
+        ids: List ID yang diminta
+        isbns: List ISBN yang diminta
+        books_by_id: Dict id -> Book yang ditemukan
+        books_by_isbn: Dict isbn -> Book yang ditemukan
+    
+    Returns:
+        dict: Response dengan hasil dan daftar input yang tidak ditemukan
+    """
+    def entry(book):
+        if book is None:
+            return None
+        data = book.to_dict()
+        data['is_available'] = book.available > 0
+        return data
+    
+    missing = {
+        'ids': [id for id in ids if id not in books_by_id],
+        'isbns': [isbn for isbn in isbns if isbn not in books_by_isbn]
+    }
+    requested = len(ids) + len(isbns)
+    found = requested - len(missing['ids']) - len(missing['isbns'])
+    
+    return {
+        'success': True,
+        'data': {
+            'ids': {str(id): entry(books_by_id.get(id)) for id in ids},
+            'isbns': {isbn: entry(books_by_isbn.get(isbn)) for isbn in isbns}
+        },
+        'missing': missing,
+        'total': found,
+        'message': f'{found} dari {requested} buku ditemukan'
+    }
+
+
+@instrument_methods('service')
 class BookService:
     """
     Facade untuk operasi Book
@@ -64,18 +120,22 @@ class BookService:
                 'data': []
             }
     
-    def get_book_by_id(self, book_id):
+    def get_book_by_id(self, book_id, include_active_loans=False):
         """
         Mendapatkan detail buku berdasarkan ID
         
         Args:
             book_id: ID buku
+            include_active_loans: Sertakan peminjaman aktif (active_loans)
         
         Returns:
             dict: Response dengan detail buku
         """
         try:
-            book = self.repository.find_by_id(book_id)
+            if include_active_loans:
+                book = self.repository.find_by_id_with_active_loans(book_id)
+            else:
+                book = self.repository.find_by_id(book_id)
             
             if not book:
                 return {
@@ -84,9 +144,13 @@ class BookService:
                     'data': None
                 }
             
+            data = book.to_dict()
+            if include_active_loans:
+                data['active_loans'] = serialize_active_loans(book)
+            
             return {
                 'success': True,
-                'data': book.to_dict(),
+                'data': data,
                 'message': 'Detail buku berhasil diambil'
             }
         except Exception as e:
@@ -266,6 +330,7 @@ class BookService:
                 'message': f'Gagal menghapus buku: {str(e)}'
             }
     
+    @coalesced('books.search')
     def search_books(self, keyword):
         """
         Mencari buku berdasarkan keyword
@@ -302,6 +367,7 @@ class BookService:
                 'data': []
             }
     
+    @coalesced('books.categories')
     def get_categories(self):
         """
         Mendapatkan daftar kategori buku
@@ -326,6 +392,31 @@ class BookService:
                 'data': []
             }
     
+    def lookup_books(self, ids, isbns):
+        """
+        Batch lookup buku berdasarkan ID dan/atau ISBN
+        Satu query IN per jenis key, menggantikan satu request per buku
+        
+        Args:
+            ids: List ID buku (sudah di-parse, lihat parse_book_lookup)
+            isbns: List ISBN buku
+        
+        Returns:
+            dict: Response dengan hasil per input (None jika tidak ditemukan)
+        """
+        try:
+            books_by_id = {book.id: book for book in self.repository.find_many_by_ids(ids)}
+            books_by_isbn = {book.isbn: book for book in self.repository.find_many_by_isbns(isbns)}
+            return build_lookup_response(ids, isbns, books_by_id, books_by_isbn)
+            
+        except Exception as e:
+            self.event_subject.notify(EventType.SYSTEM_ERROR, {'message': str(e)})
+            return {
+                'success': False,
+                'message': f'Gagal mengambil data buku: {str(e)}',
+                'data': None
+            }
+    
     def check_availability(self, book_id):
         """
         Cek ketersediaan buku
@@ -365,6 +456,42 @@ class BookService:
                 'message': f'Gagal mengecek ketersediaan: {str(e)}',
                 'data': None
             }
+    
+    def purge_deleted_books(self, batch_size=500, pause=0.0, on_batch=None):
+        """
+        Memindahkan buku soft delete yang tidak direferensikan loans ke
+        books_tombstone (lihat BookRepository.purge_deleted)
+        
+        Setiap batch dinotifikasikan sebagai event BOOK_PURGED ({'book_ids'})
+        agar observer yang menyimpan data buku di memori ikut membuangnya.
+        
+        Args:
+            batch_size: Jumlah buku per transaksi
+            pause: Jeda (detik) antar batch
+            on_batch: Optional callable (ids, total_purged) setiap batch selesai
+        
+        Returns:
+            dict: Response dengan jumlah buku yang dipindahkan
+        """
+        def notify_batch(ids, total):
+            self.event_subject.notify(EventType.BOOK_PURGED, {'book_ids': list(ids)})
+            if on_batch is not None:
+                on_batch(ids, total)
+        
+        try:
+            total = self.repository.purge_deleted(batch_size, pause, notify_batch)
+            return {
+                'success': True,
+                'data': {'purged': total},
+                'message': f'{total} buku dipindahkan ke books_tombstone'
+            }
+        except Exception as e:
+            self.event_subject.notify(EventType.SYSTEM_ERROR, {'message': str(e)})
+            return {
+                'success': False,
+                'message': f'Gagal purge buku: {str(e)}',
+                'data': None
+            }
 
 
 # Singleton instance
@@ -0,0 +1,244 @@
+"""
+Circulation Timeseries - Statistik sirkulasi per hari/minggu/bulan
+
+Per bucket interval dihitung jumlah peminjaman (loan_date), jumlah
+pengembalian (return_date), rata-rata durasi pinjam dan rasio pengembalian
+tepat waktu (return_date <= due_date). Setiap metrik diambil dengan satu
+query GROUP BY date_bucket (LoanRepository.get_circulation), termasuk
+peminjaman yang sudah diarsipkan.
+
+Bucket yang sudah lewat (sebelum bucket hari ini) jarang berubah sehingga
+disimpan di cache; setiap request hanya meng-query bucket yang belum
+di-cache ditambah bucket berjalan. Cache dibuang jika di proses ini ada
+transaksi yang mengubah bucket lampau: peminjaman atau pengembalian
+bertanggal mundur, perubahan due_date, atau penghapusan peminjaman.
+Perubahan dari worker lain terlihat setelah TIMESERIES_CACHE_SECONDS.
+"""
+
+from collections import OrderedDict, namedtuple
+from datetime import datetime, timedelta
+from threading import Lock
+from time import monotonic
+
+from app.middleware import record_cache_lookup
+from app.observers import EventObserver, EventType, event_subject
+
+
+def bucket_start(day, interval):
+    """
+    Awal bucket yang memuat tanggal day (minggu dimulai Senin)
+
+    Args:
+        day: date
+        interval: 'day', 'week' atau 'month'
+
+    Returns:
+        date
+    """
+    if interval == 'week':
+        return day - timedelta(days=day.weekday())
+    if interval == 'month':
+        return day.replace(day=1)
+    return day
+
+
+def next_bucket(start, interval):
+    """
+    Awal bucket berikutnya
+
+    Args:
+        start: Awal bucket (hasil bucket_start)
+        interval: 'day', 'week' atau 'month'
+
+    Returns:
+        date
+    """
+    if interval == 'week':
+        return start + timedelta(days=7)
+    if interval == 'month':
+        return (start.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return start + timedelta(days=1)
+
+
+def bucket_starts(start, end, interval):
+    """
+    Awal setiap bucket yang beririsan dengan rentang start..end (inklusif)
+
+    Returns:
+        List[date]
+    """
+    starts, current = [], bucket_start(start, interval)
+    while current <= end:
+        starts.append(current)
+        current = next_bucket(current, interval)
+    return starts
+
+
+# Hasil CirculationTimeseries.plan: span = rentang query (start, end
+# eksklusif) atau None jika semua bucket ada di cache
+TimeseriesPlan = namedtuple(
+    'TimeseriesPlan', ['interval', 'starts', 'today', 'span', 'cached', 'generation'])
+
+
+def _rate(value, total, digits):
+    return round(value / total, digits) if total else None
+
+
+class CirculationTimeseries(EventObserver):
+    """
+    Cache bucket historis timeseries sirkulasi
+
+    Nilai per bucket: (loans, returns, total_loan_days, on_time_returns)
+
+    Pattern: Observer (cache dibuang saat ada transaksi bertanggal mundur)
+    """
+
+    def __init__(self):
+        self.cache_size = 5000
+        self.ttl = 300.0
+        self._lock = Lock()
+        # (interval, awal bucket) -> (nilai bucket, expires_at), urut LRU
+        self._buckets = OrderedDict()
+        # Bertambah setiap invalidate
+        self._generation = 0
+
+    def init_app(self, app):
+        """
+        Membaca konfigurasi cache timeseries
+
+        Config:
+            TIMESERIES_CACHE_BUCKETS: Jumlah maksimum bucket historis di cache
+                (0 = tanpa cache)
+            TIMESERIES_CACHE_SECONDS: Umur maksimum bucket di cache (batas
+                basi untuk perubahan dari worker lain)
+
+        Args:
+            app: Flask/Quart application instance
+        """
+        self.cache_size = app.config.get('TIMESERIES_CACHE_BUCKETS', 5000)
+        self.ttl = app.config.get('TIMESERIES_CACHE_SECONDS', 300.0)
+        self.invalidate()
+
+    def plan(self, interval, starts, today):
+        """
+        Menentukan rentang yang perlu di-query
+
+        Args:
+            interval: 'day', 'week' atau 'month'
+            starts: Awal bucket yang diminta (bucket_starts)
+            today: date hari ini
+
+        Returns:
+            TimeseriesPlan
+        """
+        current = bucket_start(today, interval)
+        cached, missing = {}, []
+        now = monotonic()
+        with self._lock:
+            generation = self._generation
+            for start in starts:
+                entry = self._buckets.get((interval, start)) if start < current else None
+                if entry is None or entry[1] <= now:
+                    missing.append(start)
+                else:
+                    self._buckets.move_to_end((interval, start))
+                    cached[start] = entry[0]
+        # Hanya bucket historis yang bisa di-cache; bucket berjalan selalu di-query
+        historical = sum(1 for start in starts if start < current)
+        record_cache_lookup('circulation_timeseries', True, len(cached))
+        record_cache_lookup('circulation_timeseries', False, historical - len(cached))
+        span = (missing[0], next_bucket(missing[-1], interval)) if missing else None
+        return TimeseriesPlan(interval, starts, today, span, cached, generation)
+
+    def assemble(self, plan, loan_rows=(), return_rows=()):
+        """
+        Menggabungkan bucket dari cache dan hasil query, lalu menyimpan
+        bucket historis hasil query ke cache
+
+        Args:
+            plan: Hasil plan
+            loan_rows: Baris (bucket, loans) dari get_circulation
+            return_rows: Baris (bucket, returns, total_loan_days, on_time) dari get_circulation
+
+        Returns:
+            dict: buckets dan summary rentang
+        """
+        fetched = {}
+        for bucket, loans in loan_rows:
+            fetched[bucket] = [int(loans), 0, 0.0, 0]
+        for bucket, returns, loan_days, on_time in return_rows:
+            values = fetched.setdefault(bucket, [0, 0, 0.0, 0])
+            values[1:] = [int(returns), float(loan_days or 0), int(on_time or 0)]
+
+        interval, cached = plan.interval, plan.cached
+        current = bucket_start(plan.today, interval)
+        empty = (0, 0, 0.0, 0)
+        buckets, totals = [], [0, 0, 0.0, 0]
+        learned = []
+        for start in plan.starts:
+            values = cached.get(start)
+            if values is None:
+                values = tuple(fetched.get(start, empty))
+                if start < current:
+                    learned.append(((interval, start), values))
+            loans, returns, loan_days, on_time = values
+            totals = [total + value for total, value in zip(totals, values)]
+            buckets.append({
+                'bucket': start.isoformat(),
+                'loans': loans,
+                'returns': returns,
+                'avg_loan_days': _rate(loan_days, returns, 2),
+                'on_time_rate': _rate(on_time, returns, 4)
+            })
+
+        if learned and self.cache_size > 0 and self.ttl > 0:
+            expires_at = monotonic() + self.ttl
+            with self._lock:
+                # Cache dibuang selama query berjalan: hasil mungkin sudah basi
+                if plan.generation != self._generation:
+                    learned = ()
+                for key, values in learned:
+                    self._buckets[key] = (values, expires_at)
+                    self._buckets.move_to_end(key)
+                while len(self._buckets) > self.cache_size:
+                    self._buckets.popitem(last=False)
+
+        loans, returns, loan_days, on_time = totals
+        return {
+            'buckets': buckets,
+            'summary': {
+                'loans': loans,
+                'returns': returns,
+                'avg_loan_days': _rate(loan_days, returns, 2),
+                'on_time_rate': _rate(on_time, returns, 4)
+            }
+        }
+
+    def invalidate(self):
+        """Membuang semua bucket yang di-cache"""
+        with self._lock:
+            self._buckets.clear()
+            self._generation += 1
+
+    def update(self, event_type, data):
+        # Hanya transaksi bertanggal sebelum hari ini yang mengubah bucket
+        # historis. due_date hanya memengaruhi bucket pengembalian (on_time)
+        loan = data.get('loan') or {}
+        fields = {
+            EventType.LOAN_CREATED: ('loan_date',),
+            EventType.LOAN_RETURNED: ('return_date',),
+            EventType.LOAN_UPDATED: ('return_date',),
+            EventType.LOAN_DELETED: ('loan_date', 'return_date'),
+        }[event_type]
+        today = datetime.utcnow().date().isoformat()
+        if any(loan.get(field) and loan[field] < today for field in fields):
+            self.invalidate()
+
+    def get_subscribed_events(self):
+        return [EventType.LOAN_CREATED, EventType.LOAN_RETURNED,
+                EventType.LOAN_UPDATED, EventType.LOAN_DELETED]
+
+
+# Singleton instance, didaftarkan ke event subject
+circulation_timeseries = CirculationTimeseries()
+event_subject.attach(circulation_timeseries)
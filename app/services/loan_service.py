@@ -8,8 +8,39 @@ from app.repositories import book_repository, loan_repository
 from app.factories import model_factory
 from app.validators import loan_validator
 from app.observers import event_subject, EventType
+from app.middleware import instrument_methods
 
 
+def build_book_loans_response(book, loans, limit):
+    """
+    Menyusun response satu halaman peminjaman buku (keyset pagination)
+    Dipakai bersama oleh service sync dan async
+    
+    Args:
+        book: Book
+        loans: Hasil find_by_book dengan limit + 1 (row ekstra = ada halaman berikutnya)
+        limit: Ukuran halaman
+    
+    Returns:
+        dict: Response dengan peminjaman dan cursor halaman berikutnya
+    """
+    has_more = len(loans) > limit
+    loans = loans[:limit]
+    
+    return {
+        'success': True,
+        'data': [loan.to_dict() for loan in loans],
+        'total': len(loans),
+        'book': {'id': book.id, 'title': book.title},
+        'pagination': {
+            'limit': limit,
+            'next_cursor': loans[-1].id if has_more else None
+        },
+        'message': 'Data peminjaman buku berhasil diambil'
+    }
+
+
+@instrument_methods('service')
 class LoanService:
     """
     Facade untuk operasi Loan (Peminjaman)
@@ -37,6 +68,7 @@ class LoanService:
                 - status: 'borrowed', 'returned', 'overdue'
                 - book_id: Filter by book
                 - borrower_name: Filter by borrower
+                - include_archived: Ikut menampilkan peminjaman yang sudah diarsipkan
         
         Returns:
             dict: Response dengan list peminjaman
@@ -226,6 +258,43 @@ class LoanService:
                 'errors': {}
             }
     
+    def get_book_loans(self, book_id, status=None, limit=10, cursor=None,
+                       include_archived=False):
+        """
+        Mendapatkan peminjaman sebuah buku per halaman (keyset pagination)
+        
+        Args:
+            book_id: ID buku
+            status: Optional filter status
+            limit: Ukuran halaman
+            cursor: next_cursor dari halaman sebelumnya (None = halaman pertama)
+            include_archived: Ikut menampilkan peminjaman yang sudah diarsipkan
+        
+        Returns:
+            dict: Response dengan peminjaman dan pagination.next_cursor
+        """
+        try:
+            book = self.book_repository.find_by_id(book_id)
+            
+            if not book:
+                return {
+                    'success': False,
+                    'message': f'Buku dengan ID {book_id} tidak ditemukan',
+                    'data': []
+                }
+            
+            loans = self.loan_repository.find_by_book(
+                book_id, status, limit + 1, cursor, include_archived)
+            return build_book_loans_response(book, loans, limit)
+            
+        except Exception as e:
+            self.event_subject.notify(EventType.SYSTEM_ERROR, {'message': str(e)})
+            return {
+                'success': False,
+                'message': f'Gagal mengambil data peminjaman: {str(e)}',
+                'data': []
+            }
+    
     def get_overdue_loans(self):
         """
         Mendapatkan daftar peminjaman yang terlambat
@@ -250,18 +319,19 @@ class LoanService:
                 'data': []
             }
     
-    def get_loans_by_borrower(self, borrower_name):
+    def get_loans_by_borrower(self, borrower_name, include_archived=False):
         """
         Mendapatkan peminjaman berdasarkan nama peminjam
         
         Args:
             borrower_name: Nama peminjam
+            include_archived: Ikut menampilkan peminjaman yang sudah diarsipkan
         
         Returns:
             dict: Response dengan daftar peminjaman
         """
         try:
-            loans = self.loan_repository.find_by_borrower(borrower_name)
+            loans = self.loan_repository.find_by_borrower(borrower_name, include_archived)
             
             return {
                 'success': True,
@@ -0,0 +1,286 @@
+"""
+Overdue Analytics - Agregat keterlambatan dan denda dengan NumPy
+
+Kolom peminjaman terlambat diambil dalam satu query
+(LoanRepository.fetch_overdue_columns), lalu dihitung secara vektor:
+- hari terlambat per peminjaman (today - due_date)
+- denda per peminjaman (hari x LATE_FEE_PER_DAY, dibatasi LATE_FEE_MAX_PER_LOAN)
+- total per peminjam dan per kategori (faktorisasi dengan dict + np.bincount)
+- aging bucket (np.searchsorted terhadap OVERDUE_AGING_BUCKETS)
+
+Tidak ada Loan.is_overdue() atau to_dict() per row. Hasil di-cache per
+tanggal selama OVERDUE_ANALYTICS_CACHE_SECONDS dan dibuang saat ada
+peminjaman dikembalikan, diubah atau dihapus, atau peminjaman baru yang
+sudah lewat due_date (peminjaman bertanggal mundur).
+
+NumPy di-import saat laporan pertama dibuat, bukan saat aplikasi start.
+"""
+
+from datetime import date, datetime
+from threading import Lock
+from time import monotonic
+
+from app.middleware import record_cache_lookup
+from app.observers import EventObserver, EventType, event_subject
+
+
+DEFAULT_AGING_BUCKETS = (7, 30, 90)
+
+
+def parse_buckets(value):
+    """
+    Parse batas aging bucket ('7,30,90') menjadi tuple int urut
+
+    Args:
+        value: String dipisah koma atau iterable int
+
+    Returns:
+        tuple: Batas atas (hari, inklusif) setiap bucket kecuali yang terakhir
+    """
+    if isinstance(value, str):
+        value = [part for part in value.split(',') if part.strip()]
+    edges = sorted({int(edge) for edge in value if int(edge) > 0})
+    return tuple(edges) or DEFAULT_AGING_BUCKETS
+
+
+def bucket_labels(edges):
+    """
+    Label aging bucket, mis. (7, 30) -> ['1-7', '8-30', '31+']
+
+    Args:
+        edges: Hasil parse_buckets
+
+    Returns:
+        List[str]
+    """
+    labels, lower = [], 1
+    for edge in edges:
+        labels.append(f'{lower}-{edge}')
+        lower = edge + 1
+    labels.append(f'{lower}+')
+    return labels
+
+
+class OverdueReport:
+    """
+    Hasil analitik overdue untuk satu tanggal (array NumPy)
+
+    Agregat dihitung sekali saat dibuat; to_dict hanya memotong top-N.
+    """
+
+    def __init__(self, columns, today, fee_per_day, max_fee=0, edges=DEFAULT_AGING_BUCKETS):
+        """
+        Args:
+            columns: dict kolom dari fetch_overdue_columns
+            today: date acuan
+            fee_per_day: Denda per hari terlambat
+            max_fee: Batas denda per peminjaman (0 = tanpa batas)
+            edges: Batas aging bucket (parse_buckets)
+        """
+        import numpy as np
+
+        self.today = today
+        self.fee_per_day = fee_per_day
+        self.edges = edges
+
+        self.loan_ids = np.asarray(columns['loan_id'], dtype=np.int64)
+        self.book_ids = np.asarray(columns['book_id'], dtype=np.int64)
+        # Tanggal sebagai ordinal int64 (konversi datetime64 dari object date
+        # jauh lebih lambat)
+        due_dates = columns['due_date']
+        self.due_ordinals = np.fromiter(map(date.toordinal, due_dates), np.int64, len(due_dates))
+        self.days = today.toordinal() - self.due_ordinals
+        self.fees = self.days * fee_per_day
+        if max_fee > 0:
+            np.minimum(self.fees, max_fee, out=self.fees)
+
+        # Urutan top-N: hari terlambat terbanyak, lalu loan_id
+        self.loan_order = np.lexsort((self.loan_ids, -self.days))
+
+        self.borrowers = self._group(np, columns['borrower_name'])
+        self.categories = self._group(np, columns['category'])
+
+        count = len(self.days)
+        self.days_summary = {
+            'mean': round(float(self.days.mean()), 1) if count else 0,
+            'median': float(np.median(self.days)) if count else 0,
+            'max': int(self.days.max()) if count else 0
+        }
+
+        bucket = np.searchsorted(np.asarray(edges), self.days, side='left')
+        self.bucket_loans = np.bincount(bucket, minlength=len(edges) + 1)
+        self.bucket_fees = np.bincount(bucket, weights=self.fees, minlength=len(edges) + 1)
+
+    def _group(self, np, keys):
+        """
+        Agregat per key: jumlah peminjaman, total denda, hari terlambat maksimum
+
+        Returns:
+            dict: names, inverse, loans, fees, max_days, order (total denda menurun)
+        """
+        # Faktorisasi dengan dict (loop di C): lebih cepat dari np.unique yang
+        # mengurutkan jutaan string
+        codes = dict.fromkeys(keys)
+        for code, key in enumerate(codes):
+            codes[key] = code
+        inverse = np.fromiter(map(codes.__getitem__, keys), np.int64, len(keys))
+        names = np.array(list(codes), dtype=object)
+        name_rank = np.empty(len(names), dtype=np.int64)
+        name_rank[np.argsort(names)] = np.arange(len(names))
+
+        loans = np.bincount(inverse, minlength=len(names))
+        fees = np.bincount(inverse, weights=self.fees, minlength=len(names))
+        max_days = np.zeros(len(names), dtype=np.int64)
+        np.maximum.at(max_days, inverse, self.days)
+        return {
+            'names': names, 'inverse': inverse, 'loans': loans, 'fees': fees,
+            'max_days': max_days, 'order': np.lexsort((name_rank, -fees))
+        }
+
+    def _group_rows(self, group, key, limit=None):
+        order = group['order'] if limit is None else group['order'][:limit]
+        return [
+            {
+                key: str(group['names'][i]),
+                'loans': int(group['loans'][i]),
+                'late_fees': int(group['fees'][i]),
+                'max_days_overdue': int(group['max_days'][i])
+            }
+            for i in order
+        ]
+
+    def to_dict(self, limit=10):
+        """
+        Ringkasan untuk response API
+
+        Args:
+            limit: Jumlah peminjam dan peminjaman teratas yang ditampilkan
+
+        Returns:
+            dict
+        """
+        borrowers, categories = self.borrowers, self.categories
+        return {
+            'as_of': self.today.isoformat(),
+            'overdue_loans': len(self.loan_ids),
+            'late_fee_per_day': self.fee_per_day,
+            'total_late_fees': int(self.fees.sum()),
+            'days_overdue': self.days_summary,
+            'aging_buckets': [
+                {'bucket': label, 'loans': int(loans), 'late_fees': int(fees)}
+                for label, loans, fees in zip(
+                    bucket_labels(self.edges), self.bucket_loans, self.bucket_fees)
+            ],
+            'by_category': self._group_rows(categories, 'category'),
+            'by_borrower': self._group_rows(borrowers, 'borrower_name', limit),
+            'most_overdue_loans': [
+                {
+                    'loan_id': int(self.loan_ids[i]),
+                    'book_id': int(self.book_ids[i]),
+                    'borrower_name': str(borrowers['names'][borrowers['inverse'][i]]),
+                    'category': str(categories['names'][categories['inverse'][i]]),
+                    'due_date': date.fromordinal(int(self.due_ordinals[i])).isoformat(),
+                    'days_overdue': int(self.days[i]),
+                    'late_fee': int(self.fees[i])
+                }
+                for i in self.loan_order[:limit]
+            ]
+        }
+
+
+class OverdueAnalytics(EventObserver):
+    """
+    Konfigurasi denda dan cache OverdueReport per tanggal
+
+    Pattern: Observer (cache dibuang saat ada transaksi yang mengubah daftar terlambat)
+    """
+
+    def __init__(self):
+        self.fee_per_day = 1000
+        self.max_fee = 0
+        self.edges = DEFAULT_AGING_BUCKETS
+        self.cache_seconds = 300.0
+        self._lock = Lock()
+        # (today, expires_at, OverdueReport)
+        self._cached = None
+        # Bertambah setiap invalidate
+        self._generation = 0
+
+    def init_app(self, app):
+        """
+        Membaca konfigurasi analitik overdue
+
+        Config:
+            LATE_FEE_PER_DAY: Denda per hari terlambat
+            LATE_FEE_MAX_PER_LOAN: Batas denda per peminjaman (0 = tanpa batas)
+            OVERDUE_AGING_BUCKETS: Batas aging bucket dalam hari, mis. '7,30,90'
+            OVERDUE_ANALYTICS_CACHE_SECONDS: Lama laporan di-cache (0 = tanpa cache)
+
+        Args:
+            app: Flask/Quart application instance
+        """
+        self.fee_per_day = app.config.get('LATE_FEE_PER_DAY', 1000)
+        self.max_fee = app.config.get('LATE_FEE_MAX_PER_LOAN', 0)
+        self.edges = parse_buckets(app.config.get('OVERDUE_AGING_BUCKETS', DEFAULT_AGING_BUCKETS))
+        self.cache_seconds = app.config.get('OVERDUE_ANALYTICS_CACHE_SECONDS', 300.0)
+        self.invalidate()
+
+    def cached(self, today):
+        """
+        Laporan yang masih berlaku untuk tanggal today
+
+        Returns:
+            OverdueReport atau None
+        """
+        cached = self._cached
+        hit = bool(cached and cached[0] == today and cached[1] > monotonic())
+        record_cache_lookup('overdue_analytics', hit)
+        return cached[2] if hit else None
+
+    @property
+    def generation(self):
+        """Generasi cache, dibaca sebelum fetch_overdue_columns"""
+        return self._generation
+
+    def build(self, columns, today, generation):
+        """
+        Membuat laporan dari kolom fetch_overdue_columns lalu menyimpannya di cache
+
+        Args:
+            columns: Hasil fetch_overdue_columns
+            today: date hari ini
+            generation: Nilai generation sebelum kolom di-fetch
+
+        Returns:
+            OverdueReport
+        """
+        report = OverdueReport(columns, today, self.fee_per_day, self.max_fee, self.edges)
+        if self.cache_seconds > 0:
+            with self._lock:
+                # Cache dibuang selama query berjalan: laporan mungkin sudah basi
+                if generation == self._generation:
+                    self._cached = (today, monotonic() + self.cache_seconds, report)
+        return report
+
+    def invalidate(self):
+        """Membuang laporan yang di-cache"""
+        with self._lock:
+            self._cached = None
+            self._generation += 1
+
+    def update(self, event_type, data):
+        # Peminjaman baru hanya masuk laporan jika due_date sudah lewat
+        if event_type == EventType.LOAN_CREATED:
+            due_date = (data.get('loan') or {}).get('due_date')
+            if not due_date or due_date >= datetime.utcnow().date().isoformat():
+                return
+        self.invalidate()
+
+    def get_subscribed_events(self):
+        return [EventType.LOAN_CREATED, EventType.LOAN_RETURNED,
+                EventType.LOAN_UPDATED, EventType.LOAN_DELETED]
+
+
+# Singleton instance, didaftarkan ke event subject
+overdue_analytics = OverdueAnalytics()
+event_subject.attach(overdue_analytics)
@@ -0,0 +1,361 @@
+"""
+Popularity Tracker - Top-N buku dan peminjam terpopuler per window hari
+
+Jumlah peminjaman dihitung exact per hari (loan_date) dari event
+LOAN_CREATED, tanpa query ke tabel loans. Total per window
+(POPULARITY_WINDOWS, default 7 dan 30 hari) diperbarui per event dan top-N
+diambil dengan heap (heapq) dari total tersebut.
+
+Persistensi: setiap proses menyimpan kenaikan yang belum ditulis (pending)
+dan setiap POPULARITY_PERSIST_SECONDS menggabungkannya ke
+POPULARITY_STATE_FILE (dengan file lock), lalu memuat ulang isi file. Dengan
+begitu worker gunicorn saling melihat hitungan worker lain dan restart tidak
+menghilangkan window. Hitungan awal dari database: flask rebuild-popularity.
+
+Rebuild menulis generasi (rebuilt_at, waktu query rebuild dimulai) ke state
+file. Kenaikan pending yang dicatat sebelum generasi tersebut sudah ikut
+dihitung dari database sehingga dibuang saat digabung, agar peminjaman
+tidak terhitung dua kali.
+"""
+
+import atexit
+import heapq
+import json
+import os
+from collections import Counter
+from datetime import date, datetime, timedelta
+from threading import Lock
+from time import monotonic, time
+
+from app.observers import EventObserver, EventType, event_subject
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - tidak tersedia di Windows
+    fcntl = None
+
+
+DEFAULT_WINDOWS = (7, 30)
+
+
+def parse_windows(value):
+    """
+    Parse window hari ('7,30' atau '7d,30d') menjadi tuple int urut
+
+    Args:
+        value: String dipisah koma atau iterable int
+
+    Returns:
+        tuple
+    """
+    if isinstance(value, str):
+        value = [part.strip().rstrip('d') for part in value.split(',') if part.strip()]
+    windows = sorted({int(days) for days in value if int(days) > 0})
+    return tuple(windows) or DEFAULT_WINDOWS
+
+
+def _empty_day():
+    return {'books': Counter(), 'borrowers': Counter()}
+
+
+def _add(days, day, book_id, borrower_name):
+    counts = days.setdefault(day, _empty_day())
+    counts['books'][book_id] += 1
+    counts['borrowers'][borrower_name] += 1
+
+
+def _top(counter, limit):
+    # Jumlah terbesar dulu, seri diurutkan berdasarkan key
+    return heapq.nsmallest(limit, counter.items(), key=lambda item: (-item[1], item[0]))
+
+
+class PopularityTracker(EventObserver):
+    """
+    Hitungan peminjaman per hari, per buku dan per peminjam
+
+    Pattern: Observer (LOAN_CREATED)
+    """
+
+    def __init__(self):
+        self.windows = DEFAULT_WINDOWS
+        self.state_file = None
+        self.persist_seconds = 60.0
+        self._lock = Lock()
+        # Hari ISO -> {'books': Counter(book_id), 'borrowers': Counter(nama)}
+        self._days = {}
+        # Kenaikan yang belum digabung ke state file:
+        # [(recorded_at, hari ISO, book_id, nama peminjam)]
+        self._pending = []
+        self._titles = {}
+        self._pending_titles = {}
+        # window -> {'books', 'borrowers', 'loans'} untuk self._today
+        self._totals = {}
+        self._today = None
+        self._next_persist = 0.0
+        atexit.register(self.persist)
+
+    def init_app(self, app):
+        """
+        Membaca konfigurasi dan memuat state terakhir
+
+        Config:
+            POPULARITY_WINDOWS: Window dalam hari, mis. '7,30'
+            POPULARITY_STATE_FILE: File JSON state ('' = hanya di memori)
+            POPULARITY_PERSIST_SECONDS: Interval penggabungan ke state file
+
+        Args:
+            app: Flask/Quart application instance
+        """
+        self.windows = parse_windows(app.config.get('POPULARITY_WINDOWS', DEFAULT_WINDOWS))
+        state_file = app.config.get('POPULARITY_STATE_FILE', '')
+        self.state_file = os.path.abspath(state_file) if state_file else None
+        self.persist_seconds = app.config.get('POPULARITY_PERSIST_SECONDS', 60.0)
+        with self._lock:
+            self._days, self._pending = {}, []
+            self._titles, self._pending_titles = {}, {}
+            self._today = None
+            if self.state_file:
+                state = self._read_state()
+                self._days = state['days']
+                self._titles = state['titles']
+            self._next_persist = monotonic() + self.persist_seconds
+
+    @property
+    def retention_days(self):
+        return self.windows[-1]
+
+    def record(self, book_id, borrower_name, loan_date, title=None, today=None):
+        """
+        Menambah satu peminjaman
+
+        Args:
+            book_id: ID buku
+            borrower_name: Nama peminjam
+            loan_date: date peminjaman (di luar window terbesar diabaikan)
+            title: Judul buku (untuk response)
+            today: Override tanggal hari ini (testing)
+        """
+        today = today or datetime.utcnow().date()
+        age = (today - loan_date).days
+        if not 0 <= age < self.retention_days:
+            return
+
+        day = loan_date.isoformat()
+        with self._lock:
+            self._roll(today)
+            _add(self._days, day, book_id, borrower_name)
+            self._pending.append((time(), day, book_id, borrower_name))
+            if title:
+                self._titles[book_id] = title
+                self._pending_titles[book_id] = title
+            for window, totals in self._totals.items():
+                if age < window:
+                    totals['books'][book_id] += 1
+                    totals['borrowers'][borrower_name] += 1
+                    totals['loans'] += 1
+        self.maybe_persist()
+
+    def top(self, window, limit=10, today=None):
+        """
+        Top-N buku dan peminjam dalam window
+
+        Args:
+            window: Jumlah hari (salah satu self.windows)
+            limit: Jumlah buku/peminjam teratas
+            today: Override tanggal hari ini (testing)
+
+        Returns:
+            dict
+        """
+        self.maybe_persist()
+        today = today or datetime.utcnow().date()
+        with self._lock:
+            self._roll(today)
+            totals = self._totals[window]
+            books = _top(totals['books'], limit)
+            borrowers = _top(totals['borrowers'], limit)
+            titles = {book_id: self._titles.get(book_id) for book_id, _ in books}
+            loans = totals['loans']
+
+        return {
+            'window': f'{window}d',
+            'from': (today - timedelta(days=window - 1)).isoformat(),
+            'to': today.isoformat(),
+            'total_loans': loans,
+            'books': [
+                {'book_id': book_id, 'title': titles[book_id], 'loans': count}
+                for book_id, count in books
+            ],
+            'borrowers': [
+                {'borrower_name': name, 'loans': count}
+                for name, count in borrowers
+            ]
+        }
+
+    def load(self, rows, today=None, rebuilt_at=None):
+        """
+        Mengganti semua hitungan (flask rebuild-popularity) lalu menulis state file
+
+        Args:
+            rows: Iterable (loan_date, book_id, title, borrower_name, loans)
+            today: Override tanggal hari ini (testing)
+            rebuilt_at: Waktu (epoch) query rows dimulai, menjadi generasi
+                rebuild; default sekarang
+        """
+        today = today or datetime.utcnow().date()
+        rebuilt_at = rebuilt_at or time()
+        days, titles = {}, {}
+        for loan_date, book_id, title, borrower_name, loans in rows:
+            if not 0 <= (today - loan_date).days < self.retention_days:
+                continue
+            counts = days.setdefault(loan_date.isoformat(), _empty_day())
+            counts['books'][book_id] += loans
+            counts['borrowers'][borrower_name] += loans
+            if title:
+                titles[book_id] = title
+
+        with self._lock:
+            if self.state_file:
+                with self._state_lock():
+                    self._write_state(days, titles, rebuilt_at)
+            # Kenaikan setelah query rebuild dimulai belum ada di rows
+            self._pending = [entry for entry in self._pending if entry[0] >= rebuilt_at]
+            for _, day, book_id, borrower_name in self._pending:
+                _add(days, day, book_id, borrower_name)
+            self._days, self._titles = days, {**titles, **self._pending_titles}
+            self._today = None
+
+    def maybe_persist(self):
+        """Menggabungkan ke state file jika interval sudah lewat"""
+        if self.state_file and monotonic() >= self._next_persist:
+            self.persist()
+
+    def persist(self):
+        """
+        Menggabungkan kenaikan pending ke state file lalu memuat ulang state
+        gabungan semua proses
+        """
+        if not self.state_file:
+            return
+        with self._lock:
+            self._next_persist = monotonic() + self.persist_seconds
+            if not self._pending:
+                # Tanpa kenaikan cukup memuat ulang (file diganti atomik)
+                state = self._read_state()
+                days, titles = state['days'], state['titles']
+            else:
+                with self._state_lock():
+                    state = self._read_state()
+                    days, titles = state['days'], state['titles']
+                    for recorded_at, day, book_id, borrower_name in self._pending:
+                        # Sudah dihitung oleh rebuild (generasi di state file)
+                        if recorded_at >= state['rebuilt_at']:
+                            _add(days, day, book_id, borrower_name)
+                    titles.update(self._pending_titles)
+
+                    oldest = (datetime.utcnow().date()
+                              - timedelta(days=self.retention_days - 1)).isoformat()
+                    days = {day: counts for day, counts in days.items() if day >= oldest}
+                    self._write_state(days, titles, state['rebuilt_at'])
+
+            self._days, self._titles = days, titles
+            self._pending, self._pending_titles = [], {}
+            self._today = None
+
+    def _roll(self, today):
+        # Total window dihitung ulang saat hari berganti atau setelah state dimuat
+        if self._today == today:
+            return
+        oldest = today - timedelta(days=self.retention_days - 1)
+        self._days = {
+            day: counts for day, counts in self._days.items()
+            if date.fromisoformat(day) >= oldest
+        }
+        self._totals = {
+            window: {'books': Counter(), 'borrowers': Counter(), 'loans': 0}
+            for window in self.windows
+        }
+        for day, counts in self._days.items():
+            age = (today - date.fromisoformat(day)).days
+            for window, totals in self._totals.items():
+                if 0 <= age < window:
+                    totals['books'].update(counts['books'])
+                    totals['borrowers'].update(counts['borrowers'])
+                    totals['loans'] += sum(counts['books'].values())
+        self._today = today
+
+    def _state_lock(self):
+        return _FileLock(f'{self.state_file}.lock')
+
+    def _read_state(self):
+        try:
+            with open(self.state_file) as f:
+                state = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {'days': {}, 'titles': {}, 'rebuilt_at': 0.0}
+        return {
+            'days': {
+                day: {
+                    'books': Counter({int(book_id): n for book_id, n in counts['books'].items()}),
+                    'borrowers': Counter(counts['borrowers'])
+                }
+                for day, counts in state.get('days', {}).items()
+            },
+            'titles': {int(book_id): title for book_id, title in state.get('titles', {}).items()},
+            'rebuilt_at': state.get('rebuilt_at', 0.0)
+        }
+
+    def _write_state(self, days, titles, rebuilt_at):
+        # Hanya judul buku yang masih muncul di window yang disimpan
+        book_ids = {book_id for counts in days.values() for book_id in counts['books']}
+        state = {
+            'updated_at': datetime.utcnow().isoformat(),
+            'rebuilt_at': rebuilt_at,
+            'days': {
+                day: {'books': dict(counts['books']), 'borrowers': dict(counts['borrowers'])}
+                for day, counts in sorted(days.items())
+            },
+            'titles': {book_id: title for book_id, title in titles.items() if book_id in book_ids}
+        }
+        os.makedirs(os.path.dirname(self.state_file), exist_ok=True)
+        with open(f'{self.state_file}.tmp', 'w') as f:
+            json.dump(state, f)
+        os.replace(f'{self.state_file}.tmp', self.state_file)
+
+    def update(self, event_type, data):
+        loan = data.get('loan') or {}
+        if not loan.get('loan_date'):
+            return
+        self.record(
+            loan['book_id'], loan['borrower_name'],
+            date.fromisoformat(loan['loan_date']), loan.get('book_title')
+        )
+
+    def get_subscribed_events(self):
+        return [EventType.LOAN_CREATED]
+
+
+class _FileLock:
+    """Lock eksklusif antar proses (fcntl); no-op jika fcntl tidak tersedia"""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = None
+
+    def __enter__(self):
+        if fcntl is not None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._file = open(self.path, 'w')
+            fcntl.flock(self._file, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        return False
+
+
+# Singleton instance, didaftarkan ke event subject
+popularity_tracker = PopularityTracker()
+event_subject.attach(popularity_tracker)
@@ -0,0 +1,270 @@
+"""
+Single-Flight - Coalescing panggilan service read-only yang identik
+
+Panggilan identik (nama + argumen sama) yang datang bersamaan hanya
+dieksekusi sekali: panggilan pertama (leader) menjalankan query,
+panggilan lain menunggu dan memakai hasil yang sama. Dengan
+COALESCE_WINDOW_SECONDS > 0, hasil yang berhasil juga dipakai ulang oleh
+panggilan identik selama window tersebut setelah leader selesai (data
+bisa tertinggal paling lama sebesar window).
+
+Hanya untuk method read-only yang hasilnya tidak dimodifikasi pemanggil:
+semua pemanggil menerima object hasil yang sama.
+
+Hasil per panggilan (counter di stats() dan listener):
+- executed: leader, query benar-benar dijalankan
+- shared_inflight: menunggu leader yang sedang berjalan
+- shared_window: memakai hasil leader dari window
+"""
+
+import asyncio
+from collections import OrderedDict
+from functools import wraps
+from inspect import iscoroutinefunction
+from threading import Event, Lock
+from time import monotonic
+
+
+RESULTS = ('executed', 'shared_inflight', 'shared_window')
+
+# Listener: callable(name, result) untuk setiap panggilan yang di-coalesce
+_listeners = []
+
+_MISSING = object()
+
+
+def add_coalesce_listener(listener):
+    """
+    Mendaftarkan listener hasil coalescing
+
+    Args:
+        listener: Callable (name, result)
+    """
+    if listener not in _listeners:
+        _listeners.append(listener)
+
+
+class _Call:
+    """
+    Panggilan leader yang sedang berjalan (mode thread)
+    """
+
+    def __init__(self):
+        self.done = Event()
+        self.result = None
+        self.error = None
+
+
+def _keepable(result):
+    # Response service yang gagal tidak disimpan di window
+    return not (isinstance(result, dict) and result.get('success') is False)
+
+
+class SingleFlight:
+    """
+    Menggabungkan panggilan identik yang sedang berjalan (thread dan asyncio)
+    """
+
+    def __init__(self):
+        self.enabled = True
+        self.window = 0.0
+        self._lock = Lock()
+        self._inflight = {}
+        self._async_inflight = {}
+        # key -> (expires_at, result), urut berdasarkan waktu expire
+        self._recent = OrderedDict()
+        self._stats = {}
+
+    def init_app(self, app):
+        """
+        Membaca konfigurasi coalescing
+
+        Config:
+            COALESCE_ENABLED: Aktifkan coalescing
+            COALESCE_WINDOW_SECONDS: Lama hasil dipakai ulang setelah
+                leader selesai (0 = hanya panggilan yang bersamaan)
+
+        Args:
+            app: Flask/Quart application instance
+        """
+        self.enabled = app.config.get('COALESCE_ENABLED', True)
+        self.window = app.config.get('COALESCE_WINDOW_SECONDS', 0.0)
+        with self._lock:
+            self._recent.clear()
+
+    def stats(self):
+        """
+        Counter per nama panggilan
+
+        Returns:
+            dict: name -> {executed, shared_inflight, shared_window, saved}
+        """
+        with self._lock:
+            stats = {name: dict(counts) for name, counts in self._stats.items()}
+        for counts in stats.values():
+            counts['saved'] = counts['shared_inflight'] + counts['shared_window']
+        return stats
+
+    def reset_stats(self):
+        """
+        Mengosongkan counter
+        """
+        with self._lock:
+            self._stats.clear()
+
+    def _record(self, name, result):
+        with self._lock:
+            counts = self._stats.setdefault(name, dict.fromkeys(RESULTS, 0))
+            counts[result] += 1
+        for listener in _listeners:
+            listener(name, result)
+
+    def _recent_result(self, key):
+        # Dipanggil dengan self._lock; membuang hasil yang sudah expire
+        now = monotonic()
+        while self._recent:
+            oldest = next(iter(self._recent))
+            if self._recent[oldest][0] > now:
+                break
+            del self._recent[oldest]
+        entry = self._recent.get(key)
+        return _MISSING if entry is None else entry[1]
+
+    def _remember(self, key, result):
+        # Dipanggil dengan self._lock
+        if self.window > 0 and _keepable(result):
+            self._recent[key] = (monotonic() + self.window, result)
+            self._recent.move_to_end(key)
+
+    def do(self, name, key, fn):
+        """
+        Menjalankan fn sekali untuk semua panggilan bersamaan dengan key yang sama
+
+        Args:
+            name: Nama panggilan (label counter)
+            key: Key hashable yang mengidentifikasi panggilan
+            fn: Callable tanpa argumen
+
+        Returns:
+            Hasil fn (milik leader)
+        """
+        if not self.enabled:
+            return fn()
+
+        with self._lock:
+            result = self._recent_result(key)
+            call = None if result is not _MISSING else self._inflight.get(key)
+            leader = result is _MISSING and call is None
+            if leader:
+                call = self._inflight[key] = _Call()
+
+        if result is not _MISSING:
+            self._record(name, 'shared_window')
+            return result
+
+        if not leader:
+            call.done.wait()
+            self._record(name, 'shared_inflight')
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+                if call.error is None:
+                    self._remember(key, call.result)
+            call.done.set()
+            self._record(name, 'executed')
+        return call.result
+
+    async def do_async(self, name, key, fn):
+        """
+        Padanan do() untuk coroutine (satu event loop per proses)
+
+        Args:
+            name: Nama panggilan (label counter)
+            key: Key hashable yang mengidentifikasi panggilan
+            fn: Callable tanpa argumen yang mengembalikan coroutine
+
+        Returns:
+            Hasil fn (milik leader)
+        """
+        if not self.enabled:
+            return await fn()
+
+        with self._lock:
+            result = self._recent_result(key)
+        if result is not _MISSING:
+            self._record(name, 'shared_window')
+            return result
+
+        future = self._async_inflight.get(key)
+        if future is not None:
+            try:
+                result = await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # Leader dibatalkan (mis. client disconnect): coba lagi
+                return await self.do_async(name, key, fn)
+            self._record(name, 'shared_inflight')
+            return result
+
+        future = asyncio.get_running_loop().create_future()
+        self._async_inflight[key] = future
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Tandai sudah diambil agar tidak di-log jika tidak ada follower
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            with self._lock:
+                self._remember(key, result)
+        finally:
+            del self._async_inflight[key]
+            self._record(name, 'executed')
+        return result
+
+
+# Singleton instance
+single_flight = SingleFlight()
+
+
+def coalesced(name):
+    """
+    Decorator method service read-only: panggilan identik yang bersamaan
+    dieksekusi sekali (lihat SingleFlight). Argumen method harus hashable.
+
+    Args:
+        name: Nama panggilan (label counter)
+
+    Returns:
+        Decorator
+    """
+    def decorator(method):
+        if iscoroutinefunction(method):
+            @wraps(method)
+            async def async_wrapper(self, *args, **kwargs):
+                key = (name, args, tuple(sorted(kwargs.items())))
+                return await single_flight.do_async(
+                    name, key, lambda: method(self, *args, **kwargs))
+            return async_wrapper
+
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            key = (name, args, tuple(sorted(kwargs.items())))
+            return single_flight.do(name, key, lambda: method(self, *args, **kwargs))
+        return wrapper
+    return decorator
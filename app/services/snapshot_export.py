@@ -0,0 +1,517 @@
+"""
+Snapshot Export - Snapshot kolumnar tabel books dan loans untuk analitik offline
+
+Setiap tabel ditulis sebagai file part Arrow IPC (default, bisa di-memory-map)
+atau Parquet dengan kompresi SNAPSHOT_COMPRESSION (default zstd). Row dibaca
+dengan server-side cursor per SNAPSHOT_CHUNK_SIZE row dan setiap chunk
+langsung ditulis sebagai satu record batch, sehingga memori tidak bergantung
+pada ukuran tabel.
+
+Mode:
+- full: semua row ditulis ke part baru; part lama dihapus setelah manifest diganti
+- incremental: hanya row dengan updated_at >= as_of snapshot sebelumnya
+  dikurangi SNAPSHOT_OVERLAP_SECONDS (transaksi yang commit terlambat dan lag
+  replica) yang ditulis sebagai part tambahan. Row yang dihapus (peminjaman
+  hard delete, buku yang di-purge) tidak punya updated_at; id-nya dideteksi
+  dengan membandingkan id di snapshot dengan id yang masih ada di database,
+  lalu ditulis sebagai part deleted (kolom id saja). read_table membuang row
+  part yang lebih lama dengan id tersebut; setelah itu row yang sama masih
+  bisa muncul di beberapa part dan pembaca memakai versi dengan updated_at
+  terbaru per id.
+
+manifest.json mencatat setiap part (parts dan deletes per tabel) beserta
+jumlah row, ukuran dan sha256.
+
+PyArrow di-import saat snapshot pertama ditulis/dibaca, bukan saat aplikasi start.
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime, timedelta
+from threading import Lock
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - tidak tersedia di Windows
+    fcntl = None
+
+
+SNAPSHOT_TABLES = ('books', 'loans')
+MANIFEST_NAME = 'manifest.json'
+FILE_EXTENSIONS = {'arrow': '.arrow', 'parquet': '.parquet'}
+
+
+class SnapshotBusyError(Exception):
+    """Snapshot lain sedang berjalan"""
+
+
+def arrow_schema(columns):
+    """
+    Schema Arrow dari kolom statement SQLAlchemy
+
+    Args:
+        columns: statement.selected_columns
+
+    Returns:
+        pyarrow.Schema
+    """
+    import pyarrow as pa
+    from sqlalchemy import Boolean, Date, DateTime, Float, Integer
+
+    fields = []
+    for column in columns:
+        sql_type = column.type
+        if isinstance(sql_type, Boolean):
+            arrow_type = pa.bool_()
+        elif isinstance(sql_type, Integer):
+            arrow_type = pa.int64()
+        elif isinstance(sql_type, DateTime):
+            arrow_type = pa.timestamp('us')
+        elif isinstance(sql_type, Date):
+            arrow_type = pa.date32()
+        elif isinstance(sql_type, Float):
+            arrow_type = pa.float64()
+        else:
+            arrow_type = pa.string()
+        fields.append(pa.field(column.name, arrow_type))
+    return pa.schema(fields)
+
+
+def file_sha256(path, chunk_size=1 << 20):
+    """
+    Checksum sha256 file (dibaca per chunk)
+
+    Returns:
+        str: Hex digest
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class PartWriter:
+    """
+    Penulis satu file part: setiap chunk row menjadi satu record batch
+    """
+
+    def __init__(self, path, schema, fmt='arrow', compression='zstd'):
+        import pyarrow as pa
+
+        self.path = path
+        self.schema = schema
+        self.rows = 0
+        self._sink = None
+        if fmt == 'parquet':
+            import pyarrow.parquet as pq
+            self._writer = pq.ParquetWriter(path, schema, compression=compression or 'none')
+        else:
+            self._sink = pa.OSFile(path, 'wb')
+            options = pa.ipc.IpcWriteOptions(compression=compression)
+            self._writer = pa.ipc.new_file(self._sink, schema, options=options)
+
+    def write(self, rows):
+        """
+        Menulis satu chunk row (urutan kolom sama dengan schema)
+
+        Args:
+            rows: List row dari Result.partitions()
+        """
+        import pyarrow as pa
+
+        if not rows:
+            return
+        columns = zip(*rows)
+        arrays = [pa.array(values, type=field.type) for values, field in zip(columns, self.schema)]
+        self._writer.write_batch(pa.record_batch(arrays, schema=self.schema))
+        self.rows += len(rows)
+
+    def close(self):
+        """
+        Menutup file
+
+        Returns:
+            dict: Entri part untuk manifest (file, rows, bytes, sha256)
+        """
+        self._writer.close()
+        if self._sink is not None:
+            self._sink.close()
+        return {
+            'file': os.path.basename(self.path),
+            'rows': self.rows,
+            'bytes': os.path.getsize(self.path),
+            'sha256': file_sha256(self.path)
+        }
+
+
+class SnapshotRun:
+    """
+    Satu proses snapshot; dipakai sebagai context manager:
+    manifest diganti saat keluar normal, file part dibuang jika terjadi error
+    """
+
+    def __init__(self, store, previous, mode, release):
+        self.store = store
+        self.previous = previous
+        incremental = (
+            mode == 'incremental' and previous is not None
+            and previous['format'] == store.format
+            and previous['compression'] == store.compression
+        )
+        self.mode = 'incremental' if incremental else 'full'
+        self.sequence = previous['sequence'] + 1 if previous else 0
+        self.as_of = datetime.utcnow()
+        self.since = (
+            datetime.fromisoformat(previous['as_of']) - store.overlap if incremental else None
+        )
+        self.parts = {}
+        self.deletes = {}
+        self._writers = {}
+        self._release = release
+
+    def open(self, table, columns):
+        """
+        Membuka file part baru untuk tabel
+
+        Args:
+            table: Nama tabel (SNAPSHOT_TABLES)
+            columns: statement.selected_columns (untuk schema)
+
+        Returns:
+            PartWriter
+        """
+        name = f'{table}-{self.sequence:05d}{FILE_EXTENSIONS[self.store.format]}'
+        writer = PartWriter(os.path.join(self.store.directory, name), arrow_schema(columns),
+                            self.store.format, self.store.compression)
+        self._writers[table] = writer
+        return writer
+
+    def record_deletes(self, table, id_chunks):
+        """
+        Menulis part deleted: id di snapshot sebelumnya yang tidak ada lagi
+        di database (hanya mode incremental)
+
+        Args:
+            table: Nama tabel (SNAPSHOT_TABLES)
+            id_chunks: Chunk row (id,) yang masih ada, dibaca sebelum part
+                data ditulis agar row baru tidak dianggap terhapus
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        if self.mode != 'incremental':
+            return
+        live = pa.array([row[0] for rows in id_chunks for row in rows], type=pa.int64())
+        known = self.store.read_table(table, self.previous, columns=['id'])
+        deleted = pc.unique(known['id'].filter(pc.invert(pc.is_in(known['id'], value_set=live))))
+        if not len(deleted):
+            return
+
+        name = f'{table}-{self.sequence:05d}-deleted{FILE_EXTENSIONS[self.store.format]}'
+        writer = PartWriter(os.path.join(self.store.directory, name),
+                            pa.schema([pa.field('id', pa.int64())]),
+                            self.store.format, self.store.compression)
+        self._writers[f'{table}:deleted'] = writer
+        writer.write([(row_id,) for row_id in deleted.to_pylist()])
+        self.deletes[table] = writer.close()
+        self._writers.pop(f'{table}:deleted')
+
+    def close(self, table):
+        """Menutup part tabel; part incremental kosong tidak disimpan"""
+        writer = self._writers.pop(table)
+        part = writer.close()
+        if self.mode == 'incremental' and part['rows'] == 0:
+            os.remove(writer.path)
+            part = None
+        self.parts[table] = part
+
+    def commit(self):
+        """
+        Menulis manifest baru (atomic rename)
+
+        Returns:
+            dict: Manifest
+        """
+        previous_tables = self.previous['tables'] if self.mode == 'incremental' else {}
+        tables = {}
+        for table in SNAPSHOT_TABLES:
+            parts = list(previous_tables.get(table, {}).get('parts', []))
+            deletes = list(previous_tables.get(table, {}).get('deletes', []))
+            part = self.parts.get(table)
+            if part:
+                parts.append({'sequence': self.sequence, **part})
+            if table in self.deletes:
+                deletes.append({'sequence': self.sequence, **self.deletes[table]})
+            tables[table] = {
+                'rows': sum(entry['rows'] for entry in parts),
+                'parts': parts,
+                'deletes': deletes
+            }
+
+        history = list(self.previous['history']) if self.mode == 'incremental' else []
+        history.append({
+            'sequence': self.sequence,
+            'mode': self.mode,
+            'since': self.since.isoformat() if self.since else None,
+            'as_of': self.as_of.isoformat(),
+            'rows': {table: part['rows'] if part else 0 for table, part in self.parts.items()},
+            'deleted': {table: part['rows'] for table, part in self.deletes.items()}
+        })
+
+        manifest = {
+            'format': self.store.format,
+            'compression': self.store.compression,
+            'sequence': self.sequence,
+            'mode': self.mode,
+            'since': self.since.isoformat() if self.since else None,
+            'as_of': self.as_of.isoformat(),
+            'completed_at': datetime.utcnow().isoformat(),
+            'history': history,
+            'tables': tables
+        }
+        path = self.store.manifest_path
+        with open(f'{path}.tmp', 'w') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(f'{path}.tmp', path)
+
+        # Snapshot full menggantikan semua part sebelumnya
+        if self.mode == 'full' and self.previous:
+            for table in self.previous['tables'].values():
+                for part in table['parts'] + table.get('deletes', []):
+                    self.store.remove_file(part['file'])
+        return manifest
+
+    def abort(self):
+        """Membuang file part yang sudah ditulis"""
+        for key, writer in list(self._writers.items()):
+            try:
+                writer.close()
+            except Exception:
+                pass
+            self.store.remove_file(os.path.basename(writer.path))
+        self._writers.clear()
+        for part in list(self.parts.values()) + list(self.deletes.values()):
+            if part:
+                self.store.remove_file(part['file'])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                self.manifest = self.commit()
+            else:
+                self.abort()
+        finally:
+            self._release()
+        return False
+
+
+class SnapshotStore:
+    """
+    Direktori snapshot: konfigurasi, manifest dan pembacaan file part
+
+    Pattern: Singleton (module-level instance, dikonfigurasi via init_app)
+    """
+
+    def __init__(self):
+        self.directory = os.path.abspath('snapshots')
+        self.format = 'arrow'
+        self.compression = 'zstd'
+        self.chunk_size = 10000
+        self.overlap = timedelta(seconds=300)
+        self._lock = Lock()
+
+    def init_app(self, app):
+        """
+        Membaca konfigurasi snapshot
+
+        Config:
+            SNAPSHOT_DIR: Direktori file snapshot dan manifest
+            SNAPSHOT_FORMAT: 'arrow' (Arrow IPC) atau 'parquet'
+            SNAPSHOT_COMPRESSION: 'zstd', 'lz4' atau 'none'
+            SNAPSHOT_CHUNK_SIZE: Row per fetch server-side cursor / record batch
+            SNAPSHOT_OVERLAP_SECONDS: Mundur watermark snapshot incremental
+
+        Args:
+            app: Flask/Quart application instance
+        """
+        self.directory = os.path.abspath(app.config.get('SNAPSHOT_DIR', 'snapshots'))
+        self.format = app.config.get('SNAPSHOT_FORMAT', 'arrow')
+        if self.format not in FILE_EXTENSIONS:
+            raise ValueError(f"SNAPSHOT_FORMAT harus salah satu dari: {', '.join(FILE_EXTENSIONS)}")
+        compression = app.config.get('SNAPSHOT_COMPRESSION', 'zstd')
+        self.compression = None if compression in (None, '', 'none') else compression
+        self.chunk_size = app.config.get('SNAPSHOT_CHUNK_SIZE', 10000)
+        self.overlap = timedelta(seconds=app.config.get('SNAPSHOT_OVERLAP_SECONDS', 300))
+
+    @property
+    def manifest_path(self):
+        return os.path.join(self.directory, MANIFEST_NAME)
+
+    def load_manifest(self):
+        """
+        Manifest snapshot terakhir
+
+        Returns:
+            dict atau None jika belum ada snapshot
+        """
+        try:
+            with open(self.manifest_path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def begin(self, mode='full'):
+        """
+        Memulai snapshot (satu snapshot per direktori pada satu waktu, juga
+        antar proses jika fcntl tersedia)
+
+        Args:
+            mode: 'full' atau 'incremental' (incremental tanpa snapshot
+                sebelumnya dijalankan sebagai full)
+
+        Returns:
+            SnapshotRun
+
+        Raises:
+            SnapshotBusyError: Snapshot lain sedang berjalan
+        """
+        if not self._lock.acquire(blocking=False):
+            raise SnapshotBusyError('Snapshot lain sedang berjalan')
+
+        lock_file = None
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            if fcntl is not None:
+                lock_file = open(os.path.join(self.directory, '.lock'), 'w')
+                try:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    raise SnapshotBusyError('Snapshot lain sedang berjalan')
+        except Exception:
+            if lock_file is not None:
+                lock_file.close()
+            self._lock.release()
+            raise
+
+        def release():
+            if lock_file is not None:
+                lock_file.close()
+            self._lock.release()
+
+        return SnapshotRun(self, self.load_manifest(), mode, release)
+
+    def file_path(self, name, manifest=None):
+        """
+        Path file snapshot yang tercatat di manifest
+
+        Args:
+            name: Nama file (part atau manifest.json)
+            manifest: Manifest (default: manifest terakhir)
+
+        Returns:
+            str atau None jika file tidak tercatat
+        """
+        if name == MANIFEST_NAME:
+            return self.manifest_path
+        manifest = manifest or self.load_manifest() or {'tables': {}}
+        for table in manifest['tables'].values():
+            if any(part['file'] == name for part in table['parts'] + table.get('deletes', [])):
+                return os.path.join(self.directory, name)
+        return None
+
+    def remove_file(self, name):
+        try:
+            os.remove(os.path.join(self.directory, name))
+        except FileNotFoundError:
+            pass
+
+    def read_part(self, part, fmt, memory_map=True, columns=None):
+        """
+        Membaca satu file part
+
+        File Arrow IPC dibuka dengan memory map: buffer kolom menunjuk ke
+        page file (zero-copy jika SNAPSHOT_COMPRESSION=none), bukan salinan
+        di heap.
+
+        Returns:
+            pyarrow.Table
+        """
+        import pyarrow as pa
+
+        path = os.path.join(self.directory, part['file'])
+        if fmt == 'parquet':
+            import pyarrow.parquet as pq
+            return pq.read_table(path, columns=columns, memory_map=memory_map)
+        source = pa.memory_map(path) if memory_map else pa.OSFile(path)
+        data = pa.ipc.open_file(source).read_all()
+        return data.select(columns) if columns else data
+
+    def read_table(self, table, manifest=None, memory_map=True, columns=None):
+        """
+        Membaca semua part satu tabel menjadi satu pyarrow.Table
+
+        Row part dengan id yang tercatat di part deleted yang lebih baru
+        dibuang; row yang tersisa masih bisa berisi beberapa versi per id
+        (pakai updated_at terbaru).
+
+        Args:
+            table: Nama tabel
+            manifest: Manifest (default: manifest terakhir)
+            memory_map: Gunakan memory map
+            columns: Hanya kolom ini (default semua)
+
+        Returns:
+            pyarrow.Table atau None jika belum ada snapshot
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        manifest = manifest or self.load_manifest()
+        if manifest is None:
+            return None
+
+        entry = manifest['tables'][table]
+        deletes = [
+            (part['sequence'], self.read_part(part, manifest['format'], memory_map)['id'])
+            for part in entry.get('deletes', [])
+        ]
+        # Kolom id selalu dibaca untuk memfilter row yang dihapus
+        read_columns = columns
+        if columns and 'id' not in columns:
+            read_columns = ['id', *columns]
+        tables = []
+        for part in entry['parts']:
+            data = self.read_part(part, manifest['format'], memory_map, read_columns)
+            deleted = [ids for sequence, ids in deletes if sequence > part['sequence']]
+            if deleted:
+                deleted = pa.chunked_array(deleted).combine_chunks()
+                data = data.filter(pc.invert(pc.is_in(data['id'], value_set=deleted)))
+            tables.append(data.select(columns) if columns else data)
+        return pa.concat_tables(tables) if len(tables) > 1 else tables[0]
+
+    def verify(self, manifest=None):
+        """
+        Mencocokkan ukuran dan sha256 setiap part dengan manifest
+
+        Returns:
+            List[dict]: Part yang tidak cocok (kosong jika semua valid)
+        """
+        manifest = manifest or self.load_manifest() or {'tables': {}}
+        problems = []
+        for table in manifest['tables'].values():
+            for part in table['parts'] + table.get('deletes', []):
+                path = os.path.join(self.directory, part['file'])
+                if not os.path.exists(path):
+                    problems.append({'file': part['file'], 'error': 'file tidak ditemukan'})
+                elif os.path.getsize(path) != part['bytes'] or file_sha256(path) != part['sha256']:
+                    problems.append({'file': part['file'], 'error': 'checksum tidak cocok'})
+        return problems
+
+
+# Singleton instance
+snapshot_store = SnapshotStore()
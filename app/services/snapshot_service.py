@@ -0,0 +1,118 @@
+"""
+Snapshot Service - Service untuk snapshot kolumnar books dan loans
+"""
+
+from app.repositories import book_repository, loan_repository
+from app.repositories.book_repository import SNAPSHOT_QUERY as BOOK_SNAPSHOT_QUERY
+from app.repositories.loan_repository import SNAPSHOT_QUERY as LOAN_SNAPSHOT_QUERY
+from app.middleware import instrument_methods
+from app.services.snapshot_export import SnapshotBusyError, snapshot_store
+
+
+@instrument_methods('service')
+class SnapshotService:
+    """
+    Service untuk membuat, membaca dan memverifikasi snapshot kolumnar
+    (lihat snapshot_export)
+    """
+    
+    def __init__(self):
+        """
+        Inisialisasi service
+        """
+        self.book_repository = book_repository
+        self.loan_repository = loan_repository
+        self.store = snapshot_store
+    
+    def export_snapshot(self, mode='full'):
+        """
+        Menulis snapshot books dan loans (chunk server-side cursor langsung
+        menjadi record batch)
+        
+        Args:
+            mode: 'full' atau 'incremental'
+        
+        Returns:
+            dict: Response dengan manifest snapshot
+        """
+        sources = (
+            ('books', self.book_repository, BOOK_SNAPSHOT_QUERY),
+            ('loans', self.loan_repository, LOAN_SNAPSHOT_QUERY),
+        )
+        try:
+            with self.store.begin(mode) as run:
+                for table, repository, query in sources:
+                    if run.mode == 'incremental':
+                        ids = repository.stream_snapshot_ids(self.store.chunk_size)
+                        run.record_deletes(table, ids.partitions())
+                    writer = run.open(table, query.selected_columns)
+                    result = repository.stream_snapshot(run.since, self.store.chunk_size)
+                    for rows in result.partitions():
+                        writer.write(rows)
+                    run.close(table)
+            
+            return {
+                'success': True,
+                'data': run.manifest,
+                'message': f'Snapshot {run.mode} berhasil dibuat'
+            }
+            
+        except SnapshotBusyError as e:
+            return {
+                'success': False,
+                'message': str(e),
+                'data': None
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'message': f'Gagal membuat snapshot: {str(e)}',
+                'data': None
+            }
+    
+    def get_manifest(self):
+        """
+        Mendapatkan manifest snapshot terakhir
+        
+        Returns:
+            dict: Response dengan manifest
+        """
+        manifest = self.store.load_manifest()
+        if manifest is None:
+            return {
+                'success': False,
+                'message': 'Snapshot tidak ditemukan',
+                'data': None
+            }
+        
+        return {
+            'success': True,
+            'data': manifest,
+            'message': 'Manifest snapshot berhasil diambil'
+        }
+    
+    def verify_snapshot(self):
+        """
+        Mencocokkan ukuran dan checksum setiap file snapshot dengan manifest
+        
+        Returns:
+            dict: Response dengan daftar file yang tidak cocok
+        """
+        manifest = self.store.load_manifest()
+        if manifest is None:
+            return {
+                'success': False,
+                'message': 'Snapshot tidak ditemukan',
+                'data': None
+            }
+        
+        problems = self.store.verify(manifest)
+        return {
+            'success': True,
+            'data': {'valid': not problems, 'sequence': manifest['sequence'], 'problems': problems},
+            'message': 'Snapshot valid' if not problems else 'Snapshot tidak valid'
+        }
+
+
+# Singleton instance
+snapshot_service = SnapshotService()
@@ -2,9 +2,18 @@
 Statistics Service - Service untuk kalkulasi statistik perpustakaan
 """
 
+from datetime import datetime, timedelta
+from time import time
+
 from app.repositories import book_repository, loan_repository
+from app.middleware import instrument_methods
+from app.services.circulation_timeseries import bucket_starts, circulation_timeseries, next_bucket
+from app.services.overdue_analytics import overdue_analytics
+from app.services.popularity_tracker import popularity_tracker
+from app.services.single_flight import coalesced
 
 
+@instrument_methods('service')
 class StatisticsService:
     """
     Service untuk menghasilkan statistik perpustakaan
@@ -17,6 +26,7 @@ class StatisticsService:
         self.book_repository = book_repository
         self.loan_repository = loan_repository
     
+    @coalesced('statistics.library')
     def get_library_statistics(self):
         """
         Mendapatkan statistik lengkap perpustakaan
@@ -55,6 +65,7 @@ class StatisticsService:
                 'data': None
             }
     
+    @coalesced('statistics.categories')
     def get_category_statistics(self):
         """
         Mendapatkan statistik per kategori
@@ -63,16 +74,8 @@ class StatisticsService:
             dict: Response dengan statistik kategori
         """
         try:
-            categories = self.book_repository.get_categories()
-            
             category_stats = []
-            for category in categories:
-                total = self.book_repository.count({'category': category})
-                available = self.book_repository.count({
-                    'category': category, 
-                    'available_only': True
-                })
-                
+            for category, total, available in self.book_repository.count_by_category():
                 category_stats.append({
                     'category': category,
                     'total_books': total,
@@ -92,6 +95,140 @@ class StatisticsService:
                 'message': f'Gagal mengambil statistik: {str(e)}',
                 'data': []
             }
+    
+    @coalesced('statistics.overdue')
+    def get_overdue_statistics(self, limit=10):
+        """
+        Mendapatkan analitik keterlambatan: hari terlambat, denda per
+        peminjam dan kategori, aging bucket (lihat overdue_analytics)
+        
+        Args:
+            limit: Jumlah peminjam dan peminjaman teratas
+        
+        Returns:
+            dict: Response dengan analitik overdue
+        """
+        try:
+            today = datetime.utcnow().date()
+            report = overdue_analytics.cached(today)
+            if report is None:
+                generation = overdue_analytics.generation
+                report = overdue_analytics.build(
+                    self.loan_repository.fetch_overdue_columns(today), today, generation)
+            
+            return {
+                'success': True,
+                'data': report.to_dict(limit),
+                'message': 'Statistik keterlambatan berhasil diambil'
+            }
+            
+        except Exception as e:
+            return {
+                'success': False,
+                'message': f'Gagal mengambil statistik: {str(e)}',
+                'data': None
+            }
+    
+    @coalesced('statistics.timeseries')
+    def get_circulation_timeseries(self, start, end, interval='day'):
+        """
+        Mendapatkan timeseries sirkulasi: peminjaman, pengembalian,
+        rata-rata durasi pinjam dan rasio tepat waktu per bucket
+        
+        Hanya bucket yang belum di-cache dan bucket berjalan yang di-query
+        (lihat circulation_timeseries)
+        
+        Args:
+            start: date awal rentang (diperluas ke awal bucket)
+            end: date akhir rentang (inklusif, diperluas ke akhir bucket)
+            interval: 'day', 'week' atau 'month'
+        
+        Returns:
+            dict: Response dengan timeseries sirkulasi
+        """
+        try:
+            today = datetime.utcnow().date()
+            plan = circulation_timeseries.plan(interval, bucket_starts(start, end, interval), today)
+            loan_rows, return_rows = (), ()
+            if plan.span:
+                loan_rows, return_rows = self.loan_repository.get_circulation(
+                    interval, *plan.span)
+            series = circulation_timeseries.assemble(plan, loan_rows, return_rows)
+            last_day = next_bucket(plan.starts[-1], interval) - timedelta(days=1)
+            
+            return {
+                'success': True,
+                'data': {
+                    'interval': interval,
+                    'from': plan.starts[0].isoformat(),
+                    'to': last_day.isoformat(),
+                    **series
+                },
+                'message': 'Timeseries sirkulasi berhasil diambil'
+            }
+            
+        except Exception as e:
+            return {
+                'success': False,
+                'message': f'Gagal mengambil statistik: {str(e)}',
+                'data': None
+            }
+
+    def get_popular(self, window, limit=10):
+        """
+        Mendapatkan buku dan peminjam terpopuler dalam window hari, dari
+        hitungan di memori (lihat popularity_tracker), tanpa query database
+        
+        Args:
+            window: Jumlah hari (salah satu POPULARITY_WINDOWS)
+            limit: Jumlah buku dan peminjam teratas
+        
+        Returns:
+            dict: Response dengan top-N buku dan peminjam
+        """
+        try:
+            return {
+                'success': True,
+                'data': popularity_tracker.top(window, limit),
+                'message': 'Statistik popularitas berhasil diambil'
+            }
+            
+        except Exception as e:
+            return {
+                'success': False,
+                'message': f'Gagal mengambil statistik: {str(e)}',
+                'data': None
+            }
+    
+    def rebuild_popularity(self):
+        """
+        Mengisi ulang hitungan popularitas dari tabel loans dan loans_archive
+        (window terbesar), misalnya saat pertama dipasang atau state file hilang
+        
+        Returns:
+            dict: Response dengan jumlah peminjaman yang dihitung
+        """
+        try:
+            today = datetime.utcnow().date()
+            since = today - timedelta(days=popularity_tracker.retention_days - 1)
+            # Generasi rebuild: kenaikan pending sebelum titik ini ada di rows
+            rebuilt_at = time()
+            rows = self.loan_repository.get_popularity_counts(since)
+            popularity_tracker.load(rows, today, rebuilt_at)
+            loans = sum(row[-1] for row in rows)
+            
+            return {
+                'success': True,
+                'data': {'since': since.isoformat(), 'loans': loans},
+                'message': f'Popularitas dibangun ulang dari {loans} peminjaman sejak {since.isoformat()}'
+            }
+            
+        except Exception as e:
+            return {
+                'success': False,
+                'message': f'Gagal membangun ulang popularitas: {str(e)}',
+                'data': None
+            }
 
 
 # Singleton instance
@@ -8,11 +8,13 @@ from .response_helper import (
     validation_error_response,
     server_error_response
 )
+from .lazy_exports import lazy_exports
 
 __all__ = [
     'success_response', 
     'error_response', 
     'not_found_response', 
     'validation_error_response',
-    'server_error_response'
+    'server_error_response',
+    'lazy_exports'
 ]
@@ -0,0 +1,27 @@
+"""
+Utility helper untuk export package yang di-import saat pertama diakses
+"""
+import importlib
+import sys
+
+
+def lazy_exports(module_name, mapping):
+    """
+    Membuat __getattr__ module (PEP 562) untuk export lazy
+
+    Args:
+        module_name: __name__ package pemilik export
+        mapping: Dict nama export -> module relatif (mis. '.async_connection')
+
+    Returns:
+        callable: Fungsi __getattr__ untuk package tersebut
+    """
+    def __getattr__(name):
+        if name not in mapping:
+            raise AttributeError(f'module {module_name!r} has no attribute {name!r}')
+        value = getattr(importlib.import_module(mapping[name], module_name), name)
+        # Disimpan di module agar akses berikutnya tidak lewat __getattr__
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    return __getattr__
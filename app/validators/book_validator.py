@@ -6,9 +6,11 @@ Implementasi Strategy Pattern untuk validasi input buku
 
 from app.validators.validation_strategy import ValidationStrategy
 from app.repositories import book_repository
+from app.middleware import instrument_methods
 from datetime import datetime
 
 
+@instrument_methods('validation')
 class BookValidationStrategy(ValidationStrategy):
     """
     Concrete Strategy untuk validasi data Book
@@ -31,6 +33,32 @@ class BookValidationStrategy(ValidationStrategy):
         """
         Validasi data buku
         
+        Args:
+            data (dict): Data buku yang akan divalidasi
+            is_update (bool): True jika untuk update (field tidak wajib lengkap)
+        
+        Returns:
+            tuple: (is_valid: bool, errors: dict)
+        """
+        is_valid, errors = self.validate_fields(data, is_update)
+        
+        # Cek duplikasi ISBN (butuh database)
+        if 'isbn' in data and data['isbn'] and 'isbn' not in errors:
+            existing_book = book_repository.find_by_isbn(str(data['isbn']).strip())
+            isbn_error = self.check_isbn_conflict(existing_book, data.get('id'))
+            if isbn_error:
+                errors['isbn'] = isbn_error
+        
+        is_valid = len(errors) == 0
+        return is_valid, errors
+    
+    def validate_fields(self, data, is_update=False):
+        """
+        Validasi format data buku tanpa akses database
+        
+        Dipakai bersama oleh service sync dan async; pengecekan yang
+        membutuhkan database dilakukan terpisah (check_isbn_conflict).
+        
         Args:
             data (dict): Data buku yang akan divalidasi
             is_update (bool): True jika untuk update (field tidak wajib lengkap)
@@ -67,7 +95,7 @@ class BookValidationStrategy(ValidationStrategy):
         
         # Validasi ISBN
         if 'isbn' in data and data['isbn']:
-            isbn_error = self._validate_isbn(data['isbn'], data.get('id'))
+            isbn_error = self._validate_isbn(data['isbn'])
             if isbn_error:
                 errors['isbn'] = isbn_error
         
@@ -96,13 +124,29 @@ class BookValidationStrategy(ValidationStrategy):
         is_valid = len(errors) == 0
         return is_valid, errors
     
-    def _validate_isbn(self, isbn, book_id=None):
+    def check_isbn_conflict(self, existing_book, book_id=None):
         """
-        Validasi ISBN
+        Cek duplikasi ISBN dari hasil lookup ISBN di database
+        
+        Args:
+            existing_book: Book dengan ISBN yang sama atau None
+            book_id: ID buku (untuk update, skip jika ISBN milik buku ini)
+        
+        Returns:
+            str or None: Error message atau None jika valid
+        """
+        if existing_book:
+            if book_id is None or existing_book.id != book_id:
+                return 'ISBN sudah terdaftar di sistem'
+        
+        return None
+    
+    def _validate_isbn(self, isbn):
+        """
+        Validasi format ISBN
         
         Args:
             isbn: ISBN yang akan divalidasi
-            book_id: ID buku (untuk update, skip jika ISBN sama)
         
         Returns:
             str or None: Error message atau None jika valid
@@ -115,12 +159,6 @@ class BookValidationStrategy(ValidationStrategy):
         if len(isbn) > self.MAX_ISBN_LENGTH:
             return f'ISBN maksimal {self.MAX_ISBN_LENGTH} karakter'
         
-        # Cek duplikasi ISBN
-        existing_book = book_repository.find_by_isbn(isbn)
-        if existing_book:
-            if book_id is None or existing_book.id != book_id:
-                return 'ISBN sudah terdaftar di sistem'
-        
         return None
     
     def _validate_year(self, year):
@@ -6,9 +6,11 @@ Implementasi Strategy Pattern untuk validasi input peminjaman
 
 from app.validators.validation_strategy import ValidationStrategy
 from app.repositories import book_repository, loan_repository
+from app.middleware import instrument_methods
 from datetime import datetime
 
 
+@instrument_methods('validation')
 class LoanValidationStrategy(ValidationStrategy):
     """
     Concrete Strategy untuk validasi data Loan
@@ -28,6 +30,31 @@ class LoanValidationStrategy(ValidationStrategy):
         """
         Validasi data peminjaman
         
+        Args:
+            data (dict): Data peminjaman yang akan divalidasi
+        
+        Returns:
+            tuple: (is_valid: bool, errors: dict)
+        """
+        is_valid, errors = self.validate_fields(data)
+        
+        # Cek buku ada dan tersedia (butuh database)
+        if 'book_id' in data and data['book_id'] and 'book_id' not in errors:
+            book = book_repository.find_by_id(int(data['book_id']))
+            book_error = self.check_book_available(book)
+            if book_error:
+                errors['book_id'] = book_error
+        
+        is_valid = len(errors) == 0
+        return is_valid, errors
+    
+    def validate_fields(self, data):
+        """
+        Validasi format data peminjaman tanpa akses database
+        
+        Dipakai bersama oleh service sync dan async; pengecekan yang
+        membutuhkan database dilakukan terpisah (check_book_available).
+        
         Args:
             data (dict): Data peminjaman yang akan divalidasi
         
@@ -40,9 +67,9 @@ class LoanValidationStrategy(ValidationStrategy):
         required_errors = self._check_required_fields(data, self.REQUIRED_FIELDS)
         errors.update(required_errors)
         
-        # Validasi book_id
+        # Validasi format book_id
         if 'book_id' in data and data['book_id']:
-            book_error = self._validate_book(data['book_id'])
+            book_error = self._validate_book_id(data['book_id'])
             if book_error:
                 errors['book_id'] = book_error
         
@@ -89,9 +116,20 @@ class LoanValidationStrategy(ValidationStrategy):
         Returns:
             tuple: (is_valid: bool, errors: dict)
         """
-        errors = {}
-        
         loan = loan_repository.find_by_id(loan_id)
+        return self.check_returnable(loan)
+    
+    def check_returnable(self, loan):
+        """
+        Cek apakah peminjaman hasil lookup bisa dikembalikan
+        
+        Args:
+            loan: Loan object atau None
+        
+        Returns:
+            tuple: (is_valid: bool, errors: dict)
+        """
+        errors = {}
         
         if not loan:
             errors['loan_id'] = 'Peminjaman tidak ditemukan'
@@ -101,23 +139,16 @@ class LoanValidationStrategy(ValidationStrategy):
         is_valid = len(errors) == 0
         return is_valid, errors
     
-    def _validate_book(self, book_id):
+    def check_book_available(self, book):
         """
-        Validasi ketersediaan buku
+        Cek ketersediaan buku hasil lookup
         
         Args:
-            book_id: ID buku yang akan dipinjam
+            book: Book object atau None
         
         Returns:
             str or None: Error message atau None jika valid
         """
-        try:
-            book_id_int = int(book_id)
-        except (TypeError, ValueError):
-            return 'book_id harus berupa angka'
-        
-        # Cek apakah buku ada
-        book = book_repository.find_by_id(book_id_int)
         if not book:
             return 'Buku tidak ditemukan'
         
@@ -127,6 +158,23 @@ class LoanValidationStrategy(ValidationStrategy):
         
         return None
     
+    def _validate_book_id(self, book_id):
+        """
+        Validasi format book_id
+        
+        Args:
+            book_id: ID buku yang akan dipinjam
+        
+        Returns:
+            str or None: Error message atau None jika valid
+        """
+        try:
+            int(book_id)
+        except (TypeError, ValueError):
+            return 'book_id harus berupa angka'
+        
+        return None
+    
     def _validate_date(self, date_str, field_name):
         """
         Validasi format tanggal
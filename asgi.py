@@ -0,0 +1,16 @@
+"""
+Entry point mode ASGI (async) Library Book Management API
+
+Cara menjalankan:
+    hypercorn asgi:app --bind 0.0.0.0:5000 --workers 4
+
+Route dan format response sama dengan run.py (WSGI); bedanya setiap
+worker melayani banyak request bersamaan di satu event loop, sehingga
+menunggu database tidak menahan thread.
+"""
+
+from app.asgi import create_asgi_app
+from app.config import get_config
+
+# Buat instance aplikasi ASGI; tanpa APP_ENV / FLASK_ENV memakai konfigurasi production
+app = create_asgi_app(get_config(default='production'))
@@ -0,0 +1,6 @@
+"""
+Package benchmarks - Suite pengukuran performa Library API
+
+Jalankan dari root repository, contoh:
+    python -m benchmarks.endpoint_benchmark --preset small
+"""
@@ -0,0 +1,117 @@
+"""
+Compare Results - Membandingkan dua file hasil benchmark
+
+Cara menjalankan:
+    python -m benchmarks.compare_results baseline.json candidate.json
+"""
+
+import argparse
+import json
+import sys
+
+from benchmarks.reporting import SCHEMA_VERSION
+
+
+def _load(path):
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    if data.get('schema_version') != SCHEMA_VERSION:
+        raise SystemExit(f'{path}: schema_version tidak didukung')
+    return data
+
+
+def _change(old, new):
+    if old in (None, 0) or new is None:
+        return ''
+    return f'{(new - old) / old * 100:+.1f}%'
+
+
+def _rows(data):
+    """
+    Meratakan hasil menjadi {(grup, nama): {metric: nilai}}
+    Mendukung hasil endpoint (per backend), micro, concurrency, startup dan
+    statement benchmark
+    """
+    rows = {}
+    for backend in data.get('backends', []):
+        for name, stats in backend['endpoints'].items():
+            rows[(backend['database'], name)] = {
+                'p50': stats['latency_ms']['p50'],
+                'p95': stats['latency_ms']['p95'],
+                'p99': stats['latency_ms']['p99'],
+                'queries': stats['queries_per_request']['mean'],
+            }
+    for name, stats in data.get('benchmarks', {}).items():
+        rows[('micro', name)] = {
+            'ns/op': stats['ns_per_op'],
+            'allocs/op': stats['allocations_per_op'],
+        }
+    for mode in data.get('modes', []):
+        for level in mode['levels']:
+            rows[(mode['mode'], f'c={level["concurrency"]}')] = {
+                'rps': level['throughput_rps'],
+                'p50': level['latency_ms']['p50'],
+                'p99': level['latency_ms']['p99'],
+                'errors': level['error_rate'],
+            }
+    for phase, stats in data.get('phases', {}).items():
+        rows[('startup', phase)] = {'p50': stats['p50'], 'max': stats['max']}
+    for name, stats in data.get('statements', {}).items():
+        rows[('statement', name)] = {
+            'legacy ns/op': stats['legacy_ns_per_op'],
+            'ns/op': stats['cached_ns_per_op'],
+        }
+    partitioning = data.get('partitioning', {})
+    for phase in ('before', 'after'):
+        for name, stats in partitioning.get(phase, {}).items():
+            rows[(f'partition-{phase}', name)] = {
+                'p50': stats['p50_ms'],
+                'max': stats['max_ms'],
+                'partitions': stats['partitions_scanned'],
+            }
+    for payload, stats in data.get('compression', {}).items():
+        for codec, codec_stats in stats['codecs'].items():
+            rows[(payload, codec)] = {
+                'bytes': codec_stats['compressed_bytes'],
+                'ratio': codec_stats['ratio'],
+                'ns/op': codec_stats['ns_per_op'],
+            }
+    return rows
+
+
+def compare(baseline, candidate, out=sys.stdout):
+    """
+    Mencetak tabel perbandingan baseline vs candidate
+
+    Args:
+        baseline: Dict hasil baseline
+        candidate: Dict hasil candidate
+        out: Stream output
+    """
+    old_rows = _rows(baseline)
+    new_rows = _rows(candidate)
+
+    for key in sorted(set(old_rows) | set(new_rows)):
+        group, name = key
+        old = old_rows.get(key)
+        new = new_rows.get(key)
+        if old is None or new is None:
+            out.write(f'{group:<10} {name:<32} hanya ada di {"candidate" if old is None else "baseline"}\n')
+            continue
+        parts = [
+            f'{metric}={old[metric]}->{new[metric]} {_change(old[metric], new[metric])}'.rstrip()
+            for metric in old
+        ]
+        out.write(f'{group:<10} {name:<32} ' + '  '.join(parts) + '\n')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Bandingkan dua hasil benchmark')
+    parser.add_argument('baseline')
+    parser.add_argument('candidate')
+    args = parser.parse_args(argv)
+    compare(_load(args.baseline), _load(args.candidate))
+
+
+if __name__ == '__main__':
+    main()
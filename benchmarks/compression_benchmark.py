@@ -0,0 +1,160 @@
+"""
+Compression Benchmark - Rasio kompresi dan biaya CPU per payload
+
+Payload diambil dari response API sungguhan (SQLite sementara dengan data
+sintetis): list buku dan peminjaman berbagai ukuran, search dan statistik.
+Setiap payload dikompresi dengan setiap encoding yang tersedia pada
+beberapa level, lalu dicatat:
+- ratio: ukuran asli / ukuran terkompresi
+- us/op: waktu kompresi satu body (median)
+- MB/s: throughput kompresi (ukuran asli)
+
+Dipakai untuk memilih COMPRESSION_*_LEVEL: level default adalah titik di
+mana menaikkan level tidak lagi memperkecil body secara berarti.
+
+Cara menjalankan (dari root repository):
+    python -m benchmarks.compression_benchmark
+    python -m benchmarks.compression_benchmark --filter books
+"""
+
+import argparse
+import logging
+import os
+import tempfile
+
+
+# Encoding -> level yang dibandingkan
+LEVELS = {
+    'gzip': (1, 4, 6, 9),
+    'br': (1, 4, 6, 11),
+    'zstd': (1, 3, 6, 19),
+}
+
+# Nama payload -> path endpoint
+PAYLOADS = {
+    'books_10': '/api/books?limit=10',
+    'books_100': '/api/books?limit=100',
+    'books_1000': '/api/books?limit=1000',
+    'loans_100': '/api/loans?limit=100',
+    'loans_1000': '/api/loans?limit=1000',
+    'search': '/api/books/search?q=the',
+    'statistics': '/api/statistics',
+}
+
+
+def collect_payloads(database_uri, options):
+    """
+    Mengambil body response (tanpa kompresi) untuk setiap payload
+
+    Returns:
+        dict: nama -> bytes
+    """
+    from app import create_app
+    from app.database import db
+    from app.models import Book
+    from benchmarks.data_generator import DataGenerator
+    from benchmarks.endpoint_benchmark import _make_config
+
+    config = type('CompressionBenchmarkConfig', (_make_config(database_uri),), {
+        'COMPRESSION_ENABLED': False,
+        'METRICS_ENABLED': False
+    })
+    app = create_app(config)
+    logging.getLogger('LibraryAPI').setLevel(logging.WARNING)
+
+    with app.app_context():
+        db.create_all()
+        if not db.session.query(Book.id).count():
+            generator = DataGenerator(seed=options['seed'])
+            generator.seed_books(options['books'])
+            generator.seed_loans(options['loans'])
+
+    client = app.test_client()
+    payloads = {}
+    for name, path in PAYLOADS.items():
+        if options['filter'] and not any(f in name for f in options['filter']):
+            continue
+        payloads[name] = client.get(path).get_data()
+    return payloads
+
+
+def run(payloads, options):
+    """
+    Mengompresi setiap payload dengan setiap encoding dan level
+
+    Returns:
+        dict: payload -> {bytes, codecs: {encoding-level: stats}}
+    """
+    from app.middleware.compression import build_codecs
+    from benchmarks.micro_benchmark import measure_time
+
+    config_keys = {
+        'gzip': 'COMPRESSION_GZIP_LEVEL',
+        'br': 'COMPRESSION_BROTLI_QUALITY',
+        'zstd': 'COMPRESSION_ZSTD_LEVEL',
+    }
+
+    results = {}
+    for name, data in payloads.items():
+        print(f'{name} ({len(data)} byte)', flush=True)
+        results[name] = {'bytes': len(data), 'codecs': {}}
+
+        for encoding, levels in LEVELS.items():
+            for level in levels:
+                codecs = build_codecs({
+                    'COMPRESSION_ALGORITHMS': encoding, config_keys[encoding]: level
+                })
+                if encoding not in codecs:
+                    continue
+                codec = codecs[encoding]
+
+                compressed = codec.compress(data)
+                ns_per_op, _ = measure_time(lambda: codec.compress(data),
+                                            min_time=options['min_time'],
+                                            repeat=options['repeat'])
+                stats = {
+                    'compressed_bytes': len(compressed),
+                    'ratio': round(len(data) / len(compressed), 2),
+                    'ns_per_op': round(ns_per_op, 1),
+                    'mb_per_s': round(len(data) / (ns_per_op / 1e9) / 1e6, 1)
+                }
+                results[name]['codecs'][f'{encoding}-{level}'] = stats
+                print(f'  {encoding + "-" + str(level):<9} {stats["compressed_bytes"]:>9} byte  '
+                      f'ratio {stats["ratio"]:>6}  {ns_per_op / 1000:>9.1f} us/op  '
+                      f'{stats["mb_per_s"]:>7} MB/s', flush=True)
+
+    return results
+
+
+def main(argv=None):
+    from benchmarks.reporting import build_metadata, write_results
+
+    parser = argparse.ArgumentParser(description='Benchmark kompresi response')
+    parser.add_argument('--database-uri', help='Database URI. Default: SQLite sementara')
+    parser.add_argument('--books', type=int, default=2000)
+    parser.add_argument('--loans', type=int, default=2000)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--filter', action='append', default=[],
+                        help='Substring nama payload (boleh diulang)')
+    parser.add_argument('--min-time', type=float, default=0.1)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help='Path file JSON hasil')
+    args = parser.parse_args(argv)
+
+    database_uri = args.database_uri or 'sqlite:///' + os.path.join(
+        tempfile.mkdtemp(prefix='library-bench-'), 'compression.db')
+
+    options = {
+        'books': args.books, 'loans': args.loans, 'seed': args.seed,
+        'filter': args.filter, 'min_time': args.min_time, 'repeat': args.repeat
+    }
+    results = build_metadata('compression', options)
+    results['compression'] = run(collect_payloads(database_uri, options), options)
+
+    path = write_results(results, args.output, kind='compression')
+    print(f'Hasil benchmark ditulis ke {path}')
+    return results
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+"""
+In-Memory Repositories - Pengganti repository untuk benchmark tanpa database
+
+Mengimplementasikan BaseRepository dengan dict biasa sehingga validator
+dan service bisa diukur tanpa koneksi database.
+"""
+
+import importlib
+from contextlib import contextmanager
+
+from app.repositories import BaseRepository
+
+
+class InMemoryBookRepository(BaseRepository):
+    """
+    Repository buku berbasis dict (id -> Book)
+    """
+
+    def __init__(self, books=None):
+        self.books = {}
+        self.by_isbn = {}
+        for book in books or []:
+            self.save(book)
+
+    def find_all(self, filters=None):
+        return [book for book in self.books.values() if not book.is_deleted]
+
+    def find_by_id(self, id):
+        book = self.books.get(id)
+        return book if book is not None and not book.is_deleted else None
+
+    def find_by_isbn(self, isbn):
+        book = self.by_isbn.get(isbn)
+        return book if book is not None and not book.is_deleted else None
+
+    def save(self, book):
+        if book.id is None:
+            book.id = len(self.books) + 1
+        if book.is_deleted is None:
+            book.is_deleted = False
+        self.books[book.id] = book
+        self.by_isbn[book.isbn] = book
+        return book
+
+    def update(self, book):
+        return book
+
+    def delete(self, id):
+        book = self.find_by_id(id)
+        if book:
+            book.is_deleted = True
+            return True
+        return False
+
+    def count(self, filters=None):
+        return len(self.find_all(filters))
+
+
+class InMemoryLoanRepository(BaseRepository):
+    """
+    Repository peminjaman berbasis dict (id -> Loan)
+    """
+
+    def __init__(self, loans=None):
+        self.loans = {}
+        for loan in loans or []:
+            self.save(loan)
+
+    def find_all(self, filters=None):
+        return list(self.loans.values())
+
+    def find_by_id(self, id):
+        return self.loans.get(id)
+
+    def save(self, loan):
+        if loan.id is None:
+            loan.id = len(self.loans) + 1
+        self.loans[loan.id] = loan
+        return loan
+
+    def update(self, loan):
+        return loan
+
+    def delete(self, id):
+        return self.loans.pop(id, None) is not None
+
+    def count(self, filters=None):
+        return len(self.loans)
+
+
+@contextmanager
+def in_memory_repositories(book_repository, loan_repository):
+    """
+    Context manager yang mengganti repository di modul validator
+
+    Args:
+        book_repository: Pengganti book_repository
+        loan_repository: Pengganti loan_repository
+    """
+    # Package app.validators meng-export instance dengan nama yang sama,
+    # jadi modulnya diambil lewat importlib
+    book_validator_module = importlib.import_module('app.validators.book_validator')
+    loan_validator_module = importlib.import_module('app.validators.loan_validator')
+
+    targets = [
+        (book_validator_module, 'book_repository', book_repository),
+        (loan_validator_module, 'book_repository', book_repository),
+        (loan_validator_module, 'loan_repository', loan_repository),
+    ]
+    originals = [(module, name, getattr(module, name)) for module, name, _ in targets]
+
+    for module, name, replacement in targets:
+        setattr(module, name, replacement)
+    try:
+        yield
+    finally:
+        for module, name, original in originals:
+            setattr(module, name, original)
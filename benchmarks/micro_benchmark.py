@@ -0,0 +1,346 @@
+"""
+Micro Benchmark - Benchmark hot path Python murni (tanpa database)
+
+Mengukur serialisasi model, validator, factory dan observer secara
+terisolasi. Repository diganti InMemoryBookRepository/InMemoryLoanRepository
+sehingga tidak ada I/O sama sekali.
+
+Metrik per benchmark:
+- ns_per_op: median waktu per operasi dari beberapa repeat
+- allocations_per_op: blok memori baru per operasi yang masih hidup
+  setelah operasi selesai (objek hasil: dict, string, model)
+- peak_bytes_per_op: puncak memori (tracemalloc) selama satu operasi,
+  termasuk objek sementara
+
+Cara menjalankan (dari root repository):
+    python -m benchmarks.micro_benchmark
+    python -m benchmarks.micro_benchmark --filter to_dict --min-time 0.5
+"""
+
+import argparse
+import gc
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    """
+    Decorator untuk mendaftarkan benchmark
+
+    Fungsi yang didekorasi adalah setup: dipanggil sekali dan harus
+    mengembalikan callable tanpa argumen (operasi yang diukur).
+    """
+    def decorator(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return decorator
+
+
+def _sample_book(book_id=1):
+    from app.models import Book
+    from datetime import datetime
+
+    book = Book(
+        title='Laskar Pelangi',
+        author='Andrea Hirata',
+        isbn=f'97897930{book_id:05d}',
+        year=2005,
+        category='Fiksi',
+        stock=5
+    )
+    book.id = book_id
+    book.is_deleted = False
+    book.created_at = datetime(2024, 1, 1, 8, 30)
+    book.updated_at = datetime(2024, 1, 2, 9, 0)
+    return book
+
+
+def _sample_loan(book, loan_id=1):
+    from app.models import Loan
+    from datetime import datetime
+
+    loan = Loan(
+        book_id=book.id,
+        borrower_name='Budi Santoso',
+        loan_date=date.today() - timedelta(days=3)
+    )
+    loan.id = loan_id
+    loan.book = book
+    loan.created_at = datetime(2024, 1, 3, 10, 0)
+    return loan
+
+
+@benchmark('book.to_dict')
+def bench_book_to_dict():
+    book = _sample_book()
+    return book.to_dict
+
+
+@benchmark('loan.to_dict')
+def bench_loan_to_dict():
+    loan = _sample_loan(_sample_book())
+    return loan.to_dict
+
+
+@benchmark('book_validator.validate')
+def bench_book_validate():
+    from app.validators import book_validator
+    data = {
+        'title': 'Bumi Manusia', 'author': 'Pramoedya Ananta Toer',
+        'isbn': '9789799731234', 'year': 1980, 'category': 'Fiksi', 'stock': 3
+    }
+    return lambda: book_validator.validate(data)
+
+
+@benchmark('loan_validator.validate')
+def bench_loan_validate():
+    from app.validators import loan_validator
+    today = date.today()
+    data = {
+        'book_id': 1, 'borrower_name': 'Budi Santoso',
+        'loan_date': today.isoformat(),
+        'due_date': (today + timedelta(days=14)).isoformat()
+    }
+    return lambda: loan_validator.validate(data)
+
+
+@benchmark('loan_validator.parse_date')
+def bench_parse_date():
+    from app.validators import loan_validator
+    value = date.today().isoformat()
+    return lambda: loan_validator._validate_date(value, 'loan_date')
+
+
+@benchmark('model_factory.create_book')
+def bench_create_book():
+    from app.factories import model_factory
+    data = {
+        'title': 'Cantik Itu Luka', 'author': 'Eka Kurniawan',
+        'isbn': '9786020312583', 'year': 2002, 'category': 'Fiksi', 'stock': 4
+    }
+    return lambda: model_factory.create_book(data)
+
+
+@benchmark('model_factory.create_loan')
+def bench_create_loan():
+    from app.factories import model_factory
+    data = {
+        'book_id': 1, 'borrower_name': 'Budi Santoso',
+        'loan_date': date.today().isoformat()
+    }
+    return lambda: model_factory.create_loan(data)
+
+
+@benchmark('event_subject.notify')
+def bench_notify():
+    from app.observers import EventObserver, EventSubject, EventType
+
+    class NoopObserver(EventObserver):
+        def update(self, event_type, data):
+            pass
+
+        def get_subscribed_events(self):
+            return list(EventType)
+
+    subject = EventSubject()
+    for _ in range(3):
+        subject.attach(NoopObserver())
+
+    payload = {'loan': _sample_loan(_sample_book()).to_dict()}
+    return lambda: subject.notify(EventType.LOAN_CREATED, payload)
+
+
+def _overdue_loans(count=2000):
+    """Peminjaman terlambat sintetis untuk benchmark analitik overdue"""
+    books = [_sample_book(book_id) for book_id in range(1, 51)]
+    for book in books:
+        book.category = f'Kategori {book.id % 7}'
+
+    loans = []
+    for loan_id in range(1, count + 1):
+        loan = _sample_loan(books[loan_id % len(books)], loan_id)
+        loan.borrower_name = f'Peminjam {loan_id % 300}'
+        loan.due_date = date.today() - timedelta(days=loan_id % 120 + 1)
+        loans.append(loan)
+    return loans
+
+
+@benchmark('overdue_report.rowwise_2k')
+def bench_overdue_rowwise():
+    loans = _overdue_loans()
+
+    def op():
+        # Pendekatan lama: is_overdue() dan to_dict() per row, agregat di dict
+        today = date.today()
+        by_borrower, by_category = {}, {}
+        for loan in loans:
+            if not loan.is_overdue():
+                continue
+            data = loan.to_dict()
+            fee = (today - loan.due_date).days * 1000
+            by_borrower[data['borrower_name']] = by_borrower.get(data['borrower_name'], 0) + fee
+            category = loan.book.category
+            by_category[category] = by_category.get(category, 0) + fee
+        return by_borrower, by_category
+    return op
+
+
+@benchmark('overdue_report.numpy_2k')
+def bench_overdue_numpy():
+    from app.services.overdue_analytics import OverdueReport
+
+    loans = _overdue_loans()
+    columns = {
+        'loan_id': [loan.id for loan in loans],
+        'book_id': [loan.book_id for loan in loans],
+        'borrower_name': [loan.borrower_name for loan in loans],
+        'category': [loan.book.category for loan in loans],
+        'due_date': [loan.due_date for loan in loans],
+    }
+    return lambda: OverdueReport(columns, date.today(), 1000)
+
+
+@benchmark('activity_logger.format_message')
+def bench_format_message():
+    from app.observers import EventType, activity_logger
+    payload = {'loan': _sample_loan(_sample_book()).to_dict()}
+    return lambda: activity_logger._format_message(EventType.LOAN_CREATED, payload)
+
+
+def _time_op(op, loops):
+    started = time.perf_counter_ns()
+    for _ in range(loops):
+        op()
+    return time.perf_counter_ns() - started
+
+
+def measure_time(op, min_time=0.2, repeat=5):
+    """
+    Mengukur ns/op dengan jumlah loop yang dikalibrasi otomatis
+
+    Args:
+        op: Callable yang diukur
+        min_time: Durasi minimum satu repeat (detik)
+        repeat: Jumlah repeat
+
+    Returns:
+        tuple: (ns_per_op median, loops per repeat)
+    """
+    loops = 1
+    while True:
+        elapsed = _time_op(op, loops)
+        if elapsed >= min_time * 1e9:
+            break
+        loops *= 10 if elapsed < min_time * 1e8 else 2
+
+    samples = [_time_op(op, loops) / loops for _ in range(repeat)]
+    return statistics.median(samples), loops
+
+
+def measure_allocations(op, loops=1000):
+    """
+    Mengukur alokasi memori per operasi
+
+    Args:
+        op: Callable yang diukur
+        loops: Jumlah operasi untuk rata-rata
+
+    Returns:
+        tuple: (allocations_per_op, peak_bytes_per_op)
+    """
+    gc.collect()
+    gc.disable()
+    try:
+        # Hasil disimpan agar blok yang dialokasikan untuk objek hasil tetap hidup
+        results = []
+        before = sys.getallocatedblocks()
+        for _ in range(loops):
+            results.append(op())
+        allocated = sys.getallocatedblocks() - before
+        # Blok untuk list results sendiri tidak dihitung
+        allocations = max(0.0, (allocated - 1) / loops)
+        del results
+
+        tracemalloc.start()
+        peaks = []
+        for _ in range(min(loops, 200)):
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            op()
+            peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+        tracemalloc.stop()
+    finally:
+        gc.enable()
+
+    return allocations, statistics.median(peaks)
+
+
+def run(names=None, min_time=0.2, repeat=5):
+    """
+    Menjalankan benchmark terdaftar
+
+    Args:
+        names: Substring filter nama benchmark (None = semua)
+        min_time: Durasi minimum per repeat
+        repeat: Jumlah repeat
+
+    Returns:
+        dict: Nama benchmark -> metrik
+    """
+    from benchmarks.in_memory_repositories import (
+        InMemoryBookRepository, InMemoryLoanRepository, in_memory_repositories
+    )
+
+    book = _sample_book()
+    books = InMemoryBookRepository([book])
+    loans = InMemoryLoanRepository([_sample_loan(book)])
+
+    results = {}
+    with in_memory_repositories(books, loans):
+        for name, setup in BENCHMARKS.items():
+            if names and not any(fragment in name for fragment in names):
+                continue
+            op = setup()
+            op()  # warmup
+            ns_per_op, loops = measure_time(op, min_time=min_time, repeat=repeat)
+            allocations, peak_bytes = measure_allocations(op)
+            results[name] = {
+                'ns_per_op': round(ns_per_op, 1),
+                'allocations_per_op': round(allocations, 2),
+                'peak_bytes_per_op': peak_bytes,
+                'loops': loops
+            }
+            print(f'{name:<34} {ns_per_op:>10.1f} ns/op {allocations:>8.2f} allocs/op '
+                  f'{peak_bytes:>8} B peak/op', flush=True)
+    return results
+
+
+def main(argv=None):
+    from benchmarks.reporting import build_metadata, write_results
+
+    parser = argparse.ArgumentParser(description='Micro benchmark hot path Python')
+    parser.add_argument('--filter', action='append', default=[],
+                        help='Substring nama benchmark (boleh diulang)')
+    parser.add_argument('--min-time', type=float, default=0.2)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', help='Path file JSON hasil')
+    args = parser.parse_args(argv)
+
+    results = build_metadata('micro', {
+        'filter': args.filter, 'min_time': args.min_time, 'repeat': args.repeat
+    })
+    results['benchmarks'] = run(args.filter, min_time=args.min_time, repeat=args.repeat)
+
+    path = write_results(results, args.output, kind='micro')
+    print(f'Hasil benchmark ditulis ke {path}')
+    return results
+
+
+if __name__ == '__main__':
+    main()
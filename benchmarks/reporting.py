@@ -0,0 +1,136 @@
+"""
+Reporting - Helper statistik dan penulisan hasil benchmark ke JSON
+
+Semua file hasil memakai schema yang sama (SCHEMA_VERSION) agar
+bisa dibandingkan antar run dengan benchmarks.compare_results.
+"""
+
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime
+
+
+SCHEMA_VERSION = 1
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), 'results')
+
+
+def percentile(sorted_values, pct):
+    """
+    Nearest-rank percentile dari list yang sudah terurut
+
+    Args:
+        sorted_values: List angka terurut naik
+        pct: Persentil (0-100)
+
+    Returns:
+        float atau None jika list kosong
+    """
+    if not sorted_values:
+        return None
+    rank = max(1, int(round(pct / 100.0 * len(sorted_values))))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(values, digits=3):
+    """
+    Ringkasan distribusi (p50/p95/p99/mean/max)
+
+    Args:
+        values: List angka
+        digits: Pembulatan
+
+    Returns:
+        dict: Ringkasan statistik
+    """
+    ordered = sorted(values)
+    if not ordered:
+        return {'p50': None, 'p95': None, 'p99': None, 'mean': None, 'max': None}
+    return {
+        'p50': round(percentile(ordered, 50), digits),
+        'p95': round(percentile(ordered, 95), digits),
+        'p99': round(percentile(ordered, 99), digits),
+        'mean': round(sum(ordered) / len(ordered), digits),
+        'max': round(ordered[-1], digits)
+    }
+
+
+def peak_rss_mb():
+    """
+    Peak resident set size proses saat ini (MB)
+
+    Returns:
+        float atau None jika tidak didukung platform
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux melaporkan KB, macOS melaporkan byte
+    divisor = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return round(peak / divisor, 1)
+
+
+def git_commit():
+    """
+    Commit git saat ini (untuk melacak hasil benchmark)
+
+    Returns:
+        str atau None
+    """
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=os.path.dirname(__file__),
+            stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def build_metadata(kind, config):
+    """
+    Metadata standar untuk setiap file hasil
+
+    Args:
+        kind: Jenis benchmark ('endpoint', 'micro', ...)
+        config: Dict parameter run
+
+    Returns:
+        dict: Metadata
+    """
+    return {
+        'schema_version': SCHEMA_VERSION,
+        'kind': kind,
+        'created_at': datetime.utcnow().isoformat(timespec='seconds') + 'Z',
+        'git_commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'config': config
+    }
+
+
+def write_results(results, output=None, kind='endpoint'):
+    """
+    Menulis hasil benchmark ke file JSON
+
+    Args:
+        results: Dict hasil
+        output: Path file (default: benchmarks/results/<kind>-<timestamp>.json)
+        kind: Jenis benchmark untuk nama file default
+
+    Returns:
+        str: Path file yang ditulis
+    """
+    if not output:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        stamp = datetime.utcnow().strftime('%Y%m%d-%H%M%S')
+        output = os.path.join(RESULTS_DIR, f'{kind}-{stamp}.json')
+
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+    return output
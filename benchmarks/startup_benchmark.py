@@ -0,0 +1,173 @@
+"""
+Startup Benchmark - Mengukur waktu cold start aplikasi
+
+Setiap run adalah proses Python baru (tanpa cache modul) yang mengukur:
+- import: import package app
+- create_app: application factory (config, database, middleware, blueprint)
+- first_request: request pertama ke /health
+
+Satu run juga dijalankan dengan `python -X importtime` untuk mencatat modul
+dengan waktu import terbesar. Dengan --budget-ms, benchmark gagal (exit 1)
+jika p50 import + create_app melebihi budget, sehingga bisa dipasang di CI.
+
+Cara menjalankan (dari root repository):
+    python -m benchmarks.startup_benchmark
+    python -m benchmarks.startup_benchmark --mode asgi --runs 10
+    python -m benchmarks.startup_benchmark --budget-ms 800
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODES = ('wsgi', 'asgi')
+
+
+def probe(mode):
+    """
+    Dijalankan di subprocess (--probe): mengukur fase startup dan mencetak JSON
+
+    Args:
+        mode: 'wsgi' atau 'asgi'
+    """
+    started = time.perf_counter()
+    if mode == 'wsgi':
+        from app import create_app as factory
+    else:
+        from app.asgi import create_asgi_app as factory
+    imported = time.perf_counter()
+
+    app = factory()
+    created = time.perf_counter()
+
+    if mode == 'wsgi':
+        status = app.test_client().get('/health').status_code
+    else:
+        import asyncio
+        status = asyncio.run(app.test_client().get('/health')).status_code
+    first_request = time.perf_counter()
+
+    print(json.dumps({
+        'import_ms': (imported - started) * 1000,
+        'create_app_ms': (created - imported) * 1000,
+        'first_request_ms': (first_request - created) * 1000,
+        'status': status
+    }))
+
+
+def _run_probe(mode, env, importtime=False):
+    command = [sys.executable]
+    if importtime:
+        command += ['-X', 'importtime']
+    command += ['-m', 'benchmarks.startup_benchmark', '--probe', mode]
+
+    completed = subprocess.run(command, cwd=ROOT_DIR, env=env, capture_output=True,
+                               text=True, check=True)
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    return result, completed.stderr
+
+
+def parse_importtime(stderr, top=15):
+    """
+    Parse output `python -X importtime`
+
+    Args:
+        stderr: Output stderr proses
+        top: Jumlah modul yang diambil
+
+    Returns:
+        dict: top_self (waktu import modul itu sendiri) dan app_modules
+            (waktu kumulatif modul package app), dalam ms
+    """
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|', 2)
+        modules.append((name.strip(), int(self_us) / 1000, int(cumulative_us) / 1000))
+
+    by_self = sorted(modules, key=lambda m: m[1], reverse=True)[:top]
+    app_modules = sorted((m for m in modules if m[0] == 'app' or m[0].startswith('app.')),
+                         key=lambda m: m[2], reverse=True)[:top]
+
+    return {
+        'top_self': [{'module': n, 'self_ms': round(s, 2), 'cumulative_ms': round(c, 2)}
+                     for n, s, c in by_self],
+        'app_modules': [{'module': n, 'self_ms': round(s, 2), 'cumulative_ms': round(c, 2)}
+                        for n, s, c in app_modules]
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark waktu cold start')
+    parser.add_argument('--mode', choices=MODES, default='wsgi')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--env', default='production',
+                        help='APP_ENV untuk proses yang diukur')
+    parser.add_argument('--database-uri',
+                        help='Database URI (default: SQLite sementara)')
+    parser.add_argument('--top', type=int, default=15,
+                        help='Jumlah modul di profil import')
+    parser.add_argument('--budget-ms', type=float,
+                        help='Gagal jika p50 import + create_app melebihi nilai ini')
+    parser.add_argument('--output', help='Path file JSON hasil')
+    parser.add_argument('--quiet', action='store_true')
+
+    # Mode internal: dijalankan oleh _run_probe di subprocess
+    parser.add_argument('--probe', choices=MODES, help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    if args.probe:
+        probe(args.probe)
+        return None
+
+    from benchmarks.reporting import build_metadata, summarize, write_results
+
+    env = dict(os.environ, APP_ENV=args.env)
+    env['DATABASE_URI'] = args.database_uri or 'sqlite:///' + os.path.join(
+        tempfile.mkdtemp(prefix='library-startup-'), 'startup.db')
+
+    runs = [_run_probe(args.mode, env)[0] for _ in range(args.runs)]
+    _, importtime_stderr = _run_probe(args.mode, env, importtime=True)
+
+    phases = {}
+    for phase in ('import_ms', 'create_app_ms', 'first_request_ms'):
+        phases[phase] = summarize([run[phase] for run in runs], digits=1)
+    phases['startup_ms'] = summarize(
+        [run['import_ms'] + run['create_app_ms'] for run in runs], digits=1)
+
+    results = build_metadata('startup', {'mode': args.mode, 'runs': args.runs,
+                                         'env': args.env, 'budget_ms': args.budget_ms})
+    results['phases'] = phases
+    results['import_profile'] = parse_importtime(importtime_stderr, args.top)
+
+    if not args.quiet:
+        for phase, stats in phases.items():
+            print(f'{phase:<18} p50={stats["p50"]}ms max={stats["max"]}ms')
+        print('Import terlama (self):')
+        for module in results['import_profile']['top_self']:
+            print(f'  {module["self_ms"]:>8.2f}ms  {module["module"]}')
+
+    path = write_results(results, args.output, kind='startup')
+    print(f'Hasil benchmark ditulis ke {path}')
+
+    if args.budget_ms is not None and phases['startup_ms']['p50'] > args.budget_ms:
+        print(f'Startup p50 {phases["startup_ms"]["p50"]}ms melebihi budget {args.budget_ms}ms')
+        sys.exit(1)
+
+    return results
+
+
+if __name__ == '__main__':
+    main()
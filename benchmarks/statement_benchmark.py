@@ -0,0 +1,169 @@
+"""
+Statement Benchmark - Overhead Python per panggilan repository
+
+Membandingkan query repository versi lama (Query ORM dibangun ulang di
+setiap panggilan) dengan statement yang dibangun sekali saat import
+(nilai filter sebagai bound parameter) terhadap SQLite sementara
+berukuran kecil. Dengan dataset kecil waktu eksekusi di database hampir
+nol, sehingga selisihnya adalah overhead Python per panggilan.
+
+Prepared statement psycopg (DB_PREPARE_THRESHOLD) hanya berlaku untuk
+PostgreSQL dan tidak terukur di sini; gunakan --database-uri untuk
+menjalankan benchmark yang sama terhadap PostgreSQL.
+
+Cara menjalankan (dari root repository):
+    python -m benchmarks.statement_benchmark
+    python -m benchmarks.statement_benchmark --database-uri postgresql+psycopg://...
+"""
+
+import argparse
+import logging
+import os
+import tempfile
+from datetime import datetime
+
+
+def _legacy_queries(ctx):
+    """
+    Query versi lama (dibangun ulang setiap panggilan)
+
+    Returns:
+        dict: nama -> callable
+    """
+    from app.database import db
+    from app.models import Book, Loan
+
+    def loan_statistics():
+        today = datetime.utcnow().date()
+        return {
+            'total_loans': Loan.query.count(),
+            'borrowed_loans': Loan.query.filter_by(status='borrowed').count(),
+            'returned_loans': Loan.query.filter_by(status='returned').count(),
+            'overdue_loans': Loan.query.filter(
+                Loan.status == 'borrowed', Loan.due_date < today
+            ).count()
+        }
+
+    return {
+        'book.find_by_id': lambda: Book.query.filter_by(id=ctx['book_id'], is_deleted=False).first(),
+        'book.find_by_isbn': lambda: Book.query.filter_by(isbn=ctx['isbn'], is_deleted=False).first(),
+        'book.count': lambda: Book.query.filter_by(is_deleted=False).count(),
+        'book.count_available': lambda: Book.query.filter_by(is_deleted=False).filter(
+            Book.available > 0).count(),
+        'loan.count_by_status': lambda: Loan.query.filter(Loan.status == 'borrowed').count(),
+        'loan.find_active_by_book': lambda: Loan.query.options(db.joinedload(Loan.book)).filter_by(
+            book_id=ctx['book_id'], status='borrowed').all(),
+        'loan.get_loan_statistics': loan_statistics,
+    }
+
+
+def _cached_queries(ctx):
+    """
+    Method repository saat ini (statement prebuilt)
+
+    Returns:
+        dict: nama -> callable
+    """
+    from app.repositories import book_repository, loan_repository
+
+    return {
+        'book.find_by_id': lambda: book_repository.find_by_id(ctx['book_id']),
+        'book.find_by_isbn': lambda: book_repository.find_by_isbn(ctx['isbn']),
+        'book.count': lambda: book_repository.count(),
+        'book.count_available': lambda: book_repository.count({'available_only': True}),
+        'loan.count_by_status': lambda: loan_repository.count({'status': 'borrowed'}),
+        'loan.find_active_by_book': lambda: loan_repository.find_active_by_book(ctx['book_id']),
+        'loan.get_loan_statistics': loan_repository.get_loan_statistics,
+    }
+
+
+def run(database_uri, options):
+    """
+    Menjalankan kedua varian untuk setiap query
+
+    Returns:
+        dict: nama -> {legacy_ns_per_op, cached_ns_per_op, speedup}
+    """
+    from app import create_app
+    from app.database import db
+    from app.models import Book
+    from benchmarks.data_generator import DataGenerator
+    from benchmarks.endpoint_benchmark import _make_config
+    from benchmarks.micro_benchmark import measure_time
+
+    config = type('StatementBenchmarkConfig', (_make_config(database_uri),), {
+        # Instrumentasi dimatikan agar yang terukur hanya query
+        'SQL_INSTRUMENTATION_ENABLED': False,
+        'METRICS_ENABLED': False
+    })
+    app = create_app(config)
+    logging.getLogger('LibraryAPI').setLevel(logging.WARNING)
+
+    results = {}
+    with app.app_context():
+        db.create_all()
+        if not db.session.query(Book.id).count():
+            generator = DataGenerator(seed=options['seed'])
+            generator.seed_books(options['books'])
+            generator.seed_loans(options['loans'])
+
+        book = Book.query.order_by(Book.id).first()
+        ctx = {'book_id': book.id, 'isbn': book.isbn}
+
+        legacy = _legacy_queries(ctx)
+        cached = _cached_queries(ctx)
+
+        for name in legacy:
+            if options['filter'] and not any(f in name for f in options['filter']):
+                continue
+            # Hasil kedua varian harus sama
+            assert repr(legacy[name]()) == repr(cached[name]()), name
+
+            legacy_ns, _ = measure_time(legacy[name], min_time=options['min_time'],
+                                        repeat=options['repeat'])
+            cached_ns, _ = measure_time(cached[name], min_time=options['min_time'],
+                                        repeat=options['repeat'])
+            results[name] = {
+                'legacy_ns_per_op': round(legacy_ns, 1),
+                'cached_ns_per_op': round(cached_ns, 1),
+                'speedup': round(legacy_ns / cached_ns, 2)
+            }
+            print(f'{name:<28} query {legacy_ns / 1000:>8.1f} us/op   '
+                  f'prebuilt {cached_ns / 1000:>8.1f} us/op   '
+                  f'x{results[name]["speedup"]}', flush=True)
+
+    return results
+
+
+def main(argv=None):
+    from benchmarks.reporting import build_metadata, write_results
+
+    parser = argparse.ArgumentParser(description='Benchmark overhead statement repository')
+    parser.add_argument('--database-uri', help='Database URI. Default: SQLite sementara')
+    parser.add_argument('--books', type=int, default=200)
+    parser.add_argument('--loans', type=int, default=500)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--filter', action='append', default=[],
+                        help='Substring nama query (boleh diulang)')
+    parser.add_argument('--min-time', type=float, default=0.2)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', help='Path file JSON hasil')
+    args = parser.parse_args(argv)
+
+    database_uri = args.database_uri or 'sqlite:///' + os.path.join(
+        tempfile.mkdtemp(prefix='library-bench-'), 'statements.db')
+
+    options = {
+        'books': args.books, 'loans': args.loans, 'seed': args.seed,
+        'filter': args.filter, 'min_time': args.min_time, 'repeat': args.repeat
+    }
+    results = build_metadata('statement', options)
+    results['statements'] = run(database_uri, options)
+
+    path = write_results(results, args.output, kind='statement')
+    print(f'Hasil benchmark ditulis ke {path}')
+    return results
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""
+Konfigurasi gunicorn untuk production
+
+Worker pre-fork (gthread): jumlah worker dan thread diambil dari kelas
+konfigurasi aktif (WEB_CONCURRENCY / WEB_THREADS, ProductionConfig
+menurunkan worker dari jumlah CPU) sehingga sama dengan angka yang dipakai
+untuk menghitung ukuran connection pool.
+
+Cara menjalankan:
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+Tanpa APP_ENV / FLASK_ENV konfigurasi production yang dipakai, sama dengan wsgi.py.
+
+Reload graceful: kill -HUP <pid master> (worker lama menyelesaikan request
+yang sedang berjalan). Karena aplikasi di-preload di master, perubahan kode
+membutuhkan restart master atau upgrade binary (USR2 lalu WINCH/QUIT).
+"""
+
+import os
+import tempfile
+
+# Metrik Prometheus diagregasi lintas worker (dan bertahan saat worker di-recycle).
+# Env harus di-set sebelum package app di-import.
+if not os.getenv('PROMETHEUS_MULTIPROC_DIR'):
+    os.environ['PROMETHEUS_MULTIPROC_DIR'] = tempfile.mkdtemp(prefix='library-metrics-')
+
+from app.config import get_config  # noqa: E402
+
+
+_config = get_config(default='production')
+
+bind = os.getenv('GUNICORN_BIND', f"{os.getenv('FLASK_HOST', '0.0.0.0')}:{os.getenv('FLASK_PORT', '5000')}")
+workers = _config.WEB_CONCURRENCY
+worker_class = 'gthread'
+threads = _config.WEB_THREADS
+
+# Aplikasi di-import sekali di master lalu di-fork (copy-on-write, boot worker cepat)
+preload_app = True
+
+# Recycle worker setelah N request (jitter agar tidak restart bersamaan)
+max_requests = int(os.getenv('GUNICORN_MAX_REQUESTS', '1000'))
+max_requests_jitter = int(os.getenv('GUNICORN_MAX_REQUESTS_JITTER', '100'))
+
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '30'))
+graceful_timeout = int(os.getenv('GUNICORN_GRACEFUL_TIMEOUT', '30'))
+keepalive = int(os.getenv('GUNICORN_KEEPALIVE', '5'))
+
+accesslog = os.getenv('GUNICORN_ACCESS_LOG') or None
+errorlog = '-'
+
+
+def _app():
+    # Module wsgi sudah di-import oleh preload; import ini tidak membuat app baru
+    from wsgi import app
+    return app
+
+
+def when_ready(server):
+    """Master: tutup koneksi yang dibuka saat preload sebelum worker di-fork"""
+    from app.database import db_connection
+    db_connection.dispose_engines(_app())
+
+
+def post_fork(server, worker):
+    """Worker: pool baru (koneksi warisan master tidak boleh dipakai) + warm-up"""
+    from app.database import db_connection
+    opened = db_connection.reset_after_fork(_app())
+    server.log.info(f'Worker {worker.pid}: {opened} koneksi database dibuka')
+
+
+def child_exit(server, worker):
+    """Master: bersihkan file metrik gauge milik worker yang berhenti"""
+    from app.middleware import mark_worker_dead
+    mark_worker_dead(worker.pid)
@@ -6,11 +6,15 @@ Library Book Management API
 Aplikasi REST API untuk manajemen buku perpustakaan
 dengan arsitektur MVC dan implementasi 6 Design Patterns
 
-Cara menjalankan:
+Cara menjalankan (development):
     python run.py
     
 Atau:
     flask run
+
+Debugger dan reloader Werkzeug hanya aktif dengan FLASK_DEBUG=true.
+Untuk production gunakan gunicorn (lihat gunicorn.conf.py):
+    APP_ENV=production gunicorn -c gunicorn.conf.py wsgi:app
 """
 
 import os
@@ -23,14 +27,15 @@ if __name__ == '__main__':
     # Konfigurasi server
     host = os.getenv('FLASK_HOST', '0.0.0.0')
     port = int(os.getenv('FLASK_PORT', 5000))
-    debug = os.getenv('FLASK_ENV', 'development') == 'development'
+    # Debugger Werkzeug mengizinkan eksekusi kode: harus diaktifkan eksplisit
+    debug = os.getenv('FLASK_DEBUG', 'false').lower() == 'true'
     
     print(f"""
     ╔══════════════════════════════════════════════════════════╗
     ║       Library Book Management API v1.0.0                  ║
     ╠══════════════════════════════════════════════════════════╣
     ║  Server berjalan di: http://localhost:{port}               ║
-    ║  Mode: {'Development' if debug else 'Production'}                                     ║
+    ║  Mode: {'Debug' if debug else 'Non-debug'}                                     ║
     ║                                                          ║
     ║  Endpoints:                                              ║
     ║  - Books:      http://localhost:{port}/api/books           ║
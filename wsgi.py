@@ -0,0 +1,14 @@
+"""
+Entry point WSGI untuk server production (pre-fork)
+
+Cara menjalankan:
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+Tanpa APP_ENV / FLASK_ENV konfigurasi production yang dipakai (bukan
+development seperti run.py).
+"""
+
+from app import create_app
+from app.config import get_config
+
+app = create_app(get_config(default='production'))